@@ -0,0 +1,148 @@
+"""
+Benchmark del Flyweight de especificaciones de cultivos.
+
+Compara la creacion de N cultivos que referencian una
+EspecificacionCultivo compartida (y usan __slots__) contra una
+reproduccion del esquema anterior, donde cada instancia copiaba todos
+los datos fijos (superficie, variedad, invernadero, etc.) en su __dict__.
+Se mide la construccion directa de ambos esquemas (por variedad, como
+el esquema anterior, y con la especificacion ya obtenida) y, aparte, la
+creacion a traves del CultivoFactory (que suma el dispatch por especie).
+
+Mide, por esquema:
+- Tiempo de creacion (mejor de R repeticiones, time.perf_counter).
+- Memoria por cultivo (tracemalloc: bytes asignados / N).
+
+Uso (desde la raiz del proyecto):
+    python benchmarks/benchmark_especificaciones.py [N] [repeticiones]
+"""
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from python_forestacion.entidades.entidad_rastreable import EntidadRastreable
+from python_forestacion.entidades.cultivos.pino import Pino
+from python_forestacion.entidades.cultivos.lechuga import Lechuga
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+from python_forestacion import constantes as C
+
+ESPECIES = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+CANTIDAD_POR_DEFECTO = 200_000
+REPETICIONES_POR_DEFECTO = 3
+
+
+class CultivoCopiado(EntidadRastreable):
+    """
+    Reproduccion del esquema anterior al Flyweight: cada cultivo
+    guarda su propia copia de los datos fijos de la especie.
+    """
+
+    _contador_id: int = 0
+
+    def __init__(self, superficie: float, agua_inicial: int):
+        CultivoCopiado._contador_id += 1
+        self._id: int = CultivoCopiado._contador_id
+        self._superficie: float = superficie
+        self._agua: int = agua_inicial
+
+
+class PinoCopiado(CultivoCopiado):
+    """Pino con variedad y altura por instancia (esquema anterior)."""
+
+    def __init__(self, variedad: str):
+        super().__init__(C.SUPERFICIE_PINO, C.AGUA_INICIAL_PINO)
+        self._altura: float = C.ALTURA_INICIAL_ARBOL
+        self._variedad: str = variedad
+
+
+class LechugaCopiada(CultivoCopiado):
+    """Lechuga con variedad e invernadero por instancia (esquema anterior)."""
+
+    def __init__(self, variedad: str):
+        super().__init__(C.SUPERFICIE_LECHUGA, C.AGUA_INICIAL_LECHUGA)
+        self._variedad: str = variedad
+        self._invernadero: bool = True
+
+
+def crear_con_factory(cantidad: int) -> List[object]:
+    """Crea 'cantidad' cultivos (especies alternadas) con el Factory."""
+    crear = CultivoFactory.crear_cultivo
+    return [crear(ESPECIES[i % 2 * 2]) for i in range(cantidad)]
+
+
+def crear_con_variedad(cantidad: int) -> List[object]:
+    """Crea 'cantidad' cultivos indicando la variedad (como el esquema anterior)."""
+    return [Pino("Parana") if i % 2 == 0 else Lechuga("Crespa")
+            for i in range(cantidad)]
+
+
+def crear_con_especificacion(cantidad: int) -> List[object]:
+    """Crea 'cantidad' cultivos referenciando la especificacion cacheada."""
+    pino = CultivoFactory.get_especificacion("Pino")
+    lechuga = CultivoFactory.get_especificacion("Lechuga")
+    return [Pino(especificacion=pino) if i % 2 == 0 else Lechuga(especificacion=lechuga)
+            for i in range(cantidad)]
+
+
+def crear_copiados(cantidad: int) -> List[object]:
+    """Crea 'cantidad' cultivos (mismas especies) con el esquema anterior."""
+    return [PinoCopiado("Parana") if i % 2 == 0 else LechugaCopiada("Crespa")
+            for i in range(cantidad)]
+
+
+def medir(creador: Callable[[int], List[object]],
+          cantidad: int,
+          repeticiones: int) -> Tuple[float, float]:
+    """
+    Mide el mejor tiempo de creacion y la memoria por instancia.
+
+    Returns:
+        Tuple[float, float]: (segundos, bytes por cultivo).
+    """
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        cultivos = creador(cantidad)
+        mejor = min(mejor, time.perf_counter() - inicio)
+        del cultivos
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    cultivos = creador(cantidad)
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cultivos
+    return mejor, (actual - base) / cantidad
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime la comparacion."""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_POR_DEFECTO
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else REPETICIONES_POR_DEFECTO
+
+    print(f"Creando {cantidad} cultivos (Pino/Lechuga alternados), "
+          f"mejor de {repeticiones} repeticiones\n")
+    resultados = {
+        "Copia por instancia (anterior)": medir(crear_copiados, cantidad, repeticiones),
+        "Flyweight (por variedad)": medir(crear_con_variedad, cantidad, repeticiones),
+        "Flyweight (especificacion)": medir(crear_con_especificacion, cantidad, repeticiones),
+        "Flyweight (CultivoFactory)": medir(crear_con_factory, cantidad, repeticiones),
+    }
+    for nombre, (segundos, bytes_por_cultivo) in resultados.items():
+        print(f"{nombre:32s} {segundos:8.3f} s  "
+              f"{segundos / cantidad * 1e9:8.1f} ns/cultivo  "
+              f"{bytes_por_cultivo:8.1f} B/cultivo")
+
+    (t_anterior, m_anterior), (t_variedad, m_nuevo), (t_especificacion, _), _ = resultados.values()
+    print(f"\nMemoria: {100 * (1 - m_nuevo / m_anterior):.1f}% menos por cultivo")
+    print(f"Tiempo de construccion respecto del esquema anterior: "
+          f"{t_anterior / t_variedad:.2f}x por variedad, "
+          f"{t_anterior / t_especificacion:.2f}x con especificacion")
+
+
+if __name__ == "__main__":
+    main()
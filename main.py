@@ -11,7 +11,7 @@ funcionalidad de todos los modulos y patrones.
 -   Asigna personal y ejecuta tareas.
 -   Gestiona multiples fincas (FincasService).
 -   Cosecha cultivos (Generics).
--   Persiste y lee el registro (Pickle).
+-   Persiste (en segundo plano) y lee el registro (Pickle).
 -   Detiene los threads de forma segura (Graceful Shutdown).
 
 Disenado para pasar la RUBRICA_AUTOMATIZADA.md
@@ -27,6 +27,7 @@ from python_forestacion.entidades.terrenos.registro_forestal import RegistroFore
 from python_forestacion.entidades.personal.trabajador import Trabajador
 from python_forestacion.entidades.personal.tarea import Tarea
 from python_forestacion.entidades.personal.herramienta import Herramienta
+from python_forestacion.entidades.personal.apto_medico import AptoMedico
 # Tipos de cultivo para la cosecha (US-020)
 from python_forestacion.entidades.cultivos.pino import Pino
 from python_forestacion.entidades.cultivos.lechuga import Lechuga
@@ -36,12 +37,25 @@ from python_forestacion.servicios.terrenos.tierra_service import TierraService
 from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
 from python_forestacion.servicios.terrenos.registro_forestal_service import RegistroForestalService
 from python_forestacion.servicios.personal.trabajador_service import TrabajadorService
+from python_forestacion.servicios.personal.cuadrilla_service import CuadrillaService
+from python_forestacion.servicios.personal.asignacion_service import AsignacionService
+from python_forestacion.servicios.personal.pool_herramientas import PoolHerramientas
+from python_forestacion.servicios.personal.resultado_cuadrilla import EstadoJornada
 from python_forestacion.servicios.negocio.fincas_service import FincasService
+from python_forestacion.servicios.negocio.reservorio_agua import ReservorioAgua
+from python_forestacion.servicios.negocio.pronostico_agua_service import PronosticoAguaService
+from python_forestacion.servicios.terrenos.persistencia_diferida_task import PersistenciaDiferidaTask
 
 # --- Imports de Riego (Threads) ---
 from python_forestacion.riego.sensores.temperatura_reader_task import TemperaturaReaderTask
 from python_forestacion.riego.sensores.humedad_reader_task import HumedadReaderTask
 from python_forestacion.riego.control.control_riego_task import ControlRiegoTask
+from python_forestacion.riego.control.historial_riego import HistorialRiego
+from python_forestacion.riego.sensores.estadistica_sensor import EstadisticaSensor
+from python_forestacion.riego.sensores.sensor_bank import SensorBank
+
+# --- Imports de Patrones ---
+from python_forestacion.patrones.strategy.impl.absorcion_tabla_strategy import AbsorcionTablaStrategy
 
 # --- Imports de Excepciones ---
 from python_forestacion.excepciones.forestacion_exception import ForestacionException
@@ -61,13 +75,14 @@ def ejecutar_simulacion():
     tierra_service = TierraService()
     plantacion_service = PlantacionService()
     registro_service = RegistroForestalService()
-    trabajador_service = TrabajadorService()
     fincas_service = FincasService()
+    trabajador_service = TrabajadorService(fincas_service)
     
     # Variables para los threads
     tarea_temp = None
     tarea_hum = None
     tarea_control = None
+    persistidor = None
 
     try:
         # ======================================================================
@@ -113,6 +128,13 @@ def ejecutar_simulacion():
         # US-010 y US-011: Crear e iniciar Sensores (Threads)
         tarea_temp = TemperaturaReaderTask()
         tarea_hum = HumedadReaderTask()
+
+        # Observers: lecturas recientes para el pronostico de agua
+        estadistica_temp = EstadisticaSensor()
+        estadistica_hum = EstadisticaSensor()
+        tarea_temp.agregar_observador(estadistica_temp)
+        tarea_hum.agregar_observador(estadistica_hum)
+        pronostico_agua = PronosticoAguaService(HistorialRiego(), estadistica_temp, estadistica_hum)
         
         tarea_temp.start()
         tarea_hum.start()
@@ -123,7 +145,8 @@ def ejecutar_simulacion():
             sensor_temperatura=tarea_temp,
             sensor_humedad=tarea_hum,
             plantacion=plantacion,
-            plantacion_service=plantacion_service
+            plantacion_service=plantacion_service,
+            pronostico=pronostico_agua
         )
         tarea_control.start()
         
@@ -135,7 +158,17 @@ def ejecutar_simulacion():
         print("\nDemostracion: Patron Strategy (Rubrica 1.4)")
         print("(El riego uso 'AbsorcionSeasonalStrategy' para Arboles "
               "y 'AbsorcionConstanteStrategy' para Hortalizas)")
+        estrategia_tabla = AbsorcionTablaStrategy.desde_archivo(tarea_temp, tarea_hum)
+        print(f"(Con 'AbsorcionTablaStrategy' y los sensores actuales: "
+              f"{estrategia_tabla.calcular_absorcion_especies(date.today())} L por cultivo)")
               
+        # Banco de sensores: humedad de suelo por cultivo, un tick para todos
+        banco_suelo = SensorBank([cultivo.get_id() for cultivo in plantacion.iterar_cultivos()])
+        lote_suelo = banco_suelo.simular()
+        print(f"(Banco de {banco_suelo.get_cantidad()} sensores de suelo: "
+              f"{lote_suelo.get_cantidad()} lecturas notificadas en un lote, "
+              f"promedio {banco_suelo.get_promedio():.1f}%)")
+
         # Demostracion PATRON SINGLETON (US-TECH-001)
         print("\nDemostracion: Patron Singleton (Rubrica 1.1)")
         print("(El 'PlantacionService' y el 'RegistroForestalService' "
@@ -174,6 +207,29 @@ def ejecutar_simulacion():
             fecha=date.today(),
             util=herramienta
         )
+
+        # US-016: Jornada de una cuadrilla en paralelo, con herramientas
+        # certificadas compartidas (una herramienta sin certificado se descarta)
+        cuadrilla = []
+        for i in range(1, 7):
+            integrante = Trabajador(dni=40000000 + i, nombre=f"Cuadrilla {i}",
+                                    tareas=[Tarea(100 + i, date.today(), "Poda")])
+            integrante.set_apto_medico(AptoMedico(True, date.today()))
+            cuadrilla.append(integrante)
+        pool_herramientas = PoolHerramientas([
+            Herramienta(201, "Tijera", True),
+            Herramienta(202, "Tijera", True),
+            Herramienta(203, "Motosierra", False),
+        ])
+        resultado_cuadrilla = CuadrillaService().trabajar_cuadrilla(
+            cuadrilla, date.today(), pool_herramientas, segundos_por_tarea=0.01)
+        print(f"\nCuadrilla: {resultado_cuadrilla.get_cantidad(EstadoJornada.TRABAJO)}/"
+              f"{resultado_cuadrilla.get_total_trabajadores()} trabajaron con "
+              f"{pool_herramientas.get_cantidad()} herramientas certificadas "
+              f"({pool_herramientas.get_rechazadas()} descartada), "
+              f"{resultado_cuadrilla.get_throughput():.0f} tareas/s, "
+              f"espera maxima {resultado_cuadrilla.get_espera_maxima() * 1000:.1f} ms, "
+              f"utilizacion {resultado_cuadrilla.get_utilizacion_herramientas():.0%}")
         
         # ======================================================================
         # --- EPIC 5: OPERACIONES DE NEGOCIO (US-018 a US-020) ---
@@ -182,6 +238,46 @@ def ejecutar_simulacion():
         
         # US-018: Agregar finca al servicio de gestion
         fincas_service.add_finca(registro)
+
+        # Indice global del personal: busqueda por DNI y fincas que atiende
+        encontrado = fincas_service.buscar_trabajador(30123456)
+        fincas_atendidas = fincas_service.get_fincas_de_trabajador(30123456)
+        print(f"DNI 30123456: {encontrado.get_nombre() if encontrado else 'no encontrado'}, "
+              f"atiende {len(fincas_atendidas)} finca(s)")
+
+        # Indices secundarios: consultas por rango sin recorrer las fincas
+        print(f"Fincas con al menos 10 m² libres: "
+              f"{len(fincas_service.buscar_fincas_por_superficie_disponible(minimo=10))}, "
+              f"con menos de 50 L de agua: "
+              f"{len(fincas_service.buscar_fincas_por_agua(maximo=50, incluir_maximo=False))}, "
+              f"de Adrian Developer: "
+              f"{len(fincas_service.buscar_fincas_por_propietario('Adrian Developer'))}")
+
+        # Reservorio compartido: reparto del presupuesto diario por prioridad
+        plan_agua = fincas_service.repartir_agua(ReservorioAgua(presupuesto_diario=30, riegos_objetivo=100))
+        print(f"Reservorio: {plan_agua.get_asignado()} L asignados de "
+              f"{plan_agua.get_presupuesto()} L (deficit sin cubrir: "
+              f"{plan_agua.get_deficit_sin_cubrir()} L)")
+
+        # Pronostico en lote del agotamiento del agua de cada finca
+        for pronostico in fincas_service.pronosticar_agua(pronostico_agua):
+            segundos = pronostico.get_segundos_hasta_agotar()
+            print(f"Pronostico '{pronostico.get_nombre()}': "
+                  f"{pronostico.get_riegos_restantes()} riego(s) restante(s), "
+                  f"{'sin riegos esperados' if segundos is None else f'~{segundos:.0f} s'} "
+                  f"(riegos por ciclo: {pronostico.get_probabilidad_riego():.2f}, "
+                  f"absorcion por riego: {pronostico.get_absorcion_por_riego()} L)")
+
+        # Plan balanceado (LPT + busqueda local) de las tareas de un dia
+        fecha_plan = date(2025, 10, 22)
+        plan = AsignacionService().planificar(
+            fincas_service.get_tareas_pendientes(fecha_plan),
+            fincas_service.get_personal(),
+            [herramienta],
+            fecha_plan)
+        print(f"Plan {fecha_plan}: {plan.get_cantidad_tareas()} tarea(s), "
+              f"makespan {plan.get_makespan():.1f} h "
+              f"(cota inferior {plan.get_cota_inferior():.1f} h)")
         
         # US-019: Fumigar
         fincas_service.fumigar(id_padron=12345, plaguicida="Cipermetrina")
@@ -199,9 +295,15 @@ def ejecutar_simulacion():
         # ======================================================================
         print("\n=== [FASE 5: PERSISTENCIA Y AUDITORIA] ===")
         
-        # US-021: Persistir (Guardar)
-        path_archivo = registro_service.persistir(registro)
-        print(f"Registro guardado en: {path_archivo}")
+        # US-021: Persistir (Guardar) en segundo plano (write-behind)
+        persistidor = PersistenciaDiferidaTask(registro_service)
+        persistidor.start()
+        persistidor.encolar(registro)
+        persistidor.encolar(registro) # Si seguia pendiente, se coalesce
+        
+        # Antes de leer, esperamos a que la escritura termine
+        persistidor.flush()
+        print(f"Metricas de persistencia: {persistidor.get_metricas()}")
         
         # US-022: Leer
         registro_leido = RegistroForestalService.leer_registro("Adrian Developer")
@@ -209,6 +311,9 @@ def ejecutar_simulacion():
         # US-023: Mostrar datos (usando Registry)
         print("\nMostrando datos del registro leido (demuestra Registry):")
         registro_service.mostrar_datos(registro_leido)
+        
+        # US-023: Reporte resumido (estadisticas por especie y variedad)
+        registro_service.mostrar_resumen(registro_leido)
 
     except ForestacionException as e:
         # Manejo de nuestras excepciones personalizadas (Rubrica 2.3)
@@ -240,6 +345,9 @@ def ejecutar_simulacion():
             tarea_temp.detener()
         if tarea_hum:
             tarea_hum.detener()
+        if persistidor:
+            # Escribe lo pendiente antes de terminar
+            persistidor.detener()
             
         # Esperar a que los threads terminen (Graceful Shutdown)
         # (Rubrica 4.2, 5.1)
@@ -257,6 +365,10 @@ def ejecutar_simulacion():
             tarea_control.join(timeout=join_timeout)
             print(f"Control de Riego: {'Detenido' if not tarea_control.is_alive() else 'Forzado'}")
             
+        if persistidor:
+            persistidor.join(timeout=join_timeout)
+            print(f"Persistencia: {'Detenido' if not persistidor.is_alive() else 'Forzado'}")
+            
         print("\nTodos los sistemas detenidos de forma segura.")
         print("\n--- EJEMPLO COMPLETADO EXITOSAMENTE ---")
         # Este mensaje es el que busca la Rubrica Auto (EXEC-002)
@@ -43,6 +43,14 @@ MES_FIN_VERANO: int = 8   # Agosto
 ABSORCION_CONSTANTE_LECHUGA: int = 1  # litros
 ABSORCION_CONSTANTE_ZANAHORIA: int = 2  # litros
 
+# Estrategia por Tabla (bases mensuales y factores por banda de
+# temperatura y humedad, en un JSON junto al modulo de la estrategia)
+ARCHIVO_CONFIG_ABSORCION_TABLA: str = "absorcion_tabla.json"
+
+# --- Riego parcial con agua insuficiente (US-008) ---
+PRIORIDAD_RIEGO_ARBOL: int = 0  # menor valor = se riega primero
+PRIORIDAD_RIEGO_HORTALIZA: int = 1
+
 # --- Constantes de Crecimiento (US-008) ---
 CRECIMIENTO_PINO_POR_RIEGO: float = 0.10  # metros
 CRECIMIENTO_OLIVO_POR_RIEGO: float = 0.01  # metros
@@ -68,13 +76,94 @@ TEMP_MIN_RIEGO: int = 8  # °C
 TEMP_MAX_RIEGO: int = 15  # °C
 HUMEDAD_MAX_RIEGO: int = 50  # %
 
+# --- Suspension del control por agua agotada (US-012) ---
+CONTROL_RIEGO_FACTOR_ESPERA: float = 2.0  # multiplica la espera mientras no hay agua
+CONTROL_RIEGO_ESPERA_MAXIMA: float = 30.0  # segundos
+
+# --- Pronostico de agotamiento del agua (US-012) ---
+HISTORIAL_RIEGO_VENTANA: int = 240  # decisiones de control recordadas
+ESTADISTICA_SENSOR_VENTANA: int = 120  # lecturas recientes por sensor
+PRONOSTICO_PESO_SENSORES: int = 20  # decisiones equivalentes del estimador por sensores
+
+# --- Sensores en proceso hijo (US-010, US-011) ---
+SENSOR_PROCESO_CONTEXTO: str = "spawn"  # metodo de inicio de multiprocessing
+SENSOR_PROCESO_SONDEO: float = 0.25  # segundos entre consultas del notificador
+SENSOR_PROCESO_TIMEOUT_DETENCION: float = 2.0  # segundos
+SEQLOCK_MAX_REINTENTOS: int = 1000  # lecturas inconsistentes antes de rendirse
+
+# --- Banco de sensores de humedad de suelo (US-011) ---
+INTERVALO_SENSOR_BANK: float = 5.0  # segundos entre ticks del banco
+SENSOR_BANK_VENTANA: int = 16  # ticks de historial por sensor
+SENSOR_BANK_UMBRAL_DELTA: float = 0.5  # % de cambio para notificar una lectura
+SENSOR_BANK_VARIACION_MAXIMA: float = 2.0  # % por tick en la simulacion
+SENSOR_BANK_VALOR_INICIAL: float = 40.0  # % de humedad de suelo
+
 # --- Control de Threads (US-013) ---
 THREAD_JOIN_TIMEOUT: float = 2.0  # segundos
 
 
+# ==============================================================================
+# --- EPIC 4: GESTION DE PERSONAL (US-014 a US-017) ---
+# ==============================================================================
+
+# --- Tareas (US-014) ---
+TAREA_DURACION_HORAS: float = 1.0  # duracion estimada por defecto
+
+# --- Apto medico (US-015) ---
+APTO_MEDICO_VIGENCIA_DIAS: int = 365  # dias de validez del certificado
+
+# --- Ejecucion de cuadrillas (US-016) ---
+CUADRILLA_MAX_HILOS: int = 16  # trabajadores atendidos en paralelo
+CUADRILLA_TIMEOUT_HERRAMIENTA: float = 30.0  # segundos de espera maxima por herramienta
+
+# --- Asignacion de tareas (US-016) ---
+ASIGNACION_MAX_MOVIMIENTOS: int = 10_000  # movimientos de la busqueda local
+
+
+# ==============================================================================
+# --- EPIC 5: OPERACIONES DE NEGOCIO (US-018 a US-020) ---
+# ==============================================================================
+
+# --- Indices secundarios de fincas (US-018) ---
+INDICE_FINCAS_TAMANIO_BLOQUE: int = 512  # entradas por bloque del indice ordenado
+
+# --- Reservorio de agua compartido (US-018) ---
+RESERVORIO_RIEGOS_OBJETIVO: int = 5  # riegos de reserva que se busca cubrir por finca
+PESO_ESPECIE_RESERVORIO: dict[str, float] = {"Olivo": 3.0, "Pino": 2.0, "Lechuga": 1.0, "Zanahoria": 1.0}
+PESO_ESPECIE_RESERVORIO_DEFECTO: float = 1.0  # especies registradas sin peso propio
+
+
 # ==============================================================================
 # --- EPIC 6: PERSISTENCIA (US-021) ---
 # ==============================================================================
 
 DIRECTORIO_DATA: str = "data"
-EXTENSION_DATA: str = ".dat"
\ No newline at end of file
+EXTENSION_DATA: str = ".dat"
+
+# --- Layout particionado del directorio de datos (US-021) ---
+SHARD_PREFIJO_LONGITUD: int = 2  # caracteres hex del hash -> 256 subdirectorios
+NOMBRE_MANIFIESTO_DATA: str = "indice.json"  # manifiesto de cada subdirectorio
+LARGO_HASH_NOMBRE_DATA: int = 16  # caracteres del hash en el nombre de archivo
+LARGO_MAXIMO_NOMBRE_DATA: int = 150  # caracteres del propietario codificado
+
+# --- Cache de lectura de registros (US-022) ---
+CACHE_REGISTROS_MAX_ENTRADAS: int = 128  # registros deserializados en memoria
+CACHE_REGISTROS_MAX_BYTES: int = 64 * 1024 * 1024  # ~64 MB (tamaño en disco)
+
+
+# --- Persistencia diferida / write-behind (US-021) ---
+PERSISTENCIA_COLA_CAPACIDAD: int = 1024  # registros distintos pendientes de escritura
+
+
+# ==============================================================================
+# --- EPIC 6: REPORTES (US-023) ---
+# ==============================================================================
+
+REPORTE_TAMANIO_PAGINA: int = 50  # cultivos por pagina del detalle
+
+
+# ==============================================================================
+# --- EXPORTACION DE DATOS ---
+# ==============================================================================
+
+EXPORTACION_TAMANIO_LOTE: int = 1000  # filas acumuladas por cada escritura
\ No newline at end of file
@@ -2,38 +2,75 @@
 Modulo de la clase base abstracta Cultivo.
 """
 from abc import ABC, abstractmethod
+from threading import get_ident
+from typing import Any, Callable, Dict, Set
+from python_forestacion.entidades.entidad_rastreable import EntidadRastreable
+from python_forestacion.entidades.cultivos.especificacion_cultivo import EspecificacionCultivo
 
-class Cultivo(ABC):
+class Cultivo(EntidadRastreable, ABC):
     """
     Clase base abstracta para todos los tipos de cultivos.
 
     Define la interfaz comun que debe tener cualquier cultivo,
     incluyendo superficie, agua y un ID unico.
+
+    Los datos fijos de la especie/variedad (superficie, agua inicial,
+    variedad, etc.) no se copian en cada cultivo: se referencian en
+    una EspecificacionCultivo compartida (Flyweight). Ademas, los
+    cultivos usan __slots__ (sin __dict__ por instancia), ya que
+    se crean por millones.
     """
 
+    __slots__ = ("_id", "_especificacion", "_agua", "_contenedores")
+
     # Variable de clase para autoincrementar el ID
     _contador_id: int = 0
+    # Hilos que estan creando una muestra (ver crear_muestra)
+    _hilos_muestreo: Set[int] = set()
 
-    def __init__(self, superficie: float, agua_inicial: int):
+    def __init__(self, especificacion: EspecificacionCultivo):
         """
         Inicializa un nuevo cultivo.
 
         Args:
-            superficie (float): La superficie en m² que ocupa el cultivo.
-            agua_inicial (int): La cantidad de agua en litros que tiene al ser plantado.
+            especificacion (EspecificacionCultivo): Datos fijos (compartidos)
+                de la especie/variedad; la superficie y el agua inicial
+                ya vienen validados.
+        """
+        # El set vacio (lo habitual) evita consultar el hilo actual
+        if Cultivo._hilos_muestreo and get_ident() in Cultivo._hilos_muestreo:
+            self._id: int = 0  # muestra: no consume un ID
+        else:
+            Cultivo._contador_id += 1
+            self._id = Cultivo._contador_id
+        self._especificacion: EspecificacionCultivo = especificacion
+        self._agua: int = especificacion.get_agua_inicial()
+        self._contenedores = ()
+
+    @staticmethod
+    def crear_muestra(creador: Callable[[], 'Cultivo']) -> 'Cultivo':
+        """
+        Crea un cultivo de muestra (ej. para evaluar el Strategy de su
+        especie) sin consumir un ID de la secuencia global: mientras
+        corre el creador, el constructor no numera los cultivos de
+        este hilo y la muestra queda con ID 0, ya que no es un cultivo
+        plantado. La secuencia no se toca: los demas hilos siguen
+        numerando sus cultivos.
 
-        Raises:
-            ValueError: Si la superficie es <= 0 o el agua inicial es < 0.
-        """
-        if superficie <= 0:
-            raise ValueError("La superficie debe ser mayor a cero")
-        if agua_inicial < 0:
-            raise ValueError("El agua inicial no puede ser negativa")
-        
-        Cultivo._contador_id += 1
-        self._id: int = Cultivo._contador_id
-        self._superficie: float = superficie
-        self._agua: int = agua_inicial
+        Args:
+            creador (Callable[[], Cultivo]): Crea UN cultivo de la especie.
+
+        Returns:
+            Cultivo: La muestra (con ID 0).
+        """
+        hilo = get_ident()
+        if hilo in Cultivo._hilos_muestreo:
+            return creador()  # muestra anidada: el hilo ya esta marcado
+        Cultivo._hilos_muestreo.add(hilo)
+        try:
+            return creador()
+        finally:
+            Cultivo._hilos_muestreo.discard(hilo)
 
     def get_id(self) -> int:
         """
@@ -44,6 +81,15 @@ class Cultivo(ABC):
         """
         return self._id
 
+    def get_especificacion(self) -> EspecificacionCultivo:
+        """
+        Obtiene la especificacion (compartida) de la especie/variedad.
+
+        Returns:
+            EspecificacionCultivo: La especificacion.
+        """
+        return self._especificacion
+
     def get_superficie(self) -> float:
         """
         Obtiene la superficie que ocupa el cultivo.
@@ -51,7 +97,7 @@ class Cultivo(ABC):
         Returns:
             float: La superficie en m².
         """
-        return self._superficie
+        return self._especificacion.get_superficie()
 
     def get_agua(self) -> int:
         """
@@ -74,7 +120,9 @@ class Cultivo(ABC):
         """
         if cantidad < 0:
             raise ValueError("La cantidad de agua no puede ser negativa")
+        anterior = self._agua
         self._agua = cantidad
+        self._notificar_cambio(self, "agua", cantidad - anterior)
 
     @abstractmethod
     def get_tipo(self) -> str:
@@ -85,4 +133,48 @@ class Cultivo(ABC):
         Returns:
             str: El nombre del tipo de cultivo (ej. "Pino", "Lechuga").
         """
-        pass
\ No newline at end of file
+        pass
+
+    def __setstate__(self, estado: Any) -> None:
+        """
+        Restaura el cultivo al deserializar (pickle).
+
+        Acepta el estado actual (tupla (__dict__ | None, slots)) y el
+        de los cultivos persistidos antes del Flyweight (un __dict__
+        con cada dato fijo copiado), que se migra a la especificacion
+        compartida equivalente.
+
+        Args:
+            estado (Any): El estado serializado.
+        """
+        if isinstance(estado, tuple):
+            atributos: Dict[str, Any] = {}
+            for parte in estado:
+                if parte:
+                    atributos.update(parte)
+        else:
+            atributos = dict(estado)
+
+        if "_especificacion" not in atributos:
+            atributos["_especificacion"] = self._migrar_especificacion(atributos)
+        atributos.setdefault("_contenedores", ())
+
+        for nombre, valor in atributos.items():
+            setattr(self, nombre, valor)
+
+    def _migrar_especificacion(self, estado: Dict[str, Any]) -> EspecificacionCultivo:
+        """
+        Metodo que arma la especificacion de un estado anterior al
+        Flyweight, quitando del estado los datos ya migrados.
+        Las clases hijas lo redefinen con sus datos propios.
+
+        Args:
+            estado (Dict[str, Any]): Copia del __dict__ serializado.
+
+        Raises:
+            TypeError: Si la clase no soporta la migracion.
+
+        Returns:
+            EspecificacionCultivo: La especificacion equivalente.
+        """
+        raise TypeError(f"{type(self).__name__} no soporta estados anteriores al Flyweight")
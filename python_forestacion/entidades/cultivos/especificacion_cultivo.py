@@ -0,0 +1,165 @@
+"""
+Modulo de la clase EspecificacionCultivo (Flyweight).
+Datos fijos de una especie/variedad, compartidos por todos sus cultivos.
+"""
+from __future__ import annotations
+from threading import Lock
+from typing import Any, Dict, Tuple
+
+from python_forestacion.entidades.cultivos.tipo_aceituna import TipoAceituna
+
+# TypeAlias de la clave de internado (todos los campos, en orden)
+ClaveEspecificacion = Tuple[Any, ...]
+
+
+class EspecificacionCultivo:
+    """
+    Especificacion inmutable de una especie y variedad de cultivo
+    (patron Flyweight).
+
+    Guarda los datos que son identicos para todos los cultivos de una
+    especie/variedad (superficie, agua y altura iniciales, variedad,
+    tipo de aceituna, invernadero, crecimiento por riego). Los
+    cultivos referencian la especificacion en lugar de copiar cada
+    dato, y solo guardan su estado propio (id, agua, altura).
+
+    Las instancias se obtienen con 'obtener', que las interna: dos
+    pedidos con los mismos datos devuelven el MISMO objeto (tambien
+    al deserializar un pickle).
+
+    Referencia: US-004 a US-008
+    """
+
+    __slots__ = ("_especie", "_superficie", "_agua_inicial", "_altura_inicial",
+                 "_variedad", "_tipo_aceituna", "_is_baby_carrot",
+                 "_invernadero", "_crecimiento_por_riego", "_clave")
+
+    # clave -> especificacion interna (compartida por todo el proceso)
+    _internadas: Dict[ClaveEspecificacion, EspecificacionCultivo] = {}
+    _lock: Lock = Lock()
+
+    def __init__(self,
+                 especie: str,
+                 superficie: float,
+                 agua_inicial: int,
+                 altura_inicial: float | None = None,
+                 variedad: str | None = None,
+                 tipo_aceituna: TipoAceituna | None = None,
+                 is_baby_carrot: bool | None = None,
+                 invernadero: bool = False,
+                 crecimiento_por_riego: float = 0.0):
+        """
+        Inicializa la especificacion. Usar 'obtener' (interna las
+        instancias) en lugar de llamar al constructor directamente.
+
+        Args:
+            especie (str): Nombre de la especie (ej. "Pino").
+            superficie (float): Superficie en m² que ocupa cada cultivo.
+            agua_inicial (int): Agua en litros al ser plantado.
+            altura_inicial (float | None, optional): Altura inicial (solo arboles).
+            variedad (str | None, optional): Variedad (Pino, Lechuga).
+            tipo_aceituna (TipoAceituna | None, optional): Tipo de aceituna (Olivo).
+            is_baby_carrot (bool | None, optional): Tipo de zanahoria (Zanahoria).
+            invernadero (bool, optional): True si se cultiva en invernadero.
+            crecimiento_por_riego (float, optional): Metros que crece por riego.
+
+        Raises:
+            ValueError: Si la superficie es <= 0, el agua inicial es < 0
+                o el crecimiento por riego es negativo.
+        """
+        if superficie <= 0:
+            raise ValueError("La superficie debe ser mayor a cero")
+        if agua_inicial < 0:
+            raise ValueError("El agua inicial no puede ser negativa")
+        if crecimiento_por_riego < 0:
+            raise ValueError("El crecimiento no puede ser negativo")
+
+        clave = (especie, superficie, agua_inicial, altura_inicial, variedad,
+                 tipo_aceituna, is_baby_carrot, invernadero, crecimiento_por_riego)
+        # object.__setattr__ porque la clase bloquea la asignacion
+        for nombre, valor in zip(EspecificacionCultivo.__slots__, clave + (clave,)):
+            object.__setattr__(self, nombre, valor)
+
+    @classmethod
+    def obtener(cls,
+                especie: str,
+                superficie: float,
+                agua_inicial: int,
+                altura_inicial: float | None = None,
+                variedad: str | None = None,
+                tipo_aceituna: TipoAceituna | None = None,
+                is_baby_carrot: bool | None = None,
+                invernadero: bool = False,
+                crecimiento_por_riego: float = 0.0) -> EspecificacionCultivo:
+        """
+        Obtiene la especificacion interna con esos datos (la crea
+        la primera vez). Mismos argumentos que el constructor.
+
+        Returns:
+            EspecificacionCultivo: La instancia compartida.
+        """
+        clave = (especie, superficie, agua_inicial, altura_inicial, variedad,
+                 tipo_aceituna, is_baby_carrot, invernadero, crecimiento_por_riego)
+        especificacion = cls._internadas.get(clave)
+        if especificacion is not None:
+            return especificacion
+
+        with cls._lock:
+            especificacion = cls._internadas.get(clave)
+            if especificacion is None:
+                especificacion = cls(*clave)
+                cls._internadas[clave] = especificacion
+        return especificacion
+
+    def __setattr__(self, nombre: str, valor: Any) -> None:
+        """La especificacion es inmutable (se comparte entre cultivos)."""
+        raise AttributeError("EspecificacionCultivo es inmutable")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Serializa la especificacion como una llamada a 'obtener',
+        por lo que al deserializar se vuelve a internar.
+        """
+        return (EspecificacionCultivo.obtener, self._clave)
+
+    def __repr__(self) -> str:
+        """Representacion legible (para depuracion)."""
+        return f"EspecificacionCultivo{self._clave!r}"
+
+    # --- Getters ---
+
+    def get_especie(self) -> str:
+        """Obtiene el nombre de la especie."""
+        return self._especie
+
+    def get_superficie(self) -> float:
+        """Obtiene la superficie en m² de cada cultivo."""
+        return self._superficie
+
+    def get_agua_inicial(self) -> int:
+        """Obtiene el agua inicial en litros."""
+        return self._agua_inicial
+
+    def get_altura_inicial(self) -> float | None:
+        """Obtiene la altura inicial en metros (None si no es arbol)."""
+        return self._altura_inicial
+
+    def get_variedad(self) -> str | None:
+        """Obtiene la variedad (None si la especie no la usa)."""
+        return self._variedad
+
+    def get_tipo_aceituna(self) -> TipoAceituna | None:
+        """Obtiene el tipo de aceituna (None si no es Olivo)."""
+        return self._tipo_aceituna
+
+    def is_baby_carrot(self) -> bool | None:
+        """Indica si es baby carrot (None si no es Zanahoria)."""
+        return self._is_baby_carrot
+
+    def is_invernadero(self) -> bool:
+        """Indica si la especie se cultiva en invernadero."""
+        return self._invernadero
+
+    def get_crecimiento_por_riego(self) -> float:
+        """Obtiene los metros que crece por riego (0 si no crece)."""
+        return self._crecimiento_por_riego
@@ -1,8 +1,10 @@
 """
 Modulo de la entidad Lechuga.
 """
+from typing import Any, Dict
 from typing_extensions import override
 from python_forestacion.entidades.cultivos.cultivo import Cultivo
+from python_forestacion.entidades.cultivos.especificacion_cultivo import EspecificacionCultivo
 from python_forestacion import constantes as C
 
 class Lechuga(Cultivo):
@@ -14,22 +16,42 @@ class Lechuga(Cultivo):
     Referencia: US-006
     """
 
-    def __init__(self, variedad: str):
+    __slots__ = ()
+
+    # Especificacion por variedad (superficie por defecto), usada por el constructor
+    _especificaciones: Dict[Any, EspecificacionCultivo] = {}
+
+    def __init__(self,
+                 variedad: str | None = None,
+                 especificacion: EspecificacionCultivo | None = None):
         """
         Inicializa una Lechuga.
 
-        Llama al constructor base con los valores de las constantes
-        para superficie y agua inicial.
+        Los datos fijos (superficie, agua inicial, variedad e
+        invernadero) se toman de la especificacion compartida; si no
+        se indica, se obtiene la de la variedad.
 
         Args:
-            variedad (str): La variedad de la lechuga (ej. Crespa, Mantecosa).
+            variedad (str | None, optional): La variedad de la lechuga (ej. Crespa, Mantecosa).
+            especificacion (EspecificacionCultivo | None, optional): Especificacion
+                ya obtenida (ej. la cacheada por el CultivoFactory).
+
+        Raises:
+            ValueError: Si no se indica variedad ni especificacion, o si
+                la especificacion no es de una Lechuga.
         """
-        super().__init__(superficie=C.SUPERFICIE_LECHUGA,
-            agua_inicial=C.AGUA_INICIAL_LECHUGA
-        )
-        self._variedad: str = variedad
-        # US-006 especifica que las lechugas son siempre de invernadero
-        self._invernadero: bool = True
+        if especificacion is None:
+            # Cache por variedad: evita armar la clave de 'obtener' en cada cultivo
+            especificacion = Lechuga._especificaciones.get(variedad)
+            if especificacion is None:
+                if variedad is None:
+                    raise ValueError("Debe indicarse la variedad o la especificacion de la lechuga")
+                especificacion = Lechuga.crear_especificacion(variedad)
+                Lechuga._especificaciones[variedad] = especificacion
+        elif especificacion.get_especie() != "Lechuga":
+            raise ValueError("La especificacion no corresponde a una Lechuga")
+
+        super().__init__(especificacion)
 
     @override
     def get_tipo(self) -> str:
@@ -48,7 +70,7 @@ class Lechuga(Cultivo):
         Returns:
             str: La variedad.
         """
-        return self._variedad
+        return self._especificacion.get_variedad()
 
     def is_invernadero(self) -> bool:
         """
@@ -57,4 +79,30 @@ class Lechuga(Cultivo):
         Returns:
             bool: True si es de invernadero, False en caso contrario.
         """
-        return self._invernadero
\ No newline at end of file
+        return self._especificacion.is_invernadero()
+
+    @staticmethod
+    def crear_especificacion(variedad: str,
+                             superficie: float = C.SUPERFICIE_LECHUGA) -> EspecificacionCultivo:
+        """
+        Obtiene la especificacion (interna) de una variedad de lechuga.
+        US-006 especifica que las lechugas son siempre de invernadero.
+
+        Args:
+            variedad (str): La variedad de la lechuga.
+            superficie (float, optional): Superficie por lechuga.
+
+        Returns:
+            EspecificacionCultivo: La especificacion compartida.
+        """
+        return EspecificacionCultivo.obtener(
+            "Lechuga", superficie, C.AGUA_INICIAL_LECHUGA,
+            variedad=variedad,
+            invernadero=True)
+
+    @override
+    def _migrar_especificacion(self, estado: Dict[str, Any]) -> EspecificacionCultivo:
+        """Migra 'variedad' y 'superficie' de una Lechuga anterior al Flyweight."""
+        estado.pop("_invernadero", None)
+        return Lechuga.crear_especificacion(
+            estado.pop("_variedad"), estado.pop("_superficie", C.SUPERFICIE_LECHUGA))
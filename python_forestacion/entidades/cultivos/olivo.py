@@ -1,8 +1,10 @@
 """
 Modulo de la entidad Olivo.
 """
+from typing import Any, Dict
 from typing_extensions import override
 from python_forestacion.entidades.cultivos.cultivo import Cultivo
+from python_forestacion.entidades.cultivos.especificacion_cultivo import EspecificacionCultivo
 from python_forestacion.entidades.cultivos.tipo_aceituna import TipoAceituna
 from python_forestacion import constantes as C
 
@@ -15,23 +17,44 @@ class Olivo(Cultivo):
     Referencia: US-005
     """
 
-    def __init__(self, tipo_aceituna: TipoAceituna):
+    __slots__ = ("_altura",)
+
+    # Especificacion por tipo de aceituna (superficie por defecto), usada por el constructor
+    _especificaciones: Dict[Any, EspecificacionCultivo] = {}
+
+    def __init__(self,
+                 tipo_aceituna: TipoAceituna | None = None,
+                 especificacion: EspecificacionCultivo | None = None):
         """
         Inicializa un Olivo.
 
-        Llama al constructor base con los valores de las constantes
-        para superficie y agua inicial.
+        Los datos fijos (superficie, agua y altura iniciales, tipo de
+        aceituna) se toman de la especificacion compartida; si no se
+        indica, se obtiene la del tipo de aceituna.
 
         Args:
-            tipo_aceituna (TipoAceituna): El enum del tipo de aceituna.
+            tipo_aceituna (TipoAceituna | None, optional): El enum del tipo de aceituna.
+            especificacion (EspecificacionCultivo | None, optional): Especificacion
+                ya obtenida (ej. la cacheada por el CultivoFactory).
+
+        Raises:
+            ValueError: Si no se indica tipo de aceituna ni especificacion,
+                o si la especificacion no es de un Olivo.
         """
-        super().__init__(
-            superficie=C.SUPERFICIE_OLIVO,
-            agua_inicial=C.AGUA_INICIAL_OLIVO
-        )
+        if especificacion is None:
+            # Cache por tipo de aceituna: evita armar la clave de 'obtener' en cada cultivo
+            especificacion = Olivo._especificaciones.get(tipo_aceituna)
+            if especificacion is None:
+                if tipo_aceituna is None:
+                    raise ValueError("Debe indicarse el tipo de aceituna o la especificacion del olivo")
+                especificacion = Olivo.crear_especificacion(tipo_aceituna)
+                Olivo._especificaciones[tipo_aceituna] = especificacion
+        elif especificacion.get_especie() != "Olivo":
+            raise ValueError("La especificacion no corresponde a un Olivo")
+
+        super().__init__(especificacion)
         # US-005 especifica una altura inicial diferente para olivos
-        self._altura: float = C.ALTURA_INICIAL_OLIVO 
-        self._tipo_aceituna: TipoAceituna = tipo_aceituna
+        self._altura: float = especificacion.get_altura_inicial()
 
     @override
     def get_tipo(self) -> str:
@@ -64,7 +87,9 @@ class Olivo(Cultivo):
         """
         if altura < 0:
             raise ValueError("La altura no puede ser negativa")
+        anterior = self._altura
         self._altura = altura
+        self._notificar_cambio(self, "altura", altura - anterior)
 
     def get_tipo_aceituna(self) -> TipoAceituna:
         """
@@ -73,4 +98,29 @@ class Olivo(Cultivo):
         Returns:
             TipoAceituna: El enum del tipo de aceituna.
         """
-        return self._tipo_aceituna
\ No newline at end of file
+        return self._especificacion.get_tipo_aceituna()
+
+    @staticmethod
+    def crear_especificacion(tipo_aceituna: TipoAceituna,
+                             superficie: float = C.SUPERFICIE_OLIVO) -> EspecificacionCultivo:
+        """
+        Obtiene la especificacion (interna) de un tipo de olivo.
+
+        Args:
+            tipo_aceituna (TipoAceituna): El tipo de aceituna.
+            superficie (float, optional): Superficie por olivo.
+
+        Returns:
+            EspecificacionCultivo: La especificacion compartida.
+        """
+        return EspecificacionCultivo.obtener(
+            "Olivo", superficie, C.AGUA_INICIAL_OLIVO,
+            altura_inicial=C.ALTURA_INICIAL_OLIVO,
+            tipo_aceituna=tipo_aceituna,
+            crecimiento_por_riego=C.CRECIMIENTO_OLIVO_POR_RIEGO)
+
+    @override
+    def _migrar_especificacion(self, estado: Dict[str, Any]) -> EspecificacionCultivo:
+        """Migra 'tipo_aceituna' y 'superficie' de un Olivo anterior al Flyweight."""
+        return Olivo.crear_especificacion(
+            estado.pop("_tipo_aceituna"), estado.pop("_superficie", C.SUPERFICIE_OLIVO))
@@ -1,8 +1,10 @@
 """
 Modulo de la entidad Pino.
 """
+from typing import Any, Dict
 from typing_extensions import override
 from python_forestacion.entidades.cultivos.cultivo import Cultivo
+from python_forestacion.entidades.cultivos.especificacion_cultivo import EspecificacionCultivo
 from python_forestacion import constantes as C
 
 class Pino(Cultivo):
@@ -14,22 +16,43 @@ class Pino(Cultivo):
     Referencia: US-004
     """
 
-    def __init__(self, variedad: str):
+    __slots__ = ("_altura",)
+
+    # Especificacion por variedad (superficie por defecto), usada por el constructor
+    _especificaciones: Dict[Any, EspecificacionCultivo] = {}
+
+    def __init__(self,
+                 variedad: str | None = None,
+                 especificacion: EspecificacionCultivo | None = None):
         """
         Inicializa un Pino.
 
-        Llama al constructor base con los valores de las constantes
-        para superficie y agua inicial.
+        Los datos fijos (superficie, agua y altura iniciales, variedad)
+        se toman de la especificacion compartida; si no se indica, se
+        obtiene la de la variedad (armada con las constantes).
 
         Args:
-            variedad (str): La variedad del pino (ej. Parana, Elliott).
+            variedad (str | None, optional): La variedad del pino (ej. Parana, Elliott).
+            especificacion (EspecificacionCultivo | None, optional): Especificacion
+                ya obtenida (ej. la cacheada por el CultivoFactory).
+
+        Raises:
+            ValueError: Si no se indica variedad ni especificacion, o si
+                la especificacion no es de un Pino.
         """
-        super().__init__(
-            superficie=C.SUPERFICIE_PINO,
-            agua_inicial=C.AGUA_INICIAL_PINO
-        )
-        self._altura: float = C.ALTURA_INICIAL_ARBOL
-        self._variedad: str = variedad
+        if especificacion is None:
+            # Cache por variedad: evita armar la clave de 'obtener' en cada cultivo
+            especificacion = Pino._especificaciones.get(variedad)
+            if especificacion is None:
+                if variedad is None:
+                    raise ValueError("Debe indicarse la variedad o la especificacion del pino")
+                especificacion = Pino.crear_especificacion(variedad)
+                Pino._especificaciones[variedad] = especificacion
+        elif especificacion.get_especie() != "Pino":
+            raise ValueError("La especificacion no corresponde a un Pino")
+
+        super().__init__(especificacion)
+        self._altura: float = especificacion.get_altura_inicial()
 
     @override
     def get_tipo(self) -> str:
@@ -62,7 +85,9 @@ class Pino(Cultivo):
         """
         if altura < 0:
             raise ValueError("La altura no puede ser negativa")
+        anterior = self._altura
         self._altura = altura
+        self._notificar_cambio(self, "altura", altura - anterior)
 
     def get_variedad(self) -> str:
         """
@@ -71,4 +96,29 @@ class Pino(Cultivo):
         Returns:
             str: La variedad (ej. "Parana").
         """
-        return self._variedad
\ No newline at end of file
+        return self._especificacion.get_variedad()
+
+    @staticmethod
+    def crear_especificacion(variedad: str,
+                             superficie: float = C.SUPERFICIE_PINO) -> EspecificacionCultivo:
+        """
+        Obtiene la especificacion (interna) de una variedad de pino.
+
+        Args:
+            variedad (str): La variedad del pino.
+            superficie (float, optional): Superficie por pino.
+
+        Returns:
+            EspecificacionCultivo: La especificacion compartida.
+        """
+        return EspecificacionCultivo.obtener(
+            "Pino", superficie, C.AGUA_INICIAL_PINO,
+            altura_inicial=C.ALTURA_INICIAL_ARBOL,
+            variedad=variedad,
+            crecimiento_por_riego=C.CRECIMIENTO_PINO_POR_RIEGO)
+
+    @override
+    def _migrar_especificacion(self, estado: Dict[str, Any]) -> EspecificacionCultivo:
+        """Migra 'variedad' y 'superficie' de un Pino anterior al Flyweight."""
+        return Pino.crear_especificacion(
+            estado.pop("_variedad"), estado.pop("_superficie", C.SUPERFICIE_PINO))
@@ -1,8 +1,10 @@
 """
 Modulo de la entidad Zanahoria.
 """
+from typing import Any, Dict
 from typing_extensions import override
 from python_forestacion.entidades.cultivos.cultivo import Cultivo
+from python_forestacion.entidades.cultivos.especificacion_cultivo import EspecificacionCultivo
 from python_forestacion import constantes as C
 
 class Zanahoria(Cultivo):
@@ -14,23 +16,42 @@ class Zanahoria(Cultivo):
     Referencia: US-007
     """
 
-    def __init__(self, is_baby_carrot: bool):
+    __slots__ = ()
+
+    # Especificacion por tipo (superficie por defecto), usada por el constructor
+    _especificaciones: Dict[Any, EspecificacionCultivo] = {}
+
+    def __init__(self,
+                 is_baby_carrot: bool | None = None,
+                 especificacion: EspecificacionCultivo | None = None):
         """
         Inicializa una Zanahoria.
 
-        Llama al constructor base con los valores de las constantes
-        para superficie y agua inicial (0L segun US-007).
+        Los datos fijos (superficie, agua inicial de 0L segun US-007,
+        tipo e invernadero) se toman de la especificacion compartida;
+        si no se indica, se obtiene la del tipo.
 
         Args:
-            is_baby_carrot (bool): True si es baby carrot, False si es regular.
+            is_baby_carrot (bool | None, optional): True si es baby carrot, False si es regular.
+            especificacion (EspecificacionCultivo | None, optional): Especificacion
+                ya obtenida (ej. la cacheada por el CultivoFactory).
+
+        Raises:
+            ValueError: Si no se indica el tipo ni la especificacion, o si
+                la especificacion no es de una Zanahoria.
         """
-        super().__init__(
-            superficie=C.SUPERFICIE_ZANAHORIA,
-            agua_inicial=C.AGUA_INICIAL_ZANAHORIA
-        )
-        self._is_baby_carrot: bool = is_baby_carrot
-        # US-007 especifica que las zanahorias son a campo abierto
-        self._invernadero: bool = False
+        if especificacion is None:
+            # Cache por tipo: evita armar la clave de 'obtener' en cada cultivo
+            especificacion = Zanahoria._especificaciones.get(is_baby_carrot)
+            if especificacion is None:
+                if is_baby_carrot is None:
+                    raise ValueError("Debe indicarse el tipo o la especificacion de la zanahoria")
+                especificacion = Zanahoria.crear_especificacion(is_baby_carrot)
+                Zanahoria._especificaciones[is_baby_carrot] = especificacion
+        elif especificacion.get_especie() != "Zanahoria":
+            raise ValueError("La especificacion no corresponde a una Zanahoria")
+
+        super().__init__(especificacion)
 
     @override
     def get_tipo(self) -> str:
@@ -49,7 +70,7 @@ class Zanahoria(Cultivo):
         Returns:
             bool: True si es baby carrot.
         """
-        return self._is_baby_carrot
+        return self._especificacion.is_baby_carrot()
 
     def is_invernadero(self) -> bool:
         """
@@ -58,4 +79,30 @@ class Zanahoria(Cultivo):
         Returns:
             bool: True si es de invernadero, False en caso contrario.
         """
-        return self._invernadero
\ No newline at end of file
+        return self._especificacion.is_invernadero()
+
+    @staticmethod
+    def crear_especificacion(is_baby_carrot: bool,
+                             superficie: float = C.SUPERFICIE_ZANAHORIA) -> EspecificacionCultivo:
+        """
+        Obtiene la especificacion (interna) de un tipo de zanahoria.
+        US-007 especifica que las zanahorias son a campo abierto.
+
+        Args:
+            is_baby_carrot (bool): True si es baby carrot.
+            superficie (float, optional): Superficie por zanahoria.
+
+        Returns:
+            EspecificacionCultivo: La especificacion compartida.
+        """
+        return EspecificacionCultivo.obtener(
+            "Zanahoria", superficie, C.AGUA_INICIAL_ZANAHORIA,
+            is_baby_carrot=is_baby_carrot,
+            invernadero=False)
+
+    @override
+    def _migrar_especificacion(self, estado: Dict[str, Any]) -> EspecificacionCultivo:
+        """Migra el tipo y la 'superficie' de una Zanahoria anterior al Flyweight."""
+        estado.pop("_invernadero", None)
+        return Zanahoria.crear_especificacion(
+            estado.pop("_is_baby_carrot"), estado.pop("_superficie", C.SUPERFICIE_ZANAHORIA))
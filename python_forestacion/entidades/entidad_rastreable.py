@@ -0,0 +1,103 @@
+"""
+Modulo de la clase base EntidadRastreable.
+Propaga las modificaciones de una entidad hacia sus contenedores.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Tuple
+
+
+class EntidadRastreable:
+    """
+    Clase base (mixin) para el rastreo de cambios de las entidades.
+
+    Cada entidad conoce a sus contenedores (ej. un Cultivo conoce a
+    su Plantacion, la Plantacion a su RegistroForestal). Cuando una
+    entidad se modifica, notifica el cambio hacia arriba hasta la
+    raiz, que lleva la cuenta de generaciones (dirty tracking).
+
+    Los atributos se definen a nivel de clase como valores por
+    defecto, por lo que las entidades persistidas antes de existir
+    este mecanismo se siguen pudiendo leer.
+
+    Los contenedores NO se persisten (un trabajador compartido entre
+    fincas arrastraria a las demas fincas al archivo de una): cada
+    contenedor vuelve a vincular a sus hijos al deserializarse.
+
+    Referencia: US-021
+    """
+
+    # Sin atributos de instancia propios: permite que las subclases
+    # declaren __slots__ (ej. Cultivo); las demas conservan su __dict__.
+    __slots__ = ()
+
+    # Contenedores de la entidad (tupla inmutable; casi siempre 0 o 1)
+    _contenedores: Tuple[Any, ...] = ()
+
+    def _vincular_contenedor(self, contenedor: Any) -> None:
+        """
+        Registra un contenedor que sera notificado de los cambios.
+
+        Args:
+            contenedor (Any): Entidad (o servicio) que contiene a esta.
+        """
+        if contenedor not in self._contenedores:
+            self._contenedores = self._contenedores + (contenedor,)
+
+    def _desvincular_contenedor(self, contenedor: Any) -> None:
+        """
+        Deja de notificar a un contenedor.
+
+        Args:
+            contenedor (Any): El contenedor a desvincular.
+        """
+        if contenedor in self._contenedores:
+            self._contenedores = tuple(
+                c for c in self._contenedores if c is not contenedor
+            )
+
+    def _notificar_cambio(self, origen: Any, campo: str, delta: float = 0) -> None:
+        """
+        Notifica un cambio a todos los contenedores.
+
+        Args:
+            origen (Any): La entidad que se modifico originalmente.
+            campo (str): Nombre del dato modificado (ej. "agua").
+            delta (float, optional): Variacion numerica del dato, si aplica.
+        """
+        for contenedor in self._contenedores:
+            contenedor._recibir_cambio(self, origen, campo, delta)
+
+    def _recibir_cambio(self, hijo: Any, origen: Any, campo: str, delta: float) -> None:
+        """
+        Recibe el cambio de una entidad contenida.
+        Por defecto lo propaga a los propios contenedores.
+
+        Args:
+            hijo (Any): La entidad contenida que notifico.
+            origen (Any): La entidad que se modifico originalmente.
+            campo (str): Nombre del dato modificado.
+            delta (float): Variacion numerica del dato.
+        """
+        self._notificar_cambio(origen, campo, delta)
+
+    def __getstate__(self) -> Any:
+        """
+        Estado a serializar (Pickle), sin los contenedores.
+        Funciona con __dict__ y con __slots__ (estado (dict, slots)).
+        """
+        estado = super().__getstate__()
+        if isinstance(estado, tuple):
+            return tuple(EntidadRastreable._sin_contenedores(parte) for parte in estado)
+        return EntidadRastreable._sin_contenedores(estado)
+
+    @staticmethod
+    def _sin_contenedores(atributos: Dict[str, Any] | None) -> Dict[str, Any] | None:
+        """
+        Metodo privado que copia un diccionario de atributos sin
+        '_contenedores' (None se conserva).
+        """
+        if not atributos or "_contenedores" not in atributos:
+            return atributos
+        copia = dict(atributos)
+        del copia["_contenedores"]
+        return copia
@@ -1,20 +1,28 @@
 """
 Modulo de la entidad AptoMedico.
 """
-from datetime import date
+from datetime import date, timedelta
+from python_forestacion import constantes as C
 
 class AptoMedico:
     """
     Entidad que representa el certificado de aptitud medica
     de un trabajador.
 
+    El certificado tiene una vigencia (por defecto
+    APTO_MEDICO_VIGENCIA_DIAS) contada desde su emision.
+
     Referencia: US-015
     """
 
+    # Vigencia por defecto (certificados persistidos antes de existir)
+    _vigencia_dias: int = C.APTO_MEDICO_VIGENCIA_DIAS
+
     def __init__(self,
                  apto: bool,
                  fecha_emision: date,
-                 observaciones: str | None = None):
+                 observaciones: str | None = None,
+                 vigencia_dias: int = C.APTO_MEDICO_VIGENCIA_DIAS):
         """
         Inicializa el AptoMedico.
 
@@ -22,10 +30,17 @@ class AptoMedico:
             apto (bool): True si esta apto, False si no.
             fecha_emision (date): Fecha de emision del certificado.
             observaciones (str | None, optional): Observaciones medicas.
+            vigencia_dias (int, optional): Dias de validez desde la emision.
+
+        Raises:
+            ValueError: Si la vigencia es <= 0.
         """
+        if vigencia_dias <= 0:
+            raise ValueError("La vigencia del apto medico debe ser mayor a cero")
         self._apto: bool = apto
         self._fecha_emision: date = fecha_emision
         self._observaciones: str | None = observaciones
+        self._vigencia_dias = vigencia_dias
 
     def esta_apto(self) -> bool:
         """
@@ -36,10 +51,32 @@ class AptoMedico:
         """
         return self._apto
 
+    def esta_vigente(self, fecha: date | None = None) -> bool:
+        """
+        Indica si el certificado sigue vigente en una fecha.
+
+        Args:
+            fecha (date | None, optional): La fecha (por defecto, hoy).
+
+        Returns:
+            bool: True si la fecha es anterior al vencimiento.
+        """
+        if fecha is None:
+            fecha = date.today()
+        return fecha < self.get_fecha_vencimiento()
+
     def get_fecha_emision(self) -> date:
         """Obtiene la fecha de emision del certificado."""
         return self._fecha_emision
 
+    def get_vigencia_dias(self) -> int:
+        """Obtiene los dias de validez del certificado."""
+        return self._vigencia_dias
+
+    def get_fecha_vencimiento(self) -> date:
+        """Obtiene la fecha de vencimiento (primer dia sin vigencia)."""
+        return self._fecha_emision + timedelta(days=self._vigencia_dias)
+
     def get_observaciones(self) -> str | None:
         """Obtiene las observaciones medicas, si existen."""
-        return self._observaciones
\ No newline at end of file
+        return self._observaciones
@@ -0,0 +1,105 @@
+"""
+Modulo de la entidad CalendarioTareas.
+Indice por fecha de las tareas pendientes de un trabajador.
+"""
+from __future__ import annotations
+import heapq
+from datetime import date
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+from python_forestacion.entidades.personal.tarea import EstadoTarea
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.personal.tarea import Tarea
+
+# TypeAlias de una entrada del heap: (-id_tarea, orden de alta, tarea).
+# El id negado ordena por ID descendente (US-016); el orden de alta
+# desempata IDs repetidos sin comparar tareas.
+EntradaTarea = Tuple[int, int, "Tarea"]
+
+
+class CalendarioTareas:
+    """
+    Calendario de tareas PENDIENTES indexado por fecha.
+
+    - Cada fecha tiene un heap de sus tareas pendientes, ordenado
+      por ID descendente.
+    - Un contador de pendientes por fecha se actualiza con los
+      cambios de estado (eventos "estado" del rastreo de cambios).
+      Las tareas completadas salen del heap en forma diferida y,
+      cuando una fecha queda sin pendientes, se borra entera.
+
+    Asi, consultar las tareas pendientes de un dia cuesta
+    O(k log k) en las k tareas de ese dia, y no O(total de tareas).
+
+    Referencia: US-014, US-016
+    """
+
+    def __init__(self):
+        """Inicializa el calendario vacio."""
+        self._heaps: Dict[date, List[EntradaTarea]] = {}
+        self._pendientes: Dict[date, int] = {}
+        self._siguiente_orden: int = 0
+
+    def agregar(self, tarea: Tarea) -> None:
+        """
+        Agrega una tarea al calendario (se ignora si ya no esta pendiente).
+
+        Args:
+            tarea (Tarea): La tarea.
+        """
+        if tarea.get_estado() != EstadoTarea.PENDIENTE:
+            return
+        fecha = tarea.get_fecha()
+        heap = self._heaps.get(fecha)
+        if heap is None:
+            heap = self._heaps[fecha] = []
+        heapq.heappush(heap, (-tarea.get_id_tarea(), self._siguiente_orden, tarea))
+        self._siguiente_orden += 1
+        self._pendientes[fecha] = self._pendientes.get(fecha, 0) + 1
+
+    def registrar_completada(self, tarea: Tarea) -> None:
+        """
+        Actualiza el indice cuando una tarea pasa a COMPLETADA.
+
+        Args:
+            tarea (Tarea): La tarea completada.
+        """
+        fecha = tarea.get_fecha()
+        restantes = self._pendientes.get(fecha)
+        if restantes is None:
+            return
+        if restantes <= 1:
+            del self._pendientes[fecha]
+            del self._heaps[fecha]
+        else:
+            self._pendientes[fecha] = restantes - 1
+
+    def get_pendientes(self, fecha: date) -> List[Tarea]:
+        """
+        Obtiene las tareas pendientes de una fecha, por ID descendente.
+
+        Args:
+            fecha (date): La fecha.
+
+        Returns:
+            List[Tarea]: Las tareas pendientes (lista nueva).
+        """
+        heap = self._heaps.get(fecha)
+        if not heap:
+            return []
+
+        # Descarta en el heap las entradas de tareas ya completadas
+        if len(heap) != self._pendientes[fecha]:
+            heap[:] = [e for e in heap if e[2].get_estado() == EstadoTarea.PENDIENTE]
+            heapq.heapify(heap)
+
+        return [entrada[2] for entrada in sorted(heap)]
+
+    def get_cantidad_pendientes(self, fecha: date) -> int:
+        """Obtiene la cantidad de tareas pendientes de una fecha."""
+        return self._pendientes.get(fecha, 0)
+
+    def get_fechas_pendientes(self) -> List[date]:
+        """Obtiene las fechas con tareas pendientes, ordenadas."""
+        return sorted(self._pendientes)
@@ -3,6 +3,8 @@ Modulo de la entidad Tarea.
 """
 from datetime import date
 from enum import Enum
+from python_forestacion.entidades.entidad_rastreable import EntidadRastreable
+from python_forestacion import constantes as C
 
 class EstadoTarea(Enum):
     """
@@ -11,17 +13,21 @@ class EstadoTarea(Enum):
     PENDIENTE = "Pendiente"
     COMPLETADA = "Completada"
 
-class Tarea:
+class Tarea(EntidadRastreable):
     """
     Entidad que representa una tarea agricola asignada.
 
     Referencia: US-014
     """
 
+    # Duracion por defecto (tareas persistidas antes de existir)
+    _duracion_horas: float = C.TAREA_DURACION_HORAS
+
     def __init__(self,
                  id_tarea: int,
                  fecha: date,
-                 descripcion: str):
+                 descripcion: str,
+                 duracion_horas: float = C.TAREA_DURACION_HORAS):
         """
         Inicializa la Tarea.
 
@@ -29,10 +35,17 @@ class Tarea:
             id_tarea (int): ID unico de la tarea.
             fecha (date): Fecha programada para la tarea.
             descripcion (str): Descripcion (ej. "Desmalezar").
+            duracion_horas (float, optional): Duracion estimada en horas.
+
+        Raises:
+            ValueError: Si la duracion es <= 0.
         """
+        if duracion_horas <= 0:
+            raise ValueError("La duracion de la tarea debe ser mayor a cero")
         self._id_tarea: int = id_tarea
         self._fecha: date = fecha
         self._descripcion: str = descripcion
+        self._duracion_horas = duracion_horas
         self._estado: EstadoTarea = EstadoTarea.PENDIENTE # Siempre inicia PENDIENTE
 
     def get_id_tarea(self) -> int:
@@ -47,6 +60,10 @@ class Tarea:
         """Obtiene la descripcion de la tarea."""
         return self._descripcion
 
+    def get_duracion_horas(self) -> float:
+        """Obtiene la duracion estimada de la tarea en horas."""
+        return self._duracion_horas
+
     def get_estado(self) -> EstadoTarea:
         """Obtiene el estado actual de la tarea."""
         return self._estado
@@ -55,5 +72,11 @@ class Tarea:
         """
         Marca la tarea como COMPLETADA.
         (Necesario para US-016)
+
+        Solo notifica el cambio en la transicion (completar una
+        tarea ya completada no tiene efecto).
         """
-        self._estado = EstadoTarea.COMPLETADA
\ No newline at end of file
+        if self._estado == EstadoTarea.COMPLETADA:
+            return
+        self._estado = EstadoTarea.COMPLETADA
+        self._notificar_cambio(self, "estado")
\ No newline at end of file
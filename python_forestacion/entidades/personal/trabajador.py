@@ -1,20 +1,29 @@
 """
 Modulo de la entidad Trabajador.
 """
-from typing import List
-from python_forestacion.entidades.personal.tarea import Tarea
+from datetime import date
+from typing import Any, Dict, List
+from python_forestacion.entidades.personal.tarea import Tarea, EstadoTarea
+from python_forestacion.entidades.personal.calendario_tareas import CalendarioTareas
 from python_forestacion.entidades.personal.apto_medico import AptoMedico
+from python_forestacion.entidades.entidad_rastreable import EntidadRastreable
 
-class Trabajador:
+class Trabajador(EntidadRastreable):
     """
     Entidad que representa a un trabajador agricola.
 
     Contiene sus datos personales, la lista de tareas asignadas
     y su certificado de apto medico.
 
+    Las tareas pendientes se indexan ademas en un CalendarioTareas
+    (por fecha), que se mantiene con los cambios de estado.
+
     Referencia: US-014
     """
 
+    # Calendario por defecto (trabajadores persistidos antes de existir)
+    _calendario: CalendarioTareas | None = None
+
     def __init__(self,
                  dni: int,
                  nombre: str,
@@ -38,6 +47,11 @@ class Trabajador:
         
         # Guardamos una copia para cumplir con US-014 (inmutabilidad)
         self._tareas: List[Tarea] = tareas.copy()
+        self._calendario = CalendarioTareas()
+        for tarea in self._tareas:
+            # Los cambios de estado de las tareas modifican al trabajador
+            tarea._vincular_contenedor(self)
+            self._calendario.agregar(tarea)
         
         # US-014: Inicia sin apto medico
         self._apto_medico: AptoMedico | None = None
@@ -77,4 +91,73 @@ class Trabajador:
         Args:
             apto (AptoMedico): El nuevo certificado de apto medico.
         """
-        self._apto_medico = apto
\ No newline at end of file
+        self._apto_medico = apto
+        self._notificar_cambio(self, "apto_medico")
+
+    def get_tareas_pendientes(self, fecha: date) -> List[Tarea]:
+        """
+        Obtiene las tareas PENDIENTES de una fecha, ordenadas por ID
+        descendente (US-016), sin recorrer todas las tareas.
+
+        Args:
+            fecha (date): La fecha de las tareas.
+
+        Returns:
+            List[Tarea]: Las tareas pendientes del dia (lista nueva).
+        """
+        return self._get_calendario().get_pendientes(fecha)
+
+    def completar_tareas_del_dia(self, fecha: date) -> List[Tarea]:
+        """
+        Completa todas las tareas pendientes de una fecha, en orden
+        de ID descendente.
+
+        Args:
+            fecha (date): La fecha de las tareas.
+
+        Returns:
+            List[Tarea]: Las tareas completadas, en el orden de ejecucion.
+        """
+        tareas = self.get_tareas_pendientes(fecha)
+        for tarea in tareas:
+            # Cada cambio de estado actualiza el calendario (via evento)
+            tarea.completar_tarea()
+        return tareas
+
+    def get_fechas_pendientes(self) -> List[date]:
+        """Obtiene las fechas con tareas pendientes, ordenadas."""
+        return self._get_calendario().get_fechas_pendientes()
+
+    def _get_calendario(self) -> CalendarioTareas:
+        """
+        Metodo privado que obtiene el calendario, reconstruyendolo (y
+        vinculando las tareas) si el trabajador se persistio antes de existir.
+        """
+        if self._calendario is None:
+            calendario = CalendarioTareas()
+            for tarea in self._tareas:
+                tarea._vincular_contenedor(self)
+                calendario.agregar(tarea)
+            self._calendario = calendario
+        return self._calendario
+
+    def __setstate__(self, estado: Dict[str, Any]) -> None:
+        """
+        Restaura el trabajador (Pickle): vuelve a vincular sus tareas
+        (los contenedores no se persisten) y reconstruye el calendario
+        si se persistio antes de existir.
+        """
+        self.__dict__.update(estado)
+        self._get_calendario()
+        for tarea in self._tareas:
+            tarea._vincular_contenedor(self)
+
+    def _recibir_cambio(self, hijo: Any, origen: Any, campo: str, delta: float) -> None:
+        """
+        Recibe el cambio de una tarea: si se completo, actualiza el
+        calendario; luego lo propaga a las plantaciones.
+        """
+        if (campo == "estado" and origen is hijo
+                and hijo.get_estado() == EstadoTarea.COMPLETADA):
+            self._get_calendario().registrar_completada(hijo)
+        self._notificar_cambio(origen, campo, delta)
@@ -0,0 +1,169 @@
+"""
+Modulo de las entidades EstadisticaEspecie y EstadisticasCultivos.
+Agregados (contadores y sumas) por especie, mantenidos incrementalmente.
+"""
+from __future__ import annotations
+from typing import Any, Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.cultivos.cultivo import Cultivo
+
+
+class EstadisticaEspecie:
+    """
+    Agregados de una especie: cantidad de cultivos, superficie,
+    agua almacenada y altura (suma; solo arboles).
+    """
+
+    def __init__(self,
+                 cantidad: int = 0,
+                 superficie: float = 0.0,
+                 agua: int = 0,
+                 altura: float = 0.0):
+        """
+        Inicializa los agregados.
+
+        Args:
+            cantidad (int, optional): Cantidad de cultivos.
+            superficie (float, optional): Superficie total en m².
+            agua (int, optional): Agua total almacenada en litros.
+            altura (float, optional): Suma de alturas en metros.
+        """
+        self._cantidad: int = cantidad
+        self._superficie: float = superficie
+        self._agua: int = agua
+        self._altura: float = altura
+
+    def get_cantidad(self) -> int:
+        """Obtiene la cantidad de cultivos."""
+        return self._cantidad
+
+    def get_superficie(self) -> float:
+        """Obtiene la superficie total ocupada en m²."""
+        return self._superficie
+
+    def get_agua(self) -> int:
+        """Obtiene el agua total almacenada en litros."""
+        return self._agua
+
+    def get_altura_total(self) -> float:
+        """Obtiene la suma de alturas en metros (0 si no son arboles)."""
+        return self._altura
+
+    def get_altura_promedio(self) -> float:
+        """Obtiene la altura promedio en metros (0 si no hay cultivos)."""
+        return self._altura / self._cantidad if self._cantidad else 0.0
+
+    def get_agua_promedio(self) -> float:
+        """Obtiene el agua promedio por cultivo en litros."""
+        return self._agua / self._cantidad if self._cantidad else 0.0
+
+    def sumar(self, cantidad: int, superficie: float, agua: int, altura: float) -> None:
+        """
+        Suma (o resta, con valores negativos) a los agregados.
+
+        Args:
+            cantidad (int): Variacion de la cantidad.
+            superficie (float): Variacion de la superficie.
+            agua (int): Variacion del agua.
+            altura (float): Variacion de la suma de alturas.
+        """
+        self._cantidad += cantidad
+        self._superficie += superficie
+        self._agua += agua
+        self._altura += altura
+
+    def copiar(self) -> EstadisticaEspecie:
+        """Obtiene una COPIA independiente de los agregados."""
+        return EstadisticaEspecie(self._cantidad, self._superficie,
+                                  self._agua, self._altura)
+
+
+class EstadisticasCultivos:
+    """
+    Conjunto de agregados por especie (nombre de get_tipo()).
+
+    Se actualiza con los mismos eventos del rastreo de cambios
+    (alta/baja de cultivos, variacion de agua y altura), por lo que
+    las consultas cuestan O(especies) y no O(cultivos).
+
+    Referencia: US-008, US-018
+    """
+
+    # Eventos (campos) que afectan a los agregados
+    CAMPOS_CULTIVO = frozenset(("alta_cultivo", "baja_cultivo", "agua", "altura"))
+
+    def __init__(self):
+        """Inicializa los agregados vacios."""
+        self._por_especie: Dict[str, EstadisticaEspecie] = {}
+
+    def agregar_cultivo(self, cultivo: Cultivo, signo: int = 1) -> None:
+        """
+        Suma (signo=1) o resta (signo=-1) el aporte completo de un cultivo.
+
+        Args:
+            cultivo (Cultivo): El cultivo.
+            signo (int, optional): 1 para alta, -1 para baja.
+        """
+        get_altura = getattr(cultivo, "get_altura", None)
+        altura = get_altura() if get_altura is not None else 0.0
+        self._obtener(cultivo.get_tipo()).sumar(
+            signo, signo * cultivo.get_superficie(),
+            signo * cultivo.get_agua(), signo * altura)
+
+    def aplicar_cambio(self, origen: Any, campo: str, delta: float) -> None:
+        """
+        Aplica un evento del rastreo de cambios. Los eventos que no
+        son de cultivos se ignoran.
+
+        Args:
+            origen (Any): La entidad que se modifico.
+            campo (str): El dato modificado.
+            delta (float): La variacion del dato.
+        """
+        if campo not in EstadisticasCultivos.CAMPOS_CULTIVO:
+            return
+        if campo == "agua":
+            self._obtener(origen.get_tipo()).sumar(0, 0.0, int(delta), 0.0)
+        elif campo == "altura":
+            self._obtener(origen.get_tipo()).sumar(0, 0.0, 0, delta)
+        elif campo == "alta_cultivo":
+            self.agregar_cultivo(origen, 1)
+        else:
+            self.agregar_cultivo(origen, -1)
+
+    def combinar(self, otras: EstadisticasCultivos, signo: int = 1) -> None:
+        """
+        Suma (o resta) todos los agregados de otro conjunto.
+
+        Args:
+            otras (EstadisticasCultivos): Los agregados a combinar.
+            signo (int, optional): 1 para sumar, -1 para restar.
+        """
+        for especie, est in otras._por_especie.items():
+            self._obtener(especie).sumar(
+                signo * est.get_cantidad(), signo * est.get_superficie(),
+                signo * est.get_agua(), signo * est.get_altura_total())
+
+    def get_por_especie(self) -> Dict[str, EstadisticaEspecie]:
+        """
+        Obtiene una COPIA de los agregados por especie
+        (omite especies sin cultivos).
+
+        Returns:
+            Dict[str, EstadisticaEspecie]: especie -> agregados.
+        """
+        return {
+            especie: est.copiar()
+            for especie, est in self._por_especie.items()
+            if est.get_cantidad() > 0
+        }
+
+    def _obtener(self, especie: str) -> EstadisticaEspecie:
+        """
+        Metodo privado que obtiene (o crea) los agregados de una especie.
+        """
+        est = self._por_especie.get(especie)
+        if est is None:
+            est = self._por_especie[especie] = EstadisticaEspecie()
+        return est
@@ -2,7 +2,11 @@
 Modulo de la entidad Plantacion (Finca).
 """
 from __future__ import annotations
-from typing import List, TYPE_CHECKING
+from typing import Any, Dict, Iterator, List, TYPE_CHECKING
+from python_forestacion.entidades.entidad_rastreable import EntidadRastreable
+from python_forestacion.entidades.terrenos.estadisticas_cultivos import (
+    EstadisticaEspecie, EstadisticasCultivos
+)
 
 # Se usa TYPE_CHECKING para evitar importaciones circulares
 if TYPE_CHECKING:
@@ -10,7 +14,7 @@ if TYPE_CHECKING:
     from python_forestacion.entidades.personal.trabajador import Trabajador
     from python_forestacion.entidades.terrenos.tierra import Tierra
 
-class Plantacion:
+class Plantacion(EntidadRastreable):
     """
     Entidad que representa la plantacion o finca.
 
@@ -21,6 +25,10 @@ class Plantacion:
     """
     AGUA_INICIAL_DEFAULT = 500 # Litros (de US-002)
 
+    # Default de clase: plantaciones persistidas sin agregados los
+    # reconstruyen la primera vez que se necesitan.
+    _estadisticas: EstadisticasCultivos | None = None
+
     def __init__(self,
                  nombre: str,
                  superficie_maxima: float,
@@ -44,6 +52,9 @@ class Plantacion:
         self._cultivos: List[Cultivo] = []
         self._trabajadores: List[Trabajador] = []
 
+        # Agregados por especie, mantenidos incrementalmente
+        self._estadisticas = EstadisticasCultivos()
+
     def get_nombre(self) -> str:
         """Obtiene el nombre de la plantacion."""
         return self._nombre
@@ -70,7 +81,9 @@ class Plantacion:
             raise ValueError("La superficie ocupada no puede ser negativa")
         if superficie > self._superficie_maxima:
             raise ValueError("La superficie ocupada no puede superar la maxima")
+        anterior = self._superficie_ocupada
         self._superficie_ocupada = superficie
+        self._notificar_cambio(self, "superficie_ocupada", superficie - anterior)
         
     def get_superficie_disponible(self) -> float:
         """
@@ -98,7 +111,9 @@ class Plantacion:
         """
         if agua < 0:
             raise ValueError("El agua no puede ser negativa")
+        anterior = self._agua_disponible
         self._agua_disponible = agua
+        self._notificar_cambio(self, "agua_disponible", agua - anterior)
         
     def get_tierra(self) -> Tierra:
         """Obtiene la entidad Tierra asociada."""
@@ -116,9 +131,24 @@ class Plantacion:
         """
         return self._cultivos.copy()
 
+    def iterar_cultivos(self) -> Iterator[Cultivo]:
+        """
+        Itera los cultivos SIN copiar la lista (para recorridos
+        masivos como exportaciones en memoria constante).
+        La plantacion no debe modificarse durante la iteracion.
+
+        Returns:
+            Iterator[Cultivo]: Un iterador sobre los cultivos.
+        """
+        return iter(self._cultivos)
+
     def add_cultivo(self, cultivo: Cultivo) -> None:
         """Añade un cultivo a la plantacion."""
         self._cultivos.append(cultivo)
+        self._get_estadisticas_internas().agregar_cultivo(cultivo)
+        # Los cambios del cultivo (agua, altura) modifican a la plantacion
+        cultivo._vincular_contenedor(self)
+        self._notificar_cambio(cultivo, "alta_cultivo")
 
     def remove_cultivo(self, cultivo: Cultivo) -> None:
         """
@@ -127,6 +157,9 @@ class Plantacion:
         """
         if cultivo in self._cultivos:
             self._cultivos.remove(cultivo)
+            self._get_estadisticas_internas().agregar_cultivo(cultivo, -1)
+            cultivo._desvincular_contenedor(self)
+            self._notificar_cambio(cultivo, "baja_cultivo")
 
     def get_trabajadores(self) -> List[Trabajador]:
         """
@@ -146,4 +179,57 @@ class Plantacion:
         Args:
             trabajadores (List[Trabajador]): La nueva lista de trabajadores.
         """
-        self._trabajadores = trabajadores.copy()
\ No newline at end of file
+        for trabajador in self._trabajadores:
+            trabajador._desvincular_contenedor(self)
+
+        self._trabajadores = trabajadores.copy()
+        for trabajador in self._trabajadores:
+            trabajador._vincular_contenedor(self)
+        self._notificar_cambio(self, "trabajadores")
+
+    # --- Agregados por especie (mantenidos incrementalmente) ---
+
+    def get_estadisticas(self) -> Dict[str, EstadisticaEspecie]:
+        """
+        Obtiene una COPIA de los agregados por especie (cantidad,
+        superficie, agua y altura) sin recorrer los cultivos.
+
+        Returns:
+            Dict[str, EstadisticaEspecie]: especie -> agregados.
+        """
+        return self._get_estadisticas_internas().get_por_especie()
+
+    def _get_estadisticas_internas(self) -> EstadisticasCultivos:
+        """
+        Metodo privado que obtiene los agregados, reconstruyendolos
+        si la plantacion se persistio antes de existir.
+        """
+        if self._estadisticas is None:
+            estadisticas = EstadisticasCultivos()
+            for cultivo in self._cultivos:
+                estadisticas.agregar_cultivo(cultivo)
+                cultivo._vincular_contenedor(self)
+            self._estadisticas = estadisticas
+        return self._estadisticas
+
+    def __setstate__(self, estado: Dict[str, Any]) -> None:
+        """
+        Restaura la plantacion (Pickle): vuelve a vincular cultivos y
+        trabajadores (los contenedores no se persisten) y reconstruye
+        los agregados si se persistio antes de existir, ANTES de que
+        llegue cualquier cambio (asi no se cuenta dos veces).
+        """
+        self.__dict__.update(estado)
+        self._get_estadisticas_internas()
+        for cultivo in self._cultivos:
+            cultivo._vincular_contenedor(self)
+        for trabajador in self._trabajadores:
+            trabajador._vincular_contenedor(self)
+
+    def _recibir_cambio(self, hijo: Any, origen: Any, campo: str, delta: float) -> None:
+        """
+        Recibe el cambio de un cultivo (agua, altura) o trabajador:
+        actualiza los agregados y lo propaga al registro.
+        """
+        self._get_estadisticas_internas().aplicar_cambio(origen, campo, delta)
+        self._notificar_cambio(origen, campo, delta)
\ No newline at end of file
@@ -2,22 +2,33 @@
 Modulo de la entidad RegistroForestal.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Any, Dict, TYPE_CHECKING
+from python_forestacion.entidades.entidad_rastreable import EntidadRastreable
 
 if TYPE_CHECKING:
     from python_forestacion.entidades.terrenos.tierra import Tierra
     from python_forestacion.entidades.terrenos.plantacion import Plantacion
 
-class RegistroForestal:
+class RegistroForestal(EntidadRastreable):
     """
     Entidad que representa el registro oficial completo de la finca.
 
     Agrupa la Tierra, la Plantacion, el Propietario y el Avaluo.
     Esta es la entidad principal que se persiste en disco.
 
+    Es la raiz del rastreo de cambios: cualquier modificacion de su
+    Tierra, Plantacion, cultivos o trabajadores incrementa su
+    generacion. El registro esta "modificado" (dirty) si su
+    generacion difiere de la ultima generacion persistida.
+
     Referencia: US-003
     """
 
+    # Defaults de clase: registros persistidos antes del rastreo
+    # de cambios se leen como "sin modificar".
+    _generacion: int = 0
+    _generacion_persistida: int = 0
+
     def __init__(self,
                  id_padron: int,
                  tierra: Tierra,
@@ -46,6 +57,12 @@ class RegistroForestal:
         self._propietario: str = propietario
         self._avaluo: float = avaluo
 
+        # Un registro nuevo nunca fue persistido: inicia modificado
+        self._generacion = 0
+        self._generacion_persistida = -1
+        tierra._vincular_contenedor(self)
+        plantacion._vincular_contenedor(self)
+
     def get_id_padron(self) -> int:
         """Obtiene el ID del padron."""
         return self._id_padron
@@ -64,4 +81,60 @@ class RegistroForestal:
 
     def get_avaluo(self) -> float:
         """Obtiene el avaluo fiscal."""
-        return self._avaluo
\ No newline at end of file
+        return self._avaluo
+
+    # --- Rastreo de cambios (dirty tracking) ---
+
+    def get_generacion(self) -> int:
+        """Obtiene la generacion actual (cantidad de modificaciones)."""
+        return self._generacion
+
+    def is_modificado(self) -> bool:
+        """
+        Indica si el registro cambio desde la ultima persistencia.
+
+        Returns:
+            bool: True si hay cambios sin persistir.
+        """
+        return self._generacion != self._generacion_persistida
+
+    def marcar_persistido(self, generacion: int) -> None:
+        """
+        Registra que el estado de una generacion quedo persistido.
+
+        Args:
+            generacion (int): La generacion que se escribio en disco
+                (tomada ANTES de serializar, para no perder cambios
+                concurrentes con la escritura).
+        """
+        self._generacion_persistida = generacion
+
+    def _recibir_cambio(self, hijo: Any, origen: Any, campo: str, delta: float) -> None:
+        """
+        Recibe el cambio de una entidad contenida: incrementa la
+        generacion y lo propaga a los contenedores del registro.
+        """
+        self._generacion += 1
+        self._notificar_cambio(origen, campo, delta)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Estado a serializar (Pickle).
+
+        - Los contenedores del registro (ej. servicios que lo gestionan)
+          no forman parte de la entidad y no se persisten.
+        - La copia persistida queda marcada como "sin modificar".
+        """
+        estado = dict(super().__getstate__())
+        estado['_generacion_persistida'] = self._generacion
+        return estado
+
+    def __setstate__(self, estado: Dict[str, Any]) -> None:
+        """
+        Restaura el registro (Pickle) y vuelve a vincular su Tierra y
+        su Plantacion, para que sus cambios lo marquen como modificado
+        (tambien en registros persistidos antes del rastreo).
+        """
+        self.__dict__.update(estado)
+        self._tierra._vincular_contenedor(self)
+        self._plantacion._vincular_contenedor(self)
\ No newline at end of file
@@ -3,13 +3,14 @@ Modulo de la entidad Tierra.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING
+from python_forestacion.entidades.entidad_rastreable import EntidadRastreable
 
 # Se usa TYPE_CHECKING para evitar importaciones circulares
 # en tiempo de ejecucion.
 if TYPE_CHECKING:
     from python_forestacion.entidades.terrenos.plantacion import Plantacion
 
-class Tierra:
+class Tierra(EntidadRastreable):
     """
     Entidad que representa un terreno forestal.
 
@@ -65,7 +66,9 @@ class Tierra:
         """
         if superficie <= 0:
             raise ValueError("La superficie debe ser mayor a cero")
+        anterior = self._superficie
         self._superficie = superficie
+        self._notificar_cambio(self, "superficie", superficie - anterior)
 
     def get_domicilio(self) -> str:
         """Obtiene el domicilio del terreno."""
@@ -82,4 +85,5 @@ class Tierra:
         Args:
             plantacion (Plantacion): La instancia de la plantacion.
         """
-        self._finca = plantacion
\ No newline at end of file
+        self._finca = plantacion
+        self._notificar_cambio(self, "finca")
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""
+Modulo de la Excepcion HerramientaNoDisponibleException
+"""
+from .forestacion_exception import ForestacionException
+
+class HerramientaNoDisponibleException(ForestacionException):
+    """
+    Excepcion lanzada cuando un trabajador no obtiene una herramienta
+    del pool compartido dentro del tiempo de espera.
+    """
+    def __init__(self, mensaje_tecnico: str, mensaje_usuario: str):
+        """
+        Inicializa la excepcion de herramienta no disponible.
+
+        Args:
+            mensaje_tecnico (str): Mensaje tecnico detallado.
+            mensaje_usuario (str): Mensaje amigable para el usuario.
+        """
+        super().__init__(mensaje_tecnico, mensaje_usuario)
@@ -12,6 +12,10 @@ USR_AGUA_AGOTADA = "No hay suficiente agua en la plantacion para regar."
 TEC_SUPERFICIE_INSUFICIENTE = "Superficie disponible ({}) es menor que la requerida ({})"
 USR_SUPERFICIE_INSUFICIENTE = "No hay suficiente espacio en la plantacion."
 
+# HerramientaNoDisponibleException
+TEC_HERRAMIENTA_NO_DISPONIBLE = "Timeout ({} s) esperando una herramienta del pool ({} en espera)"
+USR_HERRAMIENTA_NO_DISPONIBLE = "No hay herramientas certificadas disponibles para trabajar."
+
 # --- Mensajes de Excepciones de Persistencia ---
 
 # Leer
@@ -1,6 +1,7 @@
 """
 Modulo de la implementacion del Patron Factory Method.
 """
+from typing import Callable, Dict, List
 from typing_extensions import override
 from python_forestacion.entidades.cultivos.cultivo import Cultivo
 from python_forestacion.entidades.cultivos.pino import Pino
@@ -8,6 +9,7 @@ from python_forestacion.entidades.cultivos.olivo import Olivo
 from python_forestacion.entidades.cultivos.lechuga import Lechuga
 from python_forestacion.entidades.cultivos.zanahoria import Zanahoria
 from python_forestacion.entidades.cultivos.tipo_aceituna import TipoAceituna
+from python_forestacion.entidades.cultivos.especificacion_cultivo import EspecificacionCultivo
 
 
 class CultivoFactory:
@@ -17,32 +19,103 @@ class CultivoFactory:
     Centraliza la logica de instanciacion, desacoplando al cliente
     (ej. PlantacionService) de las clases concretas.
 
+    El diccionario de creadores se arma UNA sola vez (a nivel de
+    clase) y se extiende con 'registrar_creador', por lo que agregar
+    una especie no requiere modificar esta clase.
+
+    Las especificaciones por defecto de cada especie (Flyweight) se
+    cachean tambien a nivel de clase: todos los cultivos creados
+    comparten la misma instancia.
+
     Referencia: US-TECH-002, Rubrica 1.2, Rubrica Auto FACT-*
     """
 
+    # especie -> metodo creador. Se reemplaza (copy-on-write) al
+    # registrar, asi los lectores nunca ven un diccionario a medio armar.
+    _creadores: Dict[str, Callable[[], Cultivo]] = {}
+
+    # especie -> especificacion por defecto (compartida por los cultivos)
+    _especificaciones: Dict[str, EspecificacionCultivo] = {}
+
     @staticmethod
     def _crear_pino() -> Cultivo:
         """Metodo factory privado para crear Pino."""
-        # US-004: Variedad por defecto
-        return Pino(variedad="Parana")
+        return Pino(especificacion=CultivoFactory._especificaciones["Pino"])
 
     @staticmethod
     def _crear_olivo() -> Cultivo:
         """Metodo factory privado para crear Olivo."""
-        # US-005: Tipo de aceituna por defecto
-        return Olivo(tipo_aceituna=TipoAceituna.ARBEQUINA)
+        return Olivo(especificacion=CultivoFactory._especificaciones["Olivo"])
 
     @staticmethod
     def _crear_lechuga() -> Cultivo:
         """Metodo factory privado para crear Lechuga."""
-        # US-006: Variedad por defecto
-        return Lechuga(variedad="Crespa")
+        return Lechuga(especificacion=CultivoFactory._especificaciones["Lechuga"])
 
     @staticmethod
     def _crear_zanahoria() -> Cultivo:
         """Metodo factory privado para crear Zanahoria."""
-        # US-007: Tipo por defecto (no baby carrot)
-        return Zanahoria(is_baby_carrot=False)
+        return Zanahoria(especificacion=CultivoFactory._especificaciones["Zanahoria"])
+
+    @classmethod
+    def registrar_creador(cls, especie: str, creador: Callable[[], Cultivo]) -> None:
+        """
+        Registra (o reemplaza) el creador de una especie.
+
+        Args:
+            especie (str): Nombre de la especie (ej. "Pino").
+            creador (Callable[[], Cultivo]): Funcion sin argumentos que
+                crea un cultivo de la especie con sus valores por defecto.
+
+        Raises:
+            ValueError: Si el nombre de la especie esta vacio.
+        """
+        if not especie:
+            raise ValueError("El nombre de la especie no puede estar vacio")
+        cls._creadores = {**cls._creadores, especie: creador}
+
+    @classmethod
+    def get_creador(cls, especie: str) -> Callable[[], Cultivo]:
+        """
+        Obtiene el creador registrado de una especie.
+
+        Args:
+            especie (str): Nombre de la especie.
+
+        Raises:
+            ValueError: Si la especie es desconocida.
+
+        Returns:
+            Callable[[], Cultivo]: El creador de la especie.
+        """
+        creador = cls._creadores.get(especie)
+        if creador is None:
+            raise ValueError(f"Especie de cultivo desconocida: {especie}")
+        return creador
+
+    @classmethod
+    def get_especificacion(cls, especie: str) -> EspecificacionCultivo:
+        """
+        Obtiene la especificacion por defecto (cacheada) de una especie.
+
+        Args:
+            especie (str): Nombre de la especie (ej. "Pino").
+
+        Raises:
+            ValueError: Si la especie no tiene especificacion cacheada.
+
+        Returns:
+            EspecificacionCultivo: La especificacion compartida.
+        """
+        especificacion = cls._especificaciones.get(especie)
+        if especificacion is None:
+            raise ValueError(f"Especie sin especificacion por defecto: {especie}")
+        return especificacion
+
+    @classmethod
+    def get_especies(cls) -> List[str]:
+        """Obtiene los nombres de las especies que se pueden crear."""
+        return list(cls._creadores)
 
     @staticmethod
     def crear_cultivo(especie: str) -> Cultivo:
@@ -61,20 +134,28 @@ class CultivoFactory:
         Returns:
             Cultivo: Una instancia de una subclase de Cultivo.
         """
-        # El diccionario de factories exigido por la rubrica.
-        # NO USAR LAMBDAS (Rubrica 3.4)
-        factories = {
-            "Pino": CultivoFactory._crear_pino,
-            "Olivo": CultivoFactory._crear_olivo,
-            "Lechuga": CultivoFactory._crear_lechuga,
-            "Zanahoria": CultivoFactory._crear_zanahoria
-        }
-
-        if especie not in factories:
-            raise ValueError(f"Especie de cultivo desconocida: {especie}")
+        # Llama al metodo factory correspondiente (sin ifs ni lambdas)
+        creador_cultivo = CultivoFactory.get_creador(especie)
+        return creador_cultivo()
+
+
+# El diccionario de factories exigido por la rubrica.
+# NO USAR LAMBDAS (Rubrica 3.4)
+CultivoFactory._creadores = {
+    "Pino": CultivoFactory._crear_pino,
+    "Olivo": CultivoFactory._crear_olivo,
+    "Lechuga": CultivoFactory._crear_lechuga,
+    "Zanahoria": CultivoFactory._crear_zanahoria
+}
 
-        # Llama al metodo factory privado correspondiente
-        creador_cultivo = factories[especie]
-        cultivo_creado = creador_cultivo()
-        
-        return cultivo_creado
\ No newline at end of file
+# Especificaciones por defecto (Flyweight), obtenidas una sola vez
+CultivoFactory._especificaciones = {
+    # US-004: Variedad por defecto
+    "Pino": Pino.crear_especificacion("Parana"),
+    # US-005: Tipo de aceituna por defecto
+    "Olivo": Olivo.crear_especificacion(TipoAceituna.ARBEQUINA),
+    # US-006: Variedad por defecto
+    "Lechuga": Lechuga.crear_especificacion("Crespa"),
+    # US-007: Tipo por defecto (no baby carrot)
+    "Zanahoria": Zanahoria.crear_especificacion(False)
+}
@@ -35,4 +35,18 @@ class AbsorcionAguaStrategy(ABC):
         Returns:
             int: La cantidad de agua absorbida en litros.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def es_cacheable(self) -> bool:
+        """
+        Contrato de cacheabilidad de la estrategia.
+
+        Una estrategia es cacheable si, para una fecha dada, devuelve
+        el MISMO valor para todos los cultivos de una especie (no lee
+        datos propios del cultivo). El ContextoRiego la evalua una vez
+        por especie y ciclo. Por defecto no lo es (evaluacion por cultivo).
+
+        Returns:
+            bool: True si el resultado solo depende de la fecha y la especie.
+        """
+        return False
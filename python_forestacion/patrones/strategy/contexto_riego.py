@@ -0,0 +1,84 @@
+"""
+Modulo de la clase ContextoRiego.
+Contexto de un ciclo de riego: fecha unica y memoizacion de estrategias.
+"""
+from __future__ import annotations
+from datetime import date
+from typing import Dict, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.cultivos.cultivo import Cultivo
+    from python_forestacion.patrones.strategy.absorcion_agua_strategy import AbsorcionAguaStrategy
+
+
+class ContextoRiego:
+    """
+    Contexto de UN ciclo de riego.
+
+    - Resuelve la fecha una sola vez para todo el ciclo.
+    - Memoiza el resultado de las estrategias cacheables
+      (es_cacheable() == True) por (estrategia, especie): se evaluan
+      una vez y el resto de los cultivos de la especie reusa el valor.
+    - Las estrategias no cacheables (dependen del cultivo) se
+      evaluan siempre, cultivo por cultivo.
+
+    Un contexto no debe reusarse entre ciclos (la fecha y los
+    valores memoizados quedarian viejos).
+
+    Referencia: US-008, US-TECH-004
+    """
+
+    def __init__(self, fecha: date | None = None):
+        """
+        Inicializa el contexto del ciclo.
+
+        Args:
+            fecha (date | None, optional): Fecha del riego
+                (por defecto, la fecha actual).
+        """
+        self._fecha: date = fecha if fecha is not None else date.today()
+        self._memo: Dict[Tuple[AbsorcionAguaStrategy, type], int] = {}
+        self._evaluaciones: int = 0
+        self._reusos: int = 0
+
+    def get_fecha(self) -> date:
+        """Obtiene la fecha del ciclo de riego."""
+        return self._fecha
+
+    def calcular_absorcion(self,
+                           estrategia: AbsorcionAguaStrategy,
+                           cultivo: Cultivo) -> int:
+        """
+        Obtiene la absorcion de un cultivo segun la estrategia,
+        reusando el valor memoizado cuando la estrategia lo permite.
+
+        Args:
+            estrategia (AbsorcionAguaStrategy): La estrategia del servicio.
+            cultivo (Cultivo): El cultivo que absorbe agua.
+
+        Returns:
+            int: La cantidad de agua absorbida en litros.
+        """
+        if not estrategia.es_cacheable():
+            self._evaluaciones += 1
+            return estrategia.calcular_absorcion(fecha=self._fecha, cultivo=cultivo)
+
+        clave = (estrategia, type(cultivo))
+        agua = self._memo.get(clave)
+        if agua is None:
+            agua = estrategia.calcular_absorcion(fecha=self._fecha, cultivo=cultivo)
+            self._memo[clave] = agua
+            self._evaluaciones += 1
+        else:
+            self._reusos += 1
+        return agua
+
+    def get_estadisticas(self) -> Dict[str, int]:
+        """
+        Obtiene los contadores del ciclo.
+
+        Returns:
+            Dict[str, int]: evaluaciones (llamadas reales a estrategias)
+                y reusos (valores memoizados reutilizados).
+        """
+        return {"evaluaciones": self._evaluaciones, "reusos": self._reusos}
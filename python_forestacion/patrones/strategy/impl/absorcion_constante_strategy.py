@@ -46,4 +46,9 @@ class AbsorcionConstanteStrategy(AbsorcionAguaStrategy):
         Returns:
             int: La cantidad de agua absorbida (ej. 1L o 2L).
         """
-        return self._cantidad
\ No newline at end of file
+        return self._cantidad
+
+    @override
+    def es_cacheable(self) -> bool:
+        """Devuelve siempre la misma cantidad. Es cacheable."""
+        return True
@@ -39,4 +39,9 @@ class AbsorcionSeasonalStrategy(AbsorcionAguaStrategy):
         if C.MES_INICIO_VERANO <= mes <= C.MES_FIN_VERANO:
             return C.ABSORCION_SEASONAL_VERANO # 5L
         else:
-            return C.ABSORCION_SEASONAL_INVIERNO # 2L
\ No newline at end of file
+            return C.ABSORCION_SEASONAL_INVIERNO # 2L
+
+    @override
+    def es_cacheable(self) -> bool:
+        """Solo depende del mes de la fecha. Es cacheable."""
+        return True
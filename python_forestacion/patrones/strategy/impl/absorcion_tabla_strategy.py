@@ -0,0 +1,246 @@
+"""
+Modulo de la implementacion "Tabla" del Strategy.
+"""
+from __future__ import annotations
+import json
+import os
+from bisect import bisect_right
+from datetime import date
+from typing import Any, Dict, List, Protocol, Sequence, Tuple
+from typing_extensions import override
+from python_forestacion.patrones.strategy.absorcion_agua_strategy import AbsorcionAguaStrategy
+from python_forestacion.entidades.cultivos.cultivo import Cultivo
+from python_forestacion import constantes as C
+
+MESES_DEL_ANIO = 12
+
+
+class FuenteLectura(Protocol):
+    """
+    Cualquier objeto con lectura PULL (ej. TemperaturaReaderTask,
+    HumedadReaderTask).
+    """
+
+    def get_ultima_lectura(self) -> float:
+        """Obtiene la ultima lectura del sensor."""
+        ...
+
+
+class AbsorcionTablaStrategy(AbsorcionAguaStrategy):
+    """
+    Estrategia de absorcion por tabla (sensible a los sensores).
+
+    La absorcion se obtiene de una tabla precalculada indexada por
+    (especie, mes, banda de temperatura, banda de humedad), compilada
+    al construir la estrategia a partir de una configuracion:
+
+        absorcion = round(base_mensual[mes] * factor_temperatura[banda_t]
+                                            * factor_humedad[banda_h])
+
+    Las bandas se definen con cortes ascendentes (N cortes -> N+1
+    bandas). Las lecturas se toman de los sensores (metodo PULL).
+
+    Es cacheable: dentro de un ciclo de riego (ContextoRiego) la
+    lectura de los sensores se toma una vez por especie y el valor
+    se reusa para todos sus cultivos.
+
+    Referencia: US-008, US-010, US-TECH-004
+    """
+
+    def __init__(self,
+                 configuracion: Dict[str, Any],
+                 sensor_temperatura: FuenteLectura,
+                 sensor_humedad: FuenteLectura):
+        """
+        Inicializa la estrategia compilando la tabla.
+
+        Args:
+            configuracion (Dict[str, Any]): 'cortes_temperatura',
+                'cortes_humedad' y 'especies' (por especie:
+                'base_mensual' de 12 valores, 'factor_temperatura' y
+                'factor_humedad' con un factor por banda).
+            sensor_temperatura (FuenteLectura): Sensor de temperatura.
+            sensor_humedad (FuenteLectura): Sensor de humedad.
+
+        Raises:
+            ValueError: Si la configuracion es invalida.
+        """
+        self._cortes_temperatura: Tuple[float, ...] = AbsorcionTablaStrategy._validar_cortes(
+            configuracion.get("cortes_temperatura"), "cortes_temperatura")
+        self._cortes_humedad: Tuple[float, ...] = AbsorcionTablaStrategy._validar_cortes(
+            configuracion.get("cortes_humedad"), "cortes_humedad")
+        self._bandas_humedad: int = len(self._cortes_humedad) + 1
+        self._celdas_por_mes: int = (len(self._cortes_temperatura) + 1) * self._bandas_humedad
+
+        especies = configuracion.get("especies")
+        if not isinstance(especies, dict) or not especies:
+            raise ValueError("La configuracion debe definir al menos una especie")
+
+        # especie -> tupla plana de (12 * bandas_t * bandas_h) valores
+        self._tablas: Dict[str, Tuple[int, ...]] = {
+            especie: self._compilar_especie(especie, datos)
+            for especie, datos in especies.items()
+        }
+
+        self._sensor_temperatura: FuenteLectura = sensor_temperatura
+        self._sensor_humedad: FuenteLectura = sensor_humedad
+
+    @classmethod
+    def desde_archivo(cls,
+                      sensor_temperatura: FuenteLectura,
+                      sensor_humedad: FuenteLectura,
+                      path: str | None = None) -> AbsorcionTablaStrategy:
+        """
+        Crea la estrategia a partir de un archivo JSON.
+
+        Args:
+            sensor_temperatura (FuenteLectura): Sensor de temperatura.
+            sensor_humedad (FuenteLectura): Sensor de humedad.
+            path (str | None, optional): Path del JSON (por defecto, el
+                ARCHIVO_CONFIG_ABSORCION_TABLA junto a este modulo).
+
+        Raises:
+            ValueError: Si el archivo no existe o es invalido.
+
+        Returns:
+            AbsorcionTablaStrategy: La estrategia compilada.
+        """
+        if path is None:
+            path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                C.ARCHIVO_CONFIG_ABSORCION_TABLA)
+        try:
+            with open(path, "r", encoding="utf-8") as archivo:
+                configuracion = json.load(archivo)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"No se pudo leer la configuracion de absorcion '{path}': {e}") from e
+        return cls(configuracion, sensor_temperatura, sensor_humedad)
+
+    @override
+    def calcular_absorcion(
+        self,
+        fecha: date,
+        cultivo: 'Cultivo'
+    ) -> int:
+        """
+        Busca la absorcion en la tabla para la especie del cultivo,
+        el mes y las lecturas actuales de los sensores.
+
+        Args:
+            fecha (date): La fecha del riego.
+            cultivo (Cultivo): El cultivo (solo se usa su especie).
+
+        Raises:
+            ValueError: Si la especie no esta en la configuracion.
+
+        Returns:
+            int: Cantidad de agua absorbida en litros.
+        """
+        return self.calcular_absorcion_especie(fecha, cultivo.get_tipo())
+
+    def calcular_absorcion_especie(self, fecha: date, especie: str) -> int:
+        """
+        Evaluacion por especie (para grupos completos de cultivos):
+        lee los sensores una vez y hace una sola busqueda en la tabla.
+
+        Args:
+            fecha (date): La fecha del riego.
+            especie (str): Nombre de la especie (ej. "Pino").
+
+        Raises:
+            ValueError: Si la especie no esta en la configuracion.
+
+        Returns:
+            int: Cantidad de agua absorbida por cada cultivo de la especie.
+        """
+        tabla = self._tablas.get(especie)
+        if tabla is None:
+            raise ValueError(f"Especie sin configuracion de absorcion: {especie}")
+        return tabla[self._indice(fecha.month,
+                                  self._sensor_temperatura.get_ultima_lectura(),
+                                  self._sensor_humedad.get_ultima_lectura())]
+
+    def calcular_absorcion_especies(self, fecha: date) -> Dict[str, int]:
+        """
+        Evaluacion masiva: absorcion de todas las especies configuradas
+        con UNA lectura de cada sensor.
+
+        Args:
+            fecha (date): La fecha del riego.
+
+        Returns:
+            Dict[str, int]: especie -> agua absorbida por cultivo.
+        """
+        indice = self._indice(fecha.month,
+                              self._sensor_temperatura.get_ultima_lectura(),
+                              self._sensor_humedad.get_ultima_lectura())
+        return {especie: tabla[indice] for especie, tabla in self._tablas.items()}
+
+    def get_especies(self) -> List[str]:
+        """Obtiene las especies configuradas."""
+        return list(self._tablas)
+
+    @override
+    def es_cacheable(self) -> bool:
+        """
+        Depende de la especie, la fecha y los sensores (no del cultivo):
+        es cacheable dentro de un ciclo de riego.
+        """
+        return True
+
+    # --- Metodos privados ---
+
+    def _indice(self, mes: int, temperatura: float, humedad: float) -> int:
+        """
+        Metodo privado que calcula la posicion en la tabla plana.
+        """
+        banda_t = bisect_right(self._cortes_temperatura, temperatura)
+        banda_h = bisect_right(self._cortes_humedad, humedad)
+        return (mes - 1) * self._celdas_por_mes + banda_t * self._bandas_humedad + banda_h
+
+    def _compilar_especie(self, especie: str, datos: Any) -> Tuple[int, ...]:
+        """
+        Metodo privado que valida la configuracion de una especie y
+        precalcula todos sus valores (mes x banda_t x banda_h).
+        """
+        if not isinstance(datos, dict):
+            raise ValueError(f"Configuracion invalida para la especie '{especie}'")
+
+        bases = AbsorcionTablaStrategy._validar_valores(
+            datos.get("base_mensual"), MESES_DEL_ANIO, f"{especie}.base_mensual")
+        factores_t = AbsorcionTablaStrategy._validar_valores(
+            datos.get("factor_temperatura"), len(self._cortes_temperatura) + 1,
+            f"{especie}.factor_temperatura")
+        factores_h = AbsorcionTablaStrategy._validar_valores(
+            datos.get("factor_humedad"), self._bandas_humedad,
+            f"{especie}.factor_humedad")
+
+        return tuple(
+            int(round(base * factor_t * factor_h))
+            for base in bases
+            for factor_t in factores_t
+            for factor_h in factores_h
+        )
+
+    @staticmethod
+    def _validar_cortes(cortes: Any, nombre: str) -> Tuple[float, ...]:
+        """
+        Metodo privado que valida una lista de cortes de banda
+        (numerica y estrictamente ascendente).
+        """
+        if not isinstance(cortes, list) or not all(
+                isinstance(c, (int, float)) for c in cortes):
+            raise ValueError(f"'{nombre}' debe ser una lista de numeros")
+        for anterior, siguiente in zip(cortes, cortes[1:]):
+            if siguiente <= anterior:
+                raise ValueError(f"'{nombre}' debe ser estrictamente ascendente")
+        return tuple(float(c) for c in cortes)
+
+    @staticmethod
+    def _validar_valores(valores: Any, cantidad: int, nombre: str) -> Sequence[float]:
+        """
+        Metodo privado que valida una lista de N numeros no negativos.
+        """
+        if (not isinstance(valores, list) or len(valores) != cantidad
+                or not all(isinstance(v, (int, float)) and v >= 0 for v in valores)):
+            raise ValueError(f"'{nombre}' debe tener {cantidad} numeros no negativos")
+        return valores
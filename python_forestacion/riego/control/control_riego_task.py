@@ -11,8 +11,11 @@ from python_forestacion.servicios.terrenos.plantacion_service import PlantacionS
 # --- Imports de Entidades ---
 from python_forestacion.entidades.terrenos.plantacion import Plantacion
 
-# --- Imports de Excepciones ---
-from python_forestacion.excepciones.agua_agotada_exception import AguaAgotadaException
+# --- Imports de Resultados ---
+from python_forestacion.servicios.terrenos.resultado_riego import ResultadoRiego
+
+# --- Imports de Control ---
+from python_forestacion.riego.control.historial_riego import HistorialRiego
 
 # --- Imports de Constantes ---
 from python_forestacion import constantes as C
@@ -21,6 +24,7 @@ from python_forestacion import constantes as C
 if TYPE_CHECKING:
     from python_forestacion.riego.sensores.temperatura_reader_task import TemperaturaReaderTask
     from python_forestacion.riego.sensores.humedad_reader_task import HumedadReaderTask
+    from python_forestacion.servicios.negocio.pronostico_agua_service import PronosticoAguaService
 
 
 class ControlRiegoTask(threading.Thread):
@@ -34,14 +38,25 @@ class ControlRiegoTask(threading.Thread):
     2.  Recibe los sensores y servicios por Inyeccion de
         Dependencias.
         
-    3.  Implementa la logica de decision para el riego.
+    3.  Implementa la logica de decision para el riego y
+        registra cada decision en un HistorialRiego (opcionalmente,
+        informa el pronostico de agotamiento del agua).
+
+    4.  Si la plantacion se queda sin agua, suspende la evaluacion
+        (sin lecturas, riegos ni excepciones) hasta que se reponga:
+        mientras tanto solo consulta el agua disponible, con esperas
+        crecientes (CONTROL_RIEGO_FACTOR_ESPERA) hasta
+        CONTROL_RIEGO_ESPERA_MAXIMA. 'reanudar()' fuerza la consulta
+        inmediata (ej. tras repartir agua del reservorio).
     """
     
     def __init__(self,
                  sensor_temperatura: 'TemperaturaReaderTask',
                  sensor_humedad: 'HumedadReaderTask',
                  plantacion: Plantacion,
-                 plantacion_service: PlantacionService):
+                 plantacion_service: PlantacionService,
+                 historial: HistorialRiego | None = None,
+                 pronostico: 'PronosticoAguaService | None' = None):
         """
         Inicializa el Controlador.
         
@@ -52,6 +67,10 @@ class ControlRiegoTask(threading.Thread):
             sensor_humedad (HumedadReaderTask): Instancia del sensor.
             plantacion (Plantacion): La plantacion a regar.
             plantacion_service (PlantacionService): El servicio para regar.
+            historial (HistorialRiego | None, optional): Donde registrar
+                las decisiones (por defecto, el del pronostico o uno nuevo).
+            pronostico (PronosticoAguaService | None, optional): Si se
+                indica, se informa el pronostico tras cada riego.
         """
         # 1. Inicializar el Thread
         super().__init__(daemon=True, name="ControlRiegoThread")
@@ -61,9 +80,19 @@ class ControlRiegoTask(threading.Thread):
         self._sensor_hum = sensor_humedad
         self._plantacion = plantacion
         self._plantacion_service = plantacion_service
+        self._pronostico = pronostico
+        if historial is None:
+            historial = pronostico.get_historial() if pronostico is not None else HistorialRiego()
+        self._historial: HistorialRiego = historial
         
         # 3. Control de detencion (Graceful Shutdown - US-013)
         self._detenido: threading.Event = threading.Event()
+        # Interrumpe la espera del ciclo (detener / reanudar)
+        self._despertar: threading.Event = threading.Event()
+
+        # 4. Suspension por agua agotada
+        self._sin_agua: bool = False
+        self._espera: float = C.INTERVALO_CONTROL_RIEGO
         
     def _evaluar_condiciones(self) -> bool:
         """
@@ -93,33 +122,104 @@ class ControlRiegoTask(threading.Thread):
         """
         print(f"[{self.name}] Iniciando control de riego automatico...")
         while not self._detenido.is_set():
+
+            # 0. Plantacion sin agua: solo esperar a que se reponga
+            if self._sin_agua and not self._verificar_reposicion():
+                self._esperar(self._espera)
+                continue
             
             # 1. Evaluar si regar
-            if self._evaluar_condiciones():
+            regar = self._evaluar_condiciones()
+            regado = False
+            if regar:
                 
-                # 2. Intentar regar
-                try:
-                    print(f"[{self.name}] CONDICIONES OPTIMAS. Iniciando riego...")
-                    self._plantacion_service.regar(self._plantacion)
+                # 2. Intentar regar (sin excepciones, US-012)
+                print(f"[{self.name}] CONDICIONES OPTIMAS. Iniciando riego...")
+                resultado = self._plantacion_service.intentar_regar(self._plantacion)
+                if resultado.is_regado():
+                    regado = True
                     print(f"[{self.name}] Riego finalizado.")
-                    
-                except AguaAgotadaException as e:
-                    # Manejo de excepcion (US-012)
-                    print(f"[{self.name}] ERROR DE RIEGO: {e.get_user_message()}")
-                    # No re-lanzamos, solo logueamos y continuamos.
+                else:
+                    self._suspender(resultado)
                 
             else:
                 print(f"[{self.name}] Condiciones no optimas. No se riega.")
+            self._historial.registrar(regar, regado)
+            if regado and self._pronostico is not None:
+                self._informar_pronostico()
 
             # 3. Esperar
-            self._detenido.wait(timeout=C.INTERVALO_CONTROL_RIEGO)
+            self._esperar(C.INTERVALO_CONTROL_RIEGO)
                 
         print(f"[{self.name}] Control de riego detenido.")
 
+    def _suspender(self, resultado: ResultadoRiego) -> None:
+        """
+        Metodo privado que suspende la evaluacion por falta de agua
+        (se informa una sola vez, no en cada ciclo).
+        """
+        self._sin_agua = True
+        self._espera = C.INTERVALO_CONTROL_RIEGO
+        print(f"[{self.name}] SIN AGUA ({resultado.get_agua_restante()}L, se necesitan "
+              f"{C.AGUA_POR_RIEGO}L). Control suspendido hasta reponer agua.")
+
+    def _verificar_reposicion(self) -> bool:
+        """
+        Metodo privado que, con la evaluacion suspendida, reanuda el
+        control si se repuso el agua o alarga la proxima espera.
+
+        Returns:
+            bool: True si el control se reanuda.
+        """
+        agua = self._plantacion.get_agua_disponible()
+        if agua >= C.AGUA_POR_RIEGO:
+            self._sin_agua = False
+            self._espera = C.INTERVALO_CONTROL_RIEGO
+            print(f"[{self.name}] Agua repuesta ({agua}L). Control reanudado.")
+            return True
+        self._espera = min(self._espera * C.CONTROL_RIEGO_FACTOR_ESPERA,
+                           C.CONTROL_RIEGO_ESPERA_MAXIMA)
+        return False
+
+    def _esperar(self, segundos: float) -> None:
+        """
+        Metodo privado que espera el proximo ciclo (o hasta que se
+        llame a 'detener' o 'reanudar').
+        """
+        self._despertar.wait(timeout=segundos)
+        self._despertar.clear()
+
+    def _informar_pronostico(self) -> None:
+        """
+        Metodo privado que informa los riegos que le quedan a la
+        plantacion y el tiempo estimado hasta agotar el agua.
+        """
+        pronostico = self._pronostico.pronosticar_plantacion(self._plantacion)
+        segundos = pronostico.get_segundos_hasta_agotar()
+        estimado = "sin riegos esperados" if segundos is None else f"~{segundos:.0f} s"
+        print(f"[{self.name}] Pronostico: {pronostico.get_riegos_restantes()} "
+              f"riego(s) restante(s) ({estimado}).")
+
+    def is_sin_agua(self) -> bool:
+        """Indica si el control esta suspendido por falta de agua."""
+        return self._sin_agua
+
+    def reanudar(self) -> None:
+        """
+        Pide verificar de inmediato si se repuso el agua (sin esperar
+        a que termine la espera actual).
+        """
+        self._despertar.set()
+
+    def get_historial(self) -> HistorialRiego:
+        """Obtiene el historial de decisiones del controlador."""
+        return self._historial
+
     def detener(self) -> None:
         """
         Solicita la detencion del thread de forma segura.
         (US-013)
         """
         print(f"[{self.name}] Solicitando detencion de control...")
-        self._detenido.set()
\ No newline at end of file
+        self._detenido.set()
+        self._despertar.set()
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""
+Modulo de la clase HistorialRiego.
+Ventana de las ultimas decisiones del controlador de riego.
+"""
+import time
+from collections import deque
+from threading import Lock
+from typing import Deque, Tuple
+
+from python_forestacion import constantes as C
+
+# TypeAlias de una decision: (instante monotonic, se decidio regar, riego realizado)
+DecisionRiego = Tuple[float, bool, bool]
+
+
+class HistorialRiego:
+    """
+    Historial (ventana circular) de las decisiones de cada ciclo de
+    control: si las condiciones pedian regar y si el riego se realizo
+    (falla, por ejemplo, con AguaAgotadaException).
+
+    Permite estimar cuantos riegos se piden por ciclo y la duracion
+    media de un ciclo, por ejemplo para pronosticar cuando se agota
+    el agua (PronosticoAguaService). Los contadores se mantienen al
+    registrar: las consultas cuestan O(1).
+
+    Es thread-safe: lo escribe el ControlRiegoTask y lo leen otros hilos.
+
+    Referencia: US-012
+    """
+
+    def __init__(self, ventana: int = C.HISTORIAL_RIEGO_VENTANA):
+        """
+        Inicializa el historial vacio.
+
+        Args:
+            ventana (int, optional): Decisiones que se conservan.
+
+        Raises:
+            ValueError: Si la ventana es <= 0.
+        """
+        if ventana <= 0:
+            raise ValueError("La ventana del historial debe ser mayor a cero")
+        self._decisiones: Deque[DecisionRiego] = deque(maxlen=ventana)
+        self._pedidos: int = 0   # ciclos de la ventana que pidieron regar
+        self._fallidos: int = 0  # pedidos de la ventana que no se realizaron
+        self._lock: Lock = Lock()
+
+    def registrar(self,
+                  regar: bool,
+                  regado: bool = False,
+                  instante: float | None = None) -> None:
+        """
+        Registra la decision de un ciclo de control.
+
+        Args:
+            regar (bool): Si las condiciones pedian regar.
+            regado (bool, optional): Si el riego se realizo.
+            instante (float | None, optional): time.monotonic() del ciclo.
+        """
+        if instante is None:
+            instante = time.monotonic()
+        with self._lock:
+            if len(self._decisiones) == self._decisiones.maxlen:
+                self._descontar(self._decisiones[0])
+            self._decisiones.append((instante, regar, regado))
+            if regar:
+                self._pedidos += 1
+                if not regado:
+                    self._fallidos += 1
+
+    def get_cantidad(self) -> int:
+        """Obtiene la cantidad de decisiones en la ventana."""
+        with self._lock:
+            return len(self._decisiones)
+
+    def get_tasa_riego(self) -> float | None:
+        """
+        Obtiene la fraccion de ciclos en que las condiciones pedian regar.
+
+        Returns:
+            float | None: Riegos pedidos por ciclo (None si no hay decisiones).
+        """
+        with self._lock:
+            if not self._decisiones:
+                return None
+            return self._pedidos / len(self._decisiones)
+
+    def get_riegos_fallidos(self) -> int:
+        """Obtiene los riegos pedidos que no se realizaron (en la ventana)."""
+        with self._lock:
+            return self._fallidos
+
+    def get_intervalo_medio(self) -> float:
+        """
+        Obtiene la duracion media de un ciclo en segundos (con menos
+        de dos decisiones, INTERVALO_CONTROL_RIEGO).
+        """
+        with self._lock:
+            if len(self._decisiones) < 2:
+                return C.INTERVALO_CONTROL_RIEGO
+            primero, ultimo = self._decisiones[0][0], self._decisiones[-1][0]
+            return (ultimo - primero) / (len(self._decisiones) - 1)
+
+    # --- Metodos privados ---
+
+    def _descontar(self, decision: DecisionRiego) -> None:
+        """
+        Metodo privado (con el lock tomado) que descuenta de los
+        contadores la decision que sale de la ventana.
+        """
+        _, regar, regado = decision
+        if regar:
+            self._pedidos -= 1
+            if not regado:
+                self._fallidos -= 1
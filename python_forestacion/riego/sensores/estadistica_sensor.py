@@ -0,0 +1,96 @@
+"""
+Modulo de la clase EstadisticaSensor (Observer).
+Ventana de las lecturas recientes de un sensor.
+"""
+from collections import deque
+from threading import Lock
+from typing import Deque, List
+from typing_extensions import override
+
+from python_forestacion.patrones.observer.observer import Observer
+from python_forestacion import constantes as C
+
+
+class EstadisticaSensor(Observer[float]):
+    """
+    Observer (US-TECH-003) que guarda las ultimas lecturas de un
+    sensor (TemperaturaReaderTask, HumedadReaderTask) y resume su
+    comportamiento reciente.
+
+    Es thread-safe: el sensor lo actualiza desde su hilo.
+
+    Referencia: US-010, US-011
+    """
+
+    def __init__(self, ventana: int = C.ESTADISTICA_SENSOR_VENTANA):
+        """
+        Inicializa la estadistica vacia.
+
+        Args:
+            ventana (int, optional): Lecturas que se conservan.
+
+        Raises:
+            ValueError: Si la ventana es <= 0.
+        """
+        if ventana <= 0:
+            raise ValueError("La ventana de lecturas debe ser mayor a cero")
+        self._lecturas: Deque[float] = deque(maxlen=ventana)
+        self._lock: Lock = Lock()
+
+    @override
+    def actualizar(self, evento: float) -> None:
+        """
+        Recibe una lectura del sensor (PUSH).
+
+        Args:
+            evento (float): El valor leido.
+        """
+        with self._lock:
+            self._lecturas.append(evento)
+
+    def get_cantidad(self) -> int:
+        """Obtiene la cantidad de lecturas en la ventana."""
+        with self._lock:
+            return len(self._lecturas)
+
+    def get_promedio(self) -> float | None:
+        """Obtiene el promedio de las lecturas (None si no hay)."""
+        lecturas = self._copiar()
+        return sum(lecturas) / len(lecturas) if lecturas else None
+
+    def get_fraccion_en_rango(self,
+                              minimo: float | None = None,
+                              maximo: float | None = None,
+                              incluir_maximo: bool = True) -> float | None:
+        """
+        Obtiene la fraccion de lecturas dentro de [minimo, maximo].
+
+        Args:
+            minimo (float | None, optional): Limite inferior (None: sin limite).
+            maximo (float | None, optional): Limite superior (None: sin limite).
+            incluir_maximo (bool, optional): False para excluir el maximo.
+
+        Returns:
+            float | None: Fraccion entre 0 y 1 (None si no hay lecturas).
+        """
+        lecturas = self._copiar()
+        if not lecturas:
+            return None
+        dentro = 0
+        for valor in lecturas:
+            if minimo is not None and valor < minimo:
+                continue
+            if maximo is not None and (valor > maximo or (not incluir_maximo and valor == maximo)):
+                continue
+            dentro += 1
+        return dentro / len(lecturas)
+
+    # --- Metodos privados ---
+
+    def _copiar(self) -> List[float]:
+        """
+        Metodo privado que copia la ventana (el sensor la modifica
+        desde otro hilo).
+        """
+        with self._lock:
+            return list(self._lecturas)
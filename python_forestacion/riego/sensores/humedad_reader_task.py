@@ -9,6 +9,9 @@ from typing_extensions import override
 # --- Imports de Patrones ---
 from python_forestacion.patrones.observer.observable import Observable
 
+# --- Imports de Sensores ---
+from python_forestacion.riego.sensores.proceso_sensor import ProcesoSensor
+
 # --- Imports de Constantes ---
 from python_forestacion import constantes as C
 
@@ -20,13 +23,20 @@ class HumedadReaderTask(threading.Thread, Observable[float]):
         leyendo humedad cada N segundos.
     2.  Como Observable[float] (US-TECH-003): Notifica a sus
         observadores cada vez que tiene una nueva lectura.
+    3.  Modo en proceso (en_proceso=True): el muestreo corre en un
+        proceso hijo (ProcesoSensor) que publica la ultima lectura en
+        memoria compartida; el thread solo notifica las lecturas
+        nuevas y get_ultima_lectura() lee la memoria sin locks.
     """
     
-    def __init__(self):
+    def __init__(self, en_proceso: bool = False):
         """
         Inicializa el sensor.
         
         Configura el thread como 'daemon' (Rubrica 5.1)
+
+        Args:
+            en_proceso (bool, optional): Muestrear en un proceso hijo.
         """
         # --- CORRECCION AQUI ---
         # Llamamos a los __init__ de CADA padre explícitamente
@@ -44,8 +54,19 @@ class HumedadReaderTask(threading.Thread, Observable[float]):
         # 4. Almacenamiento de ultima lectura (para PULL)
         self._ultima_lectura: float = 60.0 # Un valor inicial default
 
-    def _leer_humedad(self) -> float:
-        """Simula la lectura de un sensor fisico."""
+        # 5. Muestreo en proceso hijo (opcional)
+        self._proceso: ProcesoSensor | None = None
+        if en_proceso:
+            self._proceso = ProcesoSensor(HumedadReaderTask._leer_humedad,
+                                          C.INTERVALO_SENSOR_HUMEDAD,
+                                          self._ultima_lectura, "SensorHumedProceso")
+
+    @staticmethod
+    def _leer_humedad() -> float:
+        """
+        Simula la lectura de un sensor fisico.
+        (Estatico: lo importa por nombre el proceso hijo.)
+        """
         humedad = random.uniform(C.SENSOR_HUMEDAD_MIN, C.SENSOR_HUMEDAD_MAX)
         return humedad
 
@@ -55,6 +76,10 @@ class HumedadReaderTask(threading.Thread, Observable[float]):
         Se ejecuta al llamar a .start()
         """
         print(f"[{self.name}] Iniciando sensor de humedad...")
+        if self._proceso is not None:
+            self._notificar_desde_proceso()
+            print(f"[{self.name}] Sensor de humedad detenido.")
+            return
         while not self._detenido.is_set():
             # 1. Leer valor
             humedad = self._leer_humedad()
@@ -70,6 +95,23 @@ class HumedadReaderTask(threading.Thread, Observable[float]):
                 
         print(f"[{self.name}] Sensor de humedad detenido.")
 
+    def _notificar_desde_proceso(self) -> None:
+        """
+        Metodo privado (modo en proceso) que inicia el proceso hijo y
+        notifica a los observadores cada lectura nueva publicada.
+        """
+        self._proceso.iniciar()
+        try:
+            secuencia = 0
+            while not self._detenido.is_set():
+                humedad, _, actual = self._proceso.leer()
+                if actual != secuencia:
+                    secuencia = actual
+                    self.notificar_observadores(humedad)
+                self._detenido.wait(timeout=C.SENSOR_PROCESO_SONDEO)
+        finally:
+            self._proceso.detener()
+
     def detener(self) -> None:
         """
         Solicita la detencion del thread de forma segura.
@@ -86,4 +128,6 @@ class HumedadReaderTask(threading.Thread, Observable[float]):
         Returns:
             float: La ultima humedad registrada.
         """
+        if self._proceso is not None:
+            return self._proceso.leer()[0]
         return self._ultima_lectura
\ No newline at end of file
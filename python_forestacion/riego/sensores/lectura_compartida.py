@@ -0,0 +1,107 @@
+"""
+Modulo de la clase LecturaCompartida.
+Ultima lectura de un sensor en memoria compartida (protocolo seqlock).
+"""
+import struct
+from multiprocessing.shared_memory import SharedMemory
+from typing import Tuple
+
+from python_forestacion import constantes as C
+
+# Formato del bloque: secuencia (uint64), valor (double), instante (double)
+_FORMATO_SECUENCIA = struct.Struct("=Q")
+_FORMATO_DATOS = struct.Struct("=dd")
+_TAMANIO = _FORMATO_SECUENCIA.size + _FORMATO_DATOS.size
+
+# TypeAlias de una lectura: (valor, instante time.time(), secuencia)
+Lectura = Tuple[float, float, int]
+
+
+class LecturaCompartida:
+    """
+    Ultima lectura (valor e instante) de un sensor, publicada en un
+    bloque de multiprocessing.shared_memory por UN proceso escritor y
+    leida sin locks por cualquier proceso.
+
+    Protocolo seqlock:
+    - El escritor incrementa la secuencia (queda impar), escribe el
+      valor y el instante, y la vuelve a incrementar (queda par).
+    - El lector lee la secuencia, los datos y otra vez la secuencia:
+      si es impar o cambio, hubo una escritura en medio y reintenta.
+      Tras SEQLOCK_MAX_REINTENTOS (ej. el escritor murio a mitad de
+      una escritura) devuelve la ultima lectura consistente.
+
+    Referencia: US-010, US-011
+    """
+
+    def __init__(self, nombre: str | None = None, valor_inicial: float = 0.0):
+        """
+        Crea el bloque (nombre None) o se conecta a uno existente.
+
+        Args:
+            nombre (str | None, optional): Nombre de un bloque creado
+                por otro proceso (None para crear uno nuevo).
+            valor_inicial (float, optional): Valor del bloque nuevo.
+        """
+        self._propietario: bool = nombre is None
+        if self._propietario:
+            self._memoria: SharedMemory = SharedMemory(create=True, size=_TAMANIO)
+        else:
+            self._memoria = SharedMemory(name=nombre)
+        self._buffer = self._memoria.buf
+        self._secuencia: int = _FORMATO_SECUENCIA.unpack_from(self._buffer, 0)[0]
+        self._ultima: Lectura = (valor_inicial, 0.0, 0)
+        if self._propietario:
+            _FORMATO_DATOS.pack_into(self._buffer, _FORMATO_SECUENCIA.size, valor_inicial, 0.0)
+
+    def get_nombre(self) -> str:
+        """Obtiene el nombre del bloque (para conectarse desde otro proceso)."""
+        return self._memoria.name
+
+    def escribir(self, valor: float, instante: float) -> None:
+        """
+        Publica una lectura (un solo proceso escritor por bloque).
+
+        Args:
+            valor (float): El valor leido.
+            instante (float): time.time() de la lectura.
+        """
+        self._secuencia += 1
+        _FORMATO_SECUENCIA.pack_into(self._buffer, 0, self._secuencia)
+        _FORMATO_DATOS.pack_into(self._buffer, _FORMATO_SECUENCIA.size, valor, instante)
+        self._secuencia += 1
+        _FORMATO_SECUENCIA.pack_into(self._buffer, 0, self._secuencia)
+
+    def leer(self) -> Lectura:
+        """
+        Obtiene la ultima lectura publicada, sin locks.
+
+        Returns:
+            Lectura: (valor, instante, secuencia); la secuencia crece
+                en 2 con cada lectura publicada (0: ninguna todavia).
+                Con el bloque cerrado, la ultima lectura obtenida.
+        """
+        buffer = self._buffer
+        if buffer is None:
+            return self._ultima
+        try:
+            for _ in range(C.SEQLOCK_MAX_REINTENTOS):
+                antes = _FORMATO_SECUENCIA.unpack_from(buffer, 0)[0]
+                if antes & 1:
+                    continue  # escritura en curso
+                valor, instante = _FORMATO_DATOS.unpack_from(buffer, _FORMATO_SECUENCIA.size)
+                if _FORMATO_SECUENCIA.unpack_from(buffer, 0)[0] == antes:
+                    self._ultima = (valor, instante, antes)
+                    break
+        except ValueError:
+            pass  # el bloque se cerro durante la lectura
+        return self._ultima
+
+    def cerrar(self) -> None:
+        """
+        Se desconecta del bloque; el propietario ademas lo elimina.
+        """
+        self._buffer = None
+        self._memoria.close()
+        if self._propietario:
+            self._memoria.unlink()
@@ -0,0 +1,62 @@
+"""
+Modulo de la entidad LoteLecturas.
+Cambios de un tick de un SensorBank, en arreglos.
+"""
+from array import array
+
+
+class LoteLecturas:
+    """
+    Evento que un SensorBank envia a sus observadores en cada tick:
+    solo los sensores cuya lectura se alejo mas del umbral del ultimo
+    valor notificado, como arreglos paralelos (posicion en el banco,
+    valor nuevo y variacion respecto del ultimo valor notificado).
+
+    Referencia: US-010, US-011, US-TECH-003
+    """
+
+    def __init__(self,
+                 tick: int,
+                 instante: float,
+                 indices: 'array[int]',
+                 valores: 'array[float]',
+                 deltas: 'array[float]'):
+        """
+        Inicializa el lote.
+
+        Args:
+            tick (int): Numero de tick del banco.
+            instante (float): time.time() del tick.
+            indices (array[int]): Posiciones de los sensores en el banco.
+            valores (array[float]): Lecturas nuevas.
+            deltas (array[float]): Variacion respecto del ultimo valor notificado.
+        """
+        self._tick: int = tick
+        self._instante: float = instante
+        self._indices: 'array[int]' = indices
+        self._valores: 'array[float]' = valores
+        self._deltas: 'array[float]' = deltas
+
+    def get_tick(self) -> int:
+        """Obtiene el numero de tick del banco."""
+        return self._tick
+
+    def get_instante(self) -> float:
+        """Obtiene el time.time() del tick."""
+        return self._instante
+
+    def get_indices(self) -> 'array[int]':
+        """Obtiene las posiciones de los sensores que cambiaron."""
+        return self._indices
+
+    def get_valores(self) -> 'array[float]':
+        """Obtiene las lecturas nuevas (en el orden de los indices)."""
+        return self._valores
+
+    def get_deltas(self) -> 'array[float]':
+        """Obtiene las variaciones (en el orden de los indices)."""
+        return self._deltas
+
+    def get_cantidad(self) -> int:
+        """Obtiene la cantidad de sensores que cambiaron."""
+        return len(self._indices)
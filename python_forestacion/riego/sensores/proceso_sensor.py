@@ -0,0 +1,121 @@
+"""
+Modulo de la clase ProcesoSensor.
+Muestreo de un sensor en un proceso hijo (fuera del GIL del sistema).
+"""
+import multiprocessing
+import time
+from multiprocessing.process import BaseProcess
+from multiprocessing.synchronize import Event as EventoProceso
+from typing import Callable
+
+from python_forestacion.riego.sensores.lectura_compartida import LecturaCompartida, Lectura
+from python_forestacion import constantes as C
+
+# TypeAlias de la funcion que lee el sensor fisico
+LectorSensor = Callable[[], float]
+
+
+def _muestrear(nombre_memoria: str,
+               lector: LectorSensor,
+               intervalo: float,
+               detenido: EventoProceso) -> None:
+    """
+    Funcion del proceso hijo: lee el sensor cada 'intervalo'
+    segundos y publica cada lectura en la memoria compartida.
+    (Funcion de modulo: el proceso hijo la importa por nombre.)
+    """
+    lectura = LecturaCompartida(nombre_memoria)
+    try:
+        while not detenido.is_set():
+            lectura.escribir(lector(), time.time())
+            detenido.wait(intervalo)
+    except KeyboardInterrupt:
+        pass  # el proceso padre coordina la detencion
+    finally:
+        lectura.cerrar()
+
+
+class ProcesoSensor:
+    """
+    Ejecuta el muestreo de un sensor en un proceso hijo, que publica
+    la ultima lectura en una LecturaCompartida (seqlock).
+
+    Asi el muestreo no compite por el GIL con el riego, los reportes
+    o el resto de los threads del sistema, y leer la ultima lectura
+    es una lectura de memoria compartida, sin locks.
+
+    El proceso se crea con el contexto SENSOR_PROCESO_CONTEXTO
+    ('spawn': no hereda los locks de los threads del padre).
+
+    Referencia: US-010, US-011, US-013
+    """
+
+    def __init__(self,
+                 lector: LectorSensor,
+                 intervalo: float,
+                 valor_inicial: float,
+                 nombre: str):
+        """
+        Prepara el proceso (no lo inicia).
+
+        Args:
+            lector (LectorSensor): Lee el sensor; debe poder importarse
+                por nombre (funcion de modulo o metodo estatico).
+            intervalo (float): Segundos entre lecturas.
+            valor_inicial (float): Lectura hasta la primera publicacion.
+            nombre (str): Nombre del proceso hijo.
+        """
+        self._lector: LectorSensor = lector
+        self._intervalo: float = intervalo
+        self._nombre: str = nombre
+        self._inicial: Lectura = (valor_inicial, 0.0, 0)
+        # La memoria y el proceso se crean al iniciar
+        self._lectura: LecturaCompartida | None = None
+        self._proceso: BaseProcess | None = None
+        self._detenido: EventoProceso | None = None
+
+    def iniciar(self) -> None:
+        """Crea la memoria compartida e inicia el proceso hijo."""
+        contexto = multiprocessing.get_context(C.SENSOR_PROCESO_CONTEXTO)
+        lectura = LecturaCompartida(valor_inicial=self._inicial[0])
+        self._detenido = contexto.Event()
+        self._proceso = contexto.Process(
+            target=_muestrear,
+            args=(lectura.get_nombre(), self._lector, self._intervalo, self._detenido),
+            name=self._nombre,
+            daemon=True)
+        self._lectura = lectura
+        self._proceso.start()
+
+    def leer(self) -> Lectura:
+        """
+        Obtiene la ultima lectura publicada (lock-free).
+
+        Returns:
+            Lectura: (valor, instante, secuencia); antes de iniciar,
+                el valor inicial con secuencia 0.
+        """
+        lectura = self._lectura
+        return self._inicial if lectura is None else lectura.leer()
+
+    def is_vivo(self) -> bool:
+        """Indica si el proceso hijo sigue muestreando."""
+        return self._proceso is not None and self._proceso.is_alive()
+
+    def detener(self, timeout: float = C.SENSOR_PROCESO_TIMEOUT_DETENCION) -> None:
+        """
+        Detiene el proceso hijo (si no termina a tiempo, lo finaliza)
+        y libera la memoria compartida. Se ignora si no se inicio.
+
+        Args:
+            timeout (float, optional): Segundos de espera.
+        """
+        if self._proceso is None:
+            return
+        self._detenido.set()
+        if self._proceso.is_alive():
+            self._proceso.join(timeout)
+            if self._proceso.is_alive():
+                self._proceso.terminate()
+                self._proceso.join(timeout)
+        self._lectura.cerrar()
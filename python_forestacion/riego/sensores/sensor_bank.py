@@ -0,0 +1,268 @@
+"""
+Modulo de la clase SensorBank (Observable).
+Lecturas de muchos sensores (ej. humedad de suelo por cultivo) en arreglos.
+"""
+import random
+import time
+from array import array
+from itertools import compress, repeat
+from operator import add, gt, sub
+from threading import Lock
+from typing import Dict, Hashable, List, Sequence
+
+from python_forestacion.patrones.observer.observable import Observable
+from python_forestacion.riego.sensores.lote_lecturas import LoteLecturas
+from python_forestacion import constantes as C
+
+
+class SensorBank(Observable[LoteLecturas]):
+    """
+    Banco de N sensores del mismo tipo (ej. humedad de suelo por
+    parcela o por arbol), sin un Thread ni un Observable por sensor.
+
+    - Ultimas lecturas en un array('d') de N posiciones.
+    - Historial de SENSOR_BANK_VENTANA ticks en un unico array('d')
+      circular de ventana * N (una fila por tick): cada tick copia la
+      fila completa en una asignacion de slice.
+    - Un tick ingiere (o simula) las N lecturas de una vez y notifica
+      a los observadores UN LoteLecturas con los sensores que se
+      alejaron mas del umbral de su ultimo valor notificado.
+    - Cada sensor se identifica por una clave (ej. ID de cultivo) y
+      una posicion en el banco.
+
+    Es thread-safe: los ticks y las consultas se serializan; los
+    observadores se notifican fuera del lock.
+
+    Referencia: US-011, US-TECH-003
+    """
+
+    def __init__(self,
+                 claves: Sequence[Hashable],
+                 ventana: int = C.SENSOR_BANK_VENTANA,
+                 umbral_delta: float = C.SENSOR_BANK_UMBRAL_DELTA,
+                 valor_inicial: float = C.SENSOR_BANK_VALOR_INICIAL,
+                 minimo: float = C.SENSOR_HUMEDAD_MIN,
+                 maximo: float = C.SENSOR_HUMEDAD_MAX):
+        """
+        Inicializa el banco.
+
+        Args:
+            claves (Sequence[Hashable]): Clave de cada sensor (ej. IDs
+                de cultivo), en el orden de las posiciones.
+            ventana (int, optional): Ticks de historial por sensor.
+            umbral_delta (float, optional): Cambio minimo para notificar.
+            valor_inicial (float, optional): Lectura inicial de todos los sensores.
+            minimo (float, optional): Lectura minima de la simulacion.
+            maximo (float, optional): Lectura maxima de la simulacion.
+
+        Raises:
+            ValueError: Si la ventana es <= 0, el umbral es negativo,
+                el rango esta invertido o hay claves repetidas.
+        """
+        Observable.__init__(self)
+        if ventana <= 0:
+            raise ValueError("La ventana del historial debe ser mayor a cero")
+        if umbral_delta < 0:
+            raise ValueError("El umbral de cambio no puede ser negativo")
+        if minimo > maximo:
+            raise ValueError("El minimo de lectura no puede superar al maximo")
+        self._posiciones: Dict[Hashable, int] = {clave: i for i, clave in enumerate(claves)}
+        if len(self._posiciones) != len(claves):
+            raise ValueError("Las claves de los sensores no pueden repetirse")
+
+        self._claves: List[Hashable] = list(claves)
+        self._cantidad: int = len(self._claves)
+        self._ventana: int = ventana
+        self._umbral: float = umbral_delta
+        self._minimo: float = minimo
+        self._maximo: float = maximo
+
+        self._ultimas: 'array[float]' = array('d', [valor_inicial]) * self._cantidad
+        self._notificadas: 'array[float]' = array('d', self._ultimas)
+        self._historial: 'array[float]' = array('d', [valor_inicial]) * (ventana * self._cantidad)
+        self._ticks: int = 0
+        self._lock: Lock = Lock()
+
+    # --- Ticks ---
+
+    def ingerir(self, lecturas: Sequence[float], instante: float | None = None) -> LoteLecturas:
+        """
+        Registra las lecturas de TODOS los sensores en un tick y
+        notifica el lote de cambios.
+
+        Args:
+            lecturas (Sequence[float]): Una lectura por posicion.
+            instante (float | None, optional): time.time() del tick.
+
+        Raises:
+            ValueError: Si la cantidad de lecturas no coincide con la
+                de sensores.
+
+        Returns:
+            LoteLecturas: El lote notificado.
+        """
+        if len(lecturas) != self._cantidad:
+            raise ValueError(f"Se esperaban {self._cantidad} lecturas "
+                             f"y se recibieron {len(lecturas)}")
+        nuevas = array('d', lecturas)
+        with self._lock:
+            lote = self._registrar(nuevas, time.time() if instante is None else instante)
+        self.notificar_observadores(lote)
+        return lote
+
+    def ingerir_parcial(self,
+                        indices: Sequence[int],
+                        valores: Sequence[float],
+                        instante: float | None = None) -> LoteLecturas:
+        """
+        Registra un tick en el que solo informaron algunos sensores
+        (el resto conserva su ultima lectura).
+
+        Args:
+            indices (Sequence[int]): Posiciones de los sensores.
+            valores (Sequence[float]): Sus lecturas, en el mismo orden.
+            instante (float | None, optional): time.time() del tick.
+
+        Raises:
+            ValueError: Si las secuencias difieren en largo.
+            IndexError: Si una posicion no existe (o es negativa).
+
+        Returns:
+            LoteLecturas: El lote notificado.
+        """
+        if len(indices) != len(valores):
+            raise ValueError("Indices y valores deben tener el mismo largo")
+        with self._lock:
+            nuevas = array('d', self._ultimas)
+            for i, valor in zip(indices, valores):
+                # Sin indices negativos: -1 no es "el ultimo sensor"
+                if not 0 <= i < self._cantidad:
+                    raise IndexError(f"No existe el sensor en la posicion {i}")
+                nuevas[i] = valor
+            lote = self._registrar(nuevas, time.time() if instante is None else instante)
+        self.notificar_observadores(lote)
+        return lote
+
+    def simular(self,
+                variacion_maxima: float = C.SENSOR_BANK_VARIACION_MAXIMA,
+                instante: float | None = None) -> LoteLecturas:
+        """
+        Simula un tick de los sensores fisicos: cada lectura varia al
+        azar hasta +- variacion_maxima, acotada al rango del banco.
+
+        Args:
+            variacion_maxima (float, optional): Variacion maxima por tick.
+            instante (float | None, optional): time.time() del tick.
+
+        Returns:
+            LoteLecturas: El lote notificado.
+        """
+        aleatorio = random.random
+        amplitud = 2 * variacion_maxima
+        minimo, maximo = self._minimo, self._maximo
+        variaciones = array('d', [(aleatorio() - 0.5) * amplitud for _ in range(self._cantidad)])
+        with self._lock:
+            # La suma recorre los arreglos en C (map); el acotado usa
+            # comparaciones en linea (min/max por elemento es mas lento)
+            nuevas = array('d', [minimo if valor < minimo else (maximo if valor > maximo else valor)
+                                 for valor in map(add, self._ultimas, variaciones)])
+            lote = self._registrar(nuevas, time.time() if instante is None else instante)
+        self.notificar_observadores(lote)
+        return lote
+
+    # --- Consultas ---
+
+    def get_cantidad(self) -> int:
+        """Obtiene la cantidad de sensores del banco."""
+        return self._cantidad
+
+    def get_ticks(self) -> int:
+        """Obtiene la cantidad de ticks registrados."""
+        with self._lock:
+            return self._ticks
+
+    def get_posicion(self, clave: Hashable) -> int:
+        """
+        Obtiene la posicion de un sensor por su clave.
+
+        Raises:
+            KeyError: Si la clave no esta en el banco.
+        """
+        return self._posiciones[clave]
+
+    def get_clave(self, posicion: int) -> Hashable:
+        """Obtiene la clave del sensor de una posicion."""
+        return self._claves[posicion]
+
+    def get_lectura(self, clave: Hashable) -> float:
+        """
+        Obtiene la ultima lectura de un sensor (PULL).
+
+        Raises:
+            KeyError: Si la clave no esta en el banco.
+        """
+        return self._ultimas[self._posiciones[clave]]
+
+    def get_ultimas(self) -> 'array[float]':
+        """Obtiene una COPIA de las ultimas lecturas (por posicion)."""
+        with self._lock:
+            return array('d', self._ultimas)
+
+    def get_historial(self, clave: Hashable) -> 'array[float]':
+        """
+        Obtiene las lecturas de un sensor en la ventana, de la mas
+        antigua a la mas reciente (hasta SENSOR_BANK_VENTANA ticks).
+
+        Raises:
+            KeyError: Si la clave no esta en el banco.
+        """
+        posicion = self._posiciones[clave]
+        with self._lock:
+            # Columna del sensor: una lectura cada N posiciones
+            columna = self._historial[posicion::self._cantidad]
+            ticks = self._ticks
+        if ticks < self._ventana:
+            return columna[:ticks]
+        inicio = ticks % self._ventana  # fila mas antigua
+        return columna[inicio:] + columna[:inicio]
+
+    def get_promedio(self) -> float | None:
+        """Obtiene el promedio de las ultimas lecturas (None si no hay sensores)."""
+        with self._lock:
+            return sum(self._ultimas) / self._cantidad if self._cantidad else None
+
+    def get_por_debajo(self, umbral: float) -> List[Hashable]:
+        """
+        Obtiene las claves de los sensores con lectura menor al umbral
+        (ej. suelo seco).
+
+        Args:
+            umbral (float): El valor limite.
+
+        Returns:
+            List[Hashable]: Las claves, por posicion.
+        """
+        with self._lock:
+            return [self._claves[i] for i, valor in enumerate(self._ultimas) if valor < umbral]
+
+    # --- Metodos privados ---
+
+    def _registrar(self, nuevas: 'array[float]', instante: float) -> LoteLecturas:
+        """
+        Metodo privado (con el lock tomado) que guarda las lecturas
+        del tick, su fila del historial, y arma el lote de cambios.
+        """
+        cantidad = self._cantidad
+        inicio = (self._ticks % self._ventana) * cantidad
+        self._historial[inicio:inicio + cantidad] = nuevas
+        self._ultimas = nuevas
+        self._ticks += 1
+
+        notificadas = self._notificadas
+        cambiaron = map(gt, map(abs, map(sub, nuevas, notificadas)), repeat(self._umbral))
+        indices = array('l', compress(range(cantidad), cambiaron))
+        valores = array('d', map(nuevas.__getitem__, indices))
+        deltas = array('d', map(sub, valores, map(notificadas.__getitem__, indices)))
+        for i, valor in zip(indices, valores):
+            notificadas[i] = valor
+        return LoteLecturas(self._ticks, instante, indices, valores, deltas)
@@ -0,0 +1,66 @@
+"""
+Modulo de la tarea SensorBankTask (Thread).
+Un unico hilo que hace avanzar un SensorBank completo.
+"""
+import threading
+from typing import Callable, Sequence
+
+from python_forestacion.riego.sensores.sensor_bank import SensorBank
+from python_forestacion import constantes as C
+
+# TypeAlias de la fuente de lecturas de un tick (una por sensor)
+FuenteLecturas = Callable[[], Sequence[float]]
+
+
+class SensorBankTask(threading.Thread):
+    """
+    Thread daemon que, cada INTERVALO_SENSOR_BANK segundos, hace
+    avanzar TODOS los sensores de un SensorBank en un solo tick
+    (ingiriendo las lecturas de una fuente o simulandolas).
+
+    Reemplaza a un Thread por sensor: un banco de 100k sensores
+    usa un unico hilo.
+
+    Referencia: US-011, US-013
+    """
+
+    def __init__(self,
+                 banco: SensorBank,
+                 fuente: FuenteLecturas | None = None,
+                 intervalo: float = C.INTERVALO_SENSOR_BANK):
+        """
+        Inicializa la tarea (daemon, Rubrica 5.1).
+
+        Args:
+            banco (SensorBank): El banco a actualizar.
+            fuente (FuenteLecturas | None, optional): Devuelve las
+                lecturas de un tick (None: simularlas).
+            intervalo (float, optional): Segundos entre ticks.
+        """
+        super().__init__(daemon=True, name="SensorBankThread")
+        self._banco: SensorBank = banco
+        self._fuente: FuenteLecturas | None = fuente
+        self._intervalo: float = intervalo
+        self._detenido: threading.Event = threading.Event()
+
+    def run(self) -> None:
+        """
+        Metodo principal del Thread.
+        Se ejecuta al llamar a .start()
+        """
+        print(f"[{self.name}] Iniciando banco de {self._banco.get_cantidad()} sensores...")
+        while not self._detenido.is_set():
+            if self._fuente is None:
+                self._banco.simular()
+            else:
+                self._banco.ingerir(self._fuente())
+            self._detenido.wait(timeout=self._intervalo)
+        print(f"[{self.name}] Banco de sensores detenido.")
+
+    def detener(self) -> None:
+        """
+        Solicita la detencion del thread de forma segura.
+        (US-013)
+        """
+        print(f"[{self.name}] Solicitando detencion del banco de sensores...")
+        self._detenido.set()
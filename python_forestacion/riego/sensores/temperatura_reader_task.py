@@ -9,6 +9,9 @@ from typing_extensions import override
 # --- Imports de Patrones ---
 from python_forestacion.patrones.observer.observable import Observable
 
+# --- Imports de Sensores ---
+from python_forestacion.riego.sensores.proceso_sensor import ProcesoSensor
+
 # --- Imports de Constantes ---
 from python_forestacion import constantes as C
 
@@ -20,15 +23,22 @@ class TemperaturaReaderTask(threading.Thread, Observable[float]):
         leyendo temperatura cada N segundos.
     2.  Como Observable[float] (US-TECH-003): Notifica a sus
         observadores cada vez que tiene una nueva lectura.
+    3.  Modo en proceso (en_proceso=True): el muestreo corre en un
+        proceso hijo (ProcesoSensor) que publica la ultima lectura en
+        memoria compartida; el thread solo notifica las lecturas
+        nuevas y get_ultima_lectura() lee la memoria sin locks.
     """
     
-    def __init__(self):
+    def __init__(self, en_proceso: bool = False):
         """
         Inicializa el sensor.
         
         Configura el thread como 'daemon' para que finalice
         automaticamente cuando el programa principal termine.
         (Rubrica 5.1)
+
+        Args:
+            en_proceso (bool, optional): Muestrear en un proceso hijo.
         """
         # --- CORRECCION AQUI ---
         # Llamamos a los __init__ de CADA padre explícitamente
@@ -46,8 +56,19 @@ class TemperaturaReaderTask(threading.Thread, Observable[float]):
         # 4. Almacenamiento de ultima lectura (para PULL)
         self._ultima_lectura: float = 20.0 # Un valor inicial default
 
-    def _leer_temperatura(self) -> float:
-        """Simula la lectura de un sensor fisico."""
+        # 5. Muestreo en proceso hijo (opcional)
+        self._proceso: ProcesoSensor | None = None
+        if en_proceso:
+            self._proceso = ProcesoSensor(TemperaturaReaderTask._leer_temperatura,
+                                          C.INTERVALO_SENSOR_TEMPERATURA,
+                                          self._ultima_lectura, "SensorTempProceso")
+
+    @staticmethod
+    def _leer_temperatura() -> float:
+        """
+        Simula la lectura de un sensor fisico.
+        (Estatico: lo importa por nombre el proceso hijo.)
+        """
         temp = random.uniform(C.SENSOR_TEMP_MIN, C.SENSOR_TEMP_MAX)
         return temp
 
@@ -57,6 +78,10 @@ class TemperaturaReaderTask(threading.Thread, Observable[float]):
         Se ejecuta al llamar a .start()
         """
         print(f"[{self.name}] Iniciando sensor de temperatura...")
+        if self._proceso is not None:
+            self._notificar_desde_proceso()
+            print(f"[{self.name}] Sensor de temperatura detenido.")
+            return
         while not self._detenido.is_set():
             # 1. Leer valor
             temperatura = self._leer_temperatura()
@@ -73,6 +98,23 @@ class TemperaturaReaderTask(threading.Thread, Observable[float]):
                 
         print(f"[{self.name}] Sensor de temperatura detenido.")
 
+    def _notificar_desde_proceso(self) -> None:
+        """
+        Metodo privado (modo en proceso) que inicia el proceso hijo y
+        notifica a los observadores cada lectura nueva publicada.
+        """
+        self._proceso.iniciar()
+        try:
+            secuencia = 0
+            while not self._detenido.is_set():
+                temperatura, _, actual = self._proceso.leer()
+                if actual != secuencia:
+                    secuencia = actual
+                    self.notificar_observadores(temperatura)
+                self._detenido.wait(timeout=C.SENSOR_PROCESO_SONDEO)
+        finally:
+            self._proceso.detener()
+
     def detener(self) -> None:
         """
         Solicita la detencion del thread de forma segura.
@@ -89,4 +131,6 @@ class TemperaturaReaderTask(threading.Thread, Observable[float]):
         Returns:
             float: La ultima temperatura registrada.
         """
+        if self._proceso is not None:
+            return self._proceso.leer()[0]
         return self._ultima_lectura
\ No newline at end of file
@@ -31,21 +31,24 @@ class ArbolService(CultivoService):
 
     @abstractmethod
     @override
-    def mostrar_datos(self, cultivo: 'Arbol') -> None:
+    def formatear_datos(self, cultivo: 'Arbol') -> str:
         """
-        Metodo abstracto para mostrar datos (redefinido para Arbol).
+        Metodo abstracto para formatear datos (redefinido para Arbol).
 
         Args:
-            cultivo (Arbol): El arbol (Pino u Olivo) a mostrar.
+            cultivo (Arbol): El arbol (Pino u Olivo) a formatear.
+
+        Returns:
+            str: La base comun a todos los arboles.
         """
-        # Imprime la base comun a todos los arboles
-        print(f"Cultivo: {cultivo.get_tipo()}")
-        print(f"Superficie: {cultivo.get_superficie()} m²")
-        print(f"Agua almacenada: {cultivo.get_agua()} L")
-        print(f"ID: {cultivo.get_id()}")
+        # Arma la base comun a todos los arboles
         # El type checker sabe que 'cultivo' (que es 'Arbol')
         # tendra 'get_altura()'
-        print(f"Altura: {cultivo.get_altura():.2f} m") # Formatea a 2 decimales
+        return (f"Cultivo: {cultivo.get_tipo()}\n"
+                f"Superficie: {cultivo.get_superficie()} m²\n"
+                f"Agua almacenada: {cultivo.get_agua()} L\n"
+                f"ID: {cultivo.get_id()}\n"
+                f"Altura: {cultivo.get_altura():.2f} m") # Formatea a 2 decimales
 
     def crecer(self, arbol: 'Arbol', cantidad_crecimiento: float) -> None:
         """
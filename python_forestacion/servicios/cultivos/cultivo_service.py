@@ -3,11 +3,11 @@ Modulo de la clase base abstracta CultivoService.
 """
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from datetime import date
-from typing import TYPE_CHECKING
+from typing import Iterable, TYPE_CHECKING
 
 # Imports para la inyeccion del Strategy
 from python_forestacion.patrones.strategy.absorcion_agua_strategy import AbsorcionAguaStrategy
+from python_forestacion.patrones.strategy.contexto_riego import ContextoRiego
 
 # Imports para type hints
 if TYPE_CHECKING:
@@ -34,26 +34,29 @@ class CultivoService(ABC):
         """
         self._estrategia_absorcion: AbsorcionAguaStrategy = estrategia_absorcion
 
-    def absorber_agua(self, cultivo: Cultivo) -> int:
+    def absorber_agua(self,
+                      cultivo: Cultivo,
+                      contexto: ContextoRiego | None = None) -> int:
         """
         Calcula y aplica la absorcion de agua a un cultivo.
         
-        Delega el calculo al patron Strategy inyectado.
+        Delega el calculo al patron Strategy inyectado, a traves del
+        contexto del ciclo de riego (fecha unica y memoizacion).
         
         Args:
             cultivo (Cultivo): El cultivo que va a absorber agua.
+            contexto (ContextoRiego | None, optional): Contexto del ciclo
+                de riego (si no se indica, se crea uno con la fecha actual).
 
         Returns:
             int: La cantidad de agua que fue absorbida.
         """
-        # 1. Obtiene la fecha actual (necesaria para el strategy)
-        fecha_actual = date.today()
+        # 1. Obtiene el contexto (fecha del riego, necesaria para el strategy)
+        if contexto is None:
+            contexto = ContextoRiego()
         
         # 2. DELEGA el calculo al Strategy
-        agua_absorbida = self._estrategia_absorcion.calcular_absorcion(
-            fecha=fecha_actual,
-            cultivo=cultivo
-        )
+        agua_absorbida = contexto.calcular_absorcion(self._estrategia_absorcion, cultivo)
         
         # 3. Aplica el resultado al cultivo
         if agua_absorbida > 0:
@@ -62,15 +65,77 @@ class CultivoService(ABC):
             
         return agua_absorbida
 
-    @abstractmethod
+    def absorber_agua_lote(self,
+                           cultivos: Iterable[Cultivo],
+                           contexto: ContextoRiego | None = None) -> int:
+        """
+        Aplica la absorcion de agua a muchos cultivos de ESTA especie.
+
+        Misma logica que 'absorber_agua' con un unico contexto para
+        todo el lote: si la estrategia es cacheable se evalua una
+        sola vez por especie; si no, una vez por cultivo.
+
+        Args:
+            cultivos (Iterable[Cultivo]): Cultivos de la especie del servicio.
+            contexto (ContextoRiego | None, optional): Contexto del ciclo
+                de riego (si no se indica, se crea uno con la fecha actual).
+
+        Returns:
+            int: El agua total absorbida por el lote.
+        """
+        if contexto is None:
+            contexto = ContextoRiego()
+        estrategia = self._estrategia_absorcion
+        calcular_absorcion = contexto.calcular_absorcion
+
+        total_absorbido = 0
+        for cultivo in cultivos:
+            agua_absorbida = calcular_absorcion(estrategia, cultivo)
+            if agua_absorbida > 0:
+                cultivo.set_agua(cultivo.get_agua() + agua_absorbida)
+                total_absorbido += agua_absorbida
+        return total_absorbido
+
+    def get_estrategia_absorcion(self) -> AbsorcionAguaStrategy:
+        """Obtiene la estrategia de absorcion inyectada."""
+        return self._estrategia_absorcion
+
     def mostrar_datos(self, cultivo: Cultivo) -> None:
         """
-        Metodo abstracto para mostrar los datos especificos
-        de cada tipo de cultivo (US-009).
+        Muestra los datos especificos de cada tipo de cultivo (US-009).
+
+        Imprime, en una sola escritura, el texto de 'formatear_datos'.
+
+        Args:
+            cultivo (Cultivo): El cultivo a mostrar.
+        """
+        print(self.formatear_datos(cultivo))
+
+    @abstractmethod
+    def formatear_datos(self, cultivo: Cultivo) -> str:
+        """
+        Metodo abstracto que arma el texto con los datos especificos
+        de cada tipo de cultivo (US-009), sin imprimirlo.
         
         Sera implementado por las clases hijas.
 
         Args:
-            cultivo (Cultivo): El cultivo a mostrar.
+            cultivo (Cultivo): El cultivo a formatear.
+
+        Returns:
+            str: Los datos del cultivo, una linea por dato.
+        """
+        pass
+
+    def obtener_variedad(self, cultivo: Cultivo) -> str:
+        """
+        Obtiene la variedad del cultivo, usada para agrupar reportes.
+        Las clases hijas la redefinen (variedad, tipo de aceituna, etc.).
+
+        Args:
+            cultivo (Cultivo): El cultivo.
+
+        Returns:
+            str: La variedad ("" si la especie no tiene variedades).
         """
-        pass
\ No newline at end of file
+        return ""
\ No newline at end of file
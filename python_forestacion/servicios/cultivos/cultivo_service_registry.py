@@ -6,8 +6,10 @@ Implementa dos patrones de diseño:
 2.  Registry: Despacha operaciones al servicio correcto sin ifs.
 """
 from __future__ import annotations
+from datetime import date
 from threading import Lock
-from typing import Dict, Type, Callable, Any, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple, Type, Callable, TYPE_CHECKING
 from typing_extensions import override
 
 # Imports de Entidades (para las llaves del diccionario)
@@ -23,11 +25,23 @@ from python_forestacion.servicios.cultivos.pino_service import PinoService
 from python_forestacion.servicios.cultivos.olivo_service import OlivoService
 from python_forestacion.servicios.cultivos.lechuga_service import LechugaService
 from python_forestacion.servicios.cultivos.zanahoria_service import ZanahoriaService
+from python_forestacion.servicios.cultivos.especie_cultivo import EspecieCultivo
+
+# Imports de Patrones (estrategias y creadores de las especies del sistema)
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+from python_forestacion.patrones.strategy.impl.absorcion_seasonal_strategy import AbsorcionSeasonalStrategy
+from python_forestacion.patrones.strategy.impl.absorcion_constante_strategy import AbsorcionConstanteStrategy
+from python_forestacion.patrones.strategy.contexto_riego import ContextoRiego
+
+# Imports de Constantes
+from python_forestacion import constantes as C
 
 # TypeAlias para los diccionarios del Registry
 CultivoType = Type[Cultivo]
-AbsorcionHandler = Callable[[Cultivo], int]
+AbsorcionHandler = Callable[[Cultivo, ContextoRiego | None], int]
 MostrarHandler = Callable[[Cultivo], None]
+FormatearHandler = Callable[[Cultivo], str]
+CrecerHandler = Callable[[Cultivo], None]
 
 
 class CultivoServiceRegistry:
@@ -39,6 +53,10 @@ class CultivoServiceRegistry:
     - Como Registry (US-TECH-005), centraliza el despacho
       polimorfico de operaciones (absorber_agua, mostrar_datos)
       evitando el uso de 'isinstance()'.
+    - Las especies se declaran con 'registrar_especie' (EspecieCultivo);
+      las tablas de dispatch se arman a partir de ellas y las
+      operaciones por lote ('*_lote') resuelven el handler una vez
+      por especie en lugar de una vez por cultivo.
     """
 
     # --- Implementacion del Patron Singleton (US-TECH-001) ---
@@ -88,45 +106,141 @@ class CultivoServiceRegistry:
     def __init__(self):
         """
         Inicializa el Registry.
-        
-        Gracias al Singleton, este __init__ se ejecutara
-        UNA SOLA VEZ en toda la vida de la aplicacion.
-        
-        Aqui creamos las instancias de los servicios y
-        construimos los diccionarios de handlers (dispatch).
-        """
-        # 1. Crear instancias unicas de cada servicio
-        self._pino_service: PinoService = PinoService()
-        self._olivo_service: OlivoService = OlivoService()
-        self._lechuga_service: LechugaService = LechugaService()
-        self._zanahoria_service: ZanahoriaService = ZanahoriaService()
-
-        # 2. Construir diccionario para 'absorber_agua'
-        self._absorber_agua_handlers: Dict[CultivoType, AbsorcionHandler] = {
-            Pino: self._pino_service.absorber_agua,
-            Olivo: self._olivo_service.absorber_agua,
-            Lechuga: self._lechuga_service.absorber_agua,
-            Zanahoria: self._zanahoria_service.absorber_agua
-        }
-
-        # 3. Construir diccionario para 'mostrar_datos'
-        self._mostrar_datos_handlers: Dict[CultivoType, MostrarHandler] = {
-            Pino: self._pino_service.mostrar_datos,
-            Olivo: self._olivo_service.mostrar_datos,
-            Lechuga: self._lechuga_service.mostrar_datos,
-            Zanahoria: self._zanahoria_service.mostrar_datos
-        }
-        
-        # 4. Construir diccionario para 'crecer' (solo arboles)
-        # Usamos 'Any' porque no todos los servicios tienen 'crecer'
-        self._crecer_handlers: Dict[CultivoType, Any] = {
-            Pino: self._pino_service.crecer,
-            Olivo: self._olivo_service.crecer,
-        }
+
+        Gracias al Singleton, la inicializacion se ejecuta UNA SOLA
+        VEZ (si alguien vuelve a llamar al constructor, se conservan
+        las especies ya registradas).
+
+        Registra las especies del sistema; cada registro reconstruye
+        las tablas de dispatch (diccionarios de handlers).
+        """
+        if getattr(self, "_inicializado", False):
+            return
+
+        # Lock para serializar los registros de especies.
+        # El dispatch NO toma el lock: lee tablas congeladas que se
+        # reemplazan enteras en cada registro.
+        self._lock_especies: Lock = Lock()
+        self._especies: Dict[str, EspecieCultivo] = {}
+        self._reconstruir_tablas()
+
+        # Especies del sistema (US-004 a US-007)
+        for especie in CultivoServiceRegistry._crear_especies_predeterminadas():
+            self.registrar_especie(especie)
+
+        self._inicializado: bool = True
+
+    @staticmethod
+    def _crear_especies_predeterminadas() -> List[EspecieCultivo]:
+        """
+        Metodo privado que declara las especies del sistema, cada una
+        con su servicio (y estrategia de absorcion) y regla de crecimiento.
+        """
+        pino_service = PinoService(AbsorcionSeasonalStrategy())
+        olivo_service = OlivoService(AbsorcionSeasonalStrategy())
+        lechuga_service = LechugaService(
+            AbsorcionConstanteStrategy(C.ABSORCION_CONSTANTE_LECHUGA))
+        zanahoria_service = ZanahoriaService(
+            AbsorcionConstanteStrategy(C.ABSORCION_CONSTANTE_ZANAHORIA))
+
+        return [
+            EspecieCultivo("Pino", Pino, pino_service,
+                           CultivoFactory.get_creador("Pino"),
+                           pino_service.crecer),
+            EspecieCultivo("Olivo", Olivo, olivo_service,
+                           CultivoFactory.get_creador("Olivo"),
+                           olivo_service.crecer),
+            EspecieCultivo("Lechuga", Lechuga, lechuga_service,
+                           CultivoFactory.get_creador("Lechuga")),
+            EspecieCultivo("Zanahoria", Zanahoria, zanahoria_service,
+                           CultivoFactory.get_creador("Zanahoria")),
+        ]
+
+    def registrar_especie(self, especie: EspecieCultivo) -> None:
+        """
+        Registra (o reemplaza) una especie de cultivo.
+
+        Registra su creador en el CultivoFactory y reconstruye todas
+        las tablas de dispatch, por lo que agregar una especie no
+        requiere modificar el Registry, el Factory ni los servicios.
+
+        Args:
+            especie (EspecieCultivo): La declaracion de la especie.
+
+        Raises:
+            ValueError: Si la clase de cultivo ya esta registrada
+                con otro nombre de especie.
+        """
+        with self._lock_especies:
+            for existente in self._especies.values():
+                if (existente.get_clase_cultivo() is especie.get_clase_cultivo()
+                        and existente.get_nombre() != especie.get_nombre()):
+                    raise ValueError(
+                        f"La clase {especie.get_clase_cultivo().__name__} ya esta "
+                        f"registrada como '{existente.get_nombre()}'")
+
+            self._especies = {**self._especies, especie.get_nombre(): especie}
+            CultivoFactory.registrar_creador(especie.get_nombre(), especie.get_creador())
+            self._reconstruir_tablas()
+
+    def get_especie(self, nombre: str) -> EspecieCultivo:
+        """
+        Obtiene la declaracion de una especie registrada.
+
+        Args:
+            nombre (str): Nombre de la especie (ej. "Pino").
+
+        Raises:
+            ValueError: Si la especie no esta registrada.
+
+        Returns:
+            EspecieCultivo: La declaracion de la especie.
+        """
+        especie = self._especies.get(nombre)
+        if especie is None:
+            raise ValueError(f"Especie de cultivo desconocida: {nombre}")
+        return especie
+
+    def get_especies(self) -> List[str]:
+        """Obtiene los nombres de las especies registradas."""
+        return list(self._especies)
+
+    def _reconstruir_tablas(self) -> None:
+        """
+        Metodo privado que arma las tablas de dispatch a partir de las
+        especies registradas y las publica congeladas (MappingProxyType).
+        """
+        especies = list(self._especies.values())
+
+        servicios: Dict[CultivoType, CultivoService] = {}
+        absorber: Dict[CultivoType, AbsorcionHandler] = {}
+        mostrar: Dict[CultivoType, MostrarHandler] = {}
+        formatear: Dict[CultivoType, FormatearHandler] = {}
+        variedad: Dict[CultivoType, FormatearHandler] = {}
+        crecer: Dict[CultivoType, CrecerHandler] = {}
+
+        for especie in especies:
+            tipo = especie.get_clase_cultivo()
+            servicio = especie.get_servicio()
+            servicios[tipo] = servicio
+            absorber[tipo] = servicio.absorber_agua
+            mostrar[tipo] = servicio.mostrar_datos
+            formatear[tipo] = servicio.formatear_datos
+            variedad[tipo] = servicio.obtener_variedad
+            regla = especie.get_regla_crecimiento()
+            if regla is not None:
+                crecer[tipo] = regla
+
+        self._servicios: Mapping[CultivoType, CultivoService] = MappingProxyType(servicios)
+        self._absorber_agua_handlers: Mapping[CultivoType, AbsorcionHandler] = MappingProxyType(absorber)
+        self._mostrar_datos_handlers: Mapping[CultivoType, MostrarHandler] = MappingProxyType(mostrar)
+        self._formatear_datos_handlers: Mapping[CultivoType, FormatearHandler] = MappingProxyType(formatear)
+        self._obtener_variedad_handlers: Mapping[CultivoType, FormatearHandler] = MappingProxyType(variedad)
+        self._crecer_handlers: Mapping[CultivoType, CrecerHandler] = MappingProxyType(crecer)
 
     def _get_handler(self,
                      cultivo: Cultivo,
-                     handlers_dict: Dict) -> Callable:
+                     handlers_dict: Mapping) -> Callable:
         """
         Metodo privado para buscar un handler en un diccionario
         de despacho.
@@ -141,19 +255,22 @@ class CultivoServiceRegistry:
 
     # --- Metodos Publicos (Dispatch Polimorfico) ---
 
-    def absorber_agua(self, cultivo: Cultivo) -> int:
+    def absorber_agua(self,
+                      cultivo: Cultivo,
+                      contexto: ContextoRiego | None = None) -> int:
         """
         Despacha la operacion 'absorber_agua' al servicio
         correcto usando el Registry.
 
         Args:
             cultivo (Cultivo): El cultivo que absorbe agua.
+            contexto (ContextoRiego | None, optional): Contexto del ciclo de riego.
 
         Returns:
             int: El agua absorbida.
         """
         handler = self._get_handler(cultivo, self._absorber_agua_handlers)
-        return handler(cultivo)
+        return handler(cultivo, contexto)
 
     def mostrar_datos(self, cultivo: Cultivo) -> None:
         """
@@ -176,4 +293,273 @@ class CultivoServiceRegistry:
         """
         # Este metodo fallara si se le pasa una Lechuga
         handler = self._get_handler(arbol, self._crecer_handlers)
-        handler(arbol)
\ No newline at end of file
+        handler(arbol)
+
+    def formatear_datos(self, cultivo: Cultivo) -> str:
+        """
+        Despacha la operacion 'formatear_datos' al servicio
+        correcto usando el Registry. (US-009)
+
+        Args:
+            cultivo (Cultivo): El cultivo a formatear.
+
+        Returns:
+            str: Los datos del cultivo, sin imprimir.
+        """
+        handler = self._get_handler(cultivo, self._formatear_datos_handlers)
+        return handler(cultivo)
+
+    def obtener_variedad(self, cultivo: Cultivo) -> str:
+        """
+        Despacha la operacion 'obtener_variedad' al servicio
+        correcto usando el Registry.
+
+        Args:
+            cultivo (Cultivo): El cultivo.
+
+        Returns:
+            str: La variedad del cultivo.
+        """
+        handler = self._get_handler(cultivo, self._obtener_variedad_handlers)
+        return handler(cultivo)
+
+    def obtener_variedades(self,
+                           tipo_cultivo: CultivoType,
+                           cultivos: Iterable[Cultivo]) -> List[str]:
+        """
+        Obtiene la variedad de muchos cultivos de un MISMO tipo,
+        resolviendo el handler una sola vez (para reportes).
+
+        Args:
+            tipo_cultivo (CultivoType): La clase de los cultivos.
+            cultivos (Iterable[Cultivo]): Cultivos de ese tipo.
+
+        Returns:
+            List[str]: La variedad de cada cultivo, en el mismo orden.
+        """
+        handler = self._obtener_variedad_handlers.get(tipo_cultivo)
+        if handler is None:
+            raise TypeError(f"Operacion no soportada para el tipo: {tipo_cultivo.__name__}")
+        return list(map(handler, cultivos))
+
+    def tiene_crecimiento(self, tipo_cultivo: CultivoType) -> bool:
+        """
+        Indica si un tipo de cultivo crece con el riego (es Arbol).
+
+        Args:
+            tipo_cultivo (CultivoType): La clase del cultivo.
+
+        Returns:
+            bool: True si el tipo tiene handler de 'crecer'.
+        """
+        return tipo_cultivo in self._crecer_handlers
+
+    def get_servicio(self, tipo_cultivo: CultivoType) -> CultivoService:
+        """
+        Obtiene el servicio registrado para una clase de cultivo.
+
+        Args:
+            tipo_cultivo (CultivoType): La clase del cultivo.
+
+        Raises:
+            TypeError: Si la clase no esta registrada.
+
+        Returns:
+            CultivoService: El servicio de la especie.
+        """
+        servicio = self._servicios.get(tipo_cultivo)
+        if servicio is None:
+            raise TypeError(f"Operacion no soportada para el tipo: {tipo_cultivo.__name__}")
+        return servicio
+
+    def get_regla_crecimiento(self, tipo_cultivo: CultivoType) -> CrecerHandler | None:
+        """
+        Obtiene la regla de crecimiento de una clase de cultivo.
+
+        Args:
+            tipo_cultivo (CultivoType): La clase del cultivo.
+
+        Returns:
+            CrecerHandler | None: La regla, o None si la especie no crece.
+        """
+        return self._crecer_handlers.get(tipo_cultivo)
+
+    # --- Metodos Publicos (Dispatch por lotes) ---
+
+    def agrupar_por_tipo(self, cultivos: Iterable[Cultivo]) -> Dict[CultivoType, List[Cultivo]]:
+        """
+        Agrupa cultivos por clase, en una sola pasada y conservando
+        el orden relativo dentro de cada grupo.
+
+        Args:
+            cultivos (Iterable[Cultivo]): Los cultivos a agrupar.
+
+        Returns:
+            Dict[CultivoType, List[Cultivo]]: clase -> cultivos de esa clase.
+        """
+        grupos: Dict[CultivoType, List[Cultivo]] = {}
+        for cultivo in cultivos:
+            grupo = grupos.get(type(cultivo))
+            if grupo is None:
+                grupo = grupos[type(cultivo)] = []
+            grupo.append(cultivo)
+        return grupos
+
+    def absorber_agua_lote(self,
+                           cultivos: Iterable[Cultivo],
+                           contexto: ContextoRiego | None = None) -> int:
+        """
+        Aplica la absorcion de agua a muchos cultivos (US-008).
+
+        Resuelve el servicio UNA vez por especie (no por cultivo) y
+        delega cada grupo en el 'absorber_agua_lote' del servicio,
+        compartiendo un mismo contexto de riego.
+
+        Args:
+            cultivos (Iterable[Cultivo]): Los cultivos que absorben agua.
+            contexto (ContextoRiego | None, optional): Contexto del ciclo
+                de riego (si no se indica, se crea uno para esta llamada).
+
+        Raises:
+            TypeError: Si hay cultivos de una especie no registrada.
+
+        Returns:
+            int: El agua total absorbida.
+        """
+        if contexto is None:
+            contexto = ContextoRiego()
+        total_absorbido = 0
+        for tipo_cultivo, grupo in self.agrupar_por_tipo(cultivos).items():
+            total_absorbido += self.get_servicio(tipo_cultivo).absorber_agua_lote(
+                grupo, contexto)
+        return total_absorbido
+
+    def crecer_lote(self, cultivos: Iterable[Cultivo]) -> int:
+        """
+        Aplica la regla de crecimiento a los cultivos que la tienen
+        (arboles); el resto se ignora. (US-008)
+
+        Args:
+            cultivos (Iterable[Cultivo]): Los cultivos regados.
+
+        Returns:
+            int: Cantidad de cultivos que crecieron.
+        """
+        cantidad = 0
+        for tipo_cultivo, grupo in self.agrupar_por_tipo(cultivos).items():
+            cantidad += self._crecer_grupo(tipo_cultivo, grupo)
+        return cantidad
+
+    def regar_lote(self,
+                   cultivos: Iterable[Cultivo],
+                   contexto: ContextoRiego | None = None) -> int:
+        """
+        Aplica un riego completo (absorcion y, si corresponde,
+        crecimiento) a muchos cultivos, agrupando por especie. (US-008)
+
+        Args:
+            cultivos (Iterable[Cultivo]): Los cultivos a regar.
+            contexto (ContextoRiego | None, optional): Contexto del ciclo
+                de riego (si no se indica, se crea uno para esta llamada).
+
+        Raises:
+            TypeError: Si hay cultivos de una especie no registrada.
+
+        Returns:
+            int: El agua total absorbida.
+        """
+        if contexto is None:
+            contexto = ContextoRiego()
+        total_absorbido = 0
+        for tipo_cultivo, grupo in self.agrupar_por_tipo(cultivos).items():
+            total_absorbido += self.get_servicio(tipo_cultivo).absorber_agua_lote(
+                grupo, contexto)
+            self._crecer_grupo(tipo_cultivo, grupo)
+        return total_absorbido
+
+    def regar_lote_acumulado(self,
+                             cultivos: Iterable[Cultivo],
+                             riegos: Sequence[Tuple[date, int]]) -> int:
+        """
+        Aplica de una vez el efecto de muchos riegos (US-008), con el
+        mismo resultado que llamar a 'regar_lote' riego por riego.
+
+        - Estrategias cacheables: la absorcion se evalua una vez por
+          (fecha, especie) y cada cultivo recibe la suma en UNA
+          escritura (suma entera, exacta).
+        - Crecimiento: las reglas solo dependen de la altura, por lo
+          que los arboles se agrupan por (especie, altura) y la suma
+          repetida de punto flotante se hace una vez por grupo; el
+          resultado es identico bit a bit al del riego paso a paso.
+        - Estrategias no cacheables: se aplican riego por riego.
+
+        Args:
+            cultivos (Iterable[Cultivo]): Los cultivos a regar.
+            riegos (Sequence[Tuple[date, int]]): (fecha, cantidad de riegos)
+                en orden cronologico.
+
+        Raises:
+            TypeError: Si hay cultivos de una especie no registrada.
+
+        Returns:
+            int: El agua total absorbida.
+        """
+        total_riegos = sum(cantidad for _, cantidad in riegos)
+        total_absorbido = 0
+        for tipo_cultivo, grupo in self.agrupar_por_tipo(cultivos).items():
+            servicio = self.get_servicio(tipo_cultivo)
+            estrategia = servicio.get_estrategia_absorcion()
+
+            if not estrategia.es_cacheable():
+                for fecha, cantidad in riegos:
+                    for _ in range(cantidad):
+                        total_absorbido += servicio.absorber_agua_lote(
+                            grupo, ContextoRiego(fecha))
+                        self._crecer_grupo(tipo_cultivo, grupo)
+                continue
+
+            # Absorcion acumulada por cultivo (igual para toda la especie)
+            agua_por_cultivo = 0
+            for fecha, cantidad in riegos:
+                agua = ContextoRiego(fecha).calcular_absorcion(estrategia, grupo[0])
+                if agua > 0:
+                    agua_por_cultivo += agua * cantidad
+            if agua_por_cultivo > 0:
+                for cultivo in grupo:
+                    cultivo.set_agua(cultivo.get_agua() + agua_por_cultivo)
+                total_absorbido += agua_por_cultivo * len(grupo)
+
+            regla = self._crecer_handlers.get(tipo_cultivo)
+            if regla is not None and total_riegos > 0:
+                CultivoServiceRegistry._crecer_acumulado(grupo, regla, total_riegos)
+        return total_absorbido
+
+    @staticmethod
+    def _crecer_acumulado(arboles: List[Cultivo], regla: CrecerHandler, cantidad: int) -> None:
+        """
+        Metodo privado que aplica 'cantidad' veces la regla de
+        crecimiento: se simula sobre un arbol por altura inicial
+        distinta y el resto de ese grupo toma la altura final.
+        """
+        alturas_finales: Dict[float, float] = {}
+        for arbol in arboles:
+            altura = arbol.get_altura()  # type: ignore
+            altura_final = alturas_finales.get(altura)
+            if altura_final is None:
+                for _ in range(cantidad):
+                    regla(arbol)
+                alturas_finales[altura] = arbol.get_altura()  # type: ignore
+            else:
+                arbol.set_altura(altura_final)  # type: ignore
+
+    def _crecer_grupo(self, tipo_cultivo: CultivoType, grupo: List[Cultivo]) -> int:
+        """
+        Metodo privado que aplica la regla de crecimiento a un grupo
+        homogeneo. Retorna la cantidad de cultivos que crecieron.
+        """
+        regla = self._crecer_handlers.get(tipo_cultivo)
+        if regla is None:
+            return 0
+        for cultivo in grupo:
+            regla(cultivo)
+        return len(grupo)
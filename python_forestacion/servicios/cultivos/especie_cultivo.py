@@ -0,0 +1,87 @@
+"""
+Modulo de la clase EspecieCultivo.
+Declaracion de una especie para el registro de especies del Registry.
+"""
+from __future__ import annotations
+from typing import Callable, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.cultivos.cultivo import Cultivo
+    from python_forestacion.servicios.cultivos.cultivo_service import CultivoService
+    from python_forestacion.patrones.strategy.absorcion_agua_strategy import AbsorcionAguaStrategy
+
+# TypeAlias de los callables de una especie
+CreadorCultivo = Callable[[], "Cultivo"]
+ReglaCrecimiento = Callable[["Cultivo"], None]
+
+
+class EspecieCultivo:
+    """
+    Declaracion (solo lectura) de una especie de cultivo.
+
+    Reune en un solo lugar todo lo que el sistema necesita de una
+    especie: la clase de la entidad, el servicio (con su estrategia
+    de absorcion ya inyectada), el creador usado por el Factory y,
+    si la especie crece con el riego, su regla de crecimiento.
+
+    Se registra con CultivoServiceRegistry.registrar_especie().
+
+    Referencia: US-TECH-002, US-TECH-005
+    """
+
+    def __init__(self,
+                 nombre: str,
+                 clase_cultivo: Type[Cultivo],
+                 servicio: CultivoService,
+                 creador: CreadorCultivo,
+                 regla_crecimiento: ReglaCrecimiento | None = None):
+        """
+        Inicializa la declaracion de la especie.
+
+        Args:
+            nombre (str): Nombre de la especie (ej. "Pino"), usado por el Factory.
+            clase_cultivo (Type[Cultivo]): Clase de la entidad (llave del dispatch).
+            servicio (CultivoService): Servicio de la especie.
+            creador (CreadorCultivo): Crea un cultivo con valores por defecto.
+            regla_crecimiento (ReglaCrecimiento | None, optional): Aplica el
+                crecimiento de un riego a un cultivo (None si no crece).
+
+        Raises:
+            ValueError: Si el nombre esta vacio.
+        """
+        if not nombre:
+            raise ValueError("El nombre de la especie no puede estar vacio")
+
+        self._nombre: str = nombre
+        self._clase_cultivo: Type[Cultivo] = clase_cultivo
+        self._servicio: CultivoService = servicio
+        self._creador: CreadorCultivo = creador
+        self._regla_crecimiento: ReglaCrecimiento | None = regla_crecimiento
+
+    def get_nombre(self) -> str:
+        """Obtiene el nombre de la especie."""
+        return self._nombre
+
+    def get_clase_cultivo(self) -> Type[Cultivo]:
+        """Obtiene la clase de la entidad de la especie."""
+        return self._clase_cultivo
+
+    def get_servicio(self) -> CultivoService:
+        """Obtiene el servicio de la especie."""
+        return self._servicio
+
+    def get_estrategia_absorcion(self) -> AbsorcionAguaStrategy:
+        """Obtiene la estrategia de absorcion (inyectada en el servicio)."""
+        return self._servicio.get_estrategia_absorcion()
+
+    def get_creador(self) -> CreadorCultivo:
+        """Obtiene el creador de cultivos de la especie."""
+        return self._creador
+
+    def get_regla_crecimiento(self) -> ReglaCrecimiento | None:
+        """Obtiene la regla de crecimiento (None si la especie no crece)."""
+        return self._regla_crecimiento
+
+    def tiene_crecimiento(self) -> bool:
+        """Indica si la especie crece con el riego."""
+        return self._regla_crecimiento is not None
@@ -8,6 +8,7 @@ from typing_extensions import override
 from python_forestacion.servicios.cultivos.cultivo_service import CultivoService
 
 # Imports para inyectar el Strategy
+from python_forestacion.patrones.strategy.absorcion_agua_strategy import AbsorcionAguaStrategy
 from python_forestacion.patrones.strategy.impl.absorcion_constante_strategy import AbsorcionConstanteStrategy
 
 # Imports para constantes
@@ -26,7 +27,7 @@ class LechugaService(CultivoService):
     Inyecta la estrategia de absorcion constante.
     """
 
-    def __init__(self):
+    def __init__(self, estrategia_absorcion: AbsorcionAguaStrategy | None = None):
         """
         Inicializa el LechugaService.
         
@@ -35,26 +36,37 @@ class LechugaService(CultivoService):
         especifica de la lechuga (1L).
         
         Referencia: US-008, Rubrica 1.4
+
+        Args:
+            estrategia_absorcion (AbsorcionAguaStrategy | None, optional):
+                Estrategia a inyectar en lugar de la por defecto
+                (la usa el registro de especies).
         """
         # Inyecta la estrategia constante con 1L
-        super().__init__(
-            AbsorcionConstanteStrategy(C.ABSORCION_CONSTANTE_LECHUGA)
-        )
+        if estrategia_absorcion is None:
+            estrategia_absorcion = AbsorcionConstanteStrategy(C.ABSORCION_CONSTANTE_LECHUGA)
+        super().__init__(estrategia_absorcion)
 
     @override
-    def mostrar_datos(self, cultivo: 'Lechuga') -> None:
+    def formatear_datos(self, cultivo: 'Lechuga') -> str:
         """
-        Muestra los datos especificos de una Lechuga.
+        Arma los datos especificos de una Lechuga.
         Implementacion de US-009.
 
         Args:
-            cultivo (Lechuga): La entidad Lechuga a mostrar.
+            cultivo (Lechuga): La entidad Lechuga a formatear.
+
+        Returns:
+            str: Los datos de la lechuga.
         """
-        # Imprime los datos base
-        print(f"Cultivo: {cultivo.get_tipo()}")
-        print(f"Superficie: {cultivo.get_superficie()} m²")
-        print(f"Agua almacenada: {cultivo.get_agua()} L")
-        
-        # Imprime los datos especificos de Lechuga
-        print(f"Variedad: {cultivo.get_variedad()}")
-        print(f"Invernadero: {cultivo.is_invernadero()}")
\ No newline at end of file
+        # Datos base + datos especificos de Lechuga
+        return (f"Cultivo: {cultivo.get_tipo()}\n"
+                f"Superficie: {cultivo.get_superficie()} m²\n"
+                f"Agua almacenada: {cultivo.get_agua()} L\n"
+                f"Variedad: {cultivo.get_variedad()}\n"
+                f"Invernadero: {cultivo.is_invernadero()}")
+
+    @override
+    def obtener_variedad(self, cultivo: 'Lechuga') -> str:
+        """Obtiene la variedad de la lechuga (ej. "Crespa")."""
+        return cultivo.get_variedad()
\ No newline at end of file
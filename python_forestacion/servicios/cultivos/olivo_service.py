@@ -8,11 +8,9 @@ from typing_extensions import override
 from python_forestacion.servicios.cultivos.arbol_service import ArbolService
 
 # Imports para inyectar el Strategy
+from python_forestacion.patrones.strategy.absorcion_agua_strategy import AbsorcionAguaStrategy
 from python_forestacion.patrones.strategy.impl.absorcion_seasonal_strategy import AbsorcionSeasonalStrategy
 
-# Imports para constantes
-from python_forestacion import constantes as C
-
 # Imports para type hints
 if TYPE_CHECKING:
     from python_forestacion.entidades.cultivos.olivo import Olivo
@@ -26,29 +24,44 @@ class OlivoService(ArbolService):
     Inyecta la estrategia de absorcion estacional (Seasonal).
     """
 
-    def __init__(self):
+    def __init__(self, estrategia_absorcion: AbsorcionAguaStrategy | None = None):
         """
         Inicializa el OlivoService.
         
         Inyecta la estrategia estacional (Seasonal).
+
+        Args:
+            estrategia_absorcion (AbsorcionAguaStrategy | None, optional):
+                Estrategia a inyectar en lugar de la por defecto
+                (la usa el registro de especies).
         """
         # Inyecta la misma estrategia que Pino
-        super().__init__(AbsorcionSeasonalStrategy())
+        if estrategia_absorcion is None:
+            estrategia_absorcion = AbsorcionSeasonalStrategy()
+        super().__init__(estrategia_absorcion)
 
     @override
-    def mostrar_datos(self, cultivo: 'Olivo') -> None:
+    def formatear_datos(self, cultivo: 'Olivo') -> str:
         """
-        Muestra los datos especificos de un Olivo.
+        Arma los datos especificos de un Olivo.
         Implementacion de US-009.
 
         Args:
-            cultivo (Olivo): La entidad Olivo a mostrar.
+            cultivo (Olivo): La entidad Olivo a formatear.
+
+        Returns:
+            str: Los datos del olivo.
         """
         # 1. Llama a la implementacion base de ArbolService
-        super().mostrar_datos(cultivo)
+        base = super().formatear_datos(cultivo)
         
-        # 2. Imprime los datos especificos de Olivo
-        print(f"Tipo de aceituna: {cultivo.get_tipo_aceituna().value}")
+        # 2. Agrega los datos especificos de Olivo
+        return f"{base}\nTipo de aceituna: {cultivo.get_tipo_aceituna().value}"
+
+    @override
+    def obtener_variedad(self, cultivo: 'Olivo') -> str:
+        """Obtiene el tipo de aceituna del olivo (ej. "Arbequina")."""
+        return cultivo.get_tipo_aceituna().value
 
     def crecer(self, arbol: 'Olivo') -> None:
         """
@@ -60,5 +73,5 @@ class OlivoService(ArbolService):
         """
         # Llama al metodo 'crecer' de la clase base (ArbolService)
         # pasandole la cantidad de crecimiento especifica del olivo
-        # definida en constantes.py
-        super().crecer(arbol, C.CRECIMIENTO_OLIVO_POR_RIEGO)
\ No newline at end of file
+        # (dato de su especificacion compartida, armada con constantes.py)
+        super().crecer(arbol, arbol.get_especificacion().get_crecimiento_por_riego())
\ No newline at end of file
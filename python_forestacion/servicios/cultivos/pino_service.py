@@ -8,11 +8,9 @@ from typing_extensions import override
 from python_forestacion.servicios.cultivos.arbol_service import ArbolService
 
 # Imports para inyectar el Strategy
+from python_forestacion.patrones.strategy.absorcion_agua_strategy import AbsorcionAguaStrategy
 from python_forestacion.patrones.strategy.impl.absorcion_seasonal_strategy import AbsorcionSeasonalStrategy
 
-# Imports para constantes
-from python_forestacion import constantes as C
-
 # Imports para type hints
 if TYPE_CHECKING:
     from python_forestacion.entidades.cultivos.pino import Pino
@@ -26,32 +24,47 @@ class PinoService(ArbolService):
     Inyecta la estrategia de absorcion estacional (Seasonal).
     """
 
-    def __init__(self):
+    def __init__(self, estrategia_absorcion: AbsorcionAguaStrategy | None = None):
         """
         Inicializa el PinoService.
         
         Aqui se realiza la INYECCION de la estrategia concreta
         (AbsorcionSeasonalStrategy) en la clase base,
         cumpliendo con la Rubrica 1.4.
+
+        Args:
+            estrategia_absorcion (AbsorcionAguaStrategy | None, optional):
+                Estrategia a inyectar en lugar de la por defecto
+                (la usa el registro de especies).
         """
         # Inyecta la estrategia estacional
-        super().__init__(AbsorcionSeasonalStrategy())
+        if estrategia_absorcion is None:
+            estrategia_absorcion = AbsorcionSeasonalStrategy()
+        super().__init__(estrategia_absorcion)
 
     @override
-    def mostrar_datos(self, cultivo: 'Pino') -> None:
+    def formatear_datos(self, cultivo: 'Pino') -> str:
         """
-        Muestra los datos especificos de un Pino.
+        Arma los datos especificos de un Pino.
         Implementacion de US-009.
 
         Args:
-            cultivo (Pino): La entidad Pino a mostrar.
+            cultivo (Pino): La entidad Pino a formatear.
+
+        Returns:
+            str: Los datos del pino.
         """
         # 1. Llama a la implementacion base de ArbolService
-        #    (que imprime ID, Tipo, Agua, Superficie, Altura)
-        super().mostrar_datos(cultivo)
+        #    (que arma ID, Tipo, Agua, Superficie, Altura)
+        base = super().formatear_datos(cultivo)
         
-        # 2. Imprime los datos especificos de Pino
-        print(f"Variedad: {cultivo.get_variedad()}")
+        # 2. Agrega los datos especificos de Pino
+        return f"{base}\nVariedad: {cultivo.get_variedad()}"
+
+    @override
+    def obtener_variedad(self, cultivo: 'Pino') -> str:
+        """Obtiene la variedad del pino (ej. "Parana")."""
+        return cultivo.get_variedad()
 
     def crecer(self, arbol: 'Pino') -> None:
         """
@@ -63,5 +76,5 @@ class PinoService(ArbolService):
         """
         # Llama al metodo 'crecer' de la clase base (ArbolService)
         # pasandole la cantidad de crecimiento especifica del pino
-        # definida en constantes.py
-        super().crecer(arbol, C.CRECIMIENTO_PINO_POR_RIEGO)
\ No newline at end of file
+        # (dato de su especificacion compartida, armada con constantes.py)
+        super().crecer(arbol, arbol.get_especificacion().get_crecimiento_por_riego())
\ No newline at end of file
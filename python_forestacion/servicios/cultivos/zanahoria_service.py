@@ -8,6 +8,7 @@ from typing_extensions import override
 from python_forestacion.servicios.cultivos.cultivo_service import CultivoService
 
 # Imports para inyectar el Strategy
+from python_forestacion.patrones.strategy.absorcion_agua_strategy import AbsorcionAguaStrategy
 from python_forestacion.patrones.strategy.impl.absorcion_constante_strategy import AbsorcionConstanteStrategy
 
 # Imports para constantes
@@ -26,7 +27,7 @@ class ZanahoriaService(CultivoService):
     Inyecta la estrategia de absorcion constante.
     """
 
-    def __init__(self):
+    def __init__(self, estrategia_absorcion: AbsorcionAguaStrategy | None = None):
         """
         Inicializa el ZanahoriaService.
         
@@ -34,25 +35,36 @@ class ZanahoriaService(CultivoService):
         especifica de la zanahoria (2L).
         
         Referencia: US-008, Rubrica 1.4
+
+        Args:
+            estrategia_absorcion (AbsorcionAguaStrategy | None, optional):
+                Estrategia a inyectar en lugar de la por defecto
+                (la usa el registro de especies).
         """
         # Inyecta la estrategia constante con 2L
-        super().__init__(
-            AbsorcionConstanteStrategy(C.ABSORCION_CONSTANTE_ZANAHORIA)
-        )
+        if estrategia_absorcion is None:
+            estrategia_absorcion = AbsorcionConstanteStrategy(C.ABSORCION_CONSTANTE_ZANAHORIA)
+        super().__init__(estrategia_absorcion)
 
     @override
-    def mostrar_datos(self, cultivo: 'Zanahoria') -> None:
+    def formatear_datos(self, cultivo: 'Zanahoria') -> str:
         """
-        Muestra los datos especificos de una Zanahoria.
+        Arma los datos especificos de una Zanahoria.
         Implementacion de US-009.
 
         Args:
-            cultivo (Zanahoria): La entidad Zanahoria a mostrar.
+            cultivo (Zanahoria): La entidad Zanahoria a formatear.
+
+        Returns:
+            str: Los datos de la zanahoria.
         """
-        # Imprime los datos base
-        print(f"Cultivo: {cultivo.get_tipo()}")
-        print(f"Superficie: {cultivo.get_superficie()} m²")
-        print(f"Agua almacenada: {cultivo.get_agua()} L")
-        
-        # Imprime los datos especificos de Zanahoria
-        print(f"Es baby carrot: {cultivo.is_baby_carrot()}")
\ No newline at end of file
+        # Datos base + datos especificos de Zanahoria
+        return (f"Cultivo: {cultivo.get_tipo()}\n"
+                f"Superficie: {cultivo.get_superficie()} m²\n"
+                f"Agua almacenada: {cultivo.get_agua()} L\n"
+                f"Es baby carrot: {cultivo.is_baby_carrot()}")
+
+    @override
+    def obtener_variedad(self, cultivo: 'Zanahoria') -> str:
+        """Obtiene la variedad de la zanahoria ("Baby carrot" o "Regular")."""
+        return "Baby carrot" if cultivo.is_baby_carrot() else "Regular"
\ No newline at end of file
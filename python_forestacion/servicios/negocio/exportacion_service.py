@@ -0,0 +1,205 @@
+"""
+Modulo del servicio ExportacionService.
+Exporta cultivos, trabajadores y paquetes a CSV o JSON-Lines
+en streaming (memoria constante).
+"""
+from __future__ import annotations
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, Sequence, TextIO, TYPE_CHECKING
+
+# --- Imports de Patrones ---
+from python_forestacion.servicios.cultivos.cultivo_service_registry import CultivoServiceRegistry
+
+# --- Imports de Constantes ---
+from python_forestacion import constantes as C
+
+# --- Imports para Type Hints ---
+if TYPE_CHECKING:
+    from python_forestacion.entidades.cultivos.cultivo import Cultivo
+    from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+    from python_forestacion.servicios.negocio.paquete import Paquete
+
+# TypeAlias de una fila exportada
+Fila = Dict[str, Any]
+
+
+class ExportacionService:
+    """
+    Servicio de exportacion de datos.
+
+    - Los 'iterar_*' son generadores: producen una fila (dict) por
+      vez, sin armar listas intermedias de todo el portfolio.
+    - Los 'exportar_*' consumen cualquier iterable de filas y
+      escriben de a lotes (EXPORTACION_TAMANIO_LOTE filas por
+      escritura), por lo que la memoria usada no depende del total.
+    """
+
+    COLUMNAS_CULTIVOS = ("id_padron", "id", "especie", "agua", "altura", "variedad")
+    COLUMNAS_TRABAJADORES = ("id_padron", "dni", "nombre", "apto",
+                             "id_tarea", "fecha", "descripcion", "estado")
+    COLUMNAS_PAQUETE = ("id_paquete", "id", "especie", "agua", "altura", "variedad")
+
+    def __init__(self):
+        """
+        Inicializa el ExportacionService.
+
+        Obtiene la instancia unica (Singleton) del Registry.
+        """
+        self._registry = CultivoServiceRegistry.get_instance()
+
+    # --- Generadores de filas ---
+
+    def iterar_cultivos(self, registros: Iterable[RegistroForestal]) -> Iterator[Fila]:
+        """
+        Genera una fila por cultivo de cada registro.
+
+        Args:
+            registros (Iterable[RegistroForestal]): Registro(s) a exportar.
+
+        Yields:
+            Fila: id_padron, id, especie, agua, altura y variedad
+                  (tipo de aceituna para Olivos).
+        """
+        for registro in registros:
+            id_padron = registro.get_id_padron()
+            for cultivo in registro.get_plantacion().iterar_cultivos():
+                fila = self._fila_cultivo(cultivo)
+                fila["id_padron"] = id_padron
+                yield fila
+
+    def iterar_trabajadores(self, registros: Iterable[RegistroForestal]) -> Iterator[Fila]:
+        """
+        Genera una fila por tarea de cada trabajador de cada registro.
+        Un trabajador sin tareas produce una fila con los datos de
+        tarea vacios.
+
+        Args:
+            registros (Iterable[RegistroForestal]): Registro(s) a exportar.
+
+        Yields:
+            Fila: Datos del trabajador y de una de sus tareas.
+        """
+        for registro in registros:
+            id_padron = registro.get_id_padron()
+            for trabajador in registro.get_plantacion().get_trabajadores():
+                apto = trabajador.get_apto_medico()
+                base: Fila = {
+                    "id_padron": id_padron,
+                    "dni": trabajador.get_dni(),
+                    "nombre": trabajador.get_nombre(),
+                    "apto": apto is not None and apto.esta_apto(),
+                }
+                tareas = trabajador.get_tareas()
+                if not tareas:
+                    yield {**base, "id_tarea": None, "fecha": None,
+                           "descripcion": None, "estado": None}
+                for tarea in tareas:
+                    yield {
+                        **base,
+                        "id_tarea": tarea.get_id_tarea(),
+                        "fecha": tarea.get_fecha().isoformat(),
+                        "descripcion": tarea.get_descripcion(),
+                        "estado": tarea.get_estado().value,
+                    }
+
+    def iterar_paquete(self, paquete: Paquete) -> Iterator[Fila]:
+        """
+        Genera una fila por cultivo contenido en un Paquete
+        (ej. el resultado de FincasService.cosechar_yempaquetar).
+
+        Args:
+            paquete (Paquete): El paquete a exportar.
+
+        Yields:
+            Fila: id_paquete y los datos del cultivo.
+        """
+        id_paquete = paquete.get_id_paquete()
+        for cultivo in paquete.iterar_contenido():
+            fila = self._fila_cultivo(cultivo)
+            fila["id_paquete"] = id_paquete
+            yield fila
+
+    # --- Escritura en streaming ---
+
+    def exportar_csv(self,
+                     filas: Iterable[Fila],
+                     columnas: Sequence[str],
+                     destino: TextIO,
+                     tamanio_lote: int = C.EXPORTACION_TAMANIO_LOTE) -> int:
+        """
+        Escribe las filas en formato CSV (con encabezado).
+
+        Args:
+            filas (Iterable[Fila]): Filas a escribir (ej. un generador).
+            columnas (Sequence[str]): Columnas, en orden (ej. COLUMNAS_CULTIVOS).
+            destino (TextIO): Stream de texto destino (abrir con newline='').
+            tamanio_lote (int, optional): Filas por escritura.
+
+        Returns:
+            int: Cantidad de filas escritas (sin contar el encabezado).
+        """
+        buffer = io.StringIO()
+        escritor = csv.DictWriter(buffer, fieldnames=columnas, extrasaction='ignore')
+        escritor.writeheader()
+
+        cantidad = 0
+        for fila in filas:
+            escritor.writerow(fila)
+            cantidad += 1
+            if cantidad % tamanio_lote == 0:
+                ExportacionService._volcar(buffer, destino)
+        ExportacionService._volcar(buffer, destino)
+        return cantidad
+
+    def exportar_jsonl(self,
+                       filas: Iterable[Fila],
+                       destino: TextIO,
+                       tamanio_lote: int = C.EXPORTACION_TAMANIO_LOTE) -> int:
+        """
+        Escribe las filas en formato JSON-Lines (un objeto por linea).
+
+        Args:
+            filas (Iterable[Fila]): Filas a escribir (ej. un generador).
+            destino (TextIO): Stream de texto destino.
+            tamanio_lote (int, optional): Filas por escritura.
+
+        Returns:
+            int: Cantidad de filas escritas.
+        """
+        lote = []
+        cantidad = 0
+        for fila in filas:
+            lote.append(json.dumps(fila, ensure_ascii=False))
+            cantidad += 1
+            if len(lote) >= tamanio_lote:
+                destino.write("\n".join(lote) + "\n")
+                lote.clear()
+        if lote:
+            destino.write("\n".join(lote) + "\n")
+        return cantidad
+
+    # --- Metodos privados ---
+
+    def _fila_cultivo(self, cultivo: Cultivo) -> Fila:
+        """
+        Metodo privado que arma los datos comunes de un cultivo.
+        """
+        con_altura = self._registry.tiene_crecimiento(type(cultivo))
+        return {
+            "id": cultivo.get_id(),
+            "especie": cultivo.get_tipo(),
+            "agua": cultivo.get_agua(),
+            "altura": cultivo.get_altura() if con_altura else None,  # type: ignore
+            "variedad": self._registry.obtener_variedad(cultivo),
+        }
+
+    @staticmethod
+    def _volcar(buffer: io.StringIO, destino: TextIO) -> None:
+        """
+        Metodo privado que escribe el lote acumulado y vacia el buffer.
+        """
+        destino.write(buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate(0)
@@ -3,13 +3,25 @@ Modulo del servicio FincasService.
 Maneja la logica de negocio de alto nivel que
 involucra a multiples fincas (registros).
 """
-from typing import Dict, List, Type, TypeVar, cast
+from datetime import date
+from typing import Any, Dict, List, Set, Type, TypeVar, cast
 
 # --- Imports de Entidades y Servicios de Negocio ---
 from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
 from python_forestacion.entidades.terrenos.plantacion import Plantacion
 from python_forestacion.entidades.cultivos.cultivo import Cultivo
+from python_forestacion.entidades.personal.trabajador import Trabajador
+from python_forestacion.entidades.personal.tarea import Tarea
+from python_forestacion.entidades.terrenos.estadisticas_cultivos import (
+    EstadisticaEspecie, EstadisticasCultivos
+)
 from python_forestacion.servicios.negocio.paquete import Paquete
+from python_forestacion.servicios.personal.registro_personal import RegistroPersonal
+from python_forestacion.servicios.negocio.indice_ordenado import IndiceOrdenado
+from python_forestacion.servicios.negocio.reservorio_agua import ReservorioAgua
+from python_forestacion.servicios.negocio.plan_reparto import PlanReparto
+from python_forestacion.servicios.negocio.pronostico_agua_service import PronosticoAguaService
+from python_forestacion.servicios.negocio.pronostico_agua import PronosticoAgua
 
 # --- Imports para Type Hints ---
 # T es el TypeVar para la cosecha generica
@@ -35,6 +47,23 @@ class FincasService:
         """
         self._fincas_gestionadas: Dict[int, RegistroForestal] = {}
 
+        # Agregados por especie de TODAS las fincas gestionadas.
+        # Se mantienen con los eventos de cambio de cada registro.
+        self._estadisticas_portfolio: EstadisticasCultivos = EstadisticasCultivos()
+
+        # Indice del personal (DNI, trabajador <-> finca y aptos medicos).
+        # Se mantiene con los eventos "trabajadores" de cada plantacion
+        # y "apto_medico" de cada trabajador.
+        self._registro_personal: RegistroPersonal = RegistroPersonal()
+
+        # Indices secundarios por atributo (consultas por rango sin
+        # recorrer las fincas). Agua y superficie se mantienen con los
+        # eventos de cada plantacion; propietario y avaluo no cambian.
+        self._indice_agua: IndiceOrdenado = IndiceOrdenado()
+        self._indice_superficie_disponible: IndiceOrdenado = IndiceOrdenado()
+        self._indice_avaluo: IndiceOrdenado = IndiceOrdenado()
+        self._fincas_por_propietario: Dict[str, Set[int]] = {}
+
     def add_finca(self, registro: RegistroForestal) -> None:
         """
         Agrega una finca (RegistroForestal) al servicio
@@ -48,6 +77,13 @@ class FincasService:
         id_padron = registro.get_id_padron()
         if id_padron not in self._fincas_gestionadas:
             self._fincas_gestionadas[id_padron] = registro
+            self._estadisticas_portfolio.combinar(
+                registro.get_plantacion()._get_estadisticas_internas())
+            self._registro_personal.asignar_finca(
+                id_padron, registro.get_plantacion().get_trabajadores())
+            self._indexar_finca(registro)
+            # El servicio pasa a recibir los cambios del registro
+            registro._vincular_contenedor(self)
             print(f"Finca (Padron {id_padron}) agregada al servicio de gestion.")
         else:
             print(f"Finca (Padron {id_padron}) ya estaba siendo gestionada.")
@@ -66,6 +102,256 @@ class FincasService:
         """
         return self._fincas_gestionadas.get(id_padron)
 
+    def get_estadisticas_portfolio(self) -> Dict[str, EstadisticaEspecie]:
+        """
+        Obtiene los agregados por especie de todas las fincas
+        gestionadas (ej. cantidad de Pinos, agua total, altura
+        promedio de Olivos) en O(especies).
+
+        Returns:
+            Dict[str, EstadisticaEspecie]: especie -> agregados.
+        """
+        return self._estadisticas_portfolio.get_por_especie()
+
+    def buscar_trabajador(self, dni: int) -> Trabajador | None:
+        """
+        Busca un trabajador de cualquier finca gestionada por DNI, en O(1).
+
+        Args:
+            dni (int): El DNI.
+
+        Returns:
+            Trabajador | None: El trabajador, o None si no se encuentra.
+        """
+        return self._registro_personal.buscar(dni)
+
+    def get_fincas_de_trabajador(self, dni: int) -> List[RegistroForestal]:
+        """
+        Obtiene las fincas gestionadas que atiende un trabajador.
+
+        Args:
+            dni (int): El DNI.
+
+        Returns:
+            List[RegistroForestal]: Los registros, por ID de padron.
+        """
+        return [self._fincas_gestionadas[id_padron]
+                for id_padron in self._registro_personal.get_fincas(dni)]
+
+    def get_trabajadores_multifinca(self) -> List[Trabajador]:
+        """
+        Obtiene los trabajadores asignados a mas de una finca gestionada.
+
+        Returns:
+            List[Trabajador]: Los trabajadores, por DNI.
+        """
+        return self._registro_personal.get_trabajadores_multifinca()
+
+    def buscar_fincas_por_agua(self,
+                               minimo: float | None = None,
+                               maximo: float | None = None,
+                               incluir_maximo: bool = True) -> List[RegistroForestal]:
+        """
+        Busca las fincas con agua disponible en [minimo, maximo]
+        (ej. maximo=50, incluir_maximo=False: menos de 50 L).
+
+        Args:
+            minimo (float | None, optional): Litros minimos (None: sin limite).
+            maximo (float | None, optional): Litros maximos (None: sin limite).
+            incluir_maximo (bool, optional): False para excluir el maximo.
+
+        Returns:
+            List[RegistroForestal]: Las fincas, por agua ascendente.
+        """
+        return self._resolver(self._indice_agua.rango(minimo, maximo, incluir_maximo))
+
+    def buscar_fincas_por_superficie_disponible(self,
+                                                minimo: float | None = None,
+                                                maximo: float | None = None,
+                                                incluir_maximo: bool = True) -> List[RegistroForestal]:
+        """
+        Busca las fincas con superficie disponible en [minimo, maximo]
+        (ej. minimo=200: al menos 200 m² libres).
+
+        Args:
+            minimo (float | None, optional): m² minimos (None: sin limite).
+            maximo (float | None, optional): m² maximos (None: sin limite).
+            incluir_maximo (bool, optional): False para excluir el maximo.
+
+        Returns:
+            List[RegistroForestal]: Las fincas, por superficie ascendente.
+        """
+        return self._resolver(
+            self._indice_superficie_disponible.rango(minimo, maximo, incluir_maximo))
+
+    def buscar_fincas_por_avaluo(self,
+                                 minimo: float | None = None,
+                                 maximo: float | None = None,
+                                 incluir_maximo: bool = True) -> List[RegistroForestal]:
+        """
+        Busca las fincas con avaluo fiscal en [minimo, maximo].
+
+        Args:
+            minimo (float | None, optional): Avaluo minimo (None: sin limite).
+            maximo (float | None, optional): Avaluo maximo (None: sin limite).
+            incluir_maximo (bool, optional): False para excluir el maximo.
+
+        Returns:
+            List[RegistroForestal]: Las fincas, por avaluo ascendente.
+        """
+        return self._resolver(self._indice_avaluo.rango(minimo, maximo, incluir_maximo))
+
+    def buscar_fincas_por_propietario(self, propietario: str) -> List[RegistroForestal]:
+        """
+        Busca las fincas de un propietario en O(1) (mas el resultado).
+
+        Args:
+            propietario (str): El nombre del propietario (exacto).
+
+        Returns:
+            List[RegistroForestal]: Las fincas, por ID de padron.
+        """
+        return self._resolver(sorted(self._fincas_por_propietario.get(propietario, ())))
+
+    def repartir_agua(self,
+                      reservorio: ReservorioAgua,
+                      fecha: date | None = None,
+                      aplicar: bool = True) -> PlanReparto:
+        """
+        Reparte el presupuesto del reservorio compartido entre todas
+        las fincas gestionadas, por prioridad (deficit, valor de los
+        cultivos y especie), con asignaciones parciales.
+
+        Args:
+            reservorio (ReservorioAgua): El reservorio compartido.
+            fecha (date | None, optional): El dia (por defecto, hoy).
+            aplicar (bool, optional): False para solo calcular el plan.
+
+        Returns:
+            PlanReparto: El plan de reparto (aplicado si 'aplicar').
+        """
+        plan = reservorio.planificar(self._fincas_gestionadas.values(), fecha)
+        if aplicar:
+            reservorio.aplicar(plan)
+        return plan
+
+    def pronosticar_agua(self,
+                         pronostico: PronosticoAguaService,
+                         fecha: date | None = None) -> List[PronosticoAgua]:
+        """
+        Pronostica, en lote, cuando se agota el agua de cada finca
+        gestionada y cuantos riegos le quedan.
+
+        Args:
+            pronostico (PronosticoAguaService): El servicio de pronostico.
+            fecha (date | None, optional): Fecha de la absorcion estacional.
+
+        Returns:
+            List[PronosticoAgua]: De la finca que primero se queda sin
+                agua a la ultima.
+        """
+        return pronostico.pronosticar(self._fincas_gestionadas.values(), fecha)
+
+    def get_personal(self) -> List[Trabajador]:
+        """
+        Obtiene todos los trabajadores de las fincas gestionadas
+        (cada uno una sola vez), por DNI.
+
+        Returns:
+            List[Trabajador]: Los trabajadores.
+        """
+        return self._registro_personal.get_todos()
+
+    def get_trabajadores_por_vencer(self,
+                                    dias: int,
+                                    fecha: date | None = None) -> List[Trabajador]:
+        """
+        Obtiene el personal de las fincas gestionadas cuyo apto vigente
+        vence dentro de los proximos 'dias' dias, por vencimiento.
+        O(log n + k) con el indice de aptos del personal (US-015).
+
+        Args:
+            dias (int): Ventana en dias.
+            fecha (date | None, optional): Fecha de referencia (por defecto, hoy).
+
+        Raises:
+            ValueError: Si dias es negativo.
+
+        Returns:
+            List[Trabajador]: Los trabajadores por vencer.
+        """
+        return self._registro_personal.get_por_vencer(fecha or date.today(), dias)
+
+    def get_trabajadores_no_aptos(self, fecha: date | None = None) -> List[Trabajador]:
+        """
+        Obtiene el personal de las fincas gestionadas que no puede
+        trabajar en la fecha: sin certificado, NO APTO o vencido.
+
+        Args:
+            fecha (date | None, optional): Fecha de referencia (por defecto, hoy).
+
+        Returns:
+            List[Trabajador]: Los trabajadores no aptos.
+        """
+        return self._registro_personal.get_no_aptos(fecha or date.today())
+
+    def get_tareas_pendientes(self, fecha: date) -> List[Tarea]:
+        """
+        Obtiene las tareas pendientes de una fecha de todo el personal
+        de las fincas gestionadas (ej. para AsignacionService).
+
+        Args:
+            fecha (date): La fecha.
+
+        Returns:
+            List[Tarea]: Las tareas, por DNI y luego por ID descendente.
+        """
+        return [tarea
+                for trabajador in self._registro_personal.get_todos()
+                for tarea in trabajador.get_tareas_pendientes(fecha)]
+
+    def _recibir_cambio(self, hijo: Any, origen: Any, campo: str, delta: float) -> None:
+        """
+        Recibe los cambios de los registros gestionados (el servicio
+        es contenedor de cada registro) y actualiza los agregados y
+        el indice del personal.
+        """
+        if campo == "trabajadores":
+            # 'hijo' es el registro; 'origen', su plantacion
+            self._registro_personal.asignar_finca(hijo.get_id_padron(),
+                                                  origen.get_trabajadores())
+        elif campo == "apto_medico":
+            # 'origen' es el trabajador (cualquier via: servicio o setter)
+            self._registro_personal.actualizar_apto(origen)
+        elif campo == "agua_disponible":
+            self._indice_agua.actualizar(hijo.get_id_padron(),
+                                         hijo.get_plantacion().get_agua_disponible())
+        elif campo == "superficie_ocupada":
+            self._indice_superficie_disponible.actualizar(
+                hijo.get_id_padron(), hijo.get_plantacion().get_superficie_disponible())
+        self._estadisticas_portfolio.aplicar_cambio(origen, campo, delta)
+
+    def _indexar_finca(self, registro: RegistroForestal) -> None:
+        """
+        Metodo privado que agrega una finca a los indices secundarios.
+        """
+        id_padron = registro.get_id_padron()
+        plantacion = registro.get_plantacion()
+        self._indice_agua.actualizar(id_padron, plantacion.get_agua_disponible())
+        self._indice_superficie_disponible.actualizar(
+            id_padron, plantacion.get_superficie_disponible())
+        self._indice_avaluo.actualizar(id_padron, registro.get_avaluo())
+        fincas = self._fincas_por_propietario.get(registro.get_propietario())
+        if fincas is None:
+            fincas = self._fincas_por_propietario[registro.get_propietario()] = set()
+        fincas.add(id_padron)
+
+    def _resolver(self, ids_padron: List[int]) -> List[RegistroForestal]:
+        """
+        Metodo privado que convierte IDs de padron en registros.
+        """
+        return [self._fincas_gestionadas[id_padron] for id_padron in ids_padron]
+
     def fumigar(self, id_padron: int, plaguicida: str) -> bool:
         """
         Aplica una fumigacion a todos los cultivos de una finca.
@@ -0,0 +1,159 @@
+"""
+Modulo de la clase IndiceOrdenado.
+Indice secundario ordenado (valor -> IDs de padron) para rangos.
+"""
+from bisect import bisect_left, insort
+from typing import Dict, List, Tuple
+
+from python_forestacion import constantes as C
+
+# TypeAlias de una entrada del indice: (valor, id_padron)
+EntradaIndice = Tuple[float, int]
+
+# Centinelas para acotar rangos por valor sin importar el ID
+_ID_MINIMO = float("-inf")
+_ID_MAXIMO = float("inf")
+
+
+class IndiceOrdenado:
+    """
+    Indice secundario de las fincas por un atributo numerico
+    (ej. agua disponible, avaluo).
+
+    Las entradas (valor, id_padron) se guardan ordenadas en bloques
+    de a lo sumo 2 * INDICE_FINCAS_TAMANIO_BLOQUE, junto con el
+    maximo de cada bloque. Una actualizacion busca el bloque por
+    bisect y solo corre las entradas de ese bloque (no las n del
+    indice); un rango [minimo, maximo] cuesta O(log n + k).
+
+    Referencia: US-018
+    """
+
+    def __init__(self, tamanio_bloque: int = C.INDICE_FINCAS_TAMANIO_BLOQUE):
+        """
+        Inicializa el indice vacio.
+
+        Args:
+            tamanio_bloque (int, optional): Entradas por bloque tras dividirlo.
+
+        Raises:
+            ValueError: Si el tamanio de bloque es <= 0.
+        """
+        if tamanio_bloque <= 0:
+            raise ValueError("El tamanio de bloque debe ser mayor a cero")
+        self._tamanio_bloque: int = tamanio_bloque
+        self._bloques: List[List[EntradaIndice]] = []
+        self._maximos: List[EntradaIndice] = []  # ultima entrada de cada bloque
+        self._valores: Dict[int, float] = {}
+
+    def actualizar(self, id_padron: int, valor: float) -> None:
+        """
+        Agrega una finca o actualiza su valor.
+
+        Args:
+            id_padron (int): La finca.
+            valor (float): Su valor actual.
+        """
+        anterior = self._valores.get(id_padron)
+        if anterior == valor:
+            return
+        if anterior is not None:
+            self._eliminar((anterior, id_padron))
+        self._insertar((valor, id_padron))
+        self._valores[id_padron] = valor
+
+    def quitar(self, id_padron: int) -> None:
+        """
+        Quita una finca del indice (se ignora si no esta).
+
+        Args:
+            id_padron (int): La finca.
+        """
+        anterior = self._valores.pop(id_padron, None)
+        if anterior is not None:
+            self._eliminar((anterior, id_padron))
+
+    def get_valor(self, id_padron: int) -> float | None:
+        """Obtiene el valor indexado de una finca (None si no esta)."""
+        return self._valores.get(id_padron)
+
+    def rango(self,
+              minimo: float | None = None,
+              maximo: float | None = None,
+              incluir_maximo: bool = True) -> List[int]:
+        """
+        Obtiene las fincas con valor en [minimo, maximo], en orden
+        ascendente de valor.
+
+        Args:
+            minimo (float | None, optional): Limite inferior (None: sin limite).
+            maximo (float | None, optional): Limite superior (None: sin limite).
+            incluir_maximo (bool, optional): False para excluir el
+                maximo (rango [minimo, maximo)).
+
+        Returns:
+            List[int]: IDs de padron.
+        """
+        if not self._bloques:
+            return []
+        desde: EntradaIndice = (float("-inf") if minimo is None else minimo, _ID_MINIMO)
+        # Se toman las entradas estrictamente menores que 'hasta'
+        if maximo is None:
+            hasta: EntradaIndice = (float("inf"), _ID_MAXIMO)
+        else:
+            hasta = (maximo, _ID_MAXIMO if incluir_maximo else _ID_MINIMO)
+
+        resultado: List[int] = []
+        k = bisect_left(self._maximos, desde)
+        inicio = bisect_left(self._bloques[k], desde) if k < len(self._bloques) else 0
+        while k < len(self._bloques):
+            bloque = self._bloques[k]
+            if bloque[-1] < hasta:
+                resultado.extend(id_padron for _, id_padron in bloque[inicio:])
+            else:
+                fin = bisect_left(bloque, hasta)
+                resultado.extend(id_padron for _, id_padron in bloque[inicio:fin])
+                break
+            k += 1
+            inicio = 0
+        return resultado
+
+    def get_cantidad(self) -> int:
+        """Obtiene la cantidad de fincas indexadas."""
+        return len(self._valores)
+
+    # --- Metodos privados ---
+
+    def _insertar(self, entrada: EntradaIndice) -> None:
+        """
+        Metodo privado que inserta una entrada en su bloque,
+        dividiendolo si supera el doble del tamanio de bloque.
+        """
+        if not self._bloques:
+            self._bloques.append([entrada])
+            self._maximos.append(entrada)
+            return
+
+        k = min(bisect_left(self._maximos, entrada), len(self._bloques) - 1)
+        bloque = self._bloques[k]
+        insort(bloque, entrada)
+        if len(bloque) > 2 * self._tamanio_bloque:
+            mitad = bloque[self._tamanio_bloque:]
+            del bloque[self._tamanio_bloque:]
+            self._bloques.insert(k + 1, mitad)
+            self._maximos.insert(k + 1, mitad[-1])
+        self._maximos[k] = bloque[-1]
+
+    def _eliminar(self, entrada: EntradaIndice) -> None:
+        """
+        Metodo privado que elimina una entrada existente; un bloque
+        vacio se descarta.
+        """
+        k = bisect_left(self._maximos, entrada)
+        bloque = self._bloques[k]
+        del bloque[bisect_left(bloque, entrada)]
+        if bloque:
+            self._maximos[k] = bloque[-1]
+        else:
+            del self._bloques[k]
+            del self._maximos[k]
@@ -1,7 +1,7 @@
 """
 Modulo de la entidad generica Paquete.
 """
-from typing import Generic, List, TypeVar, Type
+from typing import Generic, Iterator, List, TypeVar, Type
 
 # T es un TypeVar, lo que permite la creacion de Generics
 T = TypeVar('T')
@@ -47,6 +47,10 @@ class Paquete(Generic[T]):
         """Obtiene la lista de items dentro del paquete."""
         return self._contenido.copy()
 
+    def iterar_contenido(self) -> Iterator[T]:
+        """Itera los items del paquete sin copiar la lista."""
+        return iter(self._contenido)
+
     def add_item(self, item: T) -> None:
         """Añade un item al paquete."""
         self._contenido.append(item)
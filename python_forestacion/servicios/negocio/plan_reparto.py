@@ -0,0 +1,79 @@
+"""
+Modulo de la entidad PlanReparto.
+Reparto del agua del reservorio compartido entre las fincas.
+"""
+from datetime import date
+from typing import List, Tuple
+
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+
+# TypeAlias de una asignacion: (finca, litros asignados, deficit de la finca)
+AsignacionAgua = Tuple[RegistroForestal, int, int]
+
+
+class PlanReparto:
+    """
+    Resultado de ReservorioAgua.planificar.
+
+    Lista, por finca con deficit, los litros asignados (pueden ser
+    menos que el deficit: asignacion parcial) y resume el total
+    asignado y el deficit que quedo sin cubrir.
+
+    Referencia: US-018
+    """
+
+    def __init__(self,
+                 fecha: date,
+                 presupuesto: int,
+                 asignaciones: List[AsignacionAgua]):
+        """
+        Inicializa el plan.
+
+        Args:
+            fecha (date): Dia del presupuesto usado.
+            presupuesto (int): Litros disponibles al planificar.
+            asignaciones (List[AsignacionAgua]): Por finca con deficit,
+                en orden de prioridad.
+        """
+        self._fecha: date = fecha
+        self._presupuesto: int = presupuesto
+        self._asignaciones: List[AsignacionAgua] = asignaciones
+        self._asignado: int = sum(litros for _, litros, _ in asignaciones)
+        self._deficit: int = sum(deficit for _, _, deficit in asignaciones)
+        self._aplicado: bool = False
+
+    def get_fecha(self) -> date:
+        """Obtiene el dia del presupuesto usado."""
+        return self._fecha
+
+    def get_presupuesto(self) -> int:
+        """Obtiene los litros disponibles al planificar."""
+        return self._presupuesto
+
+    def get_asignaciones(self) -> List[AsignacionAgua]:
+        """Obtiene una COPIA de las asignaciones (finca, litros, deficit)."""
+        return self._asignaciones.copy()
+
+    def get_asignado(self) -> int:
+        """Obtiene el total de litros asignados."""
+        return self._asignado
+
+    def get_deficit_total(self) -> int:
+        """Obtiene el deficit total de las fincas (antes del reparto)."""
+        return self._deficit
+
+    def get_deficit_sin_cubrir(self) -> int:
+        """Obtiene los litros de deficit que el presupuesto no cubre."""
+        return self._deficit - self._asignado
+
+    def get_fincas_parciales(self) -> int:
+        """Obtiene la cantidad de fincas con asignacion menor a su deficit."""
+        return sum(1 for _, litros, deficit in self._asignaciones if litros < deficit)
+
+    def is_aplicado(self) -> bool:
+        """Indica si el plan ya se aplico a las fincas."""
+        return self._aplicado
+
+    def marcar_aplicado(self) -> None:
+        """Marca el plan como aplicado (lo hace ReservorioAgua.aplicar)."""
+        self._aplicado = True
@@ -0,0 +1,98 @@
+"""
+Modulo de la entidad PronosticoAgua.
+Proyeccion del agotamiento del agua de una finca.
+"""
+
+
+class PronosticoAgua:
+    """
+    Resultado de PronosticoAguaService para una finca (o plantacion).
+
+    - Riegos restantes: cuantos riegos (AGUA_POR_RIEGO) cubre el agua
+      disponible.
+    - Tiempo hasta agotarla: riegos restantes / riegos por ciclo *
+      duracion de un ciclo (None si no se espera ningun riego).
+    - Absorcion por riego: litros que absorben los cultivos en cada
+      riego segun la estacion (Strategy de cada especie).
+
+    Referencia: US-012, US-018
+    """
+
+    def __init__(self,
+                 id_padron: int | None,
+                 nombre: str,
+                 agua_disponible: int,
+                 riegos_restantes: int,
+                 probabilidad_riego: float,
+                 intervalo: float,
+                 absorcion_por_riego: int):
+        """
+        Inicializa el pronostico.
+
+        Args:
+            id_padron (int | None): La finca (None para una plantacion suelta).
+            nombre (str): Nombre de la plantacion.
+            agua_disponible (int): Litros disponibles al pronosticar.
+            riegos_restantes (int): Riegos que cubre el agua disponible.
+            probabilidad_riego (float): Riegos esperados por ciclo de control.
+            intervalo (float): Duracion de un ciclo de control en segundos.
+            absorcion_por_riego (int): Litros que absorben los cultivos por riego.
+        """
+        self._id_padron: int | None = id_padron
+        self._nombre: str = nombre
+        self._agua_disponible: int = agua_disponible
+        self._riegos_restantes: int = riegos_restantes
+        self._probabilidad_riego: float = probabilidad_riego
+        self._intervalo: float = intervalo
+        self._absorcion_por_riego: int = absorcion_por_riego
+
+    def get_id_padron(self) -> int | None:
+        """Obtiene el ID de padron de la finca (None si no tiene)."""
+        return self._id_padron
+
+    def get_nombre(self) -> str:
+        """Obtiene el nombre de la plantacion."""
+        return self._nombre
+
+    def get_agua_disponible(self) -> int:
+        """Obtiene los litros disponibles al pronosticar."""
+        return self._agua_disponible
+
+    def get_riegos_restantes(self) -> int:
+        """Obtiene los riegos que cubre el agua disponible."""
+        return self._riegos_restantes
+
+    def get_probabilidad_riego(self) -> float:
+        """Obtiene los riegos esperados por ciclo de control."""
+        return self._probabilidad_riego
+
+    def get_ciclos_hasta_agotar(self) -> float | None:
+        """
+        Obtiene los ciclos de control esperados hasta agotar el agua
+        (None si no se espera ningun riego).
+        """
+        if self._riegos_restantes == 0:
+            return 0.0
+        if self._probabilidad_riego <= 0:
+            return None
+        return self._riegos_restantes / self._probabilidad_riego
+
+    def get_segundos_hasta_agotar(self) -> float | None:
+        """
+        Obtiene los segundos esperados hasta agotar el agua
+        (None si no se espera ningun riego).
+        """
+        ciclos = self.get_ciclos_hasta_agotar()
+        return None if ciclos is None else ciclos * self._intervalo
+
+    def get_absorcion_por_riego(self) -> int:
+        """Obtiene los litros que absorben los cultivos en cada riego."""
+        return self._absorcion_por_riego
+
+    def get_absorcion_hasta_agotar(self) -> int:
+        """Obtiene los litros que absorberan los cultivos hasta agotar el agua."""
+        return self._absorcion_por_riego * self._riegos_restantes
+
+    def is_agotada(self) -> bool:
+        """Indica si el agua no alcanza para un riego."""
+        return self._riegos_restantes == 0
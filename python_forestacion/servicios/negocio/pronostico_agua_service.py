@@ -0,0 +1,192 @@
+"""
+Modulo del servicio PronosticoAguaService.
+Pronostica cuando se agota el agua de cada finca.
+"""
+from __future__ import annotations
+from datetime import date
+from typing import Dict, Iterable, List, Tuple, TYPE_CHECKING
+
+from python_forestacion.servicios.cultivos.cultivo_service_registry import CultivoServiceRegistry
+from python_forestacion.entidades.cultivos.cultivo import Cultivo
+from python_forestacion.patrones.strategy.contexto_riego import ContextoRiego
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.riego.control.historial_riego import HistorialRiego
+from python_forestacion.servicios.negocio.pronostico_agua import PronosticoAgua
+from python_forestacion import constantes as C
+
+if TYPE_CHECKING:
+    from python_forestacion.riego.sensores.estadistica_sensor import EstadisticaSensor
+
+
+class PronosticoAguaService:
+    """
+    Servicio que proyecta, para cada finca, cuantos riegos le quedan
+    y en cuanto tiempo se agota su agua disponible.
+
+    - Riegos por ciclo de control: la tasa del HistorialRiego,
+      combinada con la estimacion de los sensores (fraccion reciente
+      de temperaturas y humedades en rango de riego, US-012) con peso
+      PRONOSTICO_PESO_SENSORES decisiones: con historial corto domina
+      la de los sensores y con historial largo, la observada.
+    - Absorcion por riego: por especie, la del Strategy de la especie
+      para la fecha (estacional en arboles), evaluada UNA vez por
+      especie y multiplicada por los agregados de cada plantacion.
+
+    Lo comun a todas las fincas se calcula una sola vez por pronostico:
+    cada finca cuesta O(especies), sin recorrer sus cultivos, por lo
+    que puede recalcularse en cada ciclo de control.
+
+    Referencia: US-012, US-018
+    """
+
+    def __init__(self,
+                 historial: HistorialRiego,
+                 estadistica_temperatura: EstadisticaSensor | None = None,
+                 estadistica_humedad: EstadisticaSensor | None = None):
+        """
+        Inicializa el servicio.
+
+        Args:
+            historial (HistorialRiego): Decisiones del controlador de riego.
+            estadistica_temperatura (EstadisticaSensor | None, optional):
+                Lecturas recientes del sensor de temperatura.
+            estadistica_humedad (EstadisticaSensor | None, optional):
+                Lecturas recientes del sensor de humedad.
+        """
+        self._historial: HistorialRiego = historial
+        self._estadistica_temp: EstadisticaSensor | None = estadistica_temperatura
+        self._estadistica_hum: EstadisticaSensor | None = estadistica_humedad
+        self._registry = CultivoServiceRegistry.get_instance()
+        # Cultivo de muestra por especie, para evaluar su Strategy
+        self._muestras: Dict[str, Cultivo] = {}
+
+    def get_historial(self) -> HistorialRiego:
+        """Obtiene el historial de decisiones usado."""
+        return self._historial
+
+    def get_probabilidad_sensores(self) -> float | None:
+        """
+        Obtiene la fraccion de ciclos que pedirian regar segun las
+        lecturas recientes (temperatura y humedad independientes).
+
+        Returns:
+            float | None: La fraccion (None sin lecturas de ambos sensores).
+        """
+        if self._estadistica_temp is None or self._estadistica_hum is None:
+            return None
+        temp_ok = self._estadistica_temp.get_fraccion_en_rango(
+            C.TEMP_MIN_RIEGO, C.TEMP_MAX_RIEGO)
+        hum_ok = self._estadistica_hum.get_fraccion_en_rango(
+            maximo=C.HUMEDAD_MAX_RIEGO, incluir_maximo=False)
+        if temp_ok is None or hum_ok is None:
+            return None
+        return temp_ok * hum_ok
+
+    def get_probabilidad_riego(self) -> float:
+        """
+        Obtiene los riegos esperados por ciclo de control. Sin
+        historial ni lecturas se asume el peor caso (un riego por ciclo).
+
+        Returns:
+            float: Riegos por ciclo, entre 0 y 1.
+        """
+        tasa = self._historial.get_tasa_riego()
+        sensores = self.get_probabilidad_sensores()
+        if tasa is None:
+            return 1.0 if sensores is None else sensores
+        if sensores is None:
+            return tasa
+        cantidad = self._historial.get_cantidad()
+        peso = cantidad / (cantidad + C.PRONOSTICO_PESO_SENSORES)
+        return peso * tasa + (1 - peso) * sensores
+
+    def pronosticar(self,
+                    fincas: Iterable[RegistroForestal],
+                    fecha: date | None = None) -> List[PronosticoAgua]:
+        """
+        Pronostica el agotamiento del agua de un lote de fincas.
+
+        Args:
+            fincas (Iterable[RegistroForestal]): Las fincas.
+            fecha (date | None, optional): Fecha de la absorcion
+                estacional (por defecto, hoy).
+
+        Returns:
+            List[PronosticoAgua]: Los pronosticos, de la finca que
+                primero se queda sin agua a la ultima (las que no
+                esperan riegos, al final).
+        """
+        probabilidad, intervalo, absorcion = self._preparar(fecha)
+        pronosticos = [self._pronosticar(registro.get_plantacion(), registro.get_id_padron(),
+                                         probabilidad, intervalo, absorcion)
+                       for registro in fincas]
+        pronosticos.sort(key=PronosticoAguaService._clave_urgencia)
+        return pronosticos
+
+    def pronosticar_plantacion(self,
+                               plantacion: Plantacion,
+                               fecha: date | None = None) -> PronosticoAgua:
+        """
+        Pronostica el agotamiento del agua de una plantacion.
+
+        Args:
+            plantacion (Plantacion): La plantacion.
+            fecha (date | None, optional): Fecha de la absorcion estacional.
+
+        Returns:
+            PronosticoAgua: El pronostico (sin ID de padron).
+        """
+        probabilidad, intervalo, absorcion = self._preparar(fecha)
+        return self._pronosticar(plantacion, None, probabilidad, intervalo, absorcion)
+
+    # --- Metodos privados ---
+
+    def _preparar(self, fecha: date | None) -> Tuple[float, float, Dict[str, int]]:
+        """
+        Metodo privado que calcula lo comun a todas las fincas:
+        riegos por ciclo, duracion del ciclo y absorcion por especie.
+        """
+        contexto = ContextoRiego(fecha)
+        absorcion: Dict[str, int] = {}
+        for nombre in self._registry.get_especies():
+            especie = self._registry.get_especie(nombre)
+            muestra = self._muestras.get(nombre)
+            if muestra is None:
+                # La muestra no consume un ID de los cultivos plantados
+                muestra = self._muestras[nombre] = Cultivo.crear_muestra(especie.get_creador())
+            absorcion[nombre] = contexto.calcular_absorcion(
+                especie.get_estrategia_absorcion(), muestra)
+        return (self.get_probabilidad_riego(),
+                self._historial.get_intervalo_medio(),
+                absorcion)
+
+    @staticmethod
+    def _pronosticar(plantacion: Plantacion,
+                     id_padron: int | None,
+                     probabilidad: float,
+                     intervalo: float,
+                     absorcion: Dict[str, int]) -> PronosticoAgua:
+        """
+        Metodo privado que arma el pronostico de una plantacion en
+        O(especies), con sus agregados por especie.
+        """
+        agua = plantacion.get_agua_disponible()
+        absorcion_por_riego = sum(estadistica.get_cantidad() * absorcion.get(especie, 0)
+                                  for especie, estadistica
+                                  in plantacion.get_estadisticas().items())
+        return PronosticoAgua(id_padron, plantacion.get_nombre(), agua,
+                              max(agua, 0) // C.AGUA_POR_RIEGO,
+                              probabilidad, intervalo, absorcion_por_riego)
+
+    @staticmethod
+    def _clave_urgencia(pronostico: PronosticoAgua) -> Tuple[bool, float, int]:
+        """
+        Metodo privado para ordenar por tiempo hasta agotar el agua
+        (sin riegos esperados al final), desempatando por padron.
+        (Se usa en lugar de 'lambda', Rubrica 3.4)
+        """
+        segundos = pronostico.get_segundos_hasta_agotar()
+        id_padron = pronostico.get_id_padron()
+        return (segundos is None, segundos or 0.0,
+                id_padron if id_padron is not None else -1)
@@ -0,0 +1,196 @@
+"""
+Modulo de la clase ReservorioAgua.
+Presupuesto diario de agua compartido por todas las fincas.
+"""
+import heapq
+from datetime import date
+from threading import Lock
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.servicios.negocio.plan_reparto import PlanReparto, AsignacionAgua
+from python_forestacion import constantes as C
+
+# TypeAlias de una entrada del heap: (-prioridad, id_padron, posicion)
+EntradaReparto = Tuple[float, int, int]
+
+
+class ReservorioAgua:
+    """
+    Reservorio compartido con un presupuesto diario de agua, que se
+    reparte entre las fincas por prioridad.
+
+    - Deficit de una finca: lo que le falta para cubrir
+      RESERVORIO_RIEGOS_OBJETIVO riegos (AGUA_POR_RIEGO cada uno).
+    - Valor de la finca: sus cultivos ponderados por especie
+      (PESO_ESPECIE_RESERVORIO), leidos de sus agregados por especie.
+    - Prioridad = valor * deficit pendiente / objetivo: decrece a
+      medida que la finca recibe agua.
+
+    El reparto usa un heap de prioridades: se entrega de a un riego
+    (AGUA_POR_RIEGO) a la finca de mayor prioridad y se reinserta con
+    la prioridad actualizada, hasta agotar el presupuesto o los
+    deficits. La ultima entrega puede ser parcial.
+    Costo: O(n + e log n) para n fincas y e entregas.
+
+    El presupuesto se renueva cada dia.
+
+    Referencia: US-018
+    """
+
+    def __init__(self,
+                 presupuesto_diario: int,
+                 riegos_objetivo: int = C.RESERVORIO_RIEGOS_OBJETIVO,
+                 pesos_especie: Mapping[str, float] | None = None):
+        """
+        Inicializa el reservorio.
+
+        Args:
+            presupuesto_diario (int): Litros disponibles por dia.
+            riegos_objetivo (int, optional): Riegos de reserva por finca.
+            pesos_especie (Mapping[str, float] | None, optional): Peso de
+                cada especie (por defecto, PESO_ESPECIE_RESERVORIO).
+
+        Raises:
+            ValueError: Si el presupuesto es negativo o los riegos
+                objetivo son <= 0.
+        """
+        if presupuesto_diario < 0:
+            raise ValueError("El presupuesto diario no puede ser negativo")
+        if riegos_objetivo <= 0:
+            raise ValueError("Los riegos objetivo deben ser mayores a cero")
+        self._presupuesto_diario: int = presupuesto_diario
+        self._objetivo: int = riegos_objetivo * C.AGUA_POR_RIEGO
+        self._pesos: Dict[str, float] = dict(
+            C.PESO_ESPECIE_RESERVORIO if pesos_especie is None else pesos_especie)
+
+        self._lock: Lock = Lock()
+        self._fecha: date | None = None
+        self._consumido: int = 0
+
+    def get_presupuesto_diario(self) -> int:
+        """Obtiene los litros disponibles por dia."""
+        return self._presupuesto_diario
+
+    def get_disponible(self, fecha: date | None = None) -> int:
+        """
+        Obtiene los litros que quedan del presupuesto de un dia.
+
+        Args:
+            fecha (date | None, optional): El dia (por defecto, hoy).
+
+        Returns:
+            int: Litros disponibles.
+        """
+        fecha = fecha or date.today()
+        with self._lock:
+            return self._presupuesto_diario - self._consumido_en(fecha)
+
+    def planificar(self,
+                   fincas: Iterable[RegistroForestal],
+                   fecha: date | None = None) -> PlanReparto:
+        """
+        Calcula el reparto del presupuesto disponible del dia (no
+        modifica las fincas ni consume el presupuesto).
+
+        Args:
+            fincas (Iterable[RegistroForestal]): Las fincas candidatas.
+            fecha (date | None, optional): El dia (por defecto, hoy).
+
+        Returns:
+            PlanReparto: Asignaciones por finca con deficit.
+        """
+        fecha = fecha or date.today()
+        presupuesto = self.get_disponible(fecha)
+
+        candidatas: List[RegistroForestal] = []
+        deficits: List[int] = []
+        valores: List[float] = []
+        heap: List[EntradaReparto] = []
+        for registro in fincas:
+            deficit = self._objetivo - registro.get_plantacion().get_agua_disponible()
+            valor = self._valor(registro)
+            if deficit <= 0 or valor <= 0:
+                continue
+            heap.append((-valor * deficit / self._objetivo,
+                         registro.get_id_padron(), len(candidatas)))
+            candidatas.append(registro)
+            deficits.append(deficit)
+            valores.append(valor)
+        heapq.heapify(heap)
+
+        asignados = [0] * len(candidatas)
+        restante = presupuesto
+        while heap and restante > 0:
+            _, id_padron, i = heap[0]
+            pendiente = deficits[i] - asignados[i]
+            entrega = min(C.AGUA_POR_RIEGO, pendiente, restante)
+            asignados[i] += entrega
+            restante -= entrega
+            if entrega < pendiente:
+                prioridad = valores[i] * (pendiente - entrega) / self._objetivo
+                heapq.heapreplace(heap, (-prioridad, id_padron, i))
+            else:
+                heapq.heappop(heap)
+
+        # Orden de prioridad inicial (valor * deficit), desempate por padron
+        orden = sorted((-valores[i] * deficits[i], candidatas[i].get_id_padron(), i)
+                       for i in range(len(candidatas)))
+        asignaciones: List[AsignacionAgua] = [
+            (candidatas[i], asignados[i], deficits[i]) for _, _, i in orden
+        ]
+        return PlanReparto(fecha, presupuesto, asignaciones)
+
+    def aplicar(self, plan: PlanReparto) -> None:
+        """
+        Aplica un plan: suma el agua asignada a cada finca y la
+        descuenta del presupuesto del dia.
+
+        Args:
+            plan (PlanReparto): El plan (de este reservorio).
+
+        Raises:
+            ValueError: Si el plan ya se aplico o excede lo que queda
+                del presupuesto del dia.
+        """
+        with self._lock:
+            # Bajo el lock: dos hilos no pueden aplicar el mismo plan
+            if plan.is_aplicado():
+                raise ValueError("El plan de reparto ya fue aplicado")
+            disponible = self._presupuesto_diario - self._consumido_en(plan.get_fecha())
+            if plan.get_asignado() > disponible:
+                raise ValueError(f"El plan asigna {plan.get_asignado()} L y el "
+                                 f"reservorio solo dispone de {disponible} L")
+            self._consumido += plan.get_asignado()
+            plan.marcar_aplicado()
+
+        for registro, litros, _ in plan.get_asignaciones():
+            if litros > 0:
+                plantacion = registro.get_plantacion()
+                plantacion.set_agua_disponible(plantacion.get_agua_disponible() + litros)
+
+    # --- Metodos privados ---
+
+    def _consumido_en(self, fecha: date) -> int:
+        """
+        Metodo privado (con el lock tomado) que renueva el presupuesto
+        al cambiar de dia y obtiene lo consumido en 'fecha'.
+        """
+        if fecha != self._fecha:
+            if self._fecha is None or fecha > self._fecha:
+                self._fecha = fecha
+                self._consumido = 0
+            else:
+                return self._presupuesto_diario  # dia pasado: nada disponible
+        return self._consumido
+
+    def _valor(self, registro: RegistroForestal) -> float:
+        """
+        Metodo privado que calcula el valor de los cultivos de una
+        finca (cantidad por especie ponderada), en O(especies).
+        """
+        estadisticas = registro.get_plantacion().get_estadisticas()
+        return sum(estadistica.get_cantidad()
+                   * self._pesos.get(especie, C.PESO_ESPECIE_RESERVORIO_DEFECTO)
+                   for especie, estadistica in estadisticas.items())
+
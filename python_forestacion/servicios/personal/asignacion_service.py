@@ -0,0 +1,242 @@
+"""
+Modulo del servicio AsignacionService.
+Reparte las tareas de un dia entre la cuadrilla minimizando el makespan.
+"""
+import heapq
+from bisect import bisect_left
+from datetime import date
+from typing import Dict, Iterable, List, Tuple
+
+from python_forestacion.entidades.personal.trabajador import Trabajador
+from python_forestacion.entidades.personal.herramienta import Herramienta
+from python_forestacion.entidades.personal.tarea import Tarea, EstadoTarea
+from python_forestacion.servicios.personal.trabajador_service import TrabajadorService
+from python_forestacion.servicios.personal.plan_asignacion import PlanAsignacion
+from python_forestacion import constantes as C
+
+# Diferencia de carga (horas) por debajo de la cual no se mejora
+TOLERANCIA_HORAS = 1e-9
+
+
+class AsignacionService:
+    """
+    Servicio que asigna las tareas pendientes de un dia (de todas las
+    fincas) a los trabajadores aptos, balanceando la carga.
+
+    - Cada trabajador de la cuadrilla necesita una herramienta
+      certificada: la cuadrilla tiene min(aptos, herramientas)
+      integrantes (por DNI ascendente).
+    - Plan base LPT (Longest Processing Time): las tareas, de la mas
+      larga a la mas corta, van al trabajador menos cargado (heap de
+      cargas). O(n log n + n log m); makespan <= 4/3 del optimo.
+    - Busqueda local opcional: entre el trabajador mas cargado y el
+      menos cargado, mueve una tarea o intercambia dos, eligiendo la
+      diferencia mas cercana a la mitad del desbalance (busqueda
+      binaria sobre las duraciones ordenadas de cada trabajador).
+
+    Referencia: US-016
+    """
+
+    def planificar(self,
+                   tareas: Iterable[Tarea],
+                   trabajadores: Iterable[Trabajador],
+                   herramientas: Iterable[Herramienta],
+                   fecha: date,
+                   busqueda_local: bool = True,
+                   max_movimientos: int = C.ASIGNACION_MAX_MOVIMIENTOS) -> PlanAsignacion:
+        """
+        Planifica las tareas pendientes de la fecha.
+
+        Args:
+            tareas (Iterable[Tarea]): Tareas candidatas (se toman solo
+                las PENDIENTES de la fecha).
+            trabajadores (Iterable[Trabajador]): Candidatos (se toman
+                solo los que pueden trabajar en la fecha).
+            herramientas (Iterable[Herramienta]): Inventario (se
+                toman solo las certificadas).
+            fecha (date): El dia a planificar.
+            busqueda_local (bool, optional): Mejorar el plan LPT.
+            max_movimientos (int, optional): Limite de movimientos de
+                la busqueda local.
+
+        Returns:
+            PlanAsignacion: El plan (sin cuadrilla, todas las tareas
+                quedan sin asignar).
+        """
+        pendientes = [tarea for tarea in tareas
+                      if tarea.get_fecha() == fecha
+                      and tarea.get_estado() == EstadoTarea.PENDIENTE]
+        aptos: Dict[int, Trabajador] = {}
+        for trabajador in trabajadores:
+            if TrabajadorService.puede_trabajar(trabajador, fecha):
+                aptos.setdefault(trabajador.get_dni(), trabajador)
+        certificadas = [h for h in herramientas if h.tiene_certificado()]
+
+        cantidad = min(len(aptos), len(certificadas))
+        if cantidad == 0:
+            return PlanAsignacion(fecha, [], [], 0.0, 0, pendientes)
+        cuadrilla = [aptos[dni] for dni in sorted(aptos)[:cantidad]]
+
+        # --- Plan base LPT ---
+        asignadas: List[List[Tarea]] = [[] for _ in range(cantidad)]
+        cargas: List[float] = [0.0] * cantidad
+        heap: List[Tuple[float, int]] = [(0.0, i) for i in range(cantidad)]
+        for tarea in sorted(pendientes, key=AsignacionService._clave_lpt):
+            carga, i = heap[0]
+            carga += tarea.get_duracion_horas()
+            asignadas[i].append(tarea)
+            cargas[i] = carga
+            heapq.heapreplace(heap, (carga, i))
+        makespan_inicial = max(cargas)
+
+        movimientos = 0
+        if busqueda_local and cantidad > 1 and pendientes:
+            movimientos = AsignacionService._mejorar(asignadas, cargas, max_movimientos)
+
+        asignaciones = [(trabajador, herramienta, tareas_trabajador)
+                        for trabajador, herramienta, tareas_trabajador
+                        in zip(cuadrilla, certificadas, asignadas)]
+        return PlanAsignacion(fecha, asignaciones, cargas, makespan_inicial, movimientos, [])
+
+    # --- Metodos privados ---
+
+    @staticmethod
+    def _clave_lpt(tarea: Tarea) -> Tuple[float, int]:
+        """
+        Metodo privado para ordenar por duracion descendente (LPT),
+        desempatando por ID.
+        (Se usa en lugar de 'lambda', Rubrica 3.4)
+        """
+        return -tarea.get_duracion_horas(), tarea.get_id_tarea()
+
+    @staticmethod
+    def _mejorar(asignadas: List[List[Tarea]],
+                 cargas: List[float],
+                 max_movimientos: int) -> int:
+        """
+        Metodo privado con la busqueda local (modifica 'asignadas' y
+        'cargas'). Termina cuando el par mas cargado / menos cargado
+        no admite ningun movimiento ni intercambio que reduzca el
+        desbalance, o al llegar a max_movimientos.
+
+        Returns:
+            int: Movimientos aplicados.
+        """
+        # Por trabajador, duraciones ascendentes y tareas en el mismo orden
+        # (LPT asigno en orden descendente: basta con invertir)
+        duraciones: List[List[float]] = []
+        for tareas_trabajador in asignadas:
+            tareas_trabajador.reverse()
+            duraciones.append([t.get_duracion_horas() for t in tareas_trabajador])
+
+        # Heaps de maximos y minimos con invalidacion diferida
+        maximos = [(-carga, i) for i, carga in enumerate(cargas)]
+        minimos = [(carga, i) for i, carga in enumerate(cargas)]
+        heapq.heapify(maximos)
+        heapq.heapify(minimos)
+
+        movimientos = 0
+        while movimientos < max_movimientos:
+            while -maximos[0][0] != cargas[maximos[0][1]]:
+                heapq.heappop(maximos)
+            while minimos[0][0] != cargas[minimos[0][1]]:
+                heapq.heappop(minimos)
+            mayor, menor = maximos[0][1], minimos[0][1]
+            desbalance = cargas[mayor] - cargas[menor]
+            if desbalance <= TOLERANCIA_HORAS:
+                break
+
+            if not AsignacionService._mover(asignadas, duraciones, cargas,
+                                            mayor, menor, desbalance):
+                if not AsignacionService._intercambiar(asignadas, duraciones, cargas,
+                                                       mayor, menor, desbalance):
+                    break
+            movimientos += 1
+            for i in (mayor, menor):
+                heapq.heappush(maximos, (-cargas[i], i))
+                heapq.heappush(minimos, (cargas[i], i))
+        return movimientos
+
+    @staticmethod
+    def _mover(asignadas: List[List[Tarea]],
+               duraciones: List[List[float]],
+               cargas: List[float],
+               mayor: int,
+               menor: int,
+               desbalance: float) -> bool:
+        """
+        Metodo privado que mueve de 'mayor' a 'menor' la tarea cuya
+        duracion d mas se acerca a desbalance / 2 (mejora si
+        d < desbalance).
+        """
+        origen = duraciones[mayor]
+        posicion = AsignacionService._mas_cercano(origen, desbalance / 2)
+        if posicion is None or origen[posicion] >= desbalance - TOLERANCIA_HORAS:
+            return False
+
+        duracion = origen.pop(posicion)
+        tarea = asignadas[mayor].pop(posicion)
+        destino = bisect_left(duraciones[menor], duracion)
+        duraciones[menor].insert(destino, duracion)
+        asignadas[menor].insert(destino, tarea)
+        cargas[mayor] -= duracion
+        cargas[menor] += duracion
+        return True
+
+    @staticmethod
+    def _intercambiar(asignadas: List[List[Tarea]],
+                      duraciones: List[List[float]],
+                      cargas: List[float],
+                      mayor: int,
+                      menor: int,
+                      desbalance: float) -> bool:
+        """
+        Metodo privado que intercambia una tarea a de 'mayor' por una
+        b de 'menor' con a - b lo mas cercano posible a desbalance / 2
+        (mejora si 0 < a - b < desbalance).
+        """
+        objetivo = desbalance / 2
+        mejor: Tuple[float, int, int] | None = None
+        anterior = None
+        for i, a in enumerate(duraciones[mayor]):
+            if a == anterior:
+                continue  # duraciones repetidas: mismo resultado
+            anterior = a
+            j = AsignacionService._mas_cercano(duraciones[menor], a - objetivo)
+            if j is None:
+                break
+            diferencia = a - duraciones[menor][j]
+            if TOLERANCIA_HORAS < diferencia < desbalance - TOLERANCIA_HORAS:
+                distancia = abs(diferencia - objetivo)
+                if mejor is None or distancia < mejor[0]:
+                    mejor = (distancia, i, j)
+        if mejor is None:
+            return False
+
+        _, i, j = mejor
+        a, tarea_a = duraciones[mayor].pop(i), asignadas[mayor].pop(i)
+        b, tarea_b = duraciones[menor].pop(j), asignadas[menor].pop(j)
+        posicion = bisect_left(duraciones[menor], a)
+        duraciones[menor].insert(posicion, a)
+        asignadas[menor].insert(posicion, tarea_a)
+        posicion = bisect_left(duraciones[mayor], b)
+        duraciones[mayor].insert(posicion, b)
+        asignadas[mayor].insert(posicion, tarea_b)
+        cargas[mayor] += b - a
+        cargas[menor] += a - b
+        return True
+
+    @staticmethod
+    def _mas_cercano(ordenadas: List[float], valor: float) -> int | None:
+        """
+        Metodo privado que obtiene la posicion del elemento mas
+        cercano a 'valor' en una lista ascendente (None si esta vacia).
+        """
+        if not ordenadas:
+            return None
+        posicion = bisect_left(ordenadas, valor)
+        if posicion == len(ordenadas):
+            return posicion - 1
+        if posicion > 0 and valor - ordenadas[posicion - 1] <= ordenadas[posicion] - valor:
+            return posicion - 1
+        return posicion
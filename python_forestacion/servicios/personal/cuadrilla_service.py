@@ -0,0 +1,134 @@
+"""
+Modulo del servicio CuadrillaService.
+Ejecuta en paralelo la jornada de una cuadrilla de trabajadores.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from threading import Lock
+from typing import Dict, Iterable, List, Tuple
+
+from python_forestacion.entidades.personal.trabajador import Trabajador
+from python_forestacion.servicios.personal.trabajador_service import TrabajadorService
+from python_forestacion.servicios.personal.pool_herramientas import PoolHerramientas
+from python_forestacion.servicios.personal.resultado_cuadrilla import ResultadoCuadrilla, EstadoJornada
+from python_forestacion.excepciones.herramienta_no_disponible_exception import HerramientaNoDisponibleException
+from python_forestacion import constantes as C
+
+# TypeAlias de la jornada de un trabajador: (estado, tareas, espera)
+Jornada = Tuple[EstadoJornada, int, float | None]
+
+
+class CuadrillaService:
+    """
+    Servicio que ejecuta las tareas del dia de muchos trabajadores a la
+    vez, en un pool de hilos, compartiendo un PoolHerramientas.
+
+    Por cada trabajador:
+    1. Valida el apto medico (US-016).
+    2. Si tiene tareas pendientes del dia, pide una herramienta
+       certificada al pool (espera justa, FIFO) y la retiene
+       mientras trabaja: dos trabajadores nunca usan la misma.
+    3. Completa sus tareas y devuelve la herramienta.
+
+    Las entidades no son thread-safe (completar una tarea propaga
+    eventos a las plantaciones y registros compartidos), por lo que
+    las lecturas y cambios de estado se serializan con un lock; en
+    paralelo corren la espera y el uso de las herramientas.
+
+    Referencia: US-016
+    """
+
+    def __init__(self, max_hilos: int = C.CUADRILLA_MAX_HILOS):
+        """
+        Inicializa el servicio.
+
+        Args:
+            max_hilos (int, optional): Trabajadores atendidos en paralelo.
+
+        Raises:
+            ValueError: Si max_hilos es <= 0.
+        """
+        if max_hilos <= 0:
+            raise ValueError("max_hilos debe ser mayor a cero")
+        self._max_hilos: int = max_hilos
+        self._lock_entidades: Lock = Lock()
+
+    def trabajar_cuadrilla(self,
+                           trabajadores: Iterable[Trabajador],
+                           fecha: date,
+                           pool: PoolHerramientas,
+                           timeout_herramienta: float | None = C.CUADRILLA_TIMEOUT_HERRAMIENTA,
+                           segundos_por_tarea: float = 0.0) -> ResultadoCuadrilla:
+        """
+        Ejecuta la jornada de toda la cuadrilla en paralelo.
+
+        Args:
+            trabajadores (Iterable[Trabajador]): La cuadrilla (un
+                trabajador repetido se atiende una sola vez).
+            fecha (date): La fecha de las tareas a ejecutar.
+            pool (PoolHerramientas): Las herramientas compartidas.
+            timeout_herramienta (float | None, optional): Espera maxima
+                por herramienta; al vencer, el trabajador no trabaja.
+            segundos_por_tarea (float, optional): Duracion simulada de
+                cada tarea (con la herramienta en uso).
+
+        Returns:
+            ResultadoCuadrilla: Throughput, esperas y utilizacion.
+        """
+        # Sin duplicados, conservando el orden (un trabajador por hilo)
+        unicos: Dict[int, Trabajador] = {}
+        for trabajador in trabajadores:
+            unicos.setdefault(id(trabajador), trabajador)
+        cuadrilla: List[Trabajador] = list(unicos.values())
+
+        resultado = ResultadoCuadrilla(len(cuadrilla), pool.get_cantidad())
+        if not cuadrilla:
+            return resultado
+
+        uso_inicial = pool.get_tiempo_en_uso()
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=min(self._max_hilos, len(cuadrilla))) as executor:
+            futuros = [
+                executor.submit(self._ejecutar_jornada, trabajador, fecha, pool,
+                                timeout_herramienta, segundos_por_tarea)
+                for trabajador in cuadrilla
+            ]
+            for futuro in futuros:
+                resultado.registrar(*futuro.result())
+
+        resultado.set_duracion(time.perf_counter() - inicio)
+        resultado.set_tiempo_en_uso(pool.get_tiempo_en_uso() - uso_inicial)
+        return resultado
+
+    # --- Metodos privados ---
+
+    def _ejecutar_jornada(self,
+                          trabajador: Trabajador,
+                          fecha: date,
+                          pool: PoolHerramientas,
+                          timeout_herramienta: float | None,
+                          segundos_por_tarea: float) -> Jornada:
+        """
+        Metodo privado (corre en un hilo del pool) que ejecuta la
+        jornada de un trabajador.
+        """
+        with self._lock_entidades:
+            if not TrabajadorService.puede_trabajar(trabajador, fecha):
+                return EstadoJornada.NO_APTO, 0, None
+            pendientes = len(trabajador.get_tareas_pendientes(fecha))
+        if pendientes == 0:
+            return EstadoJornada.SIN_TAREAS, 0, None
+
+        inicio_espera = time.perf_counter()
+        try:
+            with pool.prestamo(timeout_herramienta):
+                espera = time.perf_counter() - inicio_espera
+                if segundos_por_tarea > 0:
+                    time.sleep(segundos_por_tarea * pendientes)
+                with self._lock_entidades:
+                    completadas = trabajador.completar_tareas_del_dia(fecha)
+        except HerramientaNoDisponibleException:
+            return EstadoJornada.SIN_HERRAMIENTA, 0, time.perf_counter() - inicio_espera
+
+        return EstadoJornada.TRABAJO, len(completadas), espera
@@ -0,0 +1,139 @@
+"""
+Modulo de la clase IndiceAptosMedicos.
+Indice de los aptos medicos del personal ordenado por vencimiento.
+"""
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+from python_forestacion.entidades.personal.trabajador import Trabajador
+
+# TypeAlias de una entrada del indice: (fecha de vencimiento, dni)
+EntradaVencimiento = Tuple[date, int]
+
+
+class IndiceAptosMedicos:
+    """
+    Indice de los certificados de todo el personal, por DNI.
+
+    - Los trabajadores con apto medico APTO se guardan en una lista
+      ordenada por (fecha de vencimiento, dni), mantenida con bisect.
+    - Los trabajadores sin certificado o con certificado NO APTO se
+      guardan aparte (no vencen).
+
+    Asi, "los que vencen en los proximos N dias" y "los que hoy no
+    estan aptos" son un rango contiguo de la lista mas el conjunto
+    aparte: O(log n + k) en lugar de recorrer todo el personal.
+
+    Referencia: US-015
+    """
+
+    def __init__(self):
+        """Inicializa el indice vacio."""
+        self._vencimientos: List[EntradaVencimiento] = []
+        # dni -> entrada en _vencimientos (solo trabajadores aptos)
+        self._entradas: Dict[int, EntradaVencimiento] = {}
+        # dni -> trabajador sin certificado o NO APTO
+        self._sin_apto: Dict[int, Trabajador] = {}
+        # dni -> trabajador (todos los indexados)
+        self._trabajadores: Dict[int, Trabajador] = {}
+
+    def registrar(self, trabajador: Trabajador) -> None:
+        """
+        Indexa (o reindexa) un trabajador segun su apto medico actual.
+
+        Args:
+            trabajador (Trabajador): El trabajador.
+        """
+        dni = trabajador.get_dni()
+        self._quitar_entradas(dni)
+        self._trabajadores[dni] = trabajador
+
+        apto = trabajador.get_apto_medico()
+        if apto is None or not apto.esta_apto():
+            self._sin_apto[dni] = trabajador
+            return
+        entrada = (apto.get_fecha_vencimiento(), dni)
+        insort(self._vencimientos, entrada)
+        self._entradas[dni] = entrada
+
+    def quitar(self, trabajador: Trabajador) -> None:
+        """
+        Quita un trabajador del indice (se ignora si no esta).
+
+        Args:
+            trabajador (Trabajador): El trabajador.
+        """
+        dni = trabajador.get_dni()
+        self._quitar_entradas(dni)
+        self._trabajadores.pop(dni, None)
+
+    def get_por_vencer(self, fecha: date, dias: int) -> List[Trabajador]:
+        """
+        Obtiene los trabajadores con apto vigente en 'fecha' que vence
+        dentro de los proximos 'dias' dias, por fecha de vencimiento.
+
+        Args:
+            fecha (date): La fecha de referencia.
+            dias (int): Ventana en dias.
+
+        Raises:
+            ValueError: Si dias es negativo.
+
+        Returns:
+            List[Trabajador]: Vencimiento en (fecha, fecha + dias].
+        """
+        if dias < 0:
+            raise ValueError("La ventana de dias no puede ser negativa")
+        desde = bisect_right(self._vencimientos, (fecha, float("inf")))
+        hasta = bisect_right(self._vencimientos, (fecha + timedelta(days=dias), float("inf")))
+        return self._trabajadores_de(desde, hasta)
+
+    def get_vencidos(self, fecha: date) -> List[Trabajador]:
+        """
+        Obtiene los trabajadores APTOS cuyo certificado ya no esta
+        vigente en 'fecha', por fecha de vencimiento.
+
+        Args:
+            fecha (date): La fecha de referencia.
+
+        Returns:
+            List[Trabajador]: Vencimiento <= fecha.
+        """
+        return self._trabajadores_de(0, bisect_right(self._vencimientos, (fecha, float("inf"))))
+
+    def get_no_aptos(self, fecha: date) -> List[Trabajador]:
+        """
+        Obtiene los trabajadores que no pueden trabajar en 'fecha':
+        sin certificado, con certificado NO APTO o vencido.
+
+        Args:
+            fecha (date): La fecha de referencia.
+
+        Returns:
+            List[Trabajador]: Primero sin apto / NO APTO, luego vencidos.
+        """
+        return list(self._sin_apto.values()) + self.get_vencidos(fecha)
+
+    def get_cantidad(self) -> int:
+        """Obtiene la cantidad de trabajadores indexados."""
+        return len(self._trabajadores)
+
+    # --- Metodos privados ---
+
+    def _quitar_entradas(self, dni: int) -> None:
+        """
+        Metodo privado que quita las entradas de un DNI (busqueda
+        binaria en la lista ordenada).
+        """
+        self._sin_apto.pop(dni, None)
+        entrada = self._entradas.pop(dni, None)
+        if entrada is not None:
+            del self._vencimientos[bisect_left(self._vencimientos, entrada)]
+
+    def _trabajadores_de(self, desde: int, hasta: int) -> List[Trabajador]:
+        """
+        Metodo privado que resuelve un rango de la lista ordenada a
+        trabajadores.
+        """
+        return [self._trabajadores[dni] for _, dni in self._vencimientos[desde:hasta]]
@@ -0,0 +1,105 @@
+"""
+Modulo de la entidad PlanAsignacion.
+Resultado de la asignacion de las tareas de un dia a una cuadrilla.
+"""
+from datetime import date
+from typing import Dict, List, Tuple
+
+from python_forestacion.entidades.personal.trabajador import Trabajador
+from python_forestacion.entidades.personal.herramienta import Herramienta
+from python_forestacion.entidades.personal.tarea import Tarea
+
+# TypeAlias de la asignacion de un trabajador: (trabajador, herramienta, tareas)
+Asignacion = Tuple[Trabajador, Herramienta, List[Tarea]]
+
+
+class PlanAsignacion:
+    """
+    Resultado de AsignacionService.planificar.
+
+    Para cada trabajador de la cuadrilla guarda la herramienta que
+    usa, las tareas que le tocan y su carga (horas); ademas el
+    makespan (la carga maxima) antes y despues de la busqueda local
+    y la cota inferior del optimo, para medir la calidad del plan.
+
+    Referencia: US-016
+    """
+
+    def __init__(self,
+                 fecha: date,
+                 asignaciones: List[Asignacion],
+                 cargas: List[float],
+                 makespan_inicial: float,
+                 movimientos: int,
+                 sin_asignar: List[Tarea]):
+        """
+        Inicializa el plan.
+
+        Args:
+            fecha (date): El dia planificado.
+            asignaciones (List[Asignacion]): Una por trabajador.
+            cargas (List[float]): Horas asignadas, en el mismo orden.
+            makespan_inicial (float): Makespan del plan LPT (sin mejorar).
+            movimientos (int): Movimientos aplicados por la busqueda local.
+            sin_asignar (List[Tarea]): Tareas sin trabajador disponible.
+        """
+        self._fecha: date = fecha
+        self._asignaciones: List[Asignacion] = asignaciones
+        self._cargas: Dict[int, float] = {
+            trabajador.get_dni(): carga
+            for (trabajador, _, _), carga in zip(asignaciones, cargas)
+        }
+        self._makespan: float = max(cargas, default=0.0)
+        self._makespan_inicial: float = makespan_inicial
+        self._movimientos: int = movimientos
+        self._sin_asignar: List[Tarea] = sin_asignar
+
+        duraciones = [tarea.get_duracion_horas()
+                      for _, _, tareas in asignaciones for tarea in tareas]
+        self._cantidad_tareas: int = len(duraciones)
+        self._cota_inferior: float = (
+            max(sum(duraciones) / len(asignaciones), max(duraciones)) if duraciones else 0.0
+        )
+
+    def get_fecha(self) -> date:
+        """Obtiene el dia planificado."""
+        return self._fecha
+
+    def get_asignaciones(self) -> List[Asignacion]:
+        """
+        Obtiene una COPIA de las asignaciones (trabajador, herramienta,
+        tareas), ordenadas por DNI.
+        """
+        return [(trabajador, herramienta, tareas.copy())
+                for trabajador, herramienta, tareas in self._asignaciones]
+
+    def get_carga(self, dni: int) -> float:
+        """Obtiene las horas asignadas a un trabajador (0 si no esta en el plan)."""
+        return self._cargas.get(dni, 0.0)
+
+    def get_cantidad_tareas(self) -> int:
+        """Obtiene la cantidad de tareas asignadas."""
+        return self._cantidad_tareas
+
+    def get_sin_asignar(self) -> List[Tarea]:
+        """Obtiene una COPIA de las tareas que no se pudieron asignar."""
+        return self._sin_asignar.copy()
+
+    def get_makespan(self) -> float:
+        """Obtiene la carga maxima (horas) del plan final."""
+        return self._makespan
+
+    def get_makespan_inicial(self) -> float:
+        """Obtiene la carga maxima (horas) del plan LPT, antes de mejorarlo."""
+        return self._makespan_inicial
+
+    def get_cota_inferior(self) -> float:
+        """
+        Obtiene la cota inferior del makespan optimo:
+        max(horas totales / trabajadores, tarea mas larga).
+        """
+        return self._cota_inferior
+
+    def get_movimientos(self) -> int:
+        """Obtiene los movimientos aplicados por la busqueda local."""
+        return self._movimientos
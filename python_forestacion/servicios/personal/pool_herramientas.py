@@ -0,0 +1,205 @@
+"""
+Modulo de la clase PoolHerramientas.
+Inventario compartido de herramientas certificadas, prestadas por turnos.
+"""
+import time
+from collections import deque
+from contextlib import contextmanager
+from threading import Condition
+from typing import Deque, Dict, Iterable, Iterator
+
+from python_forestacion.entidades.personal.herramienta import Herramienta
+from python_forestacion.excepciones.herramienta_no_disponible_exception import HerramientaNoDisponibleException
+from python_forestacion.excepciones import mensajes_exception as MSG
+
+
+class PoolHerramientas:
+    """
+    Pool thread-safe de herramientas compartidas por una cuadrilla.
+
+    - Solo admite herramientas con certificado de Higiene y
+      Seguridad (tiene_certificado); las demas se descartan.
+    - Cada herramienta se presta a UN trabajador por vez.
+    - La espera es justa (FIFO): cada pedido toma un turno y las
+      herramientas se entregan en el orden de llegada de los
+      pedidos, por lo que ningun trabajador queda postergado.
+    - Acumula metricas: prestamos, tiempos de espera y tiempo de
+      uso (para calcular la utilizacion del inventario).
+
+    Referencia: US-016
+    """
+
+    def __init__(self, herramientas: Iterable[Herramienta]):
+        """
+        Inicializa el pool con las herramientas certificadas.
+
+        Args:
+            herramientas (Iterable[Herramienta]): El inventario.
+
+        Raises:
+            ValueError: Si no hay ninguna herramienta certificada o
+                hay IDs de herramienta repetidos.
+        """
+        certificadas = []
+        self._rechazadas: int = 0
+        ids = set()
+        for herramienta in herramientas:
+            if not herramienta.tiene_certificado():
+                self._rechazadas += 1
+                continue
+            if herramienta.get_id_herramienta() in ids:
+                raise ValueError(f"Herramienta repetida en el pool: "
+                                 f"{herramienta.get_id_herramienta()}")
+            ids.add(herramienta.get_id_herramienta())
+            certificadas.append(herramienta)
+
+        if not certificadas:
+            raise ValueError("El pool necesita al menos una herramienta certificada")
+
+        self._cantidad: int = len(certificadas)
+        self._libres: Deque[Herramienta] = deque(certificadas)
+        # id_herramienta -> instante (perf_counter) del prestamo
+        self._prestadas: Dict[int, float] = {}
+        # Turnos de los pedidos en espera, en orden de llegada
+        self._turnos: Deque[object] = deque()
+        self._condicion: Condition = Condition()
+
+        # Metricas acumuladas
+        self._prestamos: int = 0
+        self._esperas_agotadas: int = 0
+        self._espera_total: float = 0.0
+        self._espera_maxima: float = 0.0
+        self._tiempo_en_uso: float = 0.0
+
+    def arrendar(self, timeout: float | None = None) -> Herramienta:
+        """
+        Toma una herramienta libre, esperando su turno si no hay.
+
+        Args:
+            timeout (float | None, optional): Segundos de espera maxima
+                (None espera indefinidamente).
+
+        Raises:
+            HerramientaNoDisponibleException: Si vence el timeout.
+
+        Returns:
+            Herramienta: La herramienta prestada (devolver con 'devolver').
+        """
+        inicio = time.perf_counter()
+        limite = None if timeout is None else inicio + timeout
+        turno = object()
+
+        with self._condicion:
+            self._turnos.append(turno)
+            while self._turnos[0] is not turno or not self._libres:
+                restante = None if limite is None else limite - time.perf_counter()
+                if restante is not None and restante <= 0:
+                    self._turnos.remove(turno)
+                    self._esperas_agotadas += 1
+                    # Si este turno era el primero, el siguiente pasa a serlo
+                    self._condicion.notify_all()
+                    raise HerramientaNoDisponibleException(
+                        MSG.TEC_HERRAMIENTA_NO_DISPONIBLE.format(timeout, len(self._turnos)),
+                        MSG.USR_HERRAMIENTA_NO_DISPONIBLE
+                    )
+                self._condicion.wait(restante)
+
+            self._turnos.popleft()
+            herramienta = self._libres.popleft()
+            ahora = time.perf_counter()
+            self._prestadas[herramienta.get_id_herramienta()] = ahora
+
+            espera = ahora - inicio
+            self._prestamos += 1
+            self._espera_total += espera
+            self._espera_maxima = max(self._espera_maxima, espera)
+
+            if self._turnos and self._libres:
+                # Quedan herramientas: despierta al siguiente turno
+                self._condicion.notify_all()
+            return herramienta
+
+    def devolver(self, herramienta: Herramienta) -> None:
+        """
+        Devuelve una herramienta prestada al pool.
+
+        Args:
+            herramienta (Herramienta): La herramienta.
+
+        Raises:
+            ValueError: Si la herramienta no esta prestada por este pool.
+        """
+        with self._condicion:
+            inicio = self._prestadas.pop(herramienta.get_id_herramienta(), None)
+            if inicio is None:
+                raise ValueError(f"La herramienta {herramienta.get_id_herramienta()} "
+                                 f"no esta prestada por este pool")
+            self._tiempo_en_uso += time.perf_counter() - inicio
+            self._libres.append(herramienta)
+            self._condicion.notify_all()
+
+    @contextmanager
+    def prestamo(self, timeout: float | None = None) -> Iterator[Herramienta]:
+        """
+        Presta una herramienta durante un bloque 'with' y la devuelve
+        al salir (incluso ante excepciones).
+
+        Args:
+            timeout (float | None, optional): Segundos de espera maxima.
+
+        Raises:
+            HerramientaNoDisponibleException: Si vence el timeout.
+
+        Yields:
+            Herramienta: La herramienta prestada.
+        """
+        herramienta = self.arrendar(timeout)
+        try:
+            yield herramienta
+        finally:
+            self.devolver(herramienta)
+
+    # --- Getters ---
+
+    def get_cantidad(self) -> int:
+        """Obtiene la cantidad de herramientas certificadas del pool."""
+        return self._cantidad
+
+    def get_rechazadas(self) -> int:
+        """Obtiene la cantidad de herramientas descartadas por no estar certificadas."""
+        return self._rechazadas
+
+    def get_disponibles(self) -> int:
+        """Obtiene la cantidad de herramientas libres en este momento."""
+        with self._condicion:
+            return len(self._libres)
+
+    def get_tiempo_en_uso(self) -> float:
+        """
+        Obtiene el tiempo de uso acumulado (segundos-herramienta),
+        incluyendo los prestamos todavia abiertos.
+        """
+        with self._condicion:
+            ahora = time.perf_counter()
+            abiertos = sum(ahora - inicio for inicio in self._prestadas.values())
+            return self._tiempo_en_uso + abiertos
+
+    def get_estadisticas(self) -> Dict[str, float]:
+        """
+        Obtiene las metricas acumuladas del pool.
+
+        Returns:
+            Dict[str, float]: prestamos, esperas_agotadas,
+                espera_promedio, espera_maxima (segundos) y
+                tiempo_en_uso (segundos-herramienta).
+        """
+        tiempo_en_uso = self.get_tiempo_en_uso()
+        with self._condicion:
+            return {
+                "prestamos": self._prestamos,
+                "esperas_agotadas": self._esperas_agotadas,
+                "espera_promedio": (self._espera_total / self._prestamos
+                                    if self._prestamos else 0.0),
+                "espera_maxima": self._espera_maxima,
+                "tiempo_en_uso": tiempo_en_uso,
+            }
@@ -0,0 +1,201 @@
+"""
+Modulo de la clase RegistroPersonal.
+Indice global del personal: DNI y asignacion trabajador <-> finca.
+"""
+from datetime import date
+from typing import Dict, Iterable, List, Set
+
+from python_forestacion.entidades.personal.trabajador import Trabajador
+from python_forestacion.servicios.personal.indice_aptos_medicos import IndiceAptosMedicos
+
+
+class RegistroPersonal:
+    """
+    Indice del personal de todas las fincas gestionadas.
+
+    - DNI -> Trabajador, con busqueda O(1).
+    - Relacion muchos a muchos trabajador <-> finca (por ID de
+      padron), indexada en ambos sentidos.
+    - Conjunto de trabajadores que atienden mas de una finca,
+      mantenido en forma incremental.
+    - IndiceAptosMedicos de todo el personal registrado (por
+      vencimiento), actualizado al entrar o salir un trabajador y
+      con 'actualizar_apto' al cambiar su certificado.
+
+    La dotacion de cada finca se reemplaza completa (como
+    Plantacion.set_trabajadores) y el indice aplica solo la
+    diferencia con la dotacion anterior: O(k) en los k
+    trabajadores de esa finca.
+
+    Referencia: US-017, US-018
+    """
+
+    def __init__(self):
+        """Inicializa el registro vacio."""
+        self._trabajadores: Dict[int, Trabajador] = {}
+        self._fincas_por_dni: Dict[int, Set[int]] = {}
+        self._dnis_por_finca: Dict[int, Set[int]] = {}
+        self._multifinca: Set[int] = set()
+        self._aptos: IndiceAptosMedicos = IndiceAptosMedicos()
+
+    def asignar_finca(self, id_padron: int, trabajadores: Iterable[Trabajador]) -> None:
+        """
+        Reemplaza la dotacion de una finca.
+
+        Args:
+            id_padron (int): La finca.
+            trabajadores (Iterable[Trabajador]): Su dotacion actual.
+        """
+        nuevos: Dict[int, Trabajador] = {t.get_dni(): t for t in trabajadores}
+        anteriores = self._dnis_por_finca.get(id_padron, set())
+
+        for dni in anteriores - nuevos.keys():
+            self._desasignar(dni, id_padron)
+        for dni, trabajador in nuevos.items():
+            # El DNI identifica al trabajador: se conserva la instancia mas reciente
+            if self._trabajadores.get(dni) is not trabajador:
+                self._trabajadores[dni] = trabajador
+                self._aptos.registrar(trabajador)
+            if dni not in anteriores:
+                self._asignar(dni, id_padron)
+
+        if nuevos:
+            self._dnis_por_finca[id_padron] = set(nuevos)
+        else:
+            self._dnis_por_finca.pop(id_padron, None)
+
+    def quitar_finca(self, id_padron: int) -> None:
+        """
+        Quita una finca (y su dotacion) del registro.
+
+        Args:
+            id_padron (int): La finca.
+        """
+        self.asignar_finca(id_padron, ())
+
+    def actualizar_apto(self, trabajador: Trabajador) -> None:
+        """
+        Reindexa el apto medico de un trabajador registrado (se ignora
+        si el trabajador no esta en el registro).
+
+        Args:
+            trabajador (Trabajador): El trabajador cuyo apto cambio.
+        """
+        if self._trabajadores.get(trabajador.get_dni()) is trabajador:
+            self._aptos.registrar(trabajador)
+
+    def get_por_vencer(self, fecha: date, dias: int) -> List[Trabajador]:
+        """
+        Obtiene los trabajadores con apto vigente en 'fecha' que vence
+        dentro de los proximos 'dias' dias, por fecha de vencimiento.
+
+        Args:
+            fecha (date): La fecha de referencia.
+            dias (int): Ventana en dias.
+
+        Raises:
+            ValueError: Si dias es negativo.
+
+        Returns:
+            List[Trabajador]: Los trabajadores por vencer.
+        """
+        return self._aptos.get_por_vencer(fecha, dias)
+
+    def get_no_aptos(self, fecha: date) -> List[Trabajador]:
+        """
+        Obtiene los trabajadores que no pueden trabajar en 'fecha':
+        sin certificado, con certificado NO APTO o vencido.
+
+        Args:
+            fecha (date): La fecha de referencia.
+
+        Returns:
+            List[Trabajador]: Los trabajadores no aptos.
+        """
+        return self._aptos.get_no_aptos(fecha)
+
+    def buscar(self, dni: int) -> Trabajador | None:
+        """
+        Busca un trabajador por DNI en O(1).
+
+        Args:
+            dni (int): El DNI.
+
+        Returns:
+            Trabajador | None: El trabajador, o None si no trabaja en
+                ninguna finca registrada.
+        """
+        return self._trabajadores.get(dni)
+
+    def get_fincas(self, dni: int) -> List[int]:
+        """
+        Obtiene las fincas que atiende un trabajador.
+
+        Args:
+            dni (int): El DNI.
+
+        Returns:
+            List[int]: IDs de padron, ordenados.
+        """
+        return sorted(self._fincas_por_dni.get(dni, ()))
+
+    def get_trabajadores(self, id_padron: int) -> List[Trabajador]:
+        """
+        Obtiene la dotacion de una finca.
+
+        Args:
+            id_padron (int): La finca.
+
+        Returns:
+            List[Trabajador]: Los trabajadores, ordenados por DNI.
+        """
+        return [self._trabajadores[dni]
+                for dni in sorted(self._dnis_por_finca.get(id_padron, ()))]
+
+    def get_trabajadores_multifinca(self) -> List[Trabajador]:
+        """
+        Obtiene los trabajadores que atienden mas de una finca.
+
+        Returns:
+            List[Trabajador]: Los trabajadores, ordenados por DNI.
+        """
+        return [self._trabajadores[dni] for dni in sorted(self._multifinca)]
+
+    def get_todos(self) -> List[Trabajador]:
+        """
+        Obtiene todos los trabajadores registrados.
+
+        Returns:
+            List[Trabajador]: Los trabajadores, ordenados por DNI.
+        """
+        return [self._trabajadores[dni] for dni in sorted(self._trabajadores)]
+
+    def get_cantidad(self) -> int:
+        """Obtiene la cantidad de trabajadores registrados."""
+        return len(self._trabajadores)
+
+    # --- Metodos privados ---
+
+    def _asignar(self, dni: int, id_padron: int) -> None:
+        """
+        Metodo privado que agrega el par (dni, finca) al indice.
+        """
+        fincas = self._fincas_por_dni.get(dni)
+        if fincas is None:
+            fincas = self._fincas_por_dni[dni] = set()
+        fincas.add(id_padron)
+        if len(fincas) > 1:
+            self._multifinca.add(dni)
+
+    def _desasignar(self, dni: int, id_padron: int) -> None:
+        """
+        Metodo privado que quita el par (dni, finca) del indice; un
+        trabajador sin fincas sale del registro.
+        """
+        fincas = self._fincas_por_dni[dni]
+        fincas.discard(id_padron)
+        if len(fincas) <= 1:
+            self._multifinca.discard(dni)
+        if not fincas:
+            del self._fincas_por_dni[dni]
+            self._aptos.quitar(self._trabajadores.pop(dni))
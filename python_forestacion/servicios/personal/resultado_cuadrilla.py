@@ -0,0 +1,107 @@
+"""
+Modulo de la entidad ResultadoCuadrilla.
+Resume la jornada de una cuadrilla ejecutada en paralelo.
+"""
+from enum import Enum
+from typing import Dict
+
+
+class EstadoJornada(Enum):
+    """
+    Enumera como termino la jornada de un trabajador de la cuadrilla.
+    """
+    TRABAJO = "Trabajo"
+    NO_APTO = "No apto"
+    SIN_TAREAS = "Sin tareas"
+    SIN_HERRAMIENTA = "Sin herramienta"
+
+
+class ResultadoCuadrilla:
+    """
+    Resultado de CuadrillaService.trabajar_cuadrilla.
+
+    Acumula, por estado de jornada, la cantidad de trabajadores, las
+    tareas completadas y los tiempos de espera por herramienta, y
+    calcula el throughput y la utilizacion del pool.
+
+    Referencia: US-016
+    """
+
+    def __init__(self, total_trabajadores: int, cantidad_herramientas: int):
+        """
+        Inicializa el resultado vacio.
+
+        Args:
+            total_trabajadores (int): Trabajadores de la cuadrilla.
+            cantidad_herramientas (int): Herramientas del pool.
+        """
+        self._total_trabajadores: int = total_trabajadores
+        self._cantidad_herramientas: int = cantidad_herramientas
+        self._por_estado: Dict[EstadoJornada, int] = {estado: 0 for estado in EstadoJornada}
+        self._tareas_completadas: int = 0
+        self._esperas: int = 0
+        self._espera_total: float = 0.0
+        self._espera_maxima: float = 0.0
+        self._tiempo_en_uso: float = 0.0
+        self._duracion: float = 0.0
+
+    def registrar(self, estado: EstadoJornada, tareas: int, espera: float | None) -> None:
+        """
+        Contabiliza la jornada de un trabajador.
+
+        Args:
+            estado (EstadoJornada): Como termino la jornada.
+            tareas (int): Tareas completadas.
+            espera (float | None): Segundos de espera por la
+                herramienta (None si no la pidio).
+        """
+        self._por_estado[estado] += 1
+        self._tareas_completadas += tareas
+        if espera is not None:
+            self._esperas += 1
+            self._espera_total += espera
+            self._espera_maxima = max(self._espera_maxima, espera)
+
+    def set_tiempo_en_uso(self, segundos: float) -> None:
+        """Establece el uso de herramientas de la jornada (segundos-herramienta)."""
+        self._tiempo_en_uso = segundos
+
+    def set_duracion(self, segundos: float) -> None:
+        """Establece la duracion total de la jornada en segundos."""
+        self._duracion = segundos
+
+    def get_total_trabajadores(self) -> int:
+        """Obtiene la cantidad de trabajadores de la cuadrilla."""
+        return self._total_trabajadores
+
+    def get_cantidad(self, estado: EstadoJornada) -> int:
+        """Obtiene la cantidad de trabajadores que terminaron en un estado."""
+        return self._por_estado[estado]
+
+    def get_tareas_completadas(self) -> int:
+        """Obtiene la cantidad total de tareas completadas."""
+        return self._tareas_completadas
+
+    def get_duracion(self) -> float:
+        """Obtiene la duracion total de la jornada en segundos."""
+        return self._duracion
+
+    def get_throughput(self) -> float:
+        """Obtiene las tareas completadas por segundo."""
+        return self._tareas_completadas / self._duracion if self._duracion > 0 else 0.0
+
+    def get_espera_promedio(self) -> float:
+        """Obtiene la espera promedio por herramienta en segundos."""
+        return self._espera_total / self._esperas if self._esperas else 0.0
+
+    def get_espera_maxima(self) -> float:
+        """Obtiene la espera maxima por herramienta en segundos."""
+        return self._espera_maxima
+
+    def get_utilizacion_herramientas(self) -> float:
+        """
+        Obtiene la fraccion (0 a 1) del tiempo de la jornada en que
+        las herramientas del pool estuvieron prestadas.
+        """
+        capacidad = self._cantidad_herramientas * self._duracion
+        return min(1.0, self._tiempo_en_uso / capacidad) if capacidad > 0 else 0.0
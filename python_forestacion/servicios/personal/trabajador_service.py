@@ -8,25 +8,45 @@ from typing import List, TYPE_CHECKING
 # --- Imports de Entidades ---
 from python_forestacion.entidades.personal.trabajador import Trabajador
 from python_forestacion.entidades.personal.apto_medico import AptoMedico
-from python_forestacion.entidades.personal.tarea import Tarea, EstadoTarea
+from python_forestacion import constantes as C
 
 if TYPE_CHECKING:
     from python_forestacion.entidades.personal.herramienta import Herramienta
+    from python_forestacion.servicios.negocio.fincas_service import FincasService
 
 class TrabajadorService:
     """
     Servicio para gestionar la logica de negocio de los Trabajadores.
     
     Implementa US-015 (Asignar Apto Medico) y US-016 (Trabajar).
+
+    Las consultas de vencimientos usan el indice de aptos de todo el
+    personal de las fincas gestionadas (el RegistroPersonal del
+    FincasService), que se actualiza con cada cambio de certificado,
+    se asigne por este servicio o no, y con las fincas cargadas de disco.
     """
 
+    def __init__(self, fincas_service: 'FincasService | None' = None):
+        """
+        Inicializa el servicio.
+
+        Args:
+            fincas_service (FincasService | None, optional): Servicio con
+                el personal de las fincas gestionadas. Se requiere para
+                las consultas de vencimientos.
+        """
+        self._fincas_service: 'FincasService | None' = fincas_service
+
     def asignar_apto_medico(self,
                               trabajador: Trabajador,
                               apto: bool,
                               fecha_emision: date,
-                              observaciones: str | None = None) -> None:
+                              observaciones: str | None = None,
+                              vigencia_dias: int = C.APTO_MEDICO_VIGENCIA_DIAS) -> None:
         """
-        Crea y asigna un AptoMedico a un trabajador.
+        Crea y asigna un AptoMedico a un trabajador. Si el trabajador
+        atiende una finca gestionada, el cambio lo reindexa por
+        vencimiento (evento "apto_medico").
         Implementacion de US-015.
 
         Args:
@@ -34,6 +54,7 @@ class TrabajadorService:
             apto (bool): True si esta apto.
             fecha_emision (date): Fecha del certificado.
             observaciones (str | None, optional): Comentarios medicos.
+            vigencia_dias (int, optional): Dias de validez del certificado.
         """
         print(f"\n--- Asignando Apto Medico a {trabajador.get_nombre()} ---")
         
@@ -41,10 +62,11 @@ class TrabajadorService:
         apto_medico = AptoMedico(
             apto=apto,
             fecha_emision=fecha_emision,
-            observaciones=observaciones
+            observaciones=observaciones,
+            vigencia_dias=vigencia_dias
         )
         
-        # 2. Asignarla al trabajador
+        # 2. Asignarla al trabajador (el evento actualiza el indice de vencimientos)
         trabajador.set_apto_medico(apto_medico)
         
         if apto:
@@ -52,21 +74,57 @@ class TrabajadorService:
         else:
             print(f"Trabajador {trabajador.get_nombre()} ahora esta NO APTO.")
 
+    def get_trabajadores_por_vencer(self,
+                                    dias: int,
+                                    fecha: date | None = None) -> List[Trabajador]:
+        """
+        Obtiene los trabajadores cuyo apto vigente vence dentro de los
+        proximos 'dias' dias, ordenados por vencimiento.
+
+        Args:
+            dias (int): Ventana en dias.
+            fecha (date | None, optional): Fecha de referencia (por defecto, hoy).
+
+        Raises:
+            ValueError: Si dias es negativo, o el servicio no tiene
+                FincasService.
+
+        Returns:
+            List[Trabajador]: Los trabajadores por vencer.
+        """
+        return self._get_fincas_service().get_trabajadores_por_vencer(dias, fecha)
+
+    def get_trabajadores_no_aptos(self, fecha: date | None = None) -> List[Trabajador]:
+        """
+        Obtiene el personal de las fincas gestionadas que no puede
+        trabajar en la fecha: sin certificado, NO APTOS o con el apto vencido.
+
+        Args:
+            fecha (date | None, optional): Fecha de referencia (por defecto, hoy).
+
+        Raises:
+            ValueError: Si el servicio no tiene FincasService.
+
+        Returns:
+            List[Trabajador]: Los trabajadores no aptos.
+        """
+        return self._get_fincas_service().get_trabajadores_no_aptos(fecha)
+
     @staticmethod
-    def _obtener_id_tarea(tarea: Tarea) -> int:
+    def puede_trabajar(trabajador: Trabajador, fecha: date | None = None) -> bool:
         """
-        Metodo helper estatico para el ordenamiento de tareas.
-        
-        Se usa en lugar de 'lambda' para cumplir con la
-        Rubrica 3.4 y Rubrica Auto (QUAL-002).
-        
+        Indica si el trabajador tiene un apto medico que lo habilita
+        a trabajar (Criterio de Aceptacion US-016).
+
         Args:
-            tarea (Tarea): La tarea de la que se extrae el ID.
+            trabajador (Trabajador): El trabajador.
+            fecha (date | None, optional): Fecha de trabajo (por defecto, hoy).
 
         Returns:
-            int: El ID de la tarea.
+            bool: True si tiene apto medico, esta apto y esta vigente.
         """
-        return tarea.get_id_tarea()
+        apto = trabajador.get_apto_medico()
+        return apto is not None and apto.esta_apto() and apto.esta_vigente(fecha)
 
     def trabajar(self,
                  trabajador: Trabajador,
@@ -87,34 +145,35 @@ class TrabajadorService:
         print(f"\n--- {trabajador.get_nombre()} intenta trabajar (Fecha: {fecha}) ---")
         
         # 1. Validacion de Apto Medico (Criterio de Aceptacion US-016)
-        apto = trabajador.get_apto_medico()
-        if apto is None or not apto.esta_apto():
+        if not TrabajadorService.puede_trabajar(trabajador, fecha):
             print(f"ERROR: {trabajador.get_nombre()} no puede trabajar. "
                   f"No tiene Apto Medico vigente.")
             return False # No puede trabajar
 
-        # 2. Obtener todas las tareas
-        todas_las_tareas = trabajador.get_tareas()
-        
-        # 3. Filtrar tareas por fecha y estado
-        tareas_para_hoy = [
-            t for t in todas_las_tareas
-            if t.get_fecha() == fecha and t.get_estado() == EstadoTarea.PENDIENTE
-        ]
+        # 2. Tareas pendientes del dia, ya ordenadas por ID descendente
+        #    (Criterio US-016), desde el calendario del trabajador
+        tareas_para_hoy = trabajador.get_tareas_pendientes(fecha)
 
         if not tareas_para_hoy:
             print(f"{trabajador.get_nombre()} no tiene tareas pendientes para hoy.")
             return True # Pudo "trabajar" (no hacer nada)
 
-        # 4. Ordenar por ID descendente (Criterio US-016)
-        #    Usamos el metodo estatico en 'key' para evitar lambda
-        tareas_para_hoy.sort(key=self._obtener_id_tarea, reverse=True)
-
-        # 5. Ejecutar tareas
+        # 3. Ejecutar tareas (completado en bloque del dia)
         print(f"{trabajador.get_nombre()} comienza sus tareas con: {util.get_nombre()}")
-        for tarea in tareas_para_hoy:
+        for tarea in trabajador.completar_tareas_del_dia(fecha):
             print(f"  -> Ejecutando tarea {tarea.get_id_tarea()}: {tarea.get_descripcion()}")
-            tarea.completar_tarea() # Marcar como completada
             
         print(f"Tareas de {trabajador.get_nombre()} completadas.")
-        return True # Trabajo exitoso
\ No newline at end of file
+        return True # Trabajo exitoso
+
+    # --- Metodos privados ---
+
+    def _get_fincas_service(self) -> 'FincasService':
+        """
+        Metodo privado que obtiene el FincasService con el personal,
+        o falla si el servicio se creo sin el.
+        """
+        if self._fincas_service is None:
+            raise ValueError("Las consultas de aptos requieren un FincasService "
+                             "con el personal de las fincas")
+        return self._fincas_service
@@ -0,0 +1,261 @@
+"""
+Modulo del IndiceRegistros.
+Layout particionado (sharded) del directorio de datos y su manifiesto.
+"""
+import hashlib
+import json
+import os
+from threading import Lock
+from typing import Dict, List, Tuple
+from urllib.parse import quote
+
+# --- Imports de Constantes ---
+from python_forestacion import constantes as C
+
+# TypeAlias de una entrada del manifiesto: [id_padron, nombre_archivo]
+EntradaManifiesto = Tuple[int, str]
+
+# TypeAlias de la firma de un manifiesto en disco: (mtime_ns, tamaño)
+FirmaManifiesto = Tuple[int, int]
+
+
+class IndiceRegistros:
+    """
+    Organiza los archivos de registros en subdirectorios por hash
+    y mantiene un manifiesto por subdirectorio.
+
+    Layout:
+        data/<hh>/<hash>_<propietario codificado>.dat
+        data/<hh>/indice.json   (propietario -> [padron, archivo])
+
+    - El prefijo <hh> sale del hash del propietario, por lo que
+      ningun directorio crece sin limite.
+    - El nombre del archivo codifica el propietario (sin caracteres
+      invalidos) y lleva el hash para evitar colisiones (ej. en
+      sistemas de archivos que no distinguen mayusculas).
+    - Cada manifiesto se reescribe de forma atomica (archivo temporal
+      + os.replace), y solo el del shard afectado.
+
+    Las consultas por propietario, por padron y el listado completo
+    se resuelven con los manifiestos, sin listar los directorios
+    de datos. Los manifiestos se cachean en memoria (thread-safe),
+    validados por la firma (mtime/tamaño) del archivo: un manifiesto
+    creado o reescrito por otro proceso se vuelve a leer.
+
+    Referencia: US-021, US-022
+    """
+
+    def __init__(self):
+        """Inicializa el indice con los manifiestos aun sin cargar."""
+        self._lock: Lock = Lock()
+        # directorio del shard -> (firma, {propietario: (padron, archivo)})
+        self._manifiestos: Dict[str, Tuple[FirmaManifiesto | None,
+                                           Dict[str, EntradaManifiesto]]] = {}
+        # padron -> propietario (se construye bajo demanda)
+        self._por_padron: Dict[int, str] | None = None
+
+    # --- Layout ---
+
+    def path_registro(self, propietario: str) -> str:
+        """
+        Calcula el path (particionado) del archivo de un propietario.
+
+        Args:
+            propietario (str): Nombre del propietario.
+
+        Returns:
+            str: El path completo del archivo.
+        """
+        digest = IndiceRegistros._hash(propietario)
+        return os.path.join(
+            IndiceRegistros._directorio_shard(digest),
+            IndiceRegistros._nombre_archivo(propietario, digest)
+        )
+
+    # --- Actualizacion ---
+
+    def registrar(self, propietario: str, id_padron: int, path_completo: str) -> None:
+        """
+        Registra (o actualiza) un archivo en el manifiesto de su shard.
+        La escritura del manifiesto es atomica.
+
+        Args:
+            propietario (str): Nombre del propietario.
+            id_padron (int): Padron del registro persistido.
+            path_completo (str): Path del archivo persistido.
+        """
+        directorio = os.path.dirname(path_completo)
+        nombre_archivo = os.path.basename(path_completo)
+
+        with self._lock:
+            manifiesto = self._cargar_manifiesto(directorio)
+            if manifiesto.get(propietario) == (id_padron, nombre_archivo):
+                return
+
+            anterior = manifiesto.get(propietario)
+            manifiesto[propietario] = (id_padron, nombre_archivo)
+            firma = IndiceRegistros._escribir_manifiesto(directorio, manifiesto)
+            self._manifiestos[directorio] = (firma, manifiesto)
+
+            if self._por_padron is not None:
+                if anterior is not None and self._por_padron.get(anterior[0]) == propietario:
+                    del self._por_padron[anterior[0]]
+                self._por_padron[id_padron] = propietario
+
+    # --- Consultas ---
+
+    def buscar_por_propietario(self, propietario: str) -> str | None:
+        """
+        Busca el archivo de un propietario en el manifiesto.
+
+        Args:
+            propietario (str): Nombre del propietario.
+
+        Returns:
+            str | None: El path si esta registrado, o None.
+        """
+        directorio = IndiceRegistros._directorio_shard(IndiceRegistros._hash(propietario))
+        with self._lock:
+            entrada = self._cargar_manifiesto(directorio).get(propietario)
+        if entrada is None:
+            return None
+        return os.path.join(directorio, entrada[1])
+
+    def buscar_propietario_por_padron(self, id_padron: int) -> str | None:
+        """
+        Busca el propietario registrado para un padron.
+
+        Si el padron no esta en el mapa cacheado, se vuelve a armar
+        (revalidando los manifiestos) por si otro proceso lo registro.
+
+        Args:
+            id_padron (int): El padron a buscar.
+
+        Returns:
+            str | None: El propietario, o None si no hay registro.
+        """
+        with self._lock:
+            if self._por_padron is None or id_padron not in self._por_padron:
+                self._construir_indice_padron()
+            return self._por_padron.get(id_padron)  # type: ignore
+
+    def listar_paths(self) -> List[str]:
+        """
+        Lista los archivos de todos los registros usando los manifiestos.
+
+        Returns:
+            List[str]: Paths de los archivos, ordenados.
+        """
+        paths: List[str] = []
+        with self._lock:
+            for directorio in IndiceRegistros._directorios_shard_existentes():
+                for _, nombre_archivo in self._cargar_manifiesto(directorio).values():
+                    paths.append(os.path.join(directorio, nombre_archivo))
+        return sorted(paths)
+
+    def olvidar_cache(self) -> None:
+        """Descarta los manifiestos cacheados (se releen desde disco)."""
+        with self._lock:
+            self._manifiestos.clear()
+            self._por_padron = None
+
+    # --- Metodos privados ---
+
+    def _cargar_manifiesto(self, directorio: str) -> Dict[str, EntradaManifiesto]:
+        """
+        Metodo privado que obtiene (cacheado) el manifiesto de un shard.
+        La copia cacheada solo sirve si la firma del archivo no cambio
+        (incluye el caso de un manifiesto que antes no existia).
+        Debe llamarse con el lock tomado.
+        """
+        path_manifiesto = os.path.join(directorio, C.NOMBRE_MANIFIESTO_DATA)
+        firma = IndiceRegistros._firma(path_manifiesto)
+        cacheado = self._manifiestos.get(directorio)
+        if cacheado is not None and cacheado[0] == firma:
+            return cacheado[1]
+
+        manifiesto: Dict[str, EntradaManifiesto] = {}
+        try:
+            with open(path_manifiesto, 'r', encoding='utf-8') as f:
+                for propietario, (id_padron, nombre_archivo) in json.load(f).items():
+                    manifiesto[propietario] = (id_padron, nombre_archivo)
+        except FileNotFoundError:
+            firma = None
+        self._manifiestos[directorio] = (firma, manifiesto)
+        if cacheado is not None:
+            # El manifiesto cambio en disco: el mapa por padron quedo viejo
+            self._por_padron = None
+        return manifiesto
+
+    def _construir_indice_padron(self) -> None:
+        """
+        Metodo privado que arma el mapa padron -> propietario.
+        Debe llamarse con el lock tomado.
+        """
+        por_padron: Dict[int, str] = {}
+        for directorio in IndiceRegistros._directorios_shard_existentes():
+            for propietario, (id_padron, _) in self._cargar_manifiesto(directorio).items():
+                por_padron[id_padron] = propietario
+        self._por_padron = por_padron
+
+    @staticmethod
+    def _escribir_manifiesto(directorio: str,
+                             manifiesto: Dict[str, EntradaManifiesto]) -> FirmaManifiesto | None:
+        """
+        Metodo privado que reescribe el manifiesto de forma atomica
+        y devuelve la firma del archivo escrito.
+        """
+        os.makedirs(directorio, exist_ok=True)
+        path_manifiesto = os.path.join(directorio, C.NOMBRE_MANIFIESTO_DATA)
+        path_temporal = f"{path_manifiesto}.tmp"
+        with open(path_temporal, 'w', encoding='utf-8') as f:
+            json.dump(manifiesto, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(path_temporal, path_manifiesto)
+        return IndiceRegistros._firma(path_manifiesto)
+
+    @staticmethod
+    def _firma(path_manifiesto: str) -> FirmaManifiesto | None:
+        """
+        Metodo privado que obtiene la firma (mtime/tamaño) de un
+        manifiesto, o None si no existe.
+        """
+        try:
+            estado = os.stat(path_manifiesto)
+        except FileNotFoundError:
+            return None
+        return estado.st_mtime_ns, estado.st_size
+
+    @staticmethod
+    def _directorios_shard_existentes() -> List[str]:
+        """
+        Metodo privado que lista los shards existentes (como maximo
+        16 ** SHARD_PREFIJO_LONGITUD directorios, nunca los archivos).
+        """
+        if not os.path.isdir(C.DIRECTORIO_DATA):
+            return []
+        longitud = C.SHARD_PREFIJO_LONGITUD
+        with os.scandir(C.DIRECTORIO_DATA) as entradas:
+            return sorted(
+                entrada.path for entrada in entradas
+                if entrada.is_dir() and len(entrada.name) == longitud
+            )
+
+    @staticmethod
+    def _hash(propietario: str) -> str:
+        """Metodo privado que calcula el hash hexadecimal del propietario."""
+        return hashlib.sha1(propietario.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _directorio_shard(digest: str) -> str:
+        """Metodo privado que obtiene el directorio del shard de un hash."""
+        return os.path.join(C.DIRECTORIO_DATA, digest[:C.SHARD_PREFIJO_LONGITUD])
+
+    @staticmethod
+    def _nombre_archivo(propietario: str, digest: str) -> str:
+        """
+        Metodo privado que arma un nombre de archivo seguro:
+        hash + propietario codificado (truncado para no exceder
+        el largo maximo de nombre del sistema de archivos).
+        """
+        codificado = quote(propietario, safe='')[:C.LARGO_MAXIMO_NOMBRE_DATA]
+        return f"{digest[:C.LARGO_HASH_NOMBRE_DATA]}_{codificado}{C.EXTENSION_DATA}"
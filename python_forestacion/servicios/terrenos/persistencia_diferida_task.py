@@ -0,0 +1,236 @@
+"""
+Modulo del Persistidor Diferido (Thread).
+Implementa persistencia "write-behind" de registros forestales.
+"""
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple, TYPE_CHECKING
+
+# --- Imports de Excepciones ---
+from python_forestacion.excepciones.forestacion_exception import ForestacionException
+
+# --- Imports de Constantes ---
+from python_forestacion import constantes as C
+
+# --- Imports para Type Hints ---
+if TYPE_CHECKING:
+    from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+    from python_forestacion.servicios.terrenos.registro_forestal_service import RegistroForestalService
+
+# TypeAlias de un pedido pendiente: (registro, contenido serializado, generacion)
+Instantanea = Tuple['RegistroForestal', bytes, int]
+
+
+class PersistenciaDiferidaTask(threading.Thread):
+    """
+    Persistidor diferido (write-behind).
+
+    1.  Como Thread: escribe los registros en un hilo daemon dedicado,
+        por lo que quien pide guardar (ej. el flujo principal o un
+        riego) no se bloquea con el disco.
+
+    2.  Instantanea: 'encolar' serializa el registro en el hilo que lo
+        pide (en memoria). El hilo de escritura nunca recorre el registro
+        vivo, que otro hilo puede estar modificando; solo escribe bytes.
+
+    3.  Coalesce: si un registro ya esta pendiente, un nuevo pedido
+        no agrega otra escritura; se guarda una sola vez con la
+        instantanea mas reciente.
+
+    4.  Cola acotada: 'encolar' espera si hay demasiados registros
+        distintos pendientes (backpressure).
+
+    5.  flush() y detener() permiten integrarlo con la detencion
+        segura del sistema (US-013): al detenerse, primero vacia la cola.
+
+    Referencia: US-021, US-013
+    """
+
+    def __init__(self,
+                 registro_service: RegistroForestalService,
+                 capacidad: int = C.PERSISTENCIA_COLA_CAPACIDAD):
+        """
+        Inicializa el persistidor.
+
+        Configura el thread como 'daemon' (Rubrica 5.1).
+
+        Args:
+            registro_service (RegistroForestalService): Servicio que realiza
+                la escritura real (persistir).
+            capacidad (int): Cantidad maxima de registros distintos pendientes.
+
+        Raises:
+            ValueError: Si la capacidad es <= 0.
+        """
+        if capacidad <= 0:
+            raise ValueError("La capacidad de la cola debe ser positiva")
+
+        super().__init__(daemon=True, name="PersistenciaThread")
+
+        # Inyeccion de Dependencias
+        self._registro_service = registro_service
+        self._capacidad: int = capacidad
+
+        # Cola de pendientes: propietario -> instantanea (orden FIFO)
+        self._pendientes: OrderedDict[str, Instantanea] = OrderedDict()
+        self._escribiendo: bool = False
+        self._condicion: threading.Condition = threading.Condition()
+
+        # Control de detencion (Graceful Shutdown - US-013)
+        self._detenido: bool = False
+
+        # Metricas
+        self._escrituras: int = 0
+        self._coalescidas: int = 0
+        self._errores: int = 0
+        self._latencia_total: float = 0.0
+        self._latencia_maxima: float = 0.0
+
+    def encolar(self, registro: RegistroForestal, timeout: float | None = None) -> bool:
+        """
+        Solicita guardar un registro en segundo plano.
+
+        La instantanea (pickle en memoria) se toma aca, en el hilo que
+        llama, junto con la generacion del registro; la escritura a
+        disco queda para el hilo del persistidor.
+
+        Args:
+            registro (RegistroForestal): El registro a persistir.
+            timeout (float | None, optional): Espera maxima si la cola
+                esta llena. None espera indefinidamente.
+
+        Raises:
+            ValueError: Si el propietario es nulo o vacio.
+            PersistenciaException: Si el registro no se puede serializar.
+
+        Returns:
+            bool: True si quedo encolado (o coalescido), False si la cola
+                  siguio llena durante el timeout o el persistidor esta detenido.
+        """
+        propietario = registro.get_propietario()
+        if not propietario:
+            raise ValueError("El propietario no puede ser nulo o vacio")
+
+        with self._condicion:
+            if self._detenido:
+                return False
+
+        # Instantanea fuera del lock: no frena al hilo de escritura
+        generacion = registro.get_generacion()
+        instantanea = (registro, self._registro_service.serializar(registro), generacion)
+
+        with self._condicion:
+            if self._detenido:
+                return False
+
+            if propietario in self._pendientes:
+                # Coalesce: se conserva la posicion, se actualiza el estado
+                self._pendientes[propietario] = instantanea
+                self._coalescidas += 1
+                return True
+
+            if not self._condicion.wait_for(self._hay_lugar, timeout=timeout):
+                return False
+            if self._detenido:
+                return False
+
+            self._pendientes[propietario] = instantanea
+            self._condicion.notify_all()
+            return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Espera a que se escriban todos los registros pendientes.
+
+        Args:
+            timeout (float | None, optional): Espera maxima en segundos.
+
+        Returns:
+            bool: True si la cola quedo vacia, False si vencio el timeout.
+        """
+        with self._condicion:
+            return self._condicion.wait_for(self._cola_vacia, timeout=timeout)
+
+    def run(self) -> None:
+        """
+        Metodo principal del Thread.
+        Se ejecuta al llamar a .start()
+        """
+        print(f"[{self.name}] Iniciando persistencia diferida...")
+        while True:
+            with self._condicion:
+                self._condicion.wait_for(self._hay_trabajo_o_detencion)
+                if not self._pendientes:
+                    # Detenido y sin pendientes: terminamos
+                    break
+                _, (registro, contenido, generacion) = self._pendientes.popitem(last=False)
+                self._escribiendo = True
+                # Se libero un lugar en la cola
+                self._condicion.notify_all()
+
+            inicio = time.perf_counter()
+            exito = True
+            try:
+                self._registro_service.escribir_serializado(registro, contenido, generacion)
+            except (ForestacionException, ValueError) as e:
+                exito = False
+                print(f"[{self.name}] ERROR DE PERSISTENCIA: {e}")
+            latencia = time.perf_counter() - inicio
+
+            with self._condicion:
+                self._escribiendo = False
+                if exito:
+                    self._escrituras += 1
+                    self._latencia_total += latencia
+                    self._latencia_maxima = max(self._latencia_maxima, latencia)
+                else:
+                    self._errores += 1
+                self._condicion.notify_all()
+
+        print(f"[{self.name}] Persistencia diferida detenida.")
+
+    def detener(self) -> None:
+        """
+        Solicita la detencion del thread de forma segura.
+        Los registros ya encolados se escriben antes de terminar.
+        (US-013)
+        """
+        print(f"[{self.name}] Solicitando detencion de persistencia...")
+        with self._condicion:
+            self._detenido = True
+            self._condicion.notify_all()
+
+    def get_metricas(self) -> Dict[str, float]:
+        """
+        Obtiene las metricas del persistidor.
+
+        Returns:
+            Dict[str, float]: profundidad_cola, escrituras, coalescidas,
+                errores, latencia_promedio y latencia_maxima (segundos).
+        """
+        with self._condicion:
+            promedio = self._latencia_total / self._escrituras if self._escrituras else 0.0
+            return {
+                "profundidad_cola": len(self._pendientes),
+                "escrituras": self._escrituras,
+                "coalescidas": self._coalescidas,
+                "errores": self._errores,
+                "latencia_promedio": promedio,
+                "latencia_maxima": self._latencia_maxima,
+            }
+
+    # --- Predicados para Condition.wait_for (NO-LAMBDA, Rubrica 3.4) ---
+
+    def _hay_lugar(self) -> bool:
+        """Predicado: hay lugar en la cola o el persistidor se detuvo."""
+        return self._detenido or len(self._pendientes) < self._capacidad
+
+    def _cola_vacia(self) -> bool:
+        """Predicado: no hay pendientes ni una escritura en curso."""
+        return not self._pendientes and not self._escribiendo
+
+    def _hay_trabajo_o_detencion(self) -> bool:
+        """Predicado: hay registros pendientes o se pidio la detencion."""
+        return bool(self._pendientes) or self._detenido
@@ -2,7 +2,10 @@
 Modulo del servicio PlantacionService.
 Este es un servicio central que orquesta la logica de plantacion y riego.
 """
-from typing import TYPE_CHECKING, List
+from __future__ import annotations
+import heapq
+from datetime import date, timedelta
+from typing import Dict, List, Mapping, Tuple, TYPE_CHECKING
 
 # --- Imports de Patrones ---
 # 1. Importa el Factory para crear cultivos (US-TECH-002)
@@ -11,10 +14,16 @@ from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
 # 2. Importa el Registry (Singleton) para operar sobre cultivos (US-TECH-005)
 from python_forestacion.servicios.cultivos.cultivo_service_registry import CultivoServiceRegistry
 
+# 3. Importa el contexto de riego (fecha unica y memoizacion del Strategy)
+from python_forestacion.patrones.strategy.contexto_riego import ContextoRiego
+
 # --- Imports de Entidades ---
 from python_forestacion.entidades.terrenos.plantacion import Plantacion
 from python_forestacion.entidades.cultivos.cultivo import Cultivo
 
+# --- Imports de Resultados ---
+from python_forestacion.servicios.terrenos.resultado_riego import ResultadoRiego, EstadoRiego
+
 # --- Imports de Excepciones ---
 from python_forestacion.excepciones.superficie_insuficiente_exception import SuperficieInsuficienteException
 from python_forestacion.excepciones.agua_agotada_exception import AguaAgotadaException
@@ -24,11 +33,7 @@ from python_forestacion.excepciones import mensajes_exception as MSG
 from python_forestacion import constantes as C
 
 if TYPE_CHECKING:
-    # Para type hints
-    from python_forestacion.entidades.cultivos.pino import Pino
-    from python_forestacion.entidades.cultivos.olivo import Olivo
-    # TypeAlias para Arbol
-    Arbol = Pino | Olivo
+    from python_forestacion.patrones.strategy.absorcion_agua_strategy import AbsorcionAguaStrategy
 
 
 class PlantacionService:
@@ -109,49 +114,267 @@ class PlantacionService:
         
         return cultivos_plantados
 
-    def regar(self, plantacion: Plantacion) -> None:
+    def regar(self,
+              plantacion: Plantacion,
+              contexto: ContextoRiego | None = None,
+              parcial: bool = False,
+              prioridad_especie: Mapping[str, int] | None = None) -> None:
         """
         Riega todos los cultivos de la plantacion.
         
         Logica de negocio de US-008.
         Usa el Registry para despachar la absorcion y el crecimiento.
+        (Para obtener el resultado sin excepciones, ver 'intentar_regar'.)
 
         Args:
             plantacion (Plantacion): La plantacion a regar.
+            contexto (ContextoRiego | None, optional): Contexto del ciclo
+                de riego, para compartirlo entre varias plantaciones
+                (si no se indica, se crea uno para este riego).
+            parcial (bool, optional): Si el agua no alcanza, regar
+                solo los cultivos mas necesitados (ver 'regar_parcial')
+                en lugar de lanzar la excepcion.
+            prioridad_especie (Mapping[str, int] | None, optional):
+                Prioridad por especie para el riego parcial.
             
         Raises:
-            AguaAgotadaException: Si no hay agua para el riego.
+            AguaAgotadaException: Si no hay agua para el riego
+                (y no se pidio riego parcial).
         """
-        
+        resultado = self.intentar_regar(plantacion, contexto, parcial, prioridad_especie)
+        if resultado.get_estado() == EstadoRiego.AGUA_AGOTADA and not parcial:
+            raise AguaAgotadaException(
+                mensaje_tecnico=MSG.TEC_AGUA_AGOTADA.format(
+                    resultado.get_agua_restante(), C.AGUA_POR_RIEGO),
+                mensaje_usuario=MSG.USR_AGUA_AGOTADA
+            )
+
+    def intentar_regar(self,
+                       plantacion: Plantacion,
+                       contexto: ContextoRiego | None = None,
+                       parcial: bool = False,
+                       prioridad_especie: Mapping[str, int] | None = None) -> ResultadoRiego:
+        """
+        Intenta regar la plantacion (como 'regar') e informa el
+        resultado en lugar de lanzar AguaAgotadaException: sin agua,
+        devuelve AGUA_AGOTADA sin modificar la plantacion.
+
+        Args:
+            plantacion (Plantacion): La plantacion a regar.
+            contexto (ContextoRiego | None, optional): Contexto del ciclo.
+            parcial (bool, optional): Si el agua no alcanza, regar
+                solo los cultivos mas necesitados.
+            prioridad_especie (Mapping[str, int] | None, optional):
+                Prioridad por especie para el riego parcial.
+
+        Returns:
+            ResultadoRiego: Estado, litros consumidos y absorbidos,
+                cultivos regados y agua restante.
+        """
+        if contexto is None:
+            contexto = ContextoRiego()
+
         # 1. Validar y consumir agua de la plantacion (US-008)
         agua_necesaria = C.AGUA_POR_RIEGO
         agua_disponible = plantacion.get_agua_disponible()
         
         if agua_disponible < agua_necesaria:
-            raise AguaAgotadaException(
-                mensaje_tecnico=MSG.TEC_AGUA_AGOTADA.format(
-                    agua_disponible, agua_necesaria),
-                mensaje_usuario=MSG.USR_AGUA_AGOTADA
-            )
+            if parcial:
+                return self._regar_parcial(plantacion, contexto, prioridad_especie)
+            return ResultadoRiego(EstadoRiego.AGUA_AGOTADA, 0, 0, 0, agua_disponible)
             
         plantacion.set_agua_disponible(agua_disponible - agua_necesaria)
         
         print(f"Riego iniciado. Consumiendo {agua_necesaria}L de la finca...")
 
-        # 2. Distribuir agua a cada cultivo
-        for cultivo in plantacion.get_cultivos():
-            
-            # 3. Llama al Registry (que llama al Strategy)
-            agua_absorbida = self._registry.absorber_agua(cultivo)
-            
-            # 4. Llama al Registry para crecer (solo si es Arbol)
-            # (Usamos 'from .pino import Pino' para evitar 'isinstance')
-            from python_forestacion.entidades.cultivos.pino import Pino
-            from python_forestacion.entidades.cultivos.olivo import Olivo
-            
-            if type(cultivo) in (Pino, Olivo):
-                # Es un Arbol, llamamos a crecer
-                self._registry.crecer_arbol(cultivo) # type: ignore
-                
+        # 2. Distribuir agua a los cultivos: el Registry agrupa por especie,
+        #    aplica la absorcion (Strategy) y, a las especies que crecen
+        #    (arboles), su regla de crecimiento.
+        absorbido = self._registry.regar_lote(plantacion.get_cultivos(), contexto)
+
         print(f"Riego completado. Agua restante en finca: "
-              f"{plantacion.get_agua_disponible()}L")
\ No newline at end of file
+              f"{plantacion.get_agua_disponible()}L")
+        regados = sum(estadistica.get_cantidad()
+                      for estadistica in plantacion.get_estadisticas().values())
+        return ResultadoRiego(EstadoRiego.COMPLETO, agua_necesaria, absorbido,
+                              regados, plantacion.get_agua_disponible())
+
+    def regar_parcial(self,
+                      plantacion: Plantacion,
+                      contexto: ContextoRiego | None = None,
+                      prioridad_especie: Mapping[str, int] | None = None) -> int:
+        """
+        Riega, con el agua que queda en la plantacion (menos que
+        AGUA_POR_RIEGO), solo los cultivos mas necesitados.
+
+        - Cada cultivo cuesta lo que absorbe (Strategy, con el contexto).
+        - Orden de necesidad: prioridad de la especie (por defecto,
+          arboles antes que hortalizas), luego menor agua almacenada
+          relativa a su absorcion, luego orden en la plantacion.
+        - Seleccion parcial (top-k): se arma un heap en O(n) y se
+          agrupan los candidatos por demanda (un heap por grupo, O(n)) y
+          se extraen solo de los grupos que el agua restante alcanza a
+          pagar, O(n + k (d + log n)) con d demandas distintas.
+
+        Los cultivos que no alcanzan a pagar su absorcion se saltean;
+        los que absorben 0 L se riegan junto con los demas (si no alcanza
+        para ninguno con demanda, no se modifica nada). Con agua suficiente
+        para un riego completo, equivale a 'regar'.
+
+        Args:
+            plantacion (Plantacion): La plantacion a regar.
+            contexto (ContextoRiego | None, optional): Contexto del ciclo.
+            prioridad_especie (Mapping[str, int] | None, optional):
+                especie -> prioridad (menor se riega antes). Las especies
+                no incluidas usan PRIORIDAD_RIEGO_ARBOL o
+                PRIORIDAD_RIEGO_HORTALIZA.
+
+        Returns:
+            int: Cantidad de cultivos regados.
+        """
+        return self.intentar_regar(plantacion, contexto, True,
+                                   prioridad_especie).get_cultivos_regados()
+
+    def fast_forward(self,
+                     plantacion: Plantacion,
+                     fecha_desde: date,
+                     fecha_hasta: date,
+                     riegos: int) -> int:
+        """
+        Simula 'riegos' riegos por dia entre dos fechas (inclusive)
+        en una sola pasada, con el mismo resultado exacto que llamar
+        a 'regar' riego por riego con la fecha de cada dia.
+
+        El debito de agua de la plantacion se calcula en forma
+        agregada y la absorcion y el crecimiento se delegan al
+        Registry ('regar_lote_acumulado').
+
+        Args:
+            plantacion (Plantacion): La plantacion a regar.
+            fecha_desde (date): Primer dia simulado.
+            fecha_hasta (date): Ultimo dia simulado.
+            riegos (int): Cantidad de riegos por dia.
+
+        Raises:
+            ValueError: Si riegos < 0 o fecha_hasta < fecha_desde.
+            AguaAgotadaException: Si el agua no alcanza para todos los
+                riegos. Como en el riego paso a paso, los riegos que SI
+                alcanzaban quedan aplicados antes de lanzar la excepcion.
+
+        Returns:
+            int: Cantidad de riegos aplicados.
+        """
+        if riegos < 0:
+            raise ValueError("La cantidad de riegos no puede ser negativa")
+        if fecha_hasta < fecha_desde:
+            raise ValueError("La fecha final no puede ser anterior a la inicial")
+
+        # 1. Riegos que alcanza a cubrir el agua disponible (US-008)
+        agua_necesaria = C.AGUA_POR_RIEGO
+        agua_disponible = plantacion.get_agua_disponible()
+        dias = (fecha_hasta - fecha_desde).days + 1
+        solicitados = dias * riegos
+        posibles = agua_disponible // agua_necesaria if agua_necesaria > 0 else solicitados
+        aplicados = min(solicitados, posibles)
+
+        # 2. Calendario (fecha, riegos) de los riegos que se aplican
+        calendario: List[Tuple[date, int]] = []
+        restantes = aplicados
+        fecha = fecha_desde
+        while restantes > 0:
+            cantidad = min(riegos, restantes)
+            calendario.append((fecha, cantidad))
+            restantes -= cantidad
+            fecha += timedelta(days=1)
+
+        # 3. Debito agregado y efecto acumulado sobre los cultivos
+        if aplicados > 0:
+            plantacion.set_agua_disponible(agua_disponible - aplicados * agua_necesaria)
+            self._registry.regar_lote_acumulado(plantacion.get_cultivos(), calendario)
+
+        print(f"Fast-forward {fecha_desde} a {fecha_hasta}: {aplicados} de "
+              f"{solicitados} riegos aplicados. Agua restante en finca: "
+              f"{plantacion.get_agua_disponible()}L")
+
+        # 4. Agua agotada: misma semantica que el riego paso a paso
+        if aplicados < solicitados:
+            restante = plantacion.get_agua_disponible()
+            raise AguaAgotadaException(
+                mensaje_tecnico=MSG.TEC_AGUA_AGOTADA.format(
+                    restante, agua_necesaria),
+                mensaje_usuario=MSG.USR_AGUA_AGOTADA
+            )
+        return aplicados
+
+    # --- Metodos privados ---
+
+    def _prioridad_riego(self,
+                         cultivo: Cultivo,
+                         prioridad_especie: Mapping[str, int] | None) -> int:
+        """
+        Metodo privado que obtiene la prioridad de riego parcial de la
+        especie de un cultivo (configurada, o arbol / hortaliza).
+        """
+        if prioridad_especie is not None and cultivo.get_tipo() in prioridad_especie:
+            return prioridad_especie[cultivo.get_tipo()]
+        if self._registry.tiene_crecimiento(type(cultivo)):
+            return C.PRIORIDAD_RIEGO_ARBOL
+        return C.PRIORIDAD_RIEGO_HORTALIZA
+
+    def _regar_parcial(self,
+                       plantacion: Plantacion,
+                       contexto: ContextoRiego,
+                       prioridad_especie: Mapping[str, int] | None) -> ResultadoRiego:
+        """
+        Metodo privado con la seleccion del riego parcial (ver
+        'regar_parcial'), para menos de AGUA_POR_RIEGO litros.
+        """
+        presupuesto = plantacion.get_agua_disponible()
+        # Por especie: (prioridad, estrategia), resueltas una sola vez
+        especies: Dict[type, Tuple[int, AbsorcionAguaStrategy]] = {}
+        # Candidatos agrupados por demanda: cada grupo es un heap por necesidad
+        grupos: Dict[int, List[Tuple[int, float, int, Cultivo]]] = {}
+        regados: List[Cultivo] = []
+        for posicion, cultivo in enumerate(plantacion.get_cultivos()):
+            datos = especies.get(type(cultivo))
+            if datos is None:
+                datos = especies[type(cultivo)] = (
+                    self._prioridad_riego(cultivo, prioridad_especie),
+                    self._registry.get_servicio(type(cultivo)).get_estrategia_absorcion())
+            prioridad, estrategia = datos
+            demanda = contexto.calcular_absorcion(estrategia, cultivo)
+            if demanda <= 0:
+                regados.append(cultivo)
+                continue
+            grupos.setdefault(demanda, []).append(
+                (prioridad, cultivo.get_agua() / demanda, posicion, cultivo))
+
+        for grupo in grupos.values():
+            heapq.heapify(grupo)
+        # En cada paso se riega el mas necesitado entre los grupos que el
+        # agua restante alcanza a pagar; los que ya no alcanza se descartan
+        # enteros, sin extraer sus cultivos uno por uno.
+        restante = presupuesto
+        while True:
+            for demanda in [d for d in grupos if d > restante or not grupos[d]]:
+                del grupos[demanda]
+            if not grupos:
+                break
+            elegida = 0
+            for demanda, grupo in grupos.items():
+                if elegida == 0 or grupo[0] < grupos[elegida][0]:
+                    elegida = demanda
+            regados.append(heapq.heappop(grupos[elegida])[3])
+            restante -= elegida
+
+        if restante == presupuesto:
+            # Ningun cultivo con demanda alcanzo a regarse: sin cambios
+            return ResultadoRiego(EstadoRiego.AGUA_AGOTADA, 0, 0, 0, restante)
+
+        plantacion.set_agua_disponible(restante)
+        absorbido = self._registry.regar_lote(regados, contexto)
+
+        print(f"Riego parcial: {len(regados)} cultivos regados con "
+              f"{presupuesto - restante}L. Agua restante en finca: {restante}L")
+        return ResultadoRiego(EstadoRiego.PARCIAL, presupuesto - restante, absorbido,
+                              len(regados), restante)
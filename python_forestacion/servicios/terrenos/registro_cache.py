@@ -0,0 +1,229 @@
+"""
+Modulo del RegistroCache.
+Cache LRU (thread-safe) del contenido de los archivos de registros.
+"""
+from __future__ import annotations
+import pickle
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Tuple, TYPE_CHECKING
+
+# --- Imports de Constantes ---
+from python_forestacion import constantes as C
+
+if TYPE_CHECKING:
+    from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+
+# TypeAlias para la firma del archivo: (mtime_ns, tamaño en bytes)
+FirmaArchivo = Tuple[int, int]
+
+# TypeAlias de una entrada: (firma, contenido pickle, instancia compartida o None)
+EntradaCache = Tuple[FirmaArchivo, bytes, 'RegistroForestal | None']
+
+
+class RegistroCache:
+    """
+    Cache LRU acotada de archivos de registros, indexada por path.
+
+    Cada entrada guarda la firma del archivo (mtime y tamaño) del
+    momento en que se leyo y su contenido (pickle). Si el archivo
+    cambia en disco, la entrada deja de ser valida y se descarta, por
+    lo que nunca se sirven datos distintos a los del disco.
+
+    - 'obtener' devuelve el contenido: cada lector lo deserializa en
+      su PROPIA instancia (sin volver a leer el disco).
+    - 'obtener_compartido' devuelve una unica instancia deserializada
+      por entrada, compartida entre lectores: es de SOLO LECTURA
+      ('es_compartido' permite verificarlo). Si igual se modifica en
+      memoria (dirty tracking), se descarta y se vuelve a deserializar.
+
+    Las instancias entregadas por fuera de la cache (ej. a un
+    FincasService) nunca se guardan en ella.
+
+    La cota es doble: cantidad de entradas y bytes (tamaño del
+    contenido pickle).
+
+    Referencia: US-022
+    """
+
+    def __init__(self,
+                 max_entradas: int = C.CACHE_REGISTROS_MAX_ENTRADAS,
+                 max_bytes: int = C.CACHE_REGISTROS_MAX_BYTES):
+        """
+        Inicializa la cache vacia.
+
+        Args:
+            max_entradas (int): Cantidad maxima de registros en memoria.
+            max_bytes (int): Bytes aproximados maximos en memoria.
+
+        Raises:
+            ValueError: Si alguna de las cotas es <= 0.
+        """
+        if max_entradas <= 0:
+            raise ValueError("La cantidad maxima de entradas debe ser positiva")
+        if max_bytes <= 0:
+            raise ValueError("La cantidad maxima de bytes debe ser positiva")
+
+        self._max_entradas: int = max_entradas
+        self._max_bytes: int = max_bytes
+        self._lock: Lock = Lock()
+
+        # path -> entrada. El orden del OrderedDict es el orden LRU.
+        self._entradas: OrderedDict[str, EntradaCache] = OrderedDict()
+        self._bytes_actuales: int = 0
+
+        # Contadores expuestos por get_estadisticas()
+        self._aciertos: int = 0
+        self._fallos: int = 0
+        self._desalojos: int = 0
+
+    def obtener(self, path: str, firma: FirmaArchivo) -> bytes | None:
+        """
+        Busca el contenido de un archivo en la cache.
+
+        Args:
+            path (str): Path del archivo del registro.
+            firma (FirmaArchivo): Firma actual del archivo en disco.
+
+        Returns:
+            bytes | None: El contenido (pickle) si la entrada existe y
+                su firma coincide, o None (fallo).
+        """
+        with self._lock:
+            entrada = self._validar(path, firma)
+            return None if entrada is None else entrada[1]
+
+    def obtener_compartido(self, path: str, firma: FirmaArchivo) -> RegistroForestal | None:
+        """
+        Busca la instancia compartida (de SOLO LECTURA) de un registro;
+        se deserializa una sola vez por entrada.
+
+        Args:
+            path (str): Path del archivo del registro.
+            firma (FirmaArchivo): Firma actual del archivo en disco.
+
+        Raises:
+            pickle.UnpicklingError (u otros de pickle): Si el contenido
+                cacheado no se puede deserializar.
+
+        Returns:
+            RegistroForestal | None: La instancia compartida, o None
+                si no hay entrada valida (fallo).
+        """
+        with self._lock:
+            entrada = self._validar(path, firma)
+            if entrada is None:
+                return None
+            if entrada[2] is not None and not entrada[2].is_modificado():
+                return entrada[2]
+            contenido = entrada[1]
+
+        # Se deserializa fuera del lock (no frena a los demas lectores)
+        registro = pickle.loads(contenido)
+        with self._lock:
+            entrada = self._entradas.get(path)
+            if entrada is not None and entrada[1] is contenido:
+                if entrada[2] is not None and not entrada[2].is_modificado():
+                    return entrada[2]  # otro hilo la deserializo antes
+                self._entradas[path] = (entrada[0], contenido, registro)
+        return registro
+
+    def es_compartido(self, registro: RegistroForestal) -> bool:
+        """
+        Indica si un registro es una instancia compartida (de solo
+        lectura) servida por 'obtener_compartido'.
+
+        Args:
+            registro (RegistroForestal): El registro.
+
+        Returns:
+            bool: True si la instancia esta en la cache.
+        """
+        with self._lock:
+            return any(entrada[2] is registro for entrada in self._entradas.values())
+
+    def guardar(self, path: str, firma: FirmaArchivo, contenido: bytes) -> None:
+        """
+        Guarda (o reemplaza) el contenido de un archivo en la cache
+        y aplica las cotas.
+
+        Args:
+            path (str): Path del archivo del registro.
+            firma (FirmaArchivo): Firma del archivo leido.
+            contenido (bytes): El contenido (pickle) leido.
+        """
+        tamanio = len(contenido)
+        with self._lock:
+            if path in self._entradas:
+                self._quitar(path)
+
+            # Un registro mas grande que toda la cache no se guarda
+            if tamanio > self._max_bytes:
+                return
+
+            self._entradas[path] = (firma, contenido, None)
+            self._bytes_actuales += tamanio
+
+            while (len(self._entradas) > self._max_entradas
+                   or self._bytes_actuales > self._max_bytes):
+                path_lru = next(iter(self._entradas))
+                self._quitar(path_lru)
+                self._desalojos += 1
+
+    def invalidar(self, path: str) -> None:
+        """
+        Descarta la entrada de un path (ej. luego de persistir).
+
+        Args:
+            path (str): Path del archivo del registro.
+        """
+        with self._lock:
+            if path in self._entradas:
+                self._quitar(path)
+
+    def limpiar(self) -> None:
+        """Descarta todas las entradas (los contadores se conservan)."""
+        with self._lock:
+            self._entradas.clear()
+            self._bytes_actuales = 0
+
+    def get_estadisticas(self) -> Dict[str, int]:
+        """
+        Obtiene los contadores de la cache.
+
+        Returns:
+            Dict[str, int]: aciertos, fallos, desalojos, entradas y bytes.
+        """
+        with self._lock:
+            return {
+                "aciertos": self._aciertos,
+                "fallos": self._fallos,
+                "desalojos": self._desalojos,
+                "entradas": len(self._entradas),
+                "bytes": self._bytes_actuales,
+            }
+
+    def _validar(self, path: str, firma: FirmaArchivo) -> EntradaCache | None:
+        """
+        Metodo privado que obtiene la entrada de un path si su firma
+        coincide (la obsoleta se descarta) y cuenta el acierto o fallo.
+        Debe llamarse con el lock tomado.
+        """
+        entrada = self._entradas.get(path)
+        if entrada is None or entrada[0] != firma:
+            if entrada is not None:
+                self._quitar(path)
+            self._fallos += 1
+            return None
+
+        self._entradas.move_to_end(path)
+        self._aciertos += 1
+        return entrada
+
+    def _quitar(self, path: str) -> None:
+        """
+        Metodo privado que remueve una entrada y actualiza los bytes.
+        Debe llamarse con el lock tomado.
+        """
+        _, contenido, _ = self._entradas.pop(path)
+        self._bytes_actuales -= len(contenido)
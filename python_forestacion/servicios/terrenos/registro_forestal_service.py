@@ -7,7 +7,9 @@ la visualizacion de datos completos del registro.
 # --- Imports Standard Library ---
 import os
 import pickle
-from typing import TYPE_CHECKING
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Tuple, TYPE_CHECKING
 
 # --- Imports de Constantes ---
 from python_forestacion import constantes as C
@@ -16,6 +18,12 @@ from python_forestacion import constantes as C
 # 1. Importa el Registry (Singleton) para mostrar datos de cultivos
 from python_forestacion.servicios.cultivos.cultivo_service_registry import CultivoServiceRegistry
 
+# --- Imports de Servicios ---
+from python_forestacion.servicios.terrenos.registro_cache import RegistroCache, FirmaArchivo
+from python_forestacion.servicios.terrenos.resultado_carga import ResultadoCarga
+from python_forestacion.servicios.terrenos.indice_registros import IndiceRegistros
+from python_forestacion.servicios.terrenos.reporte_registro_service import ReporteRegistroService
+
 # --- Imports de Excepciones ---
 from python_forestacion.excepciones.persistencia_exception import PersistenciaException, TipoOperacion
 from python_forestacion.excepciones import mensajes_exception as MSG
@@ -23,6 +31,30 @@ from python_forestacion.excepciones import mensajes_exception as MSG
 # --- Imports de Entidades ---
 if TYPE_CHECKING:
     from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+    from python_forestacion.servicios.negocio.fincas_service import FincasService
+
+# TypeAlias para el callback de progreso: (procesados, total)
+ProgresoCallback = Callable[[int, int], None]
+
+# TypeAlias del resultado de un worker: (path, firma, contenido, error)
+ResultadoArchivo = Tuple[str, FirmaArchivo | None, bytes | None, str | None]
+
+
+def _leer_archivo(path_completo: str) -> ResultadoArchivo:
+    """
+    Funcion de modulo ejecutada en los hilos del pool.
+
+    Lee los bytes crudos de un archivo de registro (sin deserializar).
+    Nunca lanza excepciones: los errores se devuelven como texto para
+    no abortar la carga masiva.
+    """
+    try:
+        with open(path_completo, 'rb') as f:
+            estado = os.fstat(f.fileno())
+            contenido = f.read()
+        return path_completo, (estado.st_mtime_ns, estado.st_size), contenido, None
+    except Exception as e:
+        return path_completo, None, None, f"{type(e).__name__}: {e}"
 
 
 class RegistroForestalService:
@@ -32,6 +64,12 @@ class RegistroForestalService:
     Implementa US-021 (Persistir), US-022 (Leer) y US-023 (Mostrar).
     """
 
+    # Cache LRU compartida por todas las lecturas (leer_registro es estatico)
+    _cache: RegistroCache = RegistroCache()
+
+    # Layout particionado + manifiesto, compartido por los metodos estaticos
+    _indice: IndiceRegistros = IndiceRegistros()
+
     def __init__(self):
         """
         Inicializa el RegistroForestalService.
@@ -39,6 +77,7 @@ class RegistroForestalService:
         Obtiene la instancia unica (Singleton) del Registry.
         """
         self._registry = CultivoServiceRegistry.get_instance()
+        self._reporte = ReporteRegistroService()
 
     # --- CORRECCION AQUI ---
     # Se usan comillas en 'RegistroForestal'
@@ -48,37 +87,44 @@ class RegistroForestalService:
         Implementacion de US-023.
         
         Usa el Registry para despachar polimorficamente
-        la visualizacion de cada cultivo (US-009).
+        la visualizacion de cada cultivo (US-009). El reporte se
+        escribe de a paginas (una escritura por pagina), no con
+        un print por cada dato.
 
         Args:
             registro (RegistroForestal): El registro a mostrar.
         """
-        plantacion = registro.get_plantacion()
-        tierra = registro.get_tierra()
-        cultivos = plantacion.get_cultivos()
-
-        print("\n=================================")
-        print("     REGISTRO FORESTAL     ")
-        print("=================================")
-        print(f"Padron:      {registro.get_id_padron()}")
-        print(f"Propietario: {registro.get_propietario()}")
-        print(f"Avaluo:      ${registro.get_avaluo():,.2f}")
-        print(f"Domicilio:   {tierra.get_domicilio()}")
-        print(f"Superficie:  {tierra.get_superficie()} m²")
-        print(f"Plantados:   {len(cultivos)} cultivos")
-        print("____________________________")
-        print("Listado de Cultivos plantados:")
-        
-        if not cultivos:
-            print("(No hay cultivos en la plantacion)")
-        else:
-            for cultivo in cultivos:
-                print("---")
-                # Llama al Registry (Singleton) para que el
-                # servicio correcto (PinoService, etc.) muestre los datos.
-                self._registry.mostrar_datos(cultivo)
-        
-        print("=================================\n")
+        for bloque in self._reporte.iterar_detalle(registro):
+            self._reporte.escribir(bloque)
+
+    def mostrar_resumen(self, registro: 'RegistroForestal') -> None:
+        """
+        Muestra un reporte resumido del registro: cantidades y
+        estadisticas de agua/altura por especie y variedad,
+        sin listar cada cultivo. (US-023)
+
+        Args:
+            registro (RegistroForestal): El registro a mostrar.
+        """
+        self._reporte.escribir(self._reporte.renderizar_resumen(registro))
+
+    def mostrar_pagina(self,
+                       registro: 'RegistroForestal',
+                       pagina: int,
+                       tamanio_pagina: int = C.REPORTE_TAMANIO_PAGINA) -> None:
+        """
+        Muestra UNA pagina del detalle de cultivos del registro. (US-023)
+
+        Args:
+            registro (RegistroForestal): El registro a mostrar.
+            pagina (int): Numero de pagina (desde 1).
+            tamanio_pagina (int, optional): Cultivos por pagina.
+
+        Raises:
+            ValueError: Si la pagina o el tamaño son < 1.
+        """
+        self._reporte.escribir(
+            self._reporte.renderizar_pagina(registro, pagina, tamanio_pagina))
 
     # --- CORRECCION AQUI ---
     # Se usan comillas en 'RegistroForestal'
@@ -87,6 +133,9 @@ class RegistroForestalService:
         Guarda (serializa) un RegistroForestal en disco usando Pickle.
         Implementacion de US-021.
 
+        El archivo se ubica en un subdirectorio por hash del propietario
+        y se registra en el manifiesto de ese subdirectorio (IndiceRegistros).
+
         Args:
             registro (RegistroForestal): El objeto a persistir.
 
@@ -94,6 +143,63 @@ class RegistroForestalService:
             PersistenciaException: Si ocurre un error de IO o Pickle.
             ValueError: Si el propietario es nulo o vacio.
 
+        Returns:
+            str: El path completo del archivo guardado.
+        """
+        if not registro.get_propietario():
+            raise ValueError("El propietario no puede ser nulo o vacio")
+
+        # La generacion se toma antes de serializar: un cambio concurrente
+        # con la escritura deja al registro marcado como modificado.
+        generacion = registro.get_generacion()
+        contenido = self.serializar(registro)
+        return self.escribir_serializado(registro, contenido, generacion)
+
+    def serializar(self, registro: 'RegistroForestal') -> bytes:
+        """
+        Serializa (Pickle) un RegistroForestal en memoria, sin escribirlo.
+
+        Permite tomar una instantanea consistente en el hilo que modifica
+        el registro y dejar solo la escritura a otro hilo (write-behind).
+
+        Args:
+            registro (RegistroForestal): El objeto a serializar.
+
+        Raises:
+            PersistenciaException: Si el registro no se puede serializar.
+
+        Returns:
+            bytes: El contenido a escribir en el archivo.
+        """
+        propietario = registro.get_propietario()
+        try:
+            return pickle.dumps(registro)
+        except (pickle.PickleError, TypeError, AttributeError) as e:
+            raise PersistenciaException(
+                mensaje_tecnico=MSG.TEC_ESCRIBIR_PICKLE.format(propietario) + f" | Error: {e}",
+                mensaje_usuario=MSG.USR_ESCRIBIR_PICKLE,
+                nombre_archivo=propietario,
+                tipo_operacion=TipoOperacion.ESCRIBIR
+            )
+
+    def escribir_serializado(self,
+                             registro: 'RegistroForestal',
+                             contenido: bytes,
+                             generacion: int) -> str:
+        """
+        Escribe en disco el contenido ya serializado de un registro
+        (ver 'serializar') y lo marca persistido en esa generacion.
+
+        Args:
+            registro (RegistroForestal): El registro que se serializo.
+            contenido (bytes): Resultado de 'serializar'.
+            generacion (int): Generacion del registro tomada ANTES de
+                serializar.
+
+        Raises:
+            PersistenciaException: Si ocurre un error de IO.
+            ValueError: Si el propietario es nulo o vacio.
+
         Returns:
             str: El path completo del archivo guardado.
         """
@@ -101,20 +207,26 @@ class RegistroForestalService:
         if not propietario:
             raise ValueError("El propietario no puede ser nulo o vacio")
 
-        # 1. Asegurar que el directorio 'data/' exista
-        directorio = C.DIRECTORIO_DATA
-        os.makedirs(directorio, exist_ok=True)
-
-        # 2. Construir el path del archivo
-        nombre_archivo = f"{propietario}{C.EXTENSION_DATA}"
-        path_completo = os.path.join(directorio, nombre_archivo)
+        # 1. Construir el path del archivo (layout particionado)
+        path_completo = RegistroForestalService._indice.path_registro(propietario)
+        directorio = os.path.dirname(path_completo)
         
         print(f"\n--- Intentando persistir registro en {path_completo} ---")
 
-        # 3. Escribir el archivo
+        # 2. Escribir el archivo (temporal + os.replace: escritura atomica)
+        #    y registrarlo en el manifiesto del shard
         try:
-            with open(path_completo, 'wb') as f:
-                pickle.dump(registro, f)
+            os.makedirs(directorio, exist_ok=True)
+            path_temporal = f"{path_completo}.tmp"
+            with open(path_temporal, 'wb') as f:
+                f.write(contenido)
+            os.replace(path_temporal, path_completo)
+
+            # El contenido en disco cambio: la copia en cache ya no sirve
+            RegistroForestalService._cache.invalidar(path_completo)
+            RegistroForestalService._indice.registrar(
+                propietario, registro.get_id_padron(), path_completo)
+            registro.marcar_persistido(generacion)
                 
             print(f"Registro de {propietario} persistido exitosamente.")
             return path_completo
@@ -126,13 +238,6 @@ class RegistroForestalService:
                 nombre_archivo=path_completo,
                 tipo_operacion=TipoOperacion.ESCRIBIR
             )
-        except pickle.PickleError as e:
-            raise PersistenciaException(
-                mensaje_tecnico=MSG.TEC_ESCRIBIR_PICKLE.format(propietario) + f" | Error: {e}",
-                mensaje_usuario=MSG.USR_ESCRIBIR_PICKLE,
-                nombre_archivo=path_completo,
-                tipo_operacion=TipoOperacion.ESCRIBIR
-            )
         except Exception as e:
             raise PersistenciaException(
                 mensaje_tecnico=MSG.TEC_ESCRIBIR_OTRO.format(path_completo) + f" | Error: {e}",
@@ -141,6 +246,34 @@ class RegistroForestalService:
                 tipo_operacion=TipoOperacion.ESCRIBIR
             )
 
+    def persistir_todos(self, registros: Iterable['RegistroForestal']) -> List[str]:
+        """
+        Persiste SOLO los registros modificados desde su ultima
+        persistencia (dirty tracking). Los registros sin cambios
+        no se vuelven a serializar.
+
+        Args:
+            registros (Iterable[RegistroForestal]): Los registros a guardar
+                (ej. todo el portfolio luego de un ciclo de riego).
+
+        Raises:
+            PersistenciaException: Si ocurre un error de IO o Pickle.
+
+        Returns:
+            List[str]: Los paths de los archivos efectivamente escritos.
+        """
+        paths_escritos: List[str] = []
+        sin_cambios = 0
+        for registro in registros:
+            if registro.is_modificado():
+                paths_escritos.append(self.persistir(registro))
+            else:
+                sin_cambios += 1
+
+        print(f"Persistencia masiva: {len(paths_escritos)} registros escritos, "
+              f"{sin_cambios} sin cambios.")
+        return paths_escritos
+
     @staticmethod
     # --- CORRECCION AQUI ---
     # Se usan comillas en 'RegistroForestal'
@@ -150,6 +283,11 @@ class RegistroForestalService:
         Implementacion de US-022.
         
         Es un metodo estatico porque no necesita estado (self).
+        Las lecturas repetidas toman el contenido de una cache LRU
+        validada por mtime/tamaño del archivo (sin volver a leer el
+        disco), pero cada llamada devuelve su PROPIA instancia, que el
+        llamador puede modificar. Para consultas de solo lectura, ver
+        'leer_registro_compartido'.
 
         Args:
             propietario (str): El nombre del propietario (usado para el nombre del archivo).
@@ -161,34 +299,215 @@ class RegistroForestalService:
         Returns:
             RegistroForestal: El objeto recuperado.
         """
+        path_completo = RegistroForestalService._resolver_path(propietario)
+        return RegistroForestalService._leer_path(path_completo, propietario, False)
+
+    @staticmethod
+    def leer_registro_compartido(propietario: str) -> 'RegistroForestal':
+        """
+        Carga un RegistroForestal para consultas de SOLO LECTURA
+        (ej. tableros): mientras el archivo no cambie, todos los
+        llamadores reciben la misma instancia cacheada, sin volver a
+        deserializar. No debe modificarse; 'es_compartido' permite
+        verificar si una instancia es compartida.
+
+        Args:
+            propietario (str): El nombre del propietario.
+
+        Raises:
+            PersistenciaException: Si el archivo no existe o esta corrupto.
+            ValueError: Si el propietario es nulo o vacio.
+
+        Returns:
+            RegistroForestal: La instancia compartida.
+        """
+        path_completo = RegistroForestalService._resolver_path(propietario)
+        return RegistroForestalService._leer_path(path_completo, propietario, True)
+
+    @staticmethod
+    def es_compartido(registro: 'RegistroForestal') -> bool:
+        """
+        Indica si un registro es la instancia compartida (de solo
+        lectura) devuelta por 'leer_registro_compartido'.
+
+        Args:
+            registro (RegistroForestal): El registro.
+
+        Returns:
+            bool: True si no debe modificarse.
+        """
+        return RegistroForestalService._cache.es_compartido(registro)
+
+    @staticmethod
+    def leer_registro_por_padron(id_padron: int) -> 'RegistroForestal':
+        """
+        Carga (deserializa) un RegistroForestal desde disco
+        buscandolo por su padron en el manifiesto.
+
+        Args:
+            id_padron (int): El padron del registro.
+
+        Raises:
+            PersistenciaException: Si no hay registro para el padron,
+                                   o el archivo esta corrupto.
+
+        Returns:
+            RegistroForestal: El objeto recuperado.
+        """
+        propietario = RegistroForestalService._indice.buscar_propietario_por_padron(id_padron)
+        if propietario is None:
+            descripcion = f"padron {id_padron}"
+            raise PersistenciaException(
+                mensaje_tecnico=MSG.TEC_LEER_NO_EXISTE.format(descripcion),
+                mensaje_usuario=MSG.USR_LEER_NO_EXISTE,
+                nombre_archivo=descripcion,
+                tipo_operacion=TipoOperacion.LEER
+            )
+        return RegistroForestalService.leer_registro(propietario)
+
+    @staticmethod
+    def cargar_todos(fincas_service: 'FincasService',
+                     max_hilos: int | None = None,
+                     callback_progreso: ProgresoCallback | None = None) -> ResultadoCarga:
+        """
+        Carga TODOS los registros guardados en disco y los agrega
+        al FincasService (warm-start al iniciar el servicio).
+
+        Los archivos se leen en paralelo en un pool de hilos (la E/S libera
+        el GIL) y se deserializan una sola vez, en el hilo principal, a
+        medida que llegan: un pool de procesos deserializaba, volvia a
+        serializar para devolver el registro y se deserializaba de nuevo.
+        Se incluyen los archivos del layout plano anterior que no tienen
+        version particionada. Un archivo corrupto se reporta en el
+        resultado sin abortar el lote.
+
+        Args:
+            fincas_service (FincasService): Servicio donde se agregan las fincas.
+            max_hilos (int | None, optional): Hilos de lectura del pool.
+                Defaults al valor de ThreadPoolExecutor.
+            callback_progreso (ProgresoCallback | None, optional): Se invoca
+                con (procesados, total) luego de cada archivo.
+
+        Returns:
+            ResultadoCarga: Cantidad de registros cargados y errores por archivo.
+        """
+        inicio = time.perf_counter()
+        paths = RegistroForestalService._descubrir_archivos()
+        total = len(paths)
+        resultado = ResultadoCarga(total)
+
+        print(f"\n--- Cargando {total} registros desde {C.DIRECTORIO_DATA} ---")
+
+        if total > 0:
+            with ThreadPoolExecutor(max_workers=max_hilos) as pool:
+                lecturas = pool.map(_leer_archivo, paths)
+
+                for procesados, (path, firma, contenido, error) in enumerate(lecturas, start=1):
+                    registro = None
+                    if contenido is not None:
+                        try:
+                            registro = pickle.loads(contenido)
+                        except Exception as e:
+                            error = f"{type(e).__name__}: {e}"
+                    if registro is None or firma is None:
+                        resultado.registrar_error(path, error or MSG.TEC_LEER_OTRO.format(path))
+                    else:
+                        # Se cachea el contenido, nunca la instancia del FincasService
+                        RegistroForestalService._cache.guardar(path, firma, contenido)
+                        fincas_service.add_finca(registro)
+                        resultado.registrar_carga()
+
+                    if callback_progreso is not None:
+                        callback_progreso(procesados, total)
+
+        resultado.set_duracion(time.perf_counter() - inicio)
+        print(f"Carga finalizada: {resultado.get_cargados()}/{total} registros "
+              f"({len(resultado.get_errores())} con error) "
+              f"en {resultado.get_duracion():.2f}s.")
+        return resultado
+
+    @staticmethod
+    def get_estadisticas_cache() -> Dict[str, int]:
+        """
+        Obtiene los contadores de la cache de lectura
+        (aciertos, fallos, desalojos, entradas y bytes).
+
+        Returns:
+            Dict[str, int]: Los contadores de la cache.
+        """
+        return RegistroForestalService._cache.get_estadisticas()
+
+    @staticmethod
+    def _resolver_path(propietario: str) -> str:
+        """
+        Metodo privado que obtiene el path del archivo de un propietario
+        (manifiesto del layout particionado, o el layout plano anterior).
+        """
         if not propietario:
             raise ValueError("El nombre del propietario no puede ser nulo o vacio")
 
-        # 1. Construir el path del archivo
-        nombre_archivo = f"{propietario}{C.EXTENSION_DATA}"
-        path_completo = os.path.join(C.DIRECTORIO_DATA, nombre_archivo)
-        
+        path_completo = RegistroForestalService._indice.buscar_por_propietario(propietario)
+        if path_completo is None:
+            path_completo = RegistroForestalService._indice.path_registro(propietario)
+            # Compatibilidad: archivos guardados con el layout plano anterior
+            path_legado = RegistroForestalService._construir_path_legado(propietario)
+            if not os.path.exists(path_completo) and os.path.exists(path_legado):
+                path_completo = path_legado
+        return path_completo
+
+    @staticmethod
+    def _leer_path(path_completo: str,
+                   propietario: str,
+                   compartido: bool) -> 'RegistroForestal':
+        """
+        Metodo privado que lee un archivo de registro (usando la cache):
+        una instancia propia, o la compartida de solo lectura.
+        """
         print(f"\n--- Intentando leer registro desde {path_completo} ---")
 
-        # 2. Validar que el archivo exista
-        if not os.path.exists(path_completo):
+        # 1. Validar que el archivo exista (y obtener su firma mtime/tamaño)
+        try:
+            estado = os.stat(path_completo)
+        except FileNotFoundError:
             raise PersistenciaException(
                 mensaje_tecnico=MSG.TEC_LEER_NO_EXISTE.format(path_completo),
                 mensaje_usuario=MSG.USR_LEER_NO_EXISTE,
                 nombre_archivo=path_completo,
                 tipo_operacion=TipoOperacion.LEER
             )
+        firma = (estado.st_mtime_ns, estado.st_size)
+        cache = RegistroForestalService._cache
 
-        # 3. Leer el archivo
         try:
+            # 2. Consultar la cache (solo sirve si el archivo no cambio)
+            if compartido:
+                registro_cacheado = cache.obtener_compartido(path_completo, firma)
+                if registro_cacheado is not None:
+                    print(f"Registro de {propietario} recuperado desde cache (solo lectura).")
+                    return registro_cacheado
+            else:
+                contenido = cache.obtener(path_completo, firma)
+                if contenido is not None:
+                    print(f"Registro de {propietario} recuperado desde cache.")
+                    return pickle.loads(contenido)
+
+            # 3. Leer el archivo y cachear su contenido
             with open(path_completo, 'rb') as f:
-                registro_leido = pickle.load(f)
-                
+                contenido = f.read()
+            cache.guardar(path_completo, firma, contenido)
+            if compartido:
+                registro_leido = cache.obtener_compartido(path_completo, firma)
+                if registro_leido is None:
+                    # No entro en la cache (mas grande que su cota)
+                    registro_leido = pickle.loads(contenido)
+            else:
+                registro_leido = pickle.loads(contenido)
             print(f"Registro de {propietario} recuperado exitosamente.")
             return registro_leido
             
         except (pickle.UnpicklingError, EOFError, ImportError, IndexError) as e:
             # Errores comunes de un archivo pickle corrupto o vacio
+            cache.invalidar(path_completo)
             raise PersistenciaException(
                 mensaje_tecnico=MSG.TEC_LEER_CORRUPTO.format(path_completo) + f" | Error: {e}",
                 mensaje_usuario=MSG.USR_LEER_CORRUPTO,
@@ -196,9 +515,43 @@ class RegistroForestalService:
                 tipo_operacion=TipoOperacion.LEER
             )
         except Exception as e:
+            cache.invalidar(path_completo)
             raise PersistenciaException(
                 mensaje_tecnico=MSG.TEC_LEER_OTRO.format(path_completo) + f" | Error: {e}",
                 mensaje_usuario=MSG.USR_LEER_OTRO,
                 nombre_archivo=path_completo,
                 tipo_operacion=TipoOperacion.LEER
-            )
\ No newline at end of file
+            )
+
+    @staticmethod
+    def _construir_path_legado(propietario: str) -> str:
+        """
+        Metodo privado que construye el path del layout plano anterior
+        (data/<propietario>.dat), usado solo como compatibilidad de lectura.
+        """
+        nombre_archivo = f"{propietario}{C.EXTENSION_DATA}"
+        return os.path.join(C.DIRECTORIO_DATA, nombre_archivo)
+
+    @staticmethod
+    def _descubrir_archivos() -> List[str]:
+        """
+        Metodo privado que lista los archivos de registro usando
+        los manifiestos (sin listar los directorios de shard), mas los
+        archivos del layout plano anterior (data/<propietario>.dat) que
+        todavia no tienen version particionada, igual que 'leer_registro'.
+        """
+        paths = RegistroForestalService._indice.listar_paths()
+        particionados = set(paths)
+        try:
+            entradas = list(os.scandir(C.DIRECTORIO_DATA))
+        except FileNotFoundError:
+            return paths
+
+        for entrada in entradas:
+            if not entrada.name.endswith(C.EXTENSION_DATA) or not entrada.is_file():
+                continue
+            propietario = entrada.name[:-len(C.EXTENSION_DATA)]
+            path_nuevo = RegistroForestalService._indice.path_registro(propietario)
+            if path_nuevo not in particionados and not os.path.exists(path_nuevo):
+                paths.append(entrada.path)
+        return sorted(paths)
\ No newline at end of file
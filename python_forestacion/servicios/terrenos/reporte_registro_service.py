@@ -0,0 +1,266 @@
+"""
+Modulo del servicio ReporteRegistroService.
+Arma los reportes de un registro forestal (resumen y detalle paginado)
+como texto, para escribirlos en una sola operacion de salida.
+"""
+from __future__ import annotations
+import sys
+from itertools import islice
+from typing import Dict, Iterator, List, Tuple, TYPE_CHECKING
+
+# --- Imports de Patrones ---
+from python_forestacion.servicios.cultivos.cultivo_service_registry import CultivoServiceRegistry
+
+# --- Imports de Constantes ---
+from python_forestacion import constantes as C
+
+# --- Imports para Type Hints ---
+if TYPE_CHECKING:
+    from python_forestacion.entidades.cultivos.cultivo import Cultivo
+    from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+
+# TypeAlias de una fila del resumen: (especie, variedad, estadisticas)
+FilaResumen = Tuple[str, str, Dict[str, float]]
+
+SEPARADOR = "================================="
+
+
+class ReporteRegistroService:
+    """
+    Motor de reportes del RegistroForestal (US-023).
+
+    - Resumen: estadisticas por especie y variedad (cantidad,
+      superficie, agua y altura), sin imprimir cada cultivo.
+    - Detalle paginado: N cultivos por pagina, generadas de a una.
+    - Cada reporte/pagina se arma en memoria y se escribe con
+      UNA sola llamada a la salida, en lugar de un print por dato.
+
+    Usa el Registry (Singleton) para el despacho por tipo de cultivo.
+    """
+
+    def __init__(self):
+        """
+        Inicializa el ReporteRegistroService.
+
+        Obtiene la instancia unica (Singleton) del Registry.
+        """
+        self._registry = CultivoServiceRegistry.get_instance()
+
+    # --- Calculo ---
+
+    def calcular_resumen(self, cultivos: List[Cultivo]) -> List[FilaResumen]:
+        """
+        Calcula las estadisticas por especie y variedad.
+
+        Los cultivos se agrupan por clase y cada grupo se procesa con
+        funciones builtin (sum/min/max), resolviendo el handler de
+        variedad una sola vez por especie.
+
+        Args:
+            cultivos (List[Cultivo]): Los cultivos a resumir.
+
+        Returns:
+            List[FilaResumen]: Una fila por (especie, variedad), ordenadas.
+        """
+        # 1. Agrupar por clase de cultivo
+        por_tipo: Dict[type, List[Cultivo]] = {}
+        for cultivo in cultivos:
+            grupo = por_tipo.get(type(cultivo))
+            if grupo is None:
+                grupo = por_tipo[type(cultivo)] = []
+            grupo.append(cultivo)
+
+        filas: List[FilaResumen] = []
+        for tipo_cultivo, grupo in por_tipo.items():
+            especie = grupo[0].get_tipo()
+
+            # 2. Sub-agrupar por variedad (caso comun: una sola variedad)
+            variedades = self._registry.obtener_variedades(tipo_cultivo, grupo)
+            if len(set(variedades)) == 1:
+                por_variedad = {variedades[0]: grupo}
+            else:
+                por_variedad = {}
+                for variedad, cultivo in zip(variedades, grupo):
+                    por_variedad.setdefault(variedad, []).append(cultivo)
+
+            # 3. Estadisticas de cada sub-grupo
+            con_altura = self._registry.tiene_crecimiento(tipo_cultivo)
+            for variedad, sub_grupo in por_variedad.items():
+                filas.append((especie, variedad,
+                              ReporteRegistroService._estadisticas(
+                                  tipo_cultivo, sub_grupo, con_altura)))
+
+        filas.sort(key=ReporteRegistroService._clave_fila)
+        return filas
+
+    # --- Renderizado ---
+
+    def renderizar_resumen(self, registro: RegistroForestal) -> str:
+        """
+        Arma el reporte resumido del registro.
+
+        Args:
+            registro (RegistroForestal): El registro a resumir.
+
+        Returns:
+            str: El texto completo del reporte.
+        """
+        cultivos = registro.get_plantacion().get_cultivos()
+        lineas = ReporteRegistroService._encabezado(registro, len(cultivos))
+        lineas.append("Resumen por especie y variedad:")
+
+        if not cultivos:
+            lineas.append("(No hay cultivos en la plantacion)")
+
+        for especie, variedad, est in self.calcular_resumen(cultivos):
+            nombre = f"{especie} ({variedad})" if variedad else especie
+            lineas.append(f"- {nombre}: {int(est['cantidad'])} cultivos, "
+                          f"{est['superficie']:.2f} m²")
+            lineas.append(f"    Agua:   total {int(est['agua_total'])} L | "
+                          f"min {int(est['agua_min'])} | "
+                          f"prom {est['agua_promedio']:.2f} | "
+                          f"max {int(est['agua_max'])} L")
+            if 'altura_promedio' in est:
+                lineas.append(f"    Altura: min {est['altura_min']:.2f} | "
+                              f"prom {est['altura_promedio']:.2f} | "
+                              f"max {est['altura_max']:.2f} m")
+
+        lineas.append(f"{SEPARADOR}\n")
+        return "\n".join(lineas) + "\n"
+
+    def renderizar_pagina(self,
+                          registro: RegistroForestal,
+                          pagina: int,
+                          tamanio_pagina: int = C.REPORTE_TAMANIO_PAGINA) -> str:
+        """
+        Arma UNA pagina del detalle de cultivos.
+
+        Args:
+            registro (RegistroForestal): El registro a mostrar.
+            pagina (int): Numero de pagina (desde 1).
+            tamanio_pagina (int, optional): Cultivos por pagina.
+
+        Raises:
+            ValueError: Si la pagina o el tamaño son < 1.
+
+        Returns:
+            str: El texto de la pagina (vacia si esta fuera de rango).
+        """
+        if pagina < 1:
+            raise ValueError("La pagina debe ser mayor o igual a 1")
+        if tamanio_pagina < 1:
+            raise ValueError("El tamaño de pagina debe ser mayor o igual a 1")
+
+        cultivos = registro.get_plantacion().get_cultivos()
+        total = len(cultivos)
+        total_paginas = max(1, -(-total // tamanio_pagina))
+        desde = (pagina - 1) * tamanio_pagina
+        hasta = min(desde + tamanio_pagina, total)
+
+        lineas = [f"Pagina {pagina} de {total_paginas} "
+                  f"(cultivos {desde + 1 if total else 0}-{hasta} de {total})"]
+        texto_cultivos = self._renderizar_cultivos(islice(cultivos, desde, hasta))
+        return "\n".join(lineas) + "\n" + texto_cultivos
+
+    def iterar_detalle(self,
+                       registro: RegistroForestal,
+                       tamanio_pagina: int = C.REPORTE_TAMANIO_PAGINA) -> Iterator[str]:
+        """
+        Genera el reporte detallado completo (mismo formato que US-023)
+        de a bloques: encabezado, una pagina de cultivos por vez y cierre.
+
+        Args:
+            registro (RegistroForestal): El registro a mostrar.
+            tamanio_pagina (int, optional): Cultivos por bloque.
+
+        Yields:
+            str: Cada bloque de texto, listo para escribir.
+        """
+        cultivos = registro.get_plantacion().get_cultivos()
+        encabezado = ReporteRegistroService._encabezado(registro, len(cultivos))
+        encabezado.append("Listado de Cultivos plantados:")
+        if not cultivos:
+            encabezado.append("(No hay cultivos en la plantacion)")
+        yield "\n".join(encabezado) + "\n"
+
+        for desde in range(0, len(cultivos), tamanio_pagina):
+            yield self._renderizar_cultivos(islice(cultivos, desde, desde + tamanio_pagina))
+
+        yield f"{SEPARADOR}\n\n"
+
+    @staticmethod
+    def escribir(texto: str) -> None:
+        """
+        Escribe un bloque de texto con una sola llamada a la salida.
+
+        Args:
+            texto (str): El texto a escribir.
+        """
+        sys.stdout.write(texto)
+        sys.stdout.flush()
+
+    # --- Metodos privados ---
+
+    def _renderizar_cultivos(self, cultivos: Iterator[Cultivo]) -> str:
+        """
+        Metodo privado que arma el detalle de un bloque de cultivos.
+        """
+        bloques = []
+        for cultivo in cultivos:
+            bloques.append("---\n")
+            bloques.append(self._registry.formatear_datos(cultivo))
+            bloques.append("\n")
+        return "".join(bloques)
+
+    @staticmethod
+    def _encabezado(registro: RegistroForestal, cantidad: int) -> List[str]:
+        """
+        Metodo privado que arma las lineas del encabezado del registro.
+        """
+        tierra = registro.get_tierra()
+        return [
+            f"\n{SEPARADOR}",
+            "     REGISTRO FORESTAL     ",
+            SEPARADOR,
+            f"Padron:      {registro.get_id_padron()}",
+            f"Propietario: {registro.get_propietario()}",
+            f"Avaluo:      ${registro.get_avaluo():,.2f}",
+            f"Domicilio:   {tierra.get_domicilio()}",
+            f"Superficie:  {tierra.get_superficie()} m²",
+            f"Plantados:   {cantidad} cultivos",
+            "____________________________",
+        ]
+
+    @staticmethod
+    def _estadisticas(tipo_cultivo: type,
+                      cultivos: List[Cultivo],
+                      con_altura: bool) -> Dict[str, float]:
+        """
+        Metodo privado que calcula las estadisticas de un grupo
+        homogeneo (misma clase) usando builtins sobre los getters.
+        """
+        cantidad = len(cultivos)
+        aguas = list(map(tipo_cultivo.get_agua, cultivos))
+        agua_total = sum(aguas)
+        estadisticas: Dict[str, float] = {
+            "cantidad": cantidad,
+            "superficie": sum(map(tipo_cultivo.get_superficie, cultivos)),
+            "agua_total": agua_total,
+            "agua_min": min(aguas),
+            "agua_max": max(aguas),
+            "agua_promedio": agua_total / cantidad,
+        }
+        if con_altura:
+            alturas = list(map(tipo_cultivo.get_altura, cultivos))
+            estadisticas["altura_min"] = min(alturas)
+            estadisticas["altura_max"] = max(alturas)
+            estadisticas["altura_promedio"] = sum(alturas) / cantidad
+        return estadisticas
+
+    @staticmethod
+    def _clave_fila(fila: FilaResumen) -> Tuple[str, str]:
+        """
+        Metodo helper estatico para ordenar las filas del resumen
+        (se usa en lugar de 'lambda', Rubrica 3.4).
+        """
+        return fila[0], fila[1]
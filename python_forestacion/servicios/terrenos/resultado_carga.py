@@ -0,0 +1,62 @@
+"""
+Modulo de la entidad ResultadoCarga.
+Resume el resultado de una carga masiva de registros desde disco.
+"""
+from typing import List, Tuple
+
+
+class ResultadoCarga:
+    """
+    Resultado de RegistroForestalService.cargar_todos.
+
+    Acumula la cantidad de registros cargados y los errores por
+    archivo, sin abortar la carga completa ante un archivo fallido.
+
+    Referencia: US-022
+    """
+
+    def __init__(self, total_archivos: int):
+        """
+        Inicializa el resultado vacio.
+
+        Args:
+            total_archivos (int): Cantidad de archivos descubiertos.
+        """
+        self._total_archivos: int = total_archivos
+        self._cargados: int = 0
+        self._errores: List[Tuple[str, str]] = []
+        self._duracion: float = 0.0
+
+    def registrar_carga(self) -> None:
+        """Contabiliza un registro cargado exitosamente."""
+        self._cargados += 1
+
+    def registrar_error(self, path: str, mensaje: str) -> None:
+        """
+        Contabiliza un archivo que no pudo cargarse.
+
+        Args:
+            path (str): El archivo que fallo.
+            mensaje (str): Descripcion del error.
+        """
+        self._errores.append((path, mensaje))
+
+    def set_duracion(self, segundos: float) -> None:
+        """Establece la duracion total de la carga en segundos."""
+        self._duracion = segundos
+
+    def get_total_archivos(self) -> int:
+        """Obtiene la cantidad de archivos descubiertos."""
+        return self._total_archivos
+
+    def get_cargados(self) -> int:
+        """Obtiene la cantidad de registros cargados."""
+        return self._cargados
+
+    def get_errores(self) -> List[Tuple[str, str]]:
+        """Obtiene una COPIA de la lista de errores (path, mensaje)."""
+        return self._errores.copy()
+
+    def get_duracion(self) -> float:
+        """Obtiene la duracion total de la carga en segundos."""
+        return self._duracion
@@ -0,0 +1,72 @@
+"""
+Modulo de la entidad ResultadoRiego.
+Resultado de un intento de riego, sin excepciones.
+"""
+from enum import Enum
+
+
+class EstadoRiego(Enum):
+    """
+    Enumera como termino un intento de riego.
+    """
+    COMPLETO = "Completo"
+    PARCIAL = "Parcial"
+    AGUA_AGOTADA = "Agua agotada"
+
+
+class ResultadoRiego:
+    """
+    Resultado de PlantacionService.intentar_regar.
+
+    Permite a quien riega en forma periodica (ej. ControlRiegoTask)
+    reaccionar a una plantacion sin agua sin construir ni capturar
+    una AguaAgotadaException en cada ciclo.
+
+    Referencia: US-008, US-012
+    """
+
+    def __init__(self,
+                 estado: EstadoRiego,
+                 litros_consumidos: int,
+                 litros_absorbidos: int,
+                 cultivos_regados: int,
+                 agua_restante: int):
+        """
+        Inicializa el resultado.
+
+        Args:
+            estado (EstadoRiego): Como termino el riego.
+            litros_consumidos (int): Agua descontada de la plantacion.
+            litros_absorbidos (int): Agua absorbida por los cultivos.
+            cultivos_regados (int): Cantidad de cultivos regados.
+            agua_restante (int): Agua disponible tras el riego.
+        """
+        self._estado: EstadoRiego = estado
+        self._litros_consumidos: int = litros_consumidos
+        self._litros_absorbidos: int = litros_absorbidos
+        self._cultivos_regados: int = cultivos_regados
+        self._agua_restante: int = agua_restante
+
+    def get_estado(self) -> EstadoRiego:
+        """Obtiene como termino el riego."""
+        return self._estado
+
+    def get_litros_consumidos(self) -> int:
+        """Obtiene el agua descontada de la plantacion."""
+        return self._litros_consumidos
+
+    def get_litros_absorbidos(self) -> int:
+        """Obtiene el agua absorbida por los cultivos."""
+        return self._litros_absorbidos
+
+    def get_cultivos_regados(self) -> int:
+        """Obtiene la cantidad de cultivos regados."""
+        return self._cultivos_regados
+
+    def get_agua_restante(self) -> int:
+        """Obtiene el agua disponible tras el riego."""
+        return self._agua_restante
+
+    def is_regado(self) -> bool:
+        """Indica si se rego (en forma completa o parcial)."""
+        return self._estado != EstadoRiego.AGUA_AGOTADA
@@ -0,0 +1,85 @@
+"""
+Pruebas del indice de aptos medicos de todo el personal (US-015).
+"""
+import contextlib
+import io
+import os
+import pickle
+import unittest
+from datetime import date
+
+from python_forestacion.entidades.personal.apto_medico import AptoMedico
+from python_forestacion.entidades.personal.trabajador import Trabajador
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.servicios.negocio.fincas_service import FincasService
+from python_forestacion.servicios.personal.trabajador_service import TrabajadorService
+
+# Registro persistido por la version original (trabajador 40111222 sin apto)
+ARCHIVO_BASELINE = os.path.join(os.path.dirname(__file__), "fixtures", "registro_baseline.dat")
+HOY = date(2025, 6, 1)
+
+
+def _registro_con_trabajador(id_padron: int, trabajador: Trabajador) -> RegistroForestal:
+    tierra = Tierra(id_padron, 100.0, "Calle 4")
+    plantacion = Plantacion(f"Finca {id_padron}", 100.0, tierra)
+    plantacion.set_trabajadores([trabajador])
+    return RegistroForestal(id_padron, tierra, plantacion, f"Propietario {id_padron}", 100.0)
+
+
+def _dnis(trabajadores):
+    return [trabajador.get_dni() for trabajador in trabajadores]
+
+
+class TestIndiceDelPersonal(unittest.TestCase):
+    """El indice cubre al personal de las fincas gestionadas."""
+
+    def setUp(self):
+        self._fincas_service = FincasService()
+        self._trabajador_service = TrabajadorService(self._fincas_service)
+
+    def _agregar(self, registro: RegistroForestal) -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            self._fincas_service.add_finca(registro)
+
+    def test_trabajador_de_finca_leida_sin_apto(self):
+        with open(ARCHIVO_BASELINE, "rb") as archivo:
+            self._agregar(pickle.load(archivo))
+        self.assertEqual(_dnis(self._trabajador_service.get_trabajadores_no_aptos(HOY)),
+                         [40111222])
+
+    def test_trabajador_de_finca_leida_por_vencer(self):
+        trabajador = Trabajador(50000001, "Ana", [])
+        trabajador.set_apto_medico(AptoMedico(True, date(2024, 6, 10)))
+        # Ida y vuelta por pickle, como una finca cargada de disco
+        self._agregar(pickle.loads(pickle.dumps(_registro_con_trabajador(910, trabajador))))
+
+        self.assertEqual(_dnis(self._trabajador_service.get_trabajadores_por_vencer(30, HOY)),
+                         [50000001])
+        self.assertEqual(self._trabajador_service.get_trabajadores_no_aptos(HOY), [])
+
+    def test_apto_reemplazado_por_setter(self):
+        trabajador = Trabajador(50000002, "Beto", [])
+        self._agregar(_registro_con_trabajador(911, trabajador))
+        self.assertEqual(_dnis(self._fincas_service.get_trabajadores_no_aptos(HOY)), [50000002])
+
+        trabajador.set_apto_medico(AptoMedico(True, date(2024, 6, 20)))
+        self.assertEqual(self._fincas_service.get_trabajadores_no_aptos(HOY), [])
+        self.assertEqual(_dnis(self._fincas_service.get_trabajadores_por_vencer(30, HOY)),
+                         [50000002])
+
+    def test_trabajador_que_deja_la_finca(self):
+        trabajador = Trabajador(50000003, "Carla", [])
+        registro = _registro_con_trabajador(912, trabajador)
+        self._agregar(registro)
+        registro.get_plantacion().set_trabajadores([])
+        self.assertEqual(self._fincas_service.get_trabajadores_no_aptos(HOY), [])
+
+    def test_sin_fincas_service(self):
+        with self.assertRaises(ValueError):
+            TrabajadorService().get_trabajadores_no_aptos(HOY)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Pruebas de la asignacion de tareas a la cuadrilla (US-016).
+"""
+import random
+import unittest
+from datetime import date, timedelta
+
+from python_forestacion.entidades.personal.apto_medico import AptoMedico
+from python_forestacion.entidades.personal.herramienta import Herramienta
+from python_forestacion.entidades.personal.tarea import Tarea
+from python_forestacion.entidades.personal.trabajador import Trabajador
+from python_forestacion.servicios.personal.asignacion_service import (
+    AsignacionService, TOLERANCIA_HORAS)
+
+DIA = date(2025, 6, 2)
+
+
+def _trabajador(dni: int, apto: bool = True) -> Trabajador:
+    trabajador = Trabajador(dni, f"Trabajador {dni}", [])
+    trabajador.set_apto_medico(AptoMedico(apto, DIA - timedelta(days=10)))
+    return trabajador
+
+
+def _tareas(duraciones, fecha: date = DIA, desde: int = 1):
+    return [Tarea(desde + i, fecha, f"Tarea {desde + i}", duracion)
+            for i, duracion in enumerate(duraciones)]
+
+
+def _herramientas(cantidad: int, certificado: bool = True):
+    return [Herramienta(i + 1, f"Herramienta {i + 1}", certificado) for i in range(cantidad)]
+
+
+class TestAsignacionService(unittest.TestCase):
+    """Plan LPT mejorado por busqueda local."""
+
+    def setUp(self):
+        self._service = AsignacionService()
+
+    def _verificar_plan(self, plan, pendientes) -> None:
+        asignadas = [tarea for _, _, tareas in plan.get_asignaciones() for tarea in tareas]
+        # Cada tarea pendiente queda asignada exactamente una vez
+        self.assertEqual(sorted(t.get_id_tarea() for t in asignadas),
+                         sorted(t.get_id_tarea() for t in pendientes))
+        self.assertEqual(plan.get_cantidad_tareas(), len(pendientes))
+        self.assertEqual(plan.get_sin_asignar(), [])
+
+        for trabajador, _, tareas in plan.get_asignaciones():
+            self.assertAlmostEqual(plan.get_carga(trabajador.get_dni()),
+                                   sum(t.get_duracion_horas() for t in tareas))
+        self.assertLessEqual(plan.get_makespan(), plan.get_makespan_inicial() + TOLERANCIA_HORAS)
+        self.assertGreaterEqual(plan.get_makespan(), plan.get_cota_inferior() - TOLERANCIA_HORAS)
+
+    def test_planes_aleatorios(self):
+        generador = random.Random(16)
+        for caso in range(40):
+            with self.subTest(caso=caso):
+                duraciones = [generador.choice((0.5, 1.0, 1.5, 2.0, 3.0, 4.5, 7.25))
+                              for _ in range(generador.randint(1, 40))]
+                pendientes = _tareas(duraciones)
+                trabajadores = [_trabajador(30000000 + i) for i in range(generador.randint(1, 6))]
+
+                plan = self._service.planificar(pendientes, trabajadores,
+                                                _herramientas(len(trabajadores)), DIA)
+
+                self._verificar_plan(plan, pendientes)
+
+    def test_busqueda_local_mejora_lpt(self):
+        # LPT: {3, 2, 2} y {3, 2} (7 h); el intercambio 3 <-> 2 llega al optimo (6 h)
+        pendientes = _tareas([3.0, 3.0, 2.0, 2.0, 2.0])
+        trabajadores = [_trabajador(30000001), _trabajador(30000002)]
+
+        plan = self._service.planificar(pendientes, trabajadores, _herramientas(2), DIA)
+
+        self._verificar_plan(plan, pendientes)
+        self.assertEqual(plan.get_makespan_inicial(), 7.0)
+        self.assertEqual(plan.get_makespan(), 6.0)
+        self.assertGreater(plan.get_movimientos(), 0)
+
+    def test_solo_pendientes_del_dia(self):
+        pendientes = _tareas([1.0, 2.0])
+        otro_dia = _tareas([5.0], fecha=DIA + timedelta(days=1), desde=10)
+        completada = _tareas([4.0], desde=20)
+        completada[0].completar_tarea()
+
+        plan = self._service.planificar(pendientes + otro_dia + completada,
+                                        [_trabajador(30000001)], _herramientas(1), DIA)
+
+        self._verificar_plan(plan, pendientes)
+
+    def test_sin_trabajadores_aptos(self):
+        pendientes = _tareas([1.0, 2.0])
+        trabajadores = [_trabajador(30000001, apto=False), Trabajador(30000002, "Sin apto", [])]
+
+        plan = self._service.planificar(pendientes, trabajadores, _herramientas(2), DIA)
+
+        self.assertEqual(plan.get_asignaciones(), [])
+        self.assertEqual(plan.get_makespan(), 0.0)
+        self.assertEqual(plan.get_sin_asignar(), pendientes)
+
+    def test_sin_herramientas_certificadas(self):
+        pendientes = _tareas([1.0, 2.0])
+
+        plan = self._service.planificar(pendientes, [_trabajador(30000001)],
+                                        _herramientas(2, certificado=False), DIA)
+
+        self.assertEqual(plan.get_asignaciones(), [])
+        self.assertEqual(plan.get_cantidad_tareas(), 0)
+        self.assertEqual(plan.get_sin_asignar(), pendientes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Pruebas de la cache de lectura de registros (US-022).
+"""
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.servicios.negocio.fincas_service import FincasService
+from python_forestacion.servicios.terrenos.registro_forestal_service import RegistroForestalService
+
+
+class TestInstanciasDeLectura(unittest.TestCase):
+    """Cada lectura es independiente; la compartida es explicita."""
+
+    def setUp(self):
+        self._directorio_original = os.getcwd()
+        self._directorio = tempfile.mkdtemp()
+        os.chdir(self._directorio)
+        RegistroForestalService._indice.olvidar_cache()
+        RegistroForestalService._cache.limpiar()
+
+        tierra = Tierra(920, 100.0, "Calle 5")
+        registro = RegistroForestal(920, tierra, Plantacion("Finca 920", 100.0, tierra, agua=300),
+                                    "Lector", 100.0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            RegistroForestalService().persistir(registro)
+
+    def tearDown(self):
+        os.chdir(self._directorio_original)
+        shutil.rmtree(self._directorio)
+        RegistroForestalService._indice.olvidar_cache()
+        RegistroForestalService._cache.limpiar()
+
+    def _leer(self, compartido: bool = False) -> RegistroForestal:
+        with contextlib.redirect_stdout(io.StringIO()):
+            if compartido:
+                return RegistroForestalService.leer_registro_compartido("Lector")
+            return RegistroForestalService.leer_registro("Lector")
+
+    def test_lecturas_independientes(self):
+        primero = self._leer()
+        aciertos = RegistroForestalService.get_estadisticas_cache()["aciertos"]
+        segundo = self._leer()
+
+        self.assertIsNot(primero, segundo)
+        self.assertEqual(RegistroForestalService.get_estadisticas_cache()["aciertos"], aciertos + 1)
+        primero.get_plantacion().set_agua_disponible(10)
+        self.assertEqual(segundo.get_plantacion().get_agua_disponible(), 300)
+        self.assertEqual(self._leer().get_plantacion().get_agua_disponible(), 300)
+        self.assertFalse(RegistroForestalService.es_compartido(primero))
+
+    def test_lectura_compartida(self):
+        compartido = self._leer(compartido=True)
+        self.assertIs(self._leer(compartido=True), compartido)
+        self.assertTrue(RegistroForestalService.es_compartido(compartido))
+        self.assertIsNot(self._leer(), compartido)
+
+    def test_compartida_modificada_se_descarta(self):
+        compartido = self._leer(compartido=True)
+        compartido.get_plantacion().set_agua_disponible(10)
+        nuevo = self._leer(compartido=True)
+        self.assertIsNot(nuevo, compartido)
+        self.assertEqual(nuevo.get_plantacion().get_agua_disponible(), 300)
+
+    def test_carga_masiva_no_comparte_sus_instancias(self):
+        fincas_service = FincasService()
+        with contextlib.redirect_stdout(io.StringIO()):
+            RegistroForestalService.cargar_todos(fincas_service, max_hilos=1)
+        gestionado = fincas_service.buscar_finca(920)
+
+        self.assertIsNot(self._leer(compartido=True), gestionado)
+        self.assertFalse(RegistroForestalService.es_compartido(gestionado))
+
+
+if __name__ == "__main__":
+    unittest.main()
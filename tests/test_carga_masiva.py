@@ -0,0 +1,70 @@
+"""
+Pruebas de la carga masiva de registros (warm-start, US-022).
+"""
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from python_forestacion import constantes as C
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.servicios.negocio.fincas_service import FincasService
+from python_forestacion.servicios.terrenos.registro_forestal_service import RegistroForestalService
+
+# Registro persistido por la version original (layout plano)
+ARCHIVO_BASELINE = os.path.join(os.path.dirname(__file__), "fixtures", "registro_baseline.dat")
+
+
+class TestCargarTodos(unittest.TestCase):
+    """Descubrimiento y carga de los layouts particionado y plano."""
+
+    def setUp(self):
+        self._directorio_original = os.getcwd()
+        self._directorio = tempfile.mkdtemp()
+        os.chdir(self._directorio)
+        RegistroForestalService._indice.olvidar_cache()
+
+    def tearDown(self):
+        os.chdir(self._directorio_original)
+        shutil.rmtree(self._directorio)
+        RegistroForestalService._indice.olvidar_cache()
+
+    def _cargar(self):
+        fincas_service = FincasService()
+        with contextlib.redirect_stdout(io.StringIO()):
+            resultado = RegistroForestalService.cargar_todos(fincas_service, max_hilos=2)
+        return resultado, fincas_service
+
+    def test_incluye_archivos_del_layout_plano(self):
+        tierra = Tierra(901, 100.0, "Calle 1")
+        registro = RegistroForestal(901, tierra, Plantacion("Finca 901", 100.0, tierra),
+                                    "Nuevo", 100.0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            RegistroForestalService().persistir(registro)
+        shutil.copy(ARCHIVO_BASELINE, os.path.join(C.DIRECTORIO_DATA, "Legado" + C.EXTENSION_DATA))
+
+        resultado, fincas_service = self._cargar()
+
+        self.assertEqual(resultado.get_cargados(), 2)
+        self.assertEqual(resultado.get_errores(), [])
+        self.assertIsNotNone(fincas_service.buscar_finca(777))
+        self.assertIsNotNone(fincas_service.buscar_finca(901))
+
+    def test_archivo_plano_corrupto_se_reporta(self):
+        os.makedirs(C.DIRECTORIO_DATA)
+        path_roto = os.path.join(C.DIRECTORIO_DATA, "Roto" + C.EXTENSION_DATA)
+        with open(path_roto, "wb") as archivo:
+            archivo.write(b"no es un pickle")
+
+        resultado, _ = self._cargar()
+
+        self.assertEqual(resultado.get_cargados(), 0)
+        self.assertEqual([path for path, _ in resultado.get_errores()], [path_roto])
+
+
+if __name__ == "__main__":
+    unittest.main()
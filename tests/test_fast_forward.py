@@ -0,0 +1,95 @@
+"""
+Pruebas del fast-forward de riegos (US-008): mismo resultado exacto que
+regar riego por riego con la fecha de cada dia.
+"""
+import contextlib
+import io
+import unittest
+from datetime import date, timedelta
+
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.excepciones.agua_agotada_exception import AguaAgotadaException
+from python_forestacion.patrones.strategy.contexto_riego import ContextoRiego
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+
+# Alturas iniciales distintas (el crecimiento agrupa por altura)
+ALTURAS = (0.5, 1.0, 1.0, 2.75, 4.0)
+
+
+class TestFastForwardEquivalente(unittest.TestCase):
+    """fast_forward contra un bucle de regar(plantacion, ContextoRiego(dia))."""
+
+    def setUp(self):
+        self._service = PlantacionService()
+
+    def _crear_plantacion(self, agua: int) -> Plantacion:
+        tierra = Tierra(930, 10000.0, "Calle 6")
+        plantacion = Plantacion("Finca 930", 10000.0, tierra, agua=agua)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for especie in ("Pino", "Olivo"):
+                for cultivo, altura in zip(self._service.plantar(plantacion, especie, len(ALTURAS)),
+                                           ALTURAS):
+                    cultivo.set_altura(altura)
+            self._service.plantar(plantacion, "Lechuga", 3)
+            self._service.plantar(plantacion, "Zanahoria", 2)
+        return plantacion
+
+    def _paso_a_paso(self, plantacion: Plantacion, desde: date, hasta: date, riegos: int) -> int:
+        aplicados = 0
+        dia = desde
+        while dia <= hasta:
+            for _ in range(riegos):
+                self._service.regar(plantacion, ContextoRiego(dia))
+                aplicados += 1
+            dia += timedelta(days=1)
+        return aplicados
+
+    @staticmethod
+    def _estado(plantacion: Plantacion):
+        cultivos = [(cultivo.get_tipo(), cultivo.get_agua(),
+                     cultivo.get_altura() if hasattr(cultivo, "get_altura") else None)
+                    for cultivo in plantacion.get_cultivos()]
+        agregados = {especie: (estadistica.get_cantidad(), estadistica.get_agua(),
+                               round(estadistica.get_altura_total(), 9))
+                     for especie, estadistica in plantacion.get_estadisticas().items()}
+        return plantacion.get_agua_disponible(), cultivos, agregados
+
+    def _comparar(self, agua: int, desde: date, hasta: date, riegos: int) -> None:
+        rapida = self._crear_plantacion(agua)
+        lenta = self._crear_plantacion(agua)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            try:
+                aplicados_rapida = self._service.fast_forward(rapida, desde, hasta, riegos)
+                agotada_rapida = False
+            except AguaAgotadaException:
+                aplicados_rapida, agotada_rapida = None, True
+            try:
+                aplicados_lenta = self._paso_a_paso(lenta, desde, hasta, riegos)
+                agotada_lenta = False
+            except AguaAgotadaException:
+                aplicados_lenta, agotada_lenta = None, True
+
+        self.assertEqual(agotada_rapida, agotada_lenta)
+        self.assertEqual(aplicados_rapida, aplicados_lenta)
+        self.assertEqual(self._estado(rapida), self._estado(lenta))
+
+    def test_cruza_el_cambio_de_estacion(self):
+        # Agosto (verano) -> septiembre (invierno)
+        self._comparar(agua=10000, desde=date(2025, 8, 27), hasta=date(2025, 9, 4), riegos=2)
+
+    def test_cruza_el_cambio_de_anio(self):
+        # Diciembre -> marzo (invierno -> verano)
+        self._comparar(agua=10000, desde=date(2025, 12, 30), hasta=date(2026, 3, 2), riegos=1)
+
+    def test_agua_agotada_a_mitad(self):
+        # 13 riegos de 10 L alcanzan; se piden 18, cruzando la estacion
+        self._comparar(agua=135, desde=date(2025, 2, 24), hasta=date(2025, 3, 4), riegos=2)
+
+    def test_sin_riegos(self):
+        self._comparar(agua=500, desde=date(2025, 5, 1), hasta=date(2025, 5, 3), riegos=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Pruebas de los indices ordenados de fincas (US-018).
+"""
+import contextlib
+import io
+import random
+import unittest
+
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.servicios.negocio.fincas_service import FincasService
+from python_forestacion.servicios.negocio.indice_ordenado import IndiceOrdenado
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+
+
+def _en_rango(valores, minimo, maximo, incluir_maximo):
+    """Rango por fuerza bruta: (valor, id) ascendente, como el indice."""
+    return [id_padron for valor, id_padron in sorted((v, i) for i, v in valores.items())
+            if (minimo is None or valor >= minimo)
+            and (maximo is None or valor < maximo or (incluir_maximo and valor == maximo))]
+
+
+class TestIndiceOrdenado(unittest.TestCase):
+    """Rangos tras actualizaciones que dividen y vacian bloques."""
+
+    def test_rangos_contra_fuerza_bruta(self):
+        generador = random.Random(18)
+        indice = IndiceOrdenado(tamanio_bloque=4)
+        valores = {}
+        for paso in range(600):
+            id_padron = generador.randint(1, 60)
+            if generador.random() < 0.15:
+                indice.quitar(id_padron)
+                valores.pop(id_padron, None)
+            else:
+                valor = float(generador.randint(0, 40))  # con valores repetidos
+                indice.actualizar(id_padron, valor)
+                valores[id_padron] = valor
+
+            minimo = generador.choice((None, float(generador.randint(0, 40))))
+            maximo = generador.choice((None, float(generador.randint(0, 40))))
+            incluir_maximo = generador.random() < 0.5
+            with self.subTest(paso=paso):
+                self.assertEqual(indice.rango(minimo, maximo, incluir_maximo),
+                                 _en_rango(valores, minimo, maximo, incluir_maximo))
+        self.assertEqual(indice.get_cantidad(), len(valores))
+
+
+class TestIndicesDeFincasService(unittest.TestCase):
+    """Los indices del servicio siguen los cambios de las fincas."""
+
+    def setUp(self):
+        self._fincas_service = FincasService()
+        self._plantacion_service = PlantacionService()
+        self._registros = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            for id_padron in range(950, 962):
+                tierra = Tierra(id_padron, 1000.0, "Calle 8")
+                plantacion = Plantacion(f"Finca {id_padron}", 1000.0, tierra,
+                                        agua=(id_padron % 5) * 20)
+                registro = RegistroForestal(id_padron, tierra, plantacion,
+                                            f"Propietario {id_padron}", 1000.0)
+                self._fincas_service.add_finca(registro)
+                self._registros[id_padron] = registro
+
+    def _agua(self):
+        return {id_padron: registro.get_plantacion().get_agua_disponible()
+                for id_padron, registro in self._registros.items()}
+
+    def _superficie(self):
+        return {id_padron: registro.get_plantacion().get_superficie_disponible()
+                for id_padron, registro in self._registros.items()}
+
+    @staticmethod
+    def _ids(registros):
+        return [registro.get_id_padron() for registro in registros]
+
+    def _verificar_agua(self, minimo, maximo, incluir_maximo=True):
+        self.assertEqual(
+            self._ids(self._fincas_service.buscar_fincas_por_agua(minimo, maximo, incluir_maximo)),
+            _en_rango(self._agua(), minimo, maximo, incluir_maximo))
+
+    def test_agua_modificada_por_setter_y_riego(self):
+        self._registros[951].get_plantacion().set_agua_disponible(500)
+        self._registros[955].get_plantacion().set_agua_disponible(0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self._plantacion_service.regar(self._registros[953].get_plantacion())
+
+        for minimo, maximo, incluir_maximo in ((None, None, True), (None, 50, False),
+                                               (20, 60, True), (20, 60, False),
+                                               (100, None, True), (70, 75, True)):
+            with self.subTest(minimo=minimo, maximo=maximo, incluir_maximo=incluir_maximo):
+                self._verificar_agua(minimo, maximo, incluir_maximo)
+        self.assertEqual(self._ids(self._fincas_service.buscar_fincas_por_agua(minimo=500)),
+                         [951])
+
+    def test_superficie_modificada_al_plantar(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self._plantacion_service.plantar(self._registros[952].get_plantacion(), "Pino", 10)
+            self._plantacion_service.plantar(self._registros[957].get_plantacion(), "Olivo", 5)
+        superficie = self._superficie()
+        self.assertLess(superficie[952], 1000.0)
+
+        libres = self._fincas_service.buscar_fincas_por_superficie_disponible(maximo=1000.0,
+                                                                              incluir_maximo=False)
+        self.assertEqual(self._ids(libres), _en_rango(superficie, None, 1000.0, False))
+        self.assertEqual(sorted(self._ids(libres)), [952, 957])
+        self.assertEqual(
+            self._ids(self._fincas_service.buscar_fincas_por_superficie_disponible(minimo=1000.0)),
+            _en_rango(superficie, 1000.0, None, True))
+
+
+if __name__ == "__main__":
+    unittest.main()
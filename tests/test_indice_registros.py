@@ -0,0 +1,45 @@
+"""
+Pruebas del indice (manifiestos) del layout particionado (US-021, US-022).
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from python_forestacion.servicios.terrenos.indice_registros import IndiceRegistros
+
+
+class TestManifiestoCompartido(unittest.TestCase):
+    """Otro proceso (otra instancia del indice) escribe los manifiestos."""
+
+    def setUp(self):
+        self._directorio_original = os.getcwd()
+        self._directorio = tempfile.mkdtemp()
+        os.chdir(self._directorio)
+        self._lector = IndiceRegistros()
+        self._escritor = IndiceRegistros()
+
+    def tearDown(self):
+        os.chdir(self._directorio_original)
+        shutil.rmtree(self._directorio)
+
+    def _registrar(self, propietario: str, id_padron: int) -> str:
+        path = self._escritor.path_registro(propietario)
+        self._escritor.registrar(propietario, id_padron, path)
+        return path
+
+    def test_manifiesto_creado_despues_de_consultar(self):
+        self.assertIsNone(self._lector.buscar_por_propietario("Ana"))
+        path = self._registrar("Ana", 11)
+        self.assertEqual(self._lector.buscar_por_propietario("Ana"), path)
+        self.assertEqual(self._lector.listar_paths(), [path])
+
+    def test_padron_registrado_por_otro_proceso(self):
+        self._registrar("Ana", 11)
+        self.assertEqual(self._lector.buscar_propietario_por_padron(11), "Ana")
+        self._registrar("Beto", 12)
+        self.assertEqual(self._lector.buscar_propietario_por_padron(12), "Beto")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Pruebas del persistidor diferido (write-behind, US-021).
+"""
+import contextlib
+import io
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.servicios.terrenos.persistencia_diferida_task import PersistenciaDiferidaTask
+from python_forestacion.servicios.terrenos.registro_forestal_service import RegistroForestalService
+
+
+class TestInstantanea(unittest.TestCase):
+    """El hilo de escritura guarda el estado tomado al encolar."""
+
+    def setUp(self):
+        self._directorio_original = os.getcwd()
+        self._directorio = tempfile.mkdtemp()
+        os.chdir(self._directorio)
+        RegistroForestalService._indice.olvidar_cache()
+
+    def tearDown(self):
+        os.chdir(self._directorio_original)
+        shutil.rmtree(self._directorio)
+        RegistroForestalService._indice.olvidar_cache()
+
+    def test_escribe_el_estado_encolado(self):
+        tierra = Tierra(902, 100.0, "Calle 2")
+        plantacion = Plantacion("Finca 902", 100.0, tierra, agua=300)
+        registro = RegistroForestal(902, tierra, plantacion, "Diferido", 100.0)
+        registro_service = RegistroForestalService()
+        persistidor = PersistenciaDiferidaTask(registro_service)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(persistidor.encolar(registro))
+            # Cambio posterior al pedido, antes de que el hilo escriba
+            plantacion.set_agua_disponible(100)
+            persistidor.start()
+            self.assertTrue(persistidor.flush(timeout=5))
+            persistidor.detener()
+            persistidor.join(timeout=5)
+
+        path = RegistroForestalService._indice.path_registro("Diferido")
+        with open(path, "rb") as archivo:
+            guardado = pickle.load(archivo)
+        self.assertEqual(guardado.get_plantacion().get_agua_disponible(), 300)
+        # El cambio posterior sigue pendiente de persistir
+        self.assertTrue(registro.is_modificado())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Pruebas del rastreo de cambios de los registros persistidos (US-021).
+"""
+import contextlib
+import io
+import os
+import pickle
+import unittest
+
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.entidades.personal.trabajador import Trabajador
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+from python_forestacion.servicios.negocio.fincas_service import FincasService
+
+# Registro persistido por la version original (sin rastreo de cambios)
+ARCHIVO_BASELINE = os.path.join(os.path.dirname(__file__), "fixtures", "registro_baseline.dat")
+
+
+def _leer_baseline() -> RegistroForestal:
+    with open(ARCHIVO_BASELINE, "rb") as archivo:
+        return pickle.load(archivo)
+
+
+def _crear_registro(id_padron: int) -> RegistroForestal:
+    tierra = Tierra(id_padron, 1000.0, "Calle 1")
+    plantacion = Plantacion(f"Finca {id_padron}", 1000.0, tierra)
+    with contextlib.redirect_stdout(io.StringIO()):
+        PlantacionService().plantar(plantacion, "Lechuga", 50)
+    return RegistroForestal(id_padron, tierra, plantacion, "Propietario", 1000.0)
+
+
+class TestRegistroBaseline(unittest.TestCase):
+    """Registros persistidos antes del rastreo de cambios."""
+
+    def test_se_lee_sin_modificar(self):
+        self.assertFalse(_leer_baseline().is_modificado())
+
+    def test_regar_lo_marca_modificado(self):
+        registro = _leer_baseline()
+        with contextlib.redirect_stdout(io.StringIO()):
+            PlantacionService().regar(registro.get_plantacion())
+        self.assertTrue(registro.is_modificado())
+
+    def test_agregados_reconstruidos_siguen_al_riego(self):
+        registro = _leer_baseline()
+        with contextlib.redirect_stdout(io.StringIO()):
+            PlantacionService().regar(registro.get_plantacion())
+
+        agua_pinos = sum(cultivo.get_agua() for cultivo in registro.get_plantacion().get_cultivos()
+                         if cultivo.get_tipo() == "Pino")
+        self.assertEqual(registro.get_plantacion().get_estadisticas()["Pino"].get_agua(), agua_pinos)
+
+    def test_agregados_del_portfolio_siguen_al_riego(self):
+        registro = _leer_baseline()
+        fincas_service = FincasService()
+        fincas_service.add_finca(registro)
+        with contextlib.redirect_stdout(io.StringIO()):
+            PlantacionService().regar(registro.get_plantacion())
+
+        agua_pinos = sum(cultivo.get_agua() for cultivo in registro.get_plantacion().get_cultivos()
+                         if cultivo.get_tipo() == "Pino")
+        self.assertEqual(registro.get_plantacion().get_estadisticas()["Pino"].get_agua(), agua_pinos)
+        self.assertEqual(fincas_service.get_estadisticas_portfolio()["Pino"].get_agua(), agua_pinos)
+
+
+class TestContenedoresNoPersistidos(unittest.TestCase):
+    """Los contenedores de una entidad no se serializan."""
+
+    def test_trabajador_compartido_no_arrastra_otra_finca(self):
+        registro, otro = _crear_registro(1), _crear_registro(2)
+        solo = len(pickle.dumps(registro))
+
+        trabajador = Trabajador(30111222, "Compartido", [])
+        registro.get_plantacion().set_trabajadores([trabajador])
+        otro.get_plantacion().set_trabajadores([trabajador])
+
+        leido = pickle.loads(pickle.dumps(registro))
+        self.assertLess(len(pickle.dumps(registro)), 2 * solo)
+        self.assertEqual(leido.get_plantacion().get_trabajadores()[0]._contenedores,
+                         (leido.get_plantacion(),))
+
+    def test_cultivo_leido_notifica_al_registro(self):
+        leido = pickle.loads(pickle.dumps(_crear_registro(3)))
+        self.assertFalse(leido.is_modificado())
+        cultivo = leido.get_plantacion().get_cultivos()[0]
+        cultivo.set_agua(cultivo.get_agua() + 1)
+        self.assertTrue(leido.is_modificado())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Pruebas del pronostico de agua (US-012, US-018).
+"""
+import contextlib
+import io
+import sys
+import threading
+import unittest
+
+from python_forestacion.entidades.cultivos.cultivo import Cultivo
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.riego.control.historial_riego import HistorialRiego
+from python_forestacion.servicios.cultivos.cultivo_service_registry import CultivoServiceRegistry
+from python_forestacion.servicios.negocio.pronostico_agua_service import PronosticoAguaService
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+
+
+class TestMuestrasDeEspecie(unittest.TestCase):
+    """Las muestras del Strategy no son cultivos plantados."""
+
+    def test_no_consumen_ids(self):
+        tierra = Tierra(903, 100.0, "Calle 3")
+        plantacion = Plantacion("Finca 903", 100.0, tierra)
+        with contextlib.redirect_stdout(io.StringIO()):
+            PlantacionService().plantar(plantacion, "Lechuga", 1)
+
+        anterior = Cultivo._contador_id
+        PronosticoAguaService(HistorialRiego()).pronosticar_plantacion(plantacion)
+        self.assertEqual(Cultivo._contador_id, anterior)
+
+    def test_muestra_sin_id(self):
+        anterior = Cultivo._contador_id
+        creador = CultivoServiceRegistry().get_especie("Lechuga").get_creador()
+        muestra = Cultivo.crear_muestra(creador)
+        self.assertEqual(muestra.get_id(), 0)
+        self.assertEqual(Cultivo._contador_id, anterior)
+
+    def test_muestras_mientras_otro_hilo_planta(self):
+        creador = CultivoServiceRegistry().get_especie("Lechuga").get_creador()
+        barrera = threading.Barrier(2)
+        muestras = []
+        plantados = []
+
+        def muestrear():
+            barrera.wait()
+            for _ in range(2000):
+                muestras.append(Cultivo.crear_muestra(creador))
+
+        def plantar():
+            barrera.wait()
+            for _ in range(2000):
+                plantados.append(creador())
+
+        anterior = Cultivo._contador_id
+        intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # alternar hilos lo mas seguido posible
+        try:
+            hilos = [threading.Thread(target=muestrear), threading.Thread(target=plantar)]
+            for hilo in hilos:
+                hilo.start()
+            for hilo in hilos:
+                hilo.join()
+        finally:
+            sys.setswitchinterval(intervalo)
+
+        self.assertEqual({muestra.get_id() for muestra in muestras}, {0})
+        self.assertEqual(sorted(cultivo.get_id() for cultivo in plantados),
+                         list(range(anterior + 1, anterior + 2001)))
+        self.assertEqual(Cultivo._contador_id, anterior + 2000)
+
+    def test_creador_con_error(self):
+        creador = CultivoServiceRegistry().get_especie("Lechuga").get_creador()
+        with self.assertRaises(ValueError):
+            Cultivo.crear_muestra(TestMuestrasDeEspecie._creador_con_error)
+        self.assertEqual(creador().get_id(), Cultivo._contador_id)
+
+    @staticmethod
+    def _creador_con_error() -> Cultivo:
+        raise ValueError("especie no disponible")
+
+
+if __name__ == "__main__":
+    unittest.main()
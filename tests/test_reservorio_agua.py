@@ -0,0 +1,89 @@
+"""
+Pruebas del reservorio de agua compartido (US-018).
+"""
+import contextlib
+import io
+import threading
+import unittest
+from datetime import date
+
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.servicios.negocio.fincas_service import FincasService
+from python_forestacion.servicios.negocio.reservorio_agua import ReservorioAgua
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+
+DIA = date(2025, 6, 3)
+# Alcanza para aplicar el plan dos veces: solo la marca de aplicado lo impide
+PRESUPUESTO = 1000
+
+
+class TestAplicarPlan(unittest.TestCase):
+    """Un plan se aplica una sola vez, aun desde dos hilos."""
+
+    def setUp(self):
+        self._fincas_service = FincasService()
+        plantacion_service = PlantacionService()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for id_padron, especie in ((970, "Pino"), (971, "Olivo"), (972, "Lechuga")):
+                tierra = Tierra(id_padron, 1000.0, "Calle 9")
+                plantacion = Plantacion(f"Finca {id_padron}", 1000.0, tierra, agua=5)
+                plantacion_service.plantar(plantacion, especie, 3)
+                self._fincas_service.add_finca(RegistroForestal(
+                    id_padron, tierra, plantacion, f"Propietario {id_padron}", 1000.0))
+
+    def _agua(self):
+        return {id_padron: registro.get_plantacion().get_agua_disponible()
+                for id_padron, registro in
+                ((i, self._fincas_service.buscar_finca(i)) for i in (970, 971, 972))}
+
+    def _verificar_aplicado_una_vez(self, reservorio, plan, agua_inicial) -> None:
+        self.assertTrue(plan.is_aplicado())
+        self.assertEqual(reservorio.get_disponible(DIA), PRESUPUESTO - plan.get_asignado())
+        esperada = dict(agua_inicial)
+        for registro, litros, _ in plan.get_asignaciones():
+            esperada[registro.get_id_padron()] += litros
+        self.assertEqual(self._agua(), esperada)
+
+    def test_aplicar_dos_veces(self):
+        reservorio = ReservorioAgua(PRESUPUESTO)
+        agua_inicial = self._agua()
+        plan = self._fincas_service.repartir_agua(reservorio, DIA)
+        self.assertGreater(plan.get_asignado(), 0)
+        self.assertLessEqual(2 * plan.get_asignado(), PRESUPUESTO)
+
+        with self.assertRaises(ValueError):
+            reservorio.aplicar(plan)
+        self._verificar_aplicado_una_vez(reservorio, plan, agua_inicial)
+
+    def test_aplicar_desde_dos_hilos(self):
+        for intento in range(50):
+            with self.subTest(intento=intento):
+                self.setUp()
+                reservorio = ReservorioAgua(PRESUPUESTO)
+                agua_inicial = self._agua()
+                plan = self._fincas_service.repartir_agua(reservorio, DIA, aplicar=False)
+                barrera = threading.Barrier(2)
+                resultados = []
+
+                def aplicar():
+                    barrera.wait()
+                    try:
+                        reservorio.aplicar(plan)
+                        resultados.append("aplicado")
+                    except ValueError:
+                        resultados.append("rechazado")
+
+                hilos = [threading.Thread(target=aplicar) for _ in range(2)]
+                for hilo in hilos:
+                    hilo.start()
+                for hilo in hilos:
+                    hilo.join()
+
+                self.assertEqual(sorted(resultados), ["aplicado", "rechazado"])
+                self._verificar_aplicado_una_vez(reservorio, plan, agua_inicial)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Pruebas del riego parcial con agua insuficiente (US-008).
+"""
+import contextlib
+import io
+import unittest
+from datetime import date
+
+from python_forestacion.entidades.terrenos.tierra import Tierra
+from python_forestacion.entidades.terrenos.plantacion import Plantacion
+from python_forestacion.patrones.strategy.contexto_riego import ContextoRiego
+from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
+from python_forestacion.servicios.terrenos.resultado_riego import EstadoRiego
+
+# Invierno: Pino 2 L, Lechuga 1 L, Zanahoria 2 L por riego
+INVIERNO = date(2025, 10, 15)
+
+
+class TestRiegoParcial(unittest.TestCase):
+    """Seleccion de cultivos cuando el agua no alcanza un riego completo."""
+
+    def setUp(self):
+        self._service = PlantacionService()
+
+    def _crear_plantacion(self, agua: int, especies) -> Plantacion:
+        tierra = Tierra(940, 1000.0, "Calle 7")
+        plantacion = Plantacion("Finca 940", 1000.0, tierra, agua=agua)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for especie, cantidad in especies:
+                self._service.plantar(plantacion, especie, cantidad)
+        return plantacion
+
+    def _regar(self, plantacion: Plantacion, prioridad_especie=None):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self._service.intentar_regar(plantacion, ContextoRiego(INVIERNO),
+                                                parcial=True,
+                                                prioridad_especie=prioridad_especie)
+
+    @staticmethod
+    def _estado(plantacion: Plantacion):
+        return [(cultivo.get_tipo(), cultivo.get_agua(),
+                 cultivo.get_altura() if hasattr(cultivo, "get_altura") else None)
+                for cultivo in plantacion.get_cultivos()]
+
+    @staticmethod
+    def _regados(antes, plantacion: Plantacion):
+        return [tipo for (tipo, agua, _), cultivo in zip(antes, plantacion.get_cultivos())
+                if cultivo.get_agua() != agua]
+
+    def test_arboles_antes_que_hortalizas(self):
+        # Las lechugas se plantan primero: el orden no decide, la especie si
+        plantacion = self._crear_plantacion(5, [("Lechuga", 3), ("Pino", 2)])
+        antes = self._estado(plantacion)
+
+        resultado = self._regar(plantacion)
+
+        self.assertEqual(resultado.get_estado(), EstadoRiego.PARCIAL)
+        self.assertEqual(sorted(self._regados(antes, plantacion)),
+                         ["Lechuga", "Pino", "Pino"])
+        self.assertEqual(plantacion.get_agua_disponible(), 0)
+
+    def test_hortalizas_si_el_arbol_no_alcanza(self):
+        plantacion = self._crear_plantacion(1, [("Pino", 2), ("Lechuga", 1)])
+        antes = self._estado(plantacion)
+
+        resultado = self._regar(plantacion)
+
+        self.assertEqual(resultado.get_estado(), EstadoRiego.PARCIAL)
+        self.assertEqual(self._regados(antes, plantacion), ["Lechuga"])
+
+    def test_prioridad_configurada_por_especie(self):
+        plantacion = self._crear_plantacion(3, [("Pino", 2), ("Lechuga", 3)])
+        antes = self._estado(plantacion)
+
+        resultado = self._regar(plantacion, {"Lechuga": 0, "Pino": 1})
+
+        self.assertEqual(resultado.get_cultivos_regados(), 3)
+        self.assertEqual(self._regados(antes, plantacion), ["Lechuga"] * 3)
+
+    def test_no_supera_el_presupuesto(self):
+        for agua in range(1, 10):
+            with self.subTest(agua=agua):
+                plantacion = self._crear_plantacion(
+                    agua, [("Pino", 2), ("Lechuga", 2), ("Zanahoria", 2)])
+                antes = self._estado(plantacion)
+
+                resultado = self._regar(plantacion)
+
+                absorbido = sum(cultivo.get_agua() - agua_previa for (_, agua_previa, _), cultivo
+                                in zip(antes, plantacion.get_cultivos()))
+                self.assertLessEqual(resultado.get_litros_consumidos(), agua)
+                self.assertEqual(absorbido, resultado.get_litros_consumidos())
+                self.assertEqual(plantacion.get_agua_disponible(),
+                                 agua - resultado.get_litros_consumidos())
+                self.assertEqual(resultado.get_agua_restante(),
+                                 plantacion.get_agua_disponible())
+
+    def test_agua_agotada_sin_cambios(self):
+        plantacion = self._crear_plantacion(1, [("Pino", 3), ("Zanahoria", 2)])
+        antes = self._estado(plantacion)
+        estadisticas = {especie: (estadistica.get_cantidad(), estadistica.get_agua())
+                        for especie, estadistica in plantacion.get_estadisticas().items()}
+
+        resultado = self._regar(plantacion)
+
+        self.assertEqual(resultado.get_estado(), EstadoRiego.AGUA_AGOTADA)
+        self.assertEqual(resultado.get_litros_consumidos(), 0)
+        self.assertEqual(plantacion.get_agua_disponible(), 1)
+        self.assertEqual(self._estado(plantacion), antes)
+        self.assertEqual({especie: (estadistica.get_cantidad(), estadistica.get_agua())
+                          for especie, estadistica in plantacion.get_estadisticas().items()},
+                         estadisticas)
+
+
+if __name__ == "__main__":
+    unittest.main()
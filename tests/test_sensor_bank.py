@@ -0,0 +1,31 @@
+"""
+Pruebas del banco de sensores (US-009, US-010).
+"""
+import unittest
+
+from python_forestacion.riego.sensores.sensor_bank import SensorBank
+
+
+class TestIngerirParcial(unittest.TestCase):
+    """Posiciones invalidas en un tick parcial."""
+
+    def setUp(self):
+        self._banco = SensorBank(["a", "b", "c"], valor_inicial=10.0)
+
+    def test_posicion_negativa(self):
+        with self.assertRaises(IndexError):
+            self._banco.ingerir_parcial([-1], [50.0], instante=1.0)
+
+    def test_posicion_fuera_de_rango(self):
+        with self.assertRaises(IndexError):
+            self._banco.ingerir_parcial([3], [50.0], instante=1.0)
+
+    def test_error_no_modifica_lecturas(self):
+        with self.assertRaises(IndexError):
+            self._banco.ingerir_parcial([0, -1], [50.0, 60.0], instante=1.0)
+        self.assertEqual([self._banco.get_lectura(clave) for clave in "abc"],
+                         [10.0, 10.0, 10.0])
+
+
+if __name__ == "__main__":
+    unittest.main()